@@ -0,0 +1,86 @@
+"""
+Benchmark the divided difference scheme (DDS) for many right-hand sides.
+
+The script computes the Newton coefficients from random function values
+on the unisolvent nodes of a fixed grid with an increasing number of
+columns (sets of function values) and reports the wall time per column of
+each DDS backend. The maximum absolute difference to the default
+(``"numba"``) backend is reported as well.
+
+Usage::
+
+    python benchmarks/bench_dds.py
+    python benchmarks/bench_dds.py --spatial-dimension 4 --poly-degree 8
+"""
+import argparse
+import time
+
+import numpy as np
+
+import minterpy as mp
+from minterpy.dds import SUPPORTED_BACKENDS, dds
+
+NUM_COLUMNS = [1, 4, 16, 64, 256, 1024]
+
+
+def _time_dds(fct_values, tree, backend, repeat):
+    """Return the best wall time of the DDS and its results."""
+    # Warm-up (JIT compilation)
+    dds(fct_values[:, :1], tree, backend=backend)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        nwt_coeffs = dds(fct_values, tree, backend=backend)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), nwt_coeffs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spatial-dimension", type=int, default=3)
+    parser.add_argument("--poly-degree", type=int, default=15)
+    parser.add_argument("--lp-degree", type=float, default=2.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=list(SUPPORTED_BACKENDS),
+        choices=SUPPORTED_BACKENDS,
+    )
+    args = parser.parse_args()
+
+    grid = mp.Grid.from_degree(
+        args.spatial_dimension, args.poly_degree, args.lp_degree
+    )
+    tree = grid.tree
+    num_nodes = len(grid.multi_index)
+    print(f"Grid: m={args.spatial_dimension}, n={args.poly_degree}, "
+          f"p={args.lp_degree}, N={num_nodes}")
+
+    rng = np.random.default_rng(42)
+    header = f"{'cols':>6}"
+    for backend in args.backends:
+        header += f" {backend + ' [us/col]':>24}"
+    header += f" {'max. abs. diff.':>16}"
+    print(header)
+
+    for num_columns in NUM_COLUMNS:
+        fct_values = rng.random((num_nodes, num_columns))
+        line = f"{num_columns:>6}"
+        nwt_coeffs_ref = None
+        max_diff = 0.0
+        for backend in args.backends:
+            timing, nwt_coeffs = _time_dds(
+                fct_values, tree, backend, args.repeat
+            )
+            if nwt_coeffs_ref is None:
+                nwt_coeffs_ref = nwt_coeffs
+            max_diff = max(max_diff, np.max(np.abs(nwt_coeffs - nwt_coeffs_ref)))
+            line += f" {timing / num_columns * 1e6:>24.2f}"
+        line += f" {max_diff:>16.2e}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
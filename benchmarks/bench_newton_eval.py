@@ -0,0 +1,98 @@
+"""
+Benchmark the evaluation backends of polynomials in the Newton basis.
+
+The script evaluates random polynomials in the Newton basis with complete
+multi-index sets of increasing spatial dimension and compares the timing of
+the supported backends against the default (``"numba"``) backend.
+The maximum absolute difference to the default backend is reported as well.
+
+Usage::
+
+    python benchmarks/bench_newton_eval.py
+    python benchmarks/bench_newton_eval.py --num-points 5000 --backends numba numba-tree
+"""
+import argparse
+import time
+
+import numpy as np
+
+import minterpy as mp
+from minterpy.utils.polynomials.newton import (
+    SUPPORTED_EVAL_BACKENDS,
+    eval_newton_polynomials,
+)
+
+# (spatial dimension, polynomial degree, lp-degree)
+PROBLEMS = [
+    (2, 60, 2.0),
+    (4, 10, 2.0),
+    (6, 6, 2.0),
+    (8, 4, 2.0),
+    (10, 3, 2.0),
+    (12, 2, 2.0),
+    (16, 2, 1.0),
+]
+
+
+def _time_eval(xx, coeffs, exponents, generating_points, backend, repeat):
+    """Return the best wall time of the evaluation and its results."""
+    # Warm-up (JIT compilation)
+    yy = eval_newton_polynomials(
+        xx[:2], coeffs, exponents, generating_points, backend=backend
+    )
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        yy = eval_newton_polynomials(
+            xx, coeffs, exponents, generating_points, backend=backend
+        )
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), yy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--num-points", type=int, default=10000)
+    parser.add_argument("--num-polys", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=list(SUPPORTED_EVAL_BACKENDS),
+        choices=SUPPORTED_EVAL_BACKENDS,
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    header = f"{'m':>3} {'n':>3} {'p':>4} {'N':>7}"
+    for backend in args.backends:
+        header += f" {backend + ' [s]':>16}"
+    header += f" {'max. abs. diff.':>16}"
+    print(header)
+
+    for m, n, p in PROBLEMS:
+        mi = mp.MultiIndexSet.from_degree(m, n, p)
+        grid = mp.Grid(mi)
+        exponents = mi.exponents
+        generating_points = grid.generating_points
+        coeffs = rng.random((len(mi), args.num_polys))
+        xx = rng.uniform(-1, 1, size=(args.num_points, m))
+
+        line = f"{m:>3} {n:>3} {p:>4} {len(mi):>7}"
+        yy_ref = None
+        max_diff = 0.0
+        for backend in args.backends:
+            timing, yy = _time_eval(
+                xx, coeffs, exponents, generating_points, backend, args.repeat
+            )
+            if yy_ref is None:
+                yy_ref = yy
+            max_diff = max(max_diff, np.max(np.abs(yy - yy_ref)))
+            line += f" {timing:>16.4f}"
+        line += f" {max_diff:>16.2e}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark the Horner evaluation of polynomials in the Newton basis.
+
+The script interpolates the Runge function with polynomials of increasing
+degree and evaluates the resulting polynomials in the Newton basis with
+the default (``"numba"``) and the Horner (``"numba-horner"``) backend.
+For each backend the best wall time and the maximum absolute error with
+respect to a reference evaluation in extended precision (``np.longdouble``)
+of the same Newton polynomial are reported.
+
+Usage::
+
+    python benchmarks/bench_newton_horner.py
+    python benchmarks/bench_newton_horner.py --num-points 2000
+"""
+import argparse
+import time
+
+import numpy as np
+
+import minterpy as mp
+from minterpy.utils.polynomials.newton import eval_newton_polynomials
+
+# (spatial dimension, polynomial degree, lp-degree)
+PROBLEMS = [
+    (1, 50, 2.0),
+    (1, 200, 2.0),
+    (2, 30, 2.0),
+    (2, 80, 2.0),
+    (3, 20, 2.0),
+    (4, 12, 1.0),
+]
+
+BACKENDS = ["numba", "numba-horner"]
+
+
+def runge(xx):
+    """The Runge function in multiple dimensions."""
+    return 1 / (1 + 25 * np.sum(xx**2, axis=1))
+
+
+def eval_reference(xx, coeffs, exponents, generating_points):
+    """Evaluate the polynomial in the Newton basis in extended precision."""
+    xx = xx.astype(np.longdouble)
+    generating_points = generating_points.astype(np.longdouble)
+    coeffs = coeffs.astype(np.longdouble)
+    num_points, m = xx.shape
+    max_exponent = np.max(exponents)
+
+    # The one-dimensional Newton monomials in each dimension
+    products = np.ones((max_exponent + 1, num_points, m), dtype=np.longdouble)
+    for j in range(max_exponent):
+        products[j + 1] = products[j] * (xx - generating_points[j])
+
+    yy = np.zeros(num_points, dtype=np.longdouble)
+    for coeff, exponent in zip(coeffs, exponents):
+        monomial = np.prod(products[exponent, :, np.arange(m)], axis=0)
+        yy += coeff * monomial
+
+    return yy
+
+
+def _time_eval(xx, coeffs, exponents, generating_points, backend, repeat):
+    """Return the best wall time of the evaluation and its results."""
+    # Warm-up (JIT compilation)
+    eval_newton_polynomials(
+        xx[:2], coeffs, exponents, generating_points, backend=backend
+    )
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        yy = eval_newton_polynomials(
+            xx, coeffs, exponents, generating_points, backend=backend
+        )
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), yy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--num-points", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    header = f"{'m':>3} {'n':>4} {'p':>4} {'N':>6}"
+    for backend in BACKENDS:
+        header += f" {backend + ' [s]':>18} {backend + ' err.':>18}"
+    print(header)
+
+    for m, n, p in PROBLEMS:
+        interpolant = mp.interpolate(runge, m, n, p)
+        newton_poly = interpolant.to_newton()
+        coeffs = newton_poly.coeffs
+        exponents = newton_poly.multi_index.exponents
+        generating_points = newton_poly.grid.generating_points
+        xx = rng.uniform(-1, 1, size=(args.num_points, m))
+
+        yy_ref = eval_reference(xx, coeffs, exponents, generating_points)
+
+        line = f"{m:>3} {n:>4} {p:>4} {len(exponents):>6}"
+        for backend in BACKENDS:
+            timing, yy = _time_eval(
+                xx, coeffs, exponents, generating_points, backend, args.repeat
+            )
+            error = np.max(np.abs(yy - yy_ref))
+            line += f" {timing:>18.4f} {float(error):>18.2e}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
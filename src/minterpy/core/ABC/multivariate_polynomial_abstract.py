@@ -16,11 +16,12 @@ import abc
 import numpy as np
 
 from copy import copy, deepcopy
-from typing import List, Optional, Tuple, Union
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 from minterpy.global_settings import ARRAY, SCALAR
 from minterpy.core.grid import Grid
 from minterpy.core.multi_index import MultiIndexSet
+from minterpy.utils.arrays import get_batch_size, get_batch_slices
 from minterpy.utils.verification import (
     check_type,
     check_values,
@@ -30,6 +31,8 @@ from minterpy.utils.verification import (
     verify_domain,
     verify_poly_coeffs,
     verify_poly_domain,
+    verify_batch_size,
+    verify_eval_output,
     verify_poly_power,
     verify_query_points,
 )
@@ -139,6 +142,43 @@ class MultivariatePolynomialABC(abc.ABC):
         """
         pass
 
+    @staticmethod
+    def _compile_evaluator(
+        poly: "MultivariatePolynomialABC",
+        **kwargs,
+    ) -> Callable:
+        """Create a fast evaluator of the polynomial(s).
+
+        Parameters
+        ----------
+        poly : MultivariatePolynomialABC
+            A concrete instance of a polynomial class to create
+            the evaluator for.
+        **kwargs
+            Additional keyword-only arguments that change the behavior of
+            the evaluator (see the concrete implementation).
+
+        Returns
+        -------
+        Callable
+            The evaluator of the polynomial(s).
+
+        Notes
+        -----
+        - This is the default implementation for the bases that do not
+          support a compiled evaluator; concrete classes that do support
+          it override the method.
+
+        See Also
+        --------
+        compile_evaluator
+            The method to create a fast evaluator of the polynomial(s).
+        """
+        raise NotImplementedError(
+            "Compiled evaluators are not supported for polynomials of type "
+            f"{type(poly).__name__!r}."
+        )
+
     def __call__(self, xx: np.ndarray, **kwargs) -> np.ndarray:
         """Evaluate the polynomial on a set of query points.
 
@@ -157,6 +197,9 @@ class MultivariatePolynomialABC(abc.ABC):
         **kwargs
             Additional keyword-only arguments that change the behavior of
             the underlying evaluation (see the concrete implementation).
+            In particular, a preallocated output array of the same shape as
+            the returned array may be passed as ``out``; the values are
+            then written into and returned as ``out``.
 
         Returns
         -------
@@ -175,6 +218,12 @@ class MultivariatePolynomialABC(abc.ABC):
         -----
         - The function calls the concrete implementation of the static method
           ``_eval()``.
+        - Together with a reusable ``workspace``
+          (:py:class:`~minterpy.utils.arrays.EvalWorkspace`), passing ``out``
+          avoids allocating the output and the intermediate arrays
+          in repeated evaluations of the same number of query points.
+          The verification of the query points may still create a copy if
+          they are not given as a floating point array.
 
         See Also
         --------
@@ -191,12 +240,170 @@ class MultivariatePolynomialABC(abc.ABC):
         # Verify query points
         xx = verify_query_points(xx, self.spatial_dimension)
 
+        # Verify the output array
+        if kwargs.get("out") is not None:
+            verify_eval_output(kwargs["out"], len(xx), len(self))
+
+            return self._eval(self, xx, **kwargs)
+
         # Evaluate using concrete static method
         yy = self._eval(self, xx, **kwargs)
 
         # Follow the convention of output shape from an evaluation
         return shape_eval_output(yy)
 
+    def evaluate_stream(
+        self,
+        chunks: Union[np.ndarray, Iterable[np.ndarray]],
+        chunk_size: Optional[Union[int, str]] = None,
+        out: Optional[np.ndarray] = None,
+        **kwargs,
+    ) -> Iterator[np.ndarray]:
+        """Evaluate the polynomial on a stream of chunks of query points.
+
+        The method is meant for sets of query points that do not fit
+        in memory, e.g., a memory-mapped array (:class:`numpy:numpy.memmap`)
+        or an iterator that yields the query points chunk by chunk.
+
+        Parameters
+        ----------
+        chunks : Union[:class:`numpy:numpy.ndarray`, Iterable[:class:`numpy:numpy.ndarray`]]
+            The query points. Either an iterable of two-dimensional arrays
+            of shape ``(k_i, m)`` (the chunks) or a single (possibly
+            memory-mapped) array of shape ``(k, m)`` that is split into chunks
+            of ``chunk_size`` query points.
+        chunk_size : Union[int, str], optional
+            The (maximum) number of query points per chunk. If ``chunks`` is
+            a single array, it is split into chunks of this size; if ``None``
+            or ``"auto"`` (default), the chunk size is determined from
+            the number of monomials and the memory budget
+            (``minterpy.global_settings.DEFAULT_MEMORY_BUDGET``).
+            If ``chunks`` is an iterable, the chunks larger than an integer
+            ``chunk_size`` are split further; with ``None`` or ``"auto"``,
+            the chunks are evaluated as given.
+        out : :class:`numpy:numpy.ndarray`, optional
+            A preallocated (possibly memory-mapped) output array of shape
+            ``(k,)`` for a single polynomial or ``(k, np)`` for multiple
+            polynomials where ``k`` is the total number of query points.
+            The results of each chunk are written consecutively into
+            the array.
+        **kwargs
+            Additional keyword-only arguments that change the behavior of
+            the underlying evaluation (see the concrete implementation).
+
+        Returns
+        -------
+        Iterator[:class:`numpy:numpy.ndarray`]
+            The values of the polynomial evaluated at the query points of each
+            chunk, following the same output shape convention as
+            :py:meth:`__call__`. If ``out`` is given, the yielded arrays are
+            views of the corresponding part of ``out``.
+
+        Raises
+        ------
+        ValueError
+            If the output array is too small to hold the results.
+
+        Notes
+        -----
+        - The query points of every chunk are verified separately and
+          the concrete static method ``_eval()`` is called once per chunk.
+        - The evaluation is lazy; the results are only written into ``out``
+          as the returned iterator is consumed.
+
+        Examples
+        --------
+        >>> import minterpy as mp
+        >>> mi = mp.MultiIndexSet.from_degree(2, 2, 1.0)
+        >>> poly = mp.NewtonPolynomial(mi, np.arange(len(mi), dtype=float))
+        >>> xx = np.zeros((5, 2))
+        >>> out = np.empty(5)
+        >>> for yy in poly.evaluate_stream(xx, chunk_size=2, out=out):
+        ...     print(yy.shape)
+        (2,)
+        (2,)
+        (1,)
+        """
+        chunk_size = verify_batch_size(chunk_size)
+        if isinstance(chunks, np.ndarray):
+            if chunk_size is None or chunk_size == "auto":
+                chunk_size = get_batch_size(
+                    len(chunks),
+                    self.num_active_monomials,
+                )
+            chunks = (chunks,)
+        if isinstance(chunk_size, int):
+            # Split the (possibly too large) chunks further
+            chunks = (
+                xx_chunk[batch]
+                for xx_chunk in chunks
+                for batch in get_batch_slices(len(xx_chunk), chunk_size)
+            )
+
+        start_idx = 0
+        for xx in chunks:
+            # Verify the query points
+            xx = verify_query_points(xx, self.spatial_dimension)
+            if out is None:
+                yield shape_eval_output(self._eval(self, xx, **kwargs))
+                continue
+
+            # Evaluate the current chunk directly into the output array
+            end_idx = start_idx + len(xx)
+            if end_idx > len(out):
+                raise ValueError(
+                    "The output array is too small "
+                    f"(got {len(out)}, expected at least {end_idx})."
+                )
+            yy = verify_eval_output(out[start_idx:end_idx], len(xx), len(self))
+            self._eval(self, xx, out=yy, **kwargs)
+            start_idx = end_idx
+
+            yield yy
+
+    def compile_evaluator(self, **kwargs) -> Callable:
+        """Create a low-overhead evaluator of the polynomial.
+
+        The evaluator is meant for the repeated evaluation of the polynomial
+        on a single or a few query points, e.g., inside the right-hand side
+        of an ODE solver, where the overhead of :py:meth:`__call__`
+        (the verification of the query points and the preparation of
+        the arrays for the compiled code) dominates the evaluation itself.
+
+        Parameters
+        ----------
+        **kwargs
+            Additional keyword-only arguments that change the behavior of
+            the evaluator (see the concrete implementation).
+
+        Returns
+        -------
+        Callable
+            The evaluator; called with a single query point as
+            a one-dimensional array of length ``m`` or with multiple query
+            points as an array of shape ``(k, m)``.
+
+        Notes
+        -----
+        - The evaluator is a snapshot of the polynomial; later changes of
+          the polynomial (e.g., its coefficients) are not reflected.
+        - The query points are not verified. They must be given as a float
+          array of the correct shape (see the concrete implementation).
+        - Currently, only polynomials in the Newton basis support
+          an evaluator.
+
+        Examples
+        --------
+        >>> import minterpy as mp
+        >>> mi = mp.MultiIndexSet.from_degree(2, 2, 1.0)
+        >>> poly = mp.NewtonPolynomial(mi, np.ones(len(mi)))
+        >>> evaluator = poly.compile_evaluator()
+        >>> xx = np.array([[0.5, -0.5]])
+        >>> bool(np.isclose(evaluator(xx[0]), poly(xx)[0]))
+        True
+        """
+        return self._compile_evaluator(self, **kwargs)
+
     # anything else any polynomial must support
     # TODO mathematical operations? abstract
     # TODO copy operations. abstract
@@ -21,6 +21,8 @@ and the abstract base classes.
 +-------------------------+--------------------------------------------------------------------------------------+
 | :py:mod:`.tree`         | The data to carry out the multidimensional divided difference scheme (DDS)           |
 +-------------------------+--------------------------------------------------------------------------------------+
+| :py:mod:`.fct_cache`    | The cache of function values at the unisolvent nodes of grids                        |
++-------------------------+--------------------------------------------------------------------------------------+
 | :py:mod:`.ABC`          | The core abstract base classes                                                       |
 +-------------------------+--------------------------------------------------------------------------------------+
 """
@@ -37,5 +39,10 @@ from .grid import *  # noqa
 
 __all__ += grid.__all__
 
+from . import fct_cache  # noqa
+from .fct_cache import *  # noqa
+
+__all__ += fct_cache.__all__
+
 from . import ABC  # noqa # ABCs are not exposed to the top level!
 from . import tree  # noqa
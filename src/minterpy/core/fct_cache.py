@@ -0,0 +1,309 @@
+"""
+This module contains the implementation of the `FunctionValueCache` class.
+
+The `FunctionValueCache` class memoizes the values of a function at
+the unisolvent nodes of interpolation grids.
+
+Background information
+======================
+
+The unisolvent nodes of a grid are indexed by the exponents of its
+multi-index set: the node of the exponent :math:`\\alpha` is
+:math:`(p_{\\alpha_1, 1}, \\ldots, p_{\\alpha_m, m})`, where :math:`p` are
+the generating points. When a grid is refined (e.g., with
+:py:meth:`.Grid.add_exponents`, :py:meth:`.Grid.make_complete`,
+or :py:meth:`.Grid.merge`) while keeping its generating points,
+the unisolvent nodes of the refined grid are a superset of the current ones.
+
+A cache keyed by the exponents therefore allows the function to be evaluated
+only at the nodes that are missing. As a safeguard against grids with
+different generating points, a cached value is only reused if its node
+coincides with the requested node (otherwise the function is evaluated
+again and the entry is replaced).
+
+The cache supports a least-recently-used (LRU) eviction policy and can be
+stored to and loaded from the disk to be reused between runs.
+
+----
+
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+from collections import OrderedDict
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+import numpy as np
+
+from minterpy.global_settings import INT_DTYPE
+from minterpy.utils.arrays import eval_in_chunks
+
+if TYPE_CHECKING:
+    from minterpy.core.grid import Grid
+
+__all__ = ["FunctionValueCache"]
+
+
+class FunctionValueCache:
+    """A cache of the values of a function at the unisolvent nodes of grids.
+
+    Parameters
+    ----------
+    fun : Callable
+        The function whose values are cached. The function must accept as its
+        first argument a two-dimensional array of points and return as its
+        output an array of the same length as the input array.
+    max_size : int, optional
+        The maximum number of cached nodes; the least recently used nodes
+        are evicted first. If ``None`` (default), the cache is unbounded.
+    path : Union[str, os.PathLike], optional
+        The file in which the cache is stored by :py:meth:`save`. If the file
+        exists, the cache is loaded from it.
+
+    Raises
+    ------
+    ValueError
+        If the maximum size is smaller than one.
+
+    Notes
+    -----
+    - An instance can be passed to :py:meth:`.Grid.__call__`,
+      :py:meth:`.Grid.eval_on_nodes`, or :py:meth:`.Interpolator.__call__`
+      in place of the function.
+    """
+
+    def __init__(
+        self,
+        fun: Callable,
+        max_size: Optional[int] = None,
+        path: Optional[Union[str, os.PathLike]] = None,
+    ):
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"Invalid maximum size <{max_size}>")
+
+        self._fun = fun
+        self._max_size = max_size
+        self._path = None if path is None else Path(path)
+
+        # Exponent -> (node, value) in the order of the last access
+        self._entries: OrderedDict = OrderedDict()
+        self.num_hits = 0
+        self.num_evals = 0
+
+        if self._path is not None and self._path.exists():
+            self.load()
+
+    # --- Properties
+    @property
+    def fun(self) -> Callable:
+        """The function whose values are cached.
+
+        Returns
+        -------
+        Callable
+            The cached function.
+        """
+        return self._fun
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """The maximum number of cached nodes.
+
+        Returns
+        -------
+        int, optional
+            The maximum number of cached nodes; ``None`` if unbounded.
+        """
+        return self._max_size
+
+    @property
+    def path(self) -> Optional[Path]:
+        """The file in which the cache is stored.
+
+        Returns
+        -------
+        Path, optional
+            The file of the cache; ``None`` if not specified.
+        """
+        return self._path
+
+    # --- Instance methods
+    def eval_grid(
+        self,
+        grid: "Grid",
+        executor: Optional[Executor] = None,
+        chunk_size: Optional[int] = None,
+    ) -> np.ndarray:
+        """Evaluate the function on the unisolvent nodes of a grid.
+
+        Parameters
+        ----------
+        grid : Grid
+            The grid on whose unisolvent nodes the function is evaluated.
+        executor : :class:`concurrent.futures.Executor`, optional
+            The executor to evaluate the function on chunks of the missing
+            nodes (see :py:meth:`.Grid.eval_on_nodes`).
+        chunk_size : int, optional
+            The (maximum) number of nodes per call of the function if
+            an executor is given.
+
+        Returns
+        -------
+        :class:`numpy:numpy.ndarray`
+            The values of the function evaluated on the unisolvent nodes.
+
+        Notes
+        -----
+        - The function is only evaluated (in a single call or with
+          the executor) at the nodes that are not cached.
+        """
+        exponents = grid.multi_index.exponents
+        nodes = grid.unisolvent_nodes
+
+        # Look up the cached values
+        cached = {}
+        missing = []
+        for i, (exponent, node) in enumerate(zip(exponents, nodes)):
+            key = tuple(exponent)
+            entry = self._entries.get(key)
+            if entry is not None and np.array_equal(entry[0], node):
+                self._entries.move_to_end(key)
+                cached[i] = entry[1]
+            else:
+                missing.append(i)
+        self.num_hits += len(cached)
+
+        # Evaluate the function at the missing nodes only
+        new_values = None
+        if missing:
+            new_values = np.asarray(
+                eval_in_chunks(self._fun, nodes[missing], executor, chunk_size)
+            )
+            self.num_evals += len(missing)
+
+        # Assemble the values in the order of the nodes
+        cached_values = np.array(list(cached.values())) if cached else None
+        parts = [part for part in (cached_values, new_values) if part is not None]
+        # NOTE: Keep the type of the values (e.g., complex) of the function
+        values = np.empty(
+            (len(nodes),) + parts[0].shape[1:],
+            dtype=np.result_type(*parts),
+        )
+        if cached:
+            values[list(cached)] = cached_values
+        if missing:
+            values[missing] = new_values
+            for i, value in zip(missing, new_values):
+                self._entries[tuple(exponents[i])] = (nodes[i], value)
+            self._evict()
+
+        return values
+
+    def clear(self) -> None:
+        """Remove all the cached values."""
+        self._entries.clear()
+
+    def save(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """Store the cache to the disk.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike], optional
+            The file in which the cache is stored. If not specified,
+            :py:attr:`path` is used.
+
+        Raises
+        ------
+        ValueError
+            If no file is specified.
+
+        Notes
+        -----
+        - The file is written atomically (NumPy ``.npz`` format); the order
+          of the last access is preserved.
+        """
+        path = self._get_path(path)
+        exponents, nodes, values = self._to_arrays()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, exponents=exponents, nodes=nodes, values=values)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """Load the cache from the disk.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike], optional
+            The file from which the cache is loaded. If not specified,
+            :py:attr:`path` is used.
+
+        Raises
+        ------
+        ValueError
+            If no file is specified.
+
+        Notes
+        -----
+        - The loaded values are added to the currently cached values.
+        """
+        path = self._get_path(path)
+        with np.load(path) as data:
+            exponents = data["exponents"]
+            nodes = data["nodes"]
+            values = data["values"]
+
+        for exponent, node, value in zip(exponents, nodes, values):
+            self._entries[tuple(exponent)] = (node, value)
+        self._evict()
+
+    # --- Dunder methods
+    def __len__(self) -> int:
+        """Return the number of cached nodes."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"num_nodes={len(self)}, max_size={self._max_size})"
+        )
+
+    # --- Private methods
+    def _evict(self) -> None:
+        """Evict the least recently used nodes beyond the maximum size."""
+        if self._max_size is None:
+            return
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def _get_path(self, path: Optional[Union[str, os.PathLike]]) -> Path:
+        """Get the file of the cache."""
+        if path is None:
+            path = self._path
+        if path is None:
+            raise ValueError("No file of the cache is specified")
+
+        return Path(path)
+
+    def _to_arrays(self):
+        """Get the exponents, nodes, and values as arrays."""
+        if not self._entries:
+            empty = np.empty((0, 0))
+            return empty.astype(INT_DTYPE), empty, empty
+
+        exponents = np.array(list(self._entries), dtype=INT_DTYPE)
+        nodes = np.array([entry[0] for entry in self._entries.values()])
+        values = np.array([entry[1] for entry in self._entries.values()])
+
+        return exponents, nodes, values
@@ -27,6 +27,7 @@ demonstrating their usages and features.
 ----
 
 """
+from concurrent.futures import Executor
 from copy import copy, deepcopy
 from typing import Callable, Optional, Union
 
@@ -35,9 +36,10 @@ import numpy as np
 from minterpy.global_settings import ARRAY, INT_DTYPE
 from minterpy.gen_points import GENERATING_FUNCTIONS, gen_points_from_values
 
+from minterpy.core.fct_cache import FunctionValueCache
 from minterpy.core.multi_index import MultiIndexSet
 from minterpy.core.tree import MultiIndexTree
-from minterpy.utils.arrays import is_unique
+from minterpy.utils.arrays import eval_in_chunks, is_unique
 from minterpy.utils.verification import (
     check_type,
     check_values,
@@ -662,6 +664,80 @@ class Grid:
             "with the other instance"
         )
 
+    def eval_on_nodes(
+        self,
+        fun: Callable,
+        executor: Optional[Executor] = None,
+        chunk_size: Optional[int] = None,
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+    ) -> np.ndarray:
+        """Evaluate the given function on the unisolvent nodes of the grid.
+
+        Parameters
+        ----------
+        fun : Union[Callable, FunctionValueCache]
+            The given function to evaluate. The function must accept as its
+            first argument a two-dimensional array and return as its output
+            an array of the same length as the input array. If a cache of
+            function values is given, the function is only evaluated on
+            the nodes that are not cached.
+        executor : :class:`concurrent.futures.Executor`, optional
+            The executor (e.g., a thread or a process pool) to evaluate
+            the function on chunks of the unisolvent nodes concurrently.
+            If ``None`` (default), the function is called once on all
+            the nodes.
+        chunk_size : int, optional
+            The (maximum) number of nodes per call of the function if
+            an executor is given. If ``None`` (default), the nodes are split
+            evenly into a few chunks per CPU.
+        args : tuple, optional
+            Additional positional arguments passed to the given function.
+        kwargs : dict, optional
+            Additional keyword arguments passed to the given function.
+
+        Returns
+        -------
+        :class:`numpy:numpy.ndarray`
+            The values of the given function evaluated on the unisolvent nodes
+            (i.e., the coefficients of the polynomial in the Lagrange basis).
+
+        Raises
+        ------
+        TypeError
+            If additional arguments are given along with a cache of
+            function values.
+
+        Notes
+        -----
+        - The execution options are separate from the arguments of
+          the function so that the function may take keyword arguments
+          of any name (see also :py:meth:`__call__`).
+        - The values are returned in the order of the unisolvent nodes
+          regardless of the order in which the chunks are completed.
+        - With a process pool, the function and its arguments must be
+          picklable (e.g., a function defined at the top level of a module).
+          Prefer the ``"spawn"`` start method (``mp_context``) as forking
+          a process that runs compiled parallel code may deadlock.
+        """
+        if isinstance(fun, FunctionValueCache):
+            if args or kwargs:
+                raise TypeError(
+                    "Additional arguments cannot be passed to a cached function"
+                )
+            return fun.eval_grid(self, executor, chunk_size)
+
+        # No need for type checking the argument; rely on Python to raise any
+        # exceptions when a problematic 'fun' is called on the nodes.
+        return eval_in_chunks(
+            fun,
+            self.unisolvent_nodes,
+            executor=executor,
+            chunk_size=chunk_size,
+            args=args,
+            kwargs=kwargs,
+        )
+
     # --- Special methods: Copies
     # copying
     def __copy__(self):
@@ -712,10 +788,12 @@ class Grid:
 
         Parameters
         ----------
-        fun : Callable
+        fun : Union[Callable, FunctionValueCache]
             The given function to evaluate. The function must accept as its
             first argument a two-dimensional array and return as its output
-            an array of the same length as the input array.
+            an array of the same length as the input array. If a cache of
+            function values is given, the function is only evaluated on
+            the nodes that are not cached.
         *args
             Additional positional arguments passed to the given function.
         **kwargs
@@ -726,10 +804,14 @@ class Grid:
         :class:`numpy:numpy.ndarray`
             The values of the given function evaluated on the unisolvent nodes
             (i.e., the coefficients of the polynomial in the Lagrange basis).
+
+        Notes
+        -----
+        - All the keyword arguments are passed to the given function;
+          use :py:meth:`eval_on_nodes` to evaluate the function
+          concurrently with an executor.
         """
-        # No need for type checking the argument; rely on Python to raise any
-        # exceptions when a problematic 'fun' is called on the nodes.
-        return fun(self.unisolvent_nodes, *args, **kwargs)
+        return self.eval_on_nodes(fun, args=args, kwargs=kwargs)
 
     # --- Dunder methods: Rich comparison
     def __eq__(self, other: "Grid") -> bool:
@@ -51,6 +51,8 @@ from minterpy.jit_compiled.multi_index import (
 )
 from minterpy.utils.arrays import expand_dim as expand_dim_
 from minterpy.utils.multi_index import (
+    SparseExponents,
+    compress_exponents,
     get_poly_degree,
     get_exponent_matrix,
     is_complete,
@@ -108,6 +110,11 @@ class MultiIndexSet:
         # Verify the given lp_degree
         self._lp_degree = verify_lp_degree(lp_degree)
 
+        # Lazily derived arrays (memoized when accessed)
+        self._max_exponents: Optional[np.ndarray] = None
+        self._nonzero_mask: Optional[np.ndarray] = None
+        self._sparse_exponents: Optional[SparseExponents] = None
+
         # Check exponent values
         # Must be non-negative
         check_values(exponents, negative=False)
@@ -308,7 +315,7 @@ class MultiIndexSet:
         if len(self) == 0:
             return None
 
-        return np.max(self._exponents)
+        return np.max(self.max_exponents)
 
     @property
     def max_exponents(self) -> Optional[np.ndarray]:
@@ -320,11 +327,72 @@ class MultiIndexSet:
             The maximum exponents per dimension of the multi-index set given
             as one-dimensional array of length ``m`` (the spatial dimension).
             If the index set is empty, `None` is returned.
+
+        Notes
+        -----
+        - The array is computed once and then memoized; it is read-only.
         """
         if len(self) == 0:
             return None
 
-        return np.max(self._exponents, axis=0)
+        if self._max_exponents is None:
+            self._max_exponents = np.max(self._exponents, axis=0)
+            self._max_exponents.flags.writeable = False
+
+        return self._max_exponents
+
+    @property
+    def nonzero_mask(self) -> np.ndarray:
+        """The masks of the nonzero exponents per dimension.
+
+        Returns
+        -------
+        :class:`numpy:numpy.ndarray`
+            A boolean array of shape ``(N, m)`` where ``N`` is the number of
+            multi-indices and ``m`` is the spatial dimension; an element
+            is ``True`` if the corresponding exponent is nonzero.
+
+        Notes
+        -----
+        - The array is computed once and then memoized; it is read-only.
+
+        Examples
+        --------
+        >>> mi = MultiIndexSet.from_degree(2, 1, 1.0)
+        >>> mi.nonzero_mask
+        array([[False, False],
+               [ True, False],
+               [False,  True]])
+        """
+        if self._nonzero_mask is None:
+            self._nonzero_mask = self._exponents != 0
+            self._nonzero_mask.flags.writeable = False
+
+        return self._nonzero_mask
+
+    @property
+    def sparse_exponents(self) -> SparseExponents:
+        """The exponents of the multi-index set in a compressed format.
+
+        Returns
+        -------
+        SparseExponents
+            The exponents in the compressed sparse row (CSR) format; only
+            the nonzero exponents are stored (see
+            :py:func:`~minterpy.utils.multi_index.compress_exponents`).
+
+        Notes
+        -----
+        - The arrays are computed once and then memoized; they must not be
+          modified.
+        """
+        if self._sparse_exponents is None:
+            self._sparse_exponents = compress_exponents(
+                self._exponents,
+                self.nonzero_mask,
+            )
+
+        return self._sparse_exponents
 
     # --- Instance methods
     def add_exponents(
@@ -392,6 +460,10 @@ class MultiIndexSet:
         # --- Updated exponents after addition
         if inplace:
             self._exponents = new_exponents
+            # The derived arrays must be re-computed
+            self._max_exponents = None
+            self._nonzero_mask = None
+            self._sparse_exponents = None
             # The polynomial degree must be re-computed
             self._poly_degree = get_poly_degree(
                 exponents=new_exponents, lp_degree=self.lp_degree
@@ -497,6 +569,10 @@ class MultiIndexSet:
         # --- Updated exponents after expansion
         if inplace:
             self._exponents = expanded_exponents
+            # The derived arrays must be re-computed
+            self._max_exponents = None
+            self._nonzero_mask = None
+            self._sparse_exponents = None
             # NOTE: Reset properties (if the exponent is only 0's,
             #       it remains complete and downward-closed;
             #       otherwise, no. None to be safe)
@@ -735,6 +811,10 @@ class MultiIndexSet:
         if inplace:
             # Modify the current instance
             self._exponents = completed_exponents
+            # The derived arrays must be re-computed
+            self._max_exponents = None
+            self._nonzero_mask = None
+            self._sparse_exponents = None
             # By construction, the current instance is now complete
             self._is_complete = True
             # A complete set is a downward-closed set
@@ -798,6 +878,10 @@ class MultiIndexSet:
         if inplace:
             # Modify the current instance
             self._exponents = downward_closed_exponents
+            # The derived arrays must be re-computed
+            self._max_exponents = None
+            self._nonzero_mask = None
+            self._sparse_exponents = None
             # By construction, the current instance is now downward-closed
             self._is_downward_closed = True
             # ...but its completeness can't be guaranteed
@@ -852,6 +936,10 @@ class MultiIndexSet:
 
         if inplace:
             self._exponents = exp_prod
+            # The derived arrays must be re-computed
+            self._max_exponents = None
+            self._nonzero_mask = None
+            self._sparse_exponents = None
             self._lp_degree = lp_degree_prod
             # NOTE: Reset properties
             self._is_complete = None
@@ -915,6 +1003,10 @@ class MultiIndexSet:
 
         if inplace:
             self._exponents = exponents_union
+            # The derived arrays must be re-computed
+            self._max_exponents = None
+            self._nonzero_mask = None
+            self._sparse_exponents = None
             self._lp_degree = lp_degree_union
             # The polynomial degree must be re-computed
             self._poly_degree = get_poly_degree(
@@ -1217,5 +1309,15 @@ class MultiIndexSet:
         new_instance._poly_degree = self._poly_degree
         new_instance._is_complete = self._is_complete
         new_instance._is_downward_closed = self._is_downward_closed
+        if self._max_exponents is not None:
+            new_instance._max_exponents = self._max_exponents.copy()
+            new_instance._max_exponents.flags.writeable = False
+        if self._nonzero_mask is not None:
+            new_instance._nonzero_mask = self._nonzero_mask.copy()
+            new_instance._nonzero_mask.flags.writeable = False
+        if self._sparse_exponents is not None:
+            new_instance._sparse_exponents = SparseExponents(
+                *(array.copy() for array in self._sparse_exponents)
+            )
 
         return new_instance
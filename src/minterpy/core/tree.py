@@ -14,15 +14,29 @@ For more details, see :doc:`/fundamentals/dds`.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import os
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
 
 from minterpy.dds import (
     compile_problem_sizes,
     compile_splits,
     compile_subtree_sizes,
+    get_masks_header,
     precompute_masks,
 )
-from minterpy.global_settings import ARRAY, ARRAY_DICT  # noqa
+from minterpy.global_settings import ARRAY, INT_DTYPE  # noqa
+from minterpy.utils.tree_cache import (
+    get_cache_key,
+    get_tree_cache_dir,
+    load_masks,
+    load_tree_structure,
+    save_masks,
+    save_tree_structure,
+)
 
 if TYPE_CHECKING:
     # https://stackoverflow.com/questions/39740632/python-type-hinting-without-cyclic-imports
@@ -35,12 +49,25 @@ __all__ = ["MultiIndexTree"]
 
 class MultiIndexTree:
     """Base class for MultiIndexTree
+
+    :param grid: the grid whose (downward-closed) multi-index set defines the tree
+    :param cache_dir: the directory of the persistent on-disk cache of the precomputations;
+        if not given, the directory set via :py:func:`minterpy.utils.tree_cache.set_tree_cache_dir`
+        (or the environment variable ``MINTERPY_TREE_CACHE_DIR``) is used.
+        If no directory is set, nothing is cached.
+    :param lazy_masks: if ``True``, the projection masks are not stored but computed
+        just in time during the DDS and discarded afterwards (see :py:attr:`lazy_masks`).
     """
 
     #  TODO prevent dynamic attribute assignment (-> safe memory)
     # __slots__ = ["multi_index", "split_positions", "subtree_sizes", "stored_masks", "generating_points"]
 
-    def __init__(self, grid: Grid):
+    def __init__(
+        self,
+        grid: Grid,
+        cache_dir: Optional[Union[str, os.PathLike]] = None,
+        lazy_masks: bool = False,
+    ):
         multi_index = grid.multi_index
         if not multi_index.is_downward_closed:
             raise ValueError(
@@ -54,25 +81,50 @@ class MultiIndexTree:
 
         exponents = multi_index.exponents
         nr_exponents, spatial_dimension = exponents.shape
-        # NOTE: the tree structure ("splitting") depends on the exponents
-        # in each dimension of the sorted multi index array
-        # pre-compute and store where the splits appear in the exponent array
-        # this implicitly defines the "nodes" of the tree
-        # TODO compute on demand? NOTE: tree is being constructed only on demand (DDS)
-        # TODO reverse the dim order of all
-        #  (NOTE: then the "dim_idx" will then be counter intuitive: 0 for highest dimension...)
-        self.split_positions = compile_splits(exponents)
-        # also store the size of all nodes = how many exponent entries belong to this split
-        # in combination with the positions of all appearing splits
-        # the sizes fully determine the structure of the multi index tree
-        # (position and amount of children etc.)
-        self.subtree_sizes = compile_subtree_sizes(nr_exponents, self.split_positions)
-
-        self.problem_sizes = compile_problem_sizes(self.subtree_sizes)
+
+        # the precomputations depend only on the exponents (content-addressed cache)
+        if cache_dir is None:
+            cache_dir = get_tree_cache_dir()
+        self._cache_dir: Path | None = None if cache_dir is None else Path(cache_dir)
+        self._cache_key: str | None = None
+        structure = None
+        if self._cache_dir is not None:
+            self._cache_key = get_cache_key(exponents)
+            structure = load_tree_structure(
+                self._cache_dir, self._cache_key, nr_exponents, spatial_dimension
+            )
+
+        if structure is not None:  # warm start
+            self.split_positions, self.subtree_sizes, self.problem_sizes = structure
+        else:
+            # NOTE: the tree structure ("splitting") depends on the exponents
+            # in each dimension of the sorted multi index array
+            # pre-compute and store where the splits appear in the exponent array
+            # this implicitly defines the "nodes" of the tree
+            # TODO compute on demand? NOTE: tree is being constructed only on demand (DDS)
+            # TODO reverse the dim order of all
+            #  (NOTE: then the "dim_idx" will then be counter intuitive: 0 for highest dimension...)
+            self.split_positions = compile_splits(exponents)
+            # also store the size of all nodes = how many exponent entries belong to this split
+            # in combination with the positions of all appearing splits
+            # the sizes fully determine the structure of the multi index tree
+            # (position and amount of children etc.)
+            self.subtree_sizes = compile_subtree_sizes(nr_exponents, self.split_positions)
+
+            self.problem_sizes = compile_problem_sizes(self.subtree_sizes)
+            if self._cache_dir is not None:
+                save_tree_structure(
+                    self._cache_dir,
+                    self._cache_key,
+                    self.split_positions,
+                    self.subtree_sizes,
+                    self.problem_sizes,
+                )
 
         # TODO improvement: also "pre-compute" more of the recursion through the tree,
         #  avoid computing the node indices each time
-        self._stored_masks: ARRAY_DICT | None = None
+        self._stored_masks: ARRAY | None = None
+        self._lazy_masks = bool(lazy_masks)
 
     @property
     def multi_index(self) -> MultiIndexSet:
@@ -83,13 +135,41 @@ class MultiIndexTree:
         return self.grid.multi_index
 
     @property
-    def stored_masks(self) -> ARRAY_DICT:
+    def lazy_masks(self) -> bool:
+        """Whether the projection masks are computed just in time.
+
+        In the lazy mode, the DDS computes each correspondence between a left and a right node
+        when it is required during the traversal and discards it afterwards.
+        This trades some CPU time for memory; the memory of the masks is no longer proportional
+        to the number of pairs of sibling nodes but bounded by the size of the largest node.
+        Switching the mode on discards the stored masks.
+
+        :return: ``True`` if the lazy mode is selected
+        """
+        return self._lazy_masks
+
+    @lazy_masks.setter
+    def lazy_masks(self, value: bool):
+        self._lazy_masks = bool(value)
+        if self._lazy_masks:
+            self._stored_masks = None
+
+    @property
+    def stored_masks(self) -> ARRAY:
         """Returns the stored masks of the tree.
 
         :return: correspondencies between the left and right nodes of the tree
+            as a single flat array (see :py:func:`minterpy.dds.precompute_masks`);
+            an empty array in the lazy mode (see :py:attr:`lazy_masks`)
         """
         # the intermediary results required for DDS
         # TODO remove when regular DDS functionality is no longer required (together with the dds module)
+        if self._lazy_masks:
+            return np.zeros(0, dtype=INT_DTYPE)
+        if self._stored_masks is None and self._cache_dir is not None:
+            # NOTE: a cached array that doesn't match the tree is recomputed
+            header = get_masks_header(self.split_positions, self.subtree_sizes)
+            self._stored_masks = load_masks(self._cache_dir, self._cache_key, header)
         if self._stored_masks is None:  # lazy evaluation
             # based on the splittings one can compute all required correspondences
             # between nodes in the left and the right of the tree
@@ -98,4 +178,6 @@ class MultiIndexTree:
             self._stored_masks = precompute_masks(
                 self.split_positions, self.subtree_sizes, exponents
             )
+            if self._cache_dir is not None:
+                save_masks(self._cache_dir, self._cache_key, self._stored_masks)
         return self._stored_masks
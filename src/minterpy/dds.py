@@ -11,12 +11,13 @@ The tree structure is being encoded by numpy arrays for increased performance.
 from typing import TYPE_CHECKING, Optional, no_type_check
 
 import numpy as np
-from numba import njit
+from numba import get_num_threads, njit, prange
 from numba.typed import List
 
 from minterpy.global_settings import (
     ARRAY,
-    ARRAY_DICT,
+    DEFAULT_DDS_BLOCK_SIZE,
+    FLOAT_DTYPE,
     INT_DTYPE,
     INT_SET,
     INT_TUPLE,
@@ -26,6 +27,8 @@ from minterpy.global_settings import (
 if TYPE_CHECKING:
     from .core.tree import MultiIndexTree
 
+SUPPORTED_BACKENDS = ("numba", "numba-par", "numba-blocked")
+
 
 def compile_splits(exponents: ARRAY) -> TYPED_LIST:
     """Identify all the split positions in a multi-index set.
@@ -235,6 +238,74 @@ def compile_problem_sizes(subtree_sizes: TYPED_LIST) -> TYPED_LIST:
     return problem_sizes
 
 
+def compile_split_dims(nr_exponents: int, split_positions: TYPED_LIST) -> ARRAY:
+    """Identify the dimension at which each multi-index element splits off.
+
+    For each element of a (lexicographically sorted) multi-index set,
+    the split dimension is the highest dimension in which its exponents
+    differ from those of the preceding element. All the exponents above
+    the split dimension (i.e., the path from the root of the multi-index tree)
+    are shared with the preceding element.
+
+    Notes
+    -----
+    - The split dimension of the first element is the last dimension
+      (no preceding element to share anything with).
+    - An element that is not a split position in any dimension
+      only differs from its predecessor in the first dimension
+      (split dimension 0).
+    - A split position in dimension ``d`` that is not a split position
+      in dimension ``d + 1`` indicates a change of exponents in
+      dimension ``d + 1``.
+
+    Parameters
+    ----------
+    nr_exponents : int
+        The number of elements in the corresponding multi-index set.
+    split_positions: TYPED_LIST
+        The list of all the split positions in the corresponding
+        multi-index set.
+
+    Returns
+    -------
+    ARRAY
+        The split dimension of each element of the multi-index set,
+        a one-dimensional integer array of length ``nr_exponents``.
+
+    Examples
+    --------
+    >>> xx = np.array([
+    ...      [0, 0, 0],
+    ...      [1, 0, 0],
+    ...      [2, 0, 0],
+    ...      [0, 1, 0],
+    ...      [1, 1, 0],
+    ...      [0, 2, 0],
+    ...      [0, 0, 1],
+    ...      [1, 0, 1],
+    ...      [0, 1, 1],
+    ...      [1, 1, 1],
+    ...      [0, 0, 2],
+    ... ])
+    >>> split_positions = compile_splits(xx)
+    >>> compile_split_dims(len(xx), split_positions)
+    array([2, 0, 0, 1, 0, 1, 2, 0, 1, 0, 2])
+    """
+    spatial_dimension = len(split_positions)
+    split_dims = np.zeros(nr_exponents, dtype=INT_DTYPE)
+
+    # NOTE: Splits in lower dimensions include the splits in the higher ones,
+    # so iterating upward keeps the highest split dimension.
+    for dim_idx, split_position in enumerate(split_positions[:-1]):
+        split_dims[split_position] = dim_idx + 1
+
+    # The first element shares nothing
+    if nr_exponents > 0:
+        split_dims[0] = spatial_dimension - 1
+
+    return split_dims
+
+
 @njit(cache=True)
 def get_node_position(dim_idx: int, node_idx: int, split_positions: TYPED_LIST) -> int:
     """Returns the position of the initial exponent entry corresponding to this node.
@@ -556,39 +627,143 @@ def compute_projection_mask(
     return mask
 
 
+@njit(cache=True)
+def get_mask_size(
+    dim_idx: int,
+    node_idx_left: int,
+    node_idx_right: int,
+    subtree_sizes: TYPED_LIST,
+) -> int:
+    """Returns the number of entries of the projection mask between a left and a right node.
+
+    :param dim_idx: dimension
+    :param node_idx_left: the index of the left node
+    :param node_idx_right: the index of the right node
+    :param subtree_sizes: all sub tree sizes
+    :return: the length of the array returned by :py:func:`compute_projection_mask`
+    """
+    tree_size_r = get_node_size(dim_idx, node_idx_right, subtree_sizes)
+    if tree_size_r == 1:
+        return 1
+    tree_size_l = get_node_size(dim_idx, node_idx_left, subtree_sizes)
+    if tree_size_l == tree_size_r:
+        return 0
+    return tree_size_r
+
+
+@njit(cache=True)
+def get_masks_header(split_positions: TYPED_LIST, subtree_sizes: TYPED_LIST) -> ARRAY:
+    """Computes the header of the flat array of the masks of a tree.
+
+    :param split_positions: all split positions
+    :param subtree_sizes: all sub tree sizes
+    :return: the header ``[nr_dims, nr_nodes, nr_pairs]`` of the array returned by
+        :py:func:`precompute_masks`
+    """
+    dimensionality = len(split_positions)
+    nr_dims = max(dimensionality - 1, 0)
+    nr_nodes = 0
+    for dim_idx in range(nr_dims):
+        nr_nodes += len(split_positions[dim_idx])
+    nr_pairs = 0
+    for dim_idx_par in range(dimensionality - 1, 0, -1):
+        nr_nodes_in_dim = len(split_positions[dim_idx_par])
+        for node_idx_par in range(nr_nodes_in_dim):
+            first_child_idx, last_child_idx = get_direct_child_idxs(
+                dim_idx_par, node_idx_par, split_positions, subtree_sizes
+            )
+            nr_children = last_child_idx - first_child_idx + 1
+            nr_pairs += nr_children * (nr_children - 1) // 2
+
+    header = np.empty(3, dtype=INT_DTYPE)
+    header[0] = nr_dims
+    header[1] = nr_nodes
+    header[2] = nr_pairs
+
+    return header
+
+
 @njit(cache=True)
 def precompute_masks(
     split_positions: TYPED_LIST, subtree_sizes: TYPED_LIST, exponents: ARRAY
-) -> ARRAY_DICT:
+) -> ARRAY:
     """Computes and stores all required correspondences between nodes in the left and the right of the tree
     based on the given splitting.
 
     :param split_positions: all split positions
     :param subtree_sizes: all sub tree sizes
     :param exponents: exponents array
-    :return: a dictionary of all mappings from left to right
+    :return: all mappings from left to right in a single flat (CSR-like) array (see Notes)
+
+    Notes
+    -----
+    The masks are stored in one contiguous integer array (which can be serialized as is)
+    with the following consecutive sections:
+
+    - a header ``[nr_dims, nr_nodes, nr_pairs]`` where ``nr_dims`` is the number of dimensions
+      with masks (all but the highest one), ``nr_nodes`` is the total number of nodes in
+      these dimensions and ``nr_pairs`` the number of (left, right) pairs of sibling nodes;
+    - ``node_base`` (``nr_dims``): the index of the first node of each dimension
+      in ``pair_start``;
+    - ``pair_start`` (``nr_nodes``): the index of the pair ``(node, node + 1)``
+      of each left node; the pair ``(left, right)`` has the index
+      ``pair_start[left] + right - left - 1``;
+    - ``offsets`` (``nr_pairs + 1``): the start of the mask of each pair in ``data``;
+    - ``data``: the masks of all pairs.
+
+    Use :py:func:`get_mask` to look up the mask of a pair.
     """
-    masks = dict()  # required Numba numba.typed.Dict
     dimensionality = len(split_positions)
-    # recurse through the tree
+    nr_dims = max(dimensionality - 1, 0)
+
+    # the layout of the nodes and the pairs of sibling nodes
+    node_base = np.zeros(nr_dims, dtype=INT_DTYPE)
+    nr_nodes = 0
+    for dim_idx in range(nr_dims):
+        node_base[dim_idx] = nr_nodes
+        nr_nodes += len(split_positions[dim_idx])
+    pair_start = np.full(nr_nodes, -1, dtype=INT_DTYPE)
+    nr_pairs = 0
+    nr_entries = 0
     # NOTE: no masks are required for the last dimension (1D DDS used)
-    for dim_idx_par in range(
-        dimensionality - 1, 0, -1
-    ):  # starting from the highest dimension
+    for dim_idx_par in range(dimensionality - 1, 0, -1):
         dim_idx_child = dim_idx_par - 1
-        splits_in_dim = split_positions[dim_idx_par]
-        nr_nodes_in_dim = len(splits_in_dim)
+        nr_nodes_in_dim = len(split_positions[dim_idx_par])
         for node_idx_par in range(nr_nodes_in_dim):  # all parent nodes
             first_child_idx, last_child_idx = get_direct_child_idxs(
                 dim_idx_par, node_idx_par, split_positions, subtree_sizes
             )
-            if first_child_idx == last_child_idx:
-                # ATTENTION: left and right node must not be equal!
-                continue
             for node_idx_l in range(first_child_idx, last_child_idx):
-                for node_idx_r in range(
-                    node_idx_l + 1, last_child_idx + 1
-                ):  # ATTENTION: also include the last idx!
+                pair_start[node_base[dim_idx_child] + node_idx_l] = nr_pairs
+                for node_idx_r in range(node_idx_l + 1, last_child_idx + 1):
+                    nr_entries += get_mask_size(
+                        dim_idx_child, node_idx_l, node_idx_r, subtree_sizes
+                    )
+                    nr_pairs += 1
+
+    # the flat array
+    pos_pair_start = 3 + nr_dims
+    pos_offsets = pos_pair_start + nr_nodes
+    pos_data = pos_offsets + nr_pairs + 1
+    masks = np.empty(pos_data + nr_entries, dtype=INT_DTYPE)
+    masks[0] = nr_dims
+    masks[1] = nr_nodes
+    masks[2] = nr_pairs
+    masks[3:pos_pair_start] = node_base
+    masks[pos_pair_start:pos_offsets] = pair_start
+
+    # compute the masks (in the same order as the pairs)
+    pair_idx = 0
+    offset = 0
+    for dim_idx_par in range(dimensionality - 1, 0, -1):
+        dim_idx_child = dim_idx_par - 1
+        nr_nodes_in_dim = len(split_positions[dim_idx_par])
+        for node_idx_par in range(nr_nodes_in_dim):
+            first_child_idx, last_child_idx = get_direct_child_idxs(
+                dim_idx_par, node_idx_par, split_positions, subtree_sizes
+            )
+            for node_idx_l in range(first_child_idx, last_child_idx):
+                for node_idx_r in range(node_idx_l + 1, last_child_idx + 1):
                     mask = compute_projection_mask(
                         dim_idx_child,
                         node_idx_l,
@@ -597,11 +772,83 @@ def precompute_masks(
                         subtree_sizes,
                         exponents,
                     )
-                    masks[(dim_idx_child, node_idx_l, node_idx_r)] = mask
+                    masks[pos_offsets + pair_idx] = offset
+                    masks[pos_data + offset:pos_data + offset + len(mask)] = mask
+                    offset += len(mask)
+                    pair_idx += 1
+    masks[pos_offsets + nr_pairs] = offset
 
     return masks
 
 
+@njit(cache=True)
+def get_mask(masks: ARRAY, dim_idx: int, node_idx_left: int, node_idx_right: int) -> ARRAY:
+    """Returns the projection mask between a left and a right node.
+
+    :param masks: the flat array of all masks (see :py:func:`precompute_masks`)
+    :param dim_idx: dimension
+    :param node_idx_left: the index of the left node
+    :param node_idx_right: the index of the right node
+    :return: the indices of the entries in the left subtree split
+             corresponding to all entries in the right subtree split (a view of ``masks``);
+             empty if the correspondence is 1:1
+
+    Notes
+    -----
+    Due to JIT compilation this might return unexpected results when the input indices are out of bounds!
+    """
+    nr_dims = masks[0]
+    nr_nodes = masks[1]
+    nr_pairs = masks[2]
+    pos_pair_start = 3 + nr_dims
+    pos_offsets = pos_pair_start + nr_nodes
+    pos_data = pos_offsets + nr_pairs + 1
+    pair_idx = (
+        masks[pos_pair_start + masks[3 + dim_idx] + node_idx_left]
+        + node_idx_right
+        - node_idx_left
+        - 1
+    )
+    start = masks[pos_offsets + pair_idx]
+    end = masks[pos_offsets + pair_idx + 1]
+    return masks[pos_data + start:pos_data + end]
+
+
+@njit(cache=True)
+def lookup_mask(
+    masks: ARRAY,
+    dim_idx: int,
+    node_idx_left: int,
+    node_idx_right: int,
+    split_positions: TYPED_LIST,
+    subtree_sizes: TYPED_LIST,
+    exponents: ARRAY,
+) -> ARRAY:
+    """Returns the projection mask between a left and a right node (stored or computed just in time).
+
+    :param masks: the flat array of all masks (see :py:func:`precompute_masks`);
+        an empty array indicates the lazy mode in which the mask is computed on the fly
+    :param dim_idx: dimension
+    :param node_idx_left: the index of the left node
+    :param node_idx_right: the index of the right node
+    :param split_positions: all split positions
+    :param subtree_sizes: all sub tree sizes
+    :param exponents: the exponents array
+    :return: the indices of the entries in the left subtree split
+             corresponding to all entries in the right subtree split
+    """
+    if len(masks) == 0:  # lazy mode
+        return compute_projection_mask(
+            dim_idx,
+            node_idx_left,
+            node_idx_right,
+            split_positions,
+            subtree_sizes,
+            exponents,
+        )
+    return get_mask(masks, dim_idx, node_idx_left, node_idx_right)
+
+
 @njit(cache=True)
 def dds_1_dimensional(grid_values: ARRAY, result_placeholder: ARRAY) -> None:
     """One dimensional divided difference scheme
@@ -651,7 +898,8 @@ def project_n_update(
     generating_values: ARRAY,
     split_positions: TYPED_LIST,
     subtree_sizes: TYPED_LIST,
-    masks: ARRAY_DICT,
+    masks: ARRAY,
+    exponents: ARRAY,
 ) -> None:
     """Projects v_left onto v_right and computes the divided difference.
 
@@ -667,7 +915,9 @@ def project_n_update(
     :param generating_values: generating values used to create interpolation nodes
     :param split_positions: all split positions
     :param subtree_sizes: all subtree sizes
-    :param masks: a dictionary of all precomputed required correspondences between left and right nodes
+    :param masks: all precomputed required correspondences between left and right nodes (see :py:func:`precompute_masks`)
+        or an empty array to compute them just in time (see :py:func:`lookup_mask`)
+    :param exponents: the exponents array
 
     """
     idx_offset = node_idx_r - node_idx_l
@@ -678,9 +928,9 @@ def project_n_update(
     gen_val_r = generating_values[exponent_r]
     grid_val_diff = gen_val_r - gen_val_l
 
-    mask = masks[
-        (dim_idx, node_idx_l, node_idx_r)
-    ]  # look up the mapping between left and right
+    mask = lookup_mask(
+        masks, dim_idx, node_idx_l, node_idx_r, split_positions, subtree_sizes, exponents
+    )  # look up the mapping between left and right
     if (
         len(mask) > 0
     ):  # only if the mask contains entries (no mapping required otherwise)
@@ -700,7 +950,7 @@ def jit_dds(
     generating_points: ARRAY,
     split_positions: TYPED_LIST,
     subtree_sizes: TYPED_LIST,
-    masks: ARRAY_DICT,
+    masks: ARRAY,
     exponents: ARRAY,
 ) -> None:
     """Divided difference scheme for multiple dimensions
@@ -712,7 +962,8 @@ def jit_dds(
     :param generating_points: generating points for the grid
     :param split_positions: all the split positions
     :param subtree_sizes: all sub tree sizes
-    :param masks: a dictionary of all precomputed required correspondences between left and right nodes
+    :param masks: all precomputed required correspondences between left and right nodes (see :py:func:`precompute_masks`)
+        or an empty array to compute them just in time (see :py:func:`lookup_mask`)
     :param exponents: the exponents array
 
     Notes
@@ -773,6 +1024,7 @@ def jit_dds(
                         split_positions,
                         subtree_sizes,
                         masks,
+                        exponents,
                     )
 
     # compute the usual 1D DDS for ALL leaf nodes!
@@ -791,12 +1043,414 @@ def jit_dds(
         dds_1_dimensional(generating_values, v_leaf)
 
 
-def dds(fct_values: ARRAY, tree: "MultiIndexTree") -> ARRAY:
+@njit(cache=True)
+def _dds_block(
+    block: ARRAY,
+    generating_points: ARRAY,
+    split_positions: TYPED_LIST,
+    subtree_sizes: TYPED_LIST,
+    masks: ARRAY,
+    exponents: ARRAY,
+) -> None:
+    """Divided difference scheme on a (contiguous) block of coefficient columns.
+
+    :param block: 2D array of the function values (a block of columns), replaced by the Newton coefficients
+    :param generating_points: generating points for the grid
+    :param split_positions: all the split positions
+    :param subtree_sizes: all sub tree sizes
+    :param masks: all precomputed required correspondences between left and right nodes (see :py:func:`precompute_masks`)
+        or an empty array to compute them just in time (see :py:func:`lookup_mask`)
+    :param exponents: the exponents array
+
+    Notes
+    -----
+    Same traversal as :py:func:`jit_dds` but with explicit loops:
+    the innermost loop runs over the (contiguous) columns of a row
+    and no temporary arrays are created for the projections and the 1D DDS.
+    """
+    nr_columns = block.shape[1]
+    dimensionality = len(split_positions)
+    for dim_idx_par in range(dimensionality - 1, 0, -1):
+        dim_idx_child = dim_idx_par - 1
+        splits_in_dim = split_positions[dim_idx_par]
+        nr_nodes_in_dim = len(splits_in_dim)
+        generating_values = generating_points[:, dim_idx_par]
+        for node_idx_par in range(nr_nodes_in_dim):
+            first_child_idx, last_child_idx = get_direct_child_idxs(
+                dim_idx_par, node_idx_par, split_positions, subtree_sizes
+            )
+            for node_idx_l in range(first_child_idx, last_child_idx):
+                pos_l = get_node_position(dim_idx_child, node_idx_l, split_positions)
+                exponent_l = exponents[pos_l, dim_idx_par]
+                for node_idx_r in range(node_idx_l + 1, last_child_idx + 1):
+                    exponent_r = exponent_l + node_idx_r - node_idx_l
+                    grid_val_diff = (
+                        generating_values[exponent_r] - generating_values[exponent_l]
+                    )
+                    mask = lookup_mask(
+                        masks,
+                        dim_idx_child,
+                        node_idx_l,
+                        node_idx_r,
+                        split_positions,
+                        subtree_sizes,
+                        exponents,
+                    )
+                    pos_r = get_node_position(dim_idx_child, node_idx_r, split_positions)
+                    size_r = get_node_size(dim_idx_child, node_idx_r, subtree_sizes)
+                    for i in range(size_r):
+                        if len(mask) > 0:
+                            row_l = pos_l + mask[i]
+                        else:
+                            row_l = pos_l + i
+                        row_r = pos_r + i
+                        for j in range(nr_columns):
+                            block[row_r, j] = (
+                                block[row_r, j] - block[row_l, j]
+                            ) / grid_val_diff
+
+    # the usual 1D DDS for ALL leaf nodes
+    splits_in_dim = split_positions[0]
+    nr_nodes_in_dim = len(splits_in_dim)
+    generating_values = generating_points[:, 0]
+    for node_idx in range(nr_nodes_in_dim):
+        pos = get_node_position(0, node_idx, split_positions)
+        size = get_node_size(0, node_idx, subtree_sizes)
+        for i in range(1, size):
+            row_prev = pos + i - 1
+            for k in range(i, size):
+                val_diff = generating_values[k] - generating_values[i - 1]
+                for j in range(nr_columns):
+                    block[pos + k, j] = (
+                        block[pos + k, j] - block[row_prev, j]
+                    ) / val_diff
+
+
+@njit(cache=True)
+def jit_dds_blocked(
+    result_placeholder: ARRAY,
+    generating_points: ARRAY,
+    split_positions: TYPED_LIST,
+    subtree_sizes: TYPED_LIST,
+    masks: ARRAY,
+    exponents: ARRAY,
+    block_size: int,
+) -> None:
+    """Divided difference scheme for multiple dimensions (blocked over columns)
+
+    :param result_placeholder: 2D array where the results (=Newton coefficients) should be stored.
+        Initially this array must contain the function values on the corresponding unisolvent nodes
+        (= Lagrange coefficients).
+    :param generating_points: generating points for the grid
+    :param split_positions: all the split positions
+    :param subtree_sizes: all sub tree sizes
+    :param masks: all precomputed required correspondences between left and right nodes (see :py:func:`precompute_masks`)
+        or an empty array to compute them just in time (see :py:func:`lookup_mask`)
+    :param exponents: the exponents array
+    :param block_size: the number of columns processed at once
+
+    Notes
+    -----
+    Works on a result placeholder. Nothing is returned.
+    Tuned for many sets of coefficients (wide ``result_placeholder``):
+    the columns are processed in blocks of ``block_size``, each copied into
+    a C-contiguous buffer (unless the whole C-contiguous array fits a single block)
+    so that every update of a row streams through contiguous memory.
+    The results are identical to :py:func:`jit_dds`.
+    """
+    nr_columns = result_placeholder.shape[1]
+    if nr_columns <= block_size and result_placeholder.flags.c_contiguous:
+        _dds_block(
+            result_placeholder,
+            generating_points,
+            split_positions,
+            subtree_sizes,
+            masks,
+            exponents,
+        )
+        return
+
+    for start in range(0, nr_columns, block_size):
+        end = min(start + block_size, nr_columns)
+        block = np.ascontiguousarray(result_placeholder[:, start:end])
+        _dds_block(
+            block,
+            generating_points,
+            split_positions,
+            subtree_sizes,
+            masks,
+            exponents,
+        )
+        result_placeholder[:, start:end] = block
+
+
+@njit(parallel=True, nogil=True)
+def jit_dds_par(
+    result_placeholder: ARRAY,
+    generating_points: ARRAY,
+    split_positions: TYPED_LIST,
+    subtree_sizes: TYPED_LIST,
+    masks: ARRAY,
+    exponents: ARRAY,
+) -> None:
+    """Divided difference scheme for multiple dimensions (parallel over nodes)
+
+    :param result_placeholder: 2D array where the results (=Newton coefficients) should be stored.
+        Initially this array must contain the function values on the corresponding unisolvent nodes
+        (= Lagrange coefficients).
+    :param generating_points: generating points for the grid
+    :param split_positions: all the split positions
+    :param subtree_sizes: all sub tree sizes
+    :param masks: all precomputed required correspondences between left and right nodes (see :py:func:`precompute_masks`)
+        or an empty array to compute them just in time (see :py:func:`lookup_mask`)
+    :param exponents: the exponents array
+
+    Notes
+    -----
+    Works on a result placeholder. Nothing is returned.
+    The updates of :py:func:`jit_dds` are regrouped into steps:
+    in step ``s`` the ``s``-th child of every parent node in a dimension is projected
+    onto all the children to its right. The right nodes of a step are pairwise disjoint
+    and the left nodes are not modified within the step, hence all the updates
+    of a step are independent and are distributed over the threads.
+    Each right node receives the same updates in the same order as in the serial scheme,
+    so the results are identical.
+    The 1D DDS of the leaf nodes are independent as well.
+    """
+    dimensionality = len(split_positions)
+    for dim_idx_par in range(dimensionality - 1, 0, -1):
+        dim_idx_child = dim_idx_par - 1
+        splits_in_dim = split_positions[dim_idx_par]
+        nr_nodes_in_dim = len(splits_in_dim)
+        generating_values = generating_points[:, dim_idx_par]
+
+        # The range of the direct children of all parent nodes
+        first_child_idxs = np.empty(nr_nodes_in_dim, dtype=INT_DTYPE)
+        last_child_idxs = np.empty(nr_nodes_in_dim, dtype=INT_DTYPE)
+        nr_steps = 0
+        for node_idx_par in range(nr_nodes_in_dim):
+            first_child_idx, last_child_idx = get_direct_child_idxs(
+                dim_idx_par, node_idx_par, split_positions, subtree_sizes
+            )
+            first_child_idxs[node_idx_par] = first_child_idx
+            last_child_idxs[node_idx_par] = last_child_idx
+            nr_steps = max(nr_steps, last_child_idx - first_child_idx)
+
+        for step in range(nr_steps):
+            # Collect the independent (left, right) pairs of this step
+            nr_tasks = 0
+            for node_idx_par in range(nr_nodes_in_dim):
+                nr_tasks += max(
+                    0, last_child_idxs[node_idx_par] - first_child_idxs[node_idx_par] - step
+                )
+            node_idxs_l = np.empty(nr_tasks, dtype=INT_DTYPE)
+            node_idxs_r = np.empty(nr_tasks, dtype=INT_DTYPE)
+            task_idx = 0
+            for node_idx_par in range(nr_nodes_in_dim):
+                node_idx_l = first_child_idxs[node_idx_par] + step
+                for node_idx_r in range(node_idx_l + 1, last_child_idxs[node_idx_par] + 1):
+                    node_idxs_l[task_idx] = node_idx_l
+                    node_idxs_r[task_idx] = node_idx_r
+                    task_idx += 1
+
+            for task_idx in prange(nr_tasks):
+                node_idx_l = node_idxs_l[task_idx]
+                v_left = get_array_slice(
+                    dim_idx_child,
+                    node_idx_l,
+                    result_placeholder,
+                    split_positions,
+                    subtree_sizes,
+                )
+                pos_l = get_node_position(dim_idx_child, node_idx_l, split_positions)
+                exponent_l = exponents[pos_l, dim_idx_par]
+                project_n_update(
+                    dim_idx_child,
+                    node_idx_l,
+                    node_idxs_r[task_idx],
+                    exponent_l,
+                    v_left,
+                    result_placeholder,
+                    generating_values,
+                    split_positions,
+                    subtree_sizes,
+                    masks,
+                    exponents,
+                )
+
+    # compute the usual 1D DDS for ALL leaf nodes (independently)
+    splits_in_dim = split_positions[0]
+    nr_nodes_in_dim = len(splits_in_dim)
+    generating_values = generating_points[:, 0]
+    for node_idx in prange(nr_nodes_in_dim):
+        v_leaf = get_array_slice(
+            0,
+            node_idx,
+            result_placeholder,
+            split_positions,
+            subtree_sizes,
+        )
+        dds_1_dimensional(generating_values, v_leaf)
+
+
+@njit(parallel=True, nogil=True)
+def jit_dds_par_columns(
+    result_placeholder: ARRAY,
+    generating_points: ARRAY,
+    split_positions: TYPED_LIST,
+    subtree_sizes: TYPED_LIST,
+    masks: ARRAY,
+    exponents: ARRAY,
+) -> None:
+    """Divided difference scheme for multiple dimensions (parallel over columns)
+
+    :param result_placeholder: 2D array where the results (=Newton coefficients) should be stored.
+        Initially this array must contain the function values on the corresponding unisolvent nodes
+        (= Lagrange coefficients).
+    :param generating_points: generating points for the grid
+    :param split_positions: all the split positions
+    :param subtree_sizes: all sub tree sizes
+    :param masks: all precomputed required correspondences between left and right nodes (see :py:func:`precompute_masks`)
+        or an empty array to compute them just in time (see :py:func:`lookup_mask`)
+    :param exponents: the exponents array
+
+    Notes
+    -----
+    Works on a result placeholder. Nothing is returned.
+    The sets of coefficients (columns) are independent; the columns are split
+    into one contiguous block per thread and the serial scheme :py:func:`jit_dds`
+    is applied to each block.
+    """
+    nr_columns = result_placeholder.shape[1]
+    nr_blocks = min(get_num_threads(), nr_columns)
+    block_size = (nr_columns + nr_blocks - 1) // nr_blocks
+    for block_idx in prange(nr_blocks):
+        start = block_idx * block_size
+        end = min(start + block_size, nr_columns)
+        if start >= end:
+            continue
+        jit_dds(
+            result_placeholder[:, start:end],
+            generating_points,
+            split_positions,
+            subtree_sizes,
+            masks,
+            exponents,
+        )
+
+
+def _run_dds(
+    result_placeholder: ARRAY,
+    generating_points: ARRAY,
+    split_positions: TYPED_LIST,
+    subtree_sizes: TYPED_LIST,
+    masks: ARRAY,
+    exponents: ARRAY,
+    backend: str,
+    block_size: Optional[int] = None,
+) -> None:
+    """Runs the divided difference scheme in place with the selected backend.
+
+    :param result_placeholder: 2D array initially containing the function values
+    :param generating_points: generating points for the grid
+    :param split_positions: all the split positions
+    :param subtree_sizes: all sub tree sizes
+    :param masks: all precomputed required correspondences between left and right nodes (see :py:func:`precompute_masks`)
+        or an empty array to compute them just in time (see :py:func:`lookup_mask`)
+    :param exponents: the exponents array
+    :param backend: the computational backend, ``"numba"``, ``"numba-par"``, or ``"numba-blocked"``
+    :param block_size: the number of columns processed at once by the ``"numba-blocked"`` backend;
+        if not given, ``minterpy.global_settings.DEFAULT_DDS_BLOCK_SIZE`` is used
+    :raises NotImplementedError: if the backend is not supported
+
+    Notes
+    -----
+    With the ``"numba-par"`` backend the columns are distributed over the threads
+    if there are at least as many columns as threads; otherwise the independent
+    nodes of the tree are.
+    """
+    backend = backend.lower()
+    if backend not in SUPPORTED_BACKENDS:
+        raise NotImplementedError(f"Backend <{backend}> is not supported")
+
+    if backend == "numba-blocked":
+        if block_size is None:
+            block_size = DEFAULT_DDS_BLOCK_SIZE
+        if block_size < 1:
+            raise ValueError(f"Invalid block size <{block_size}>; must be positive")
+        jit_dds_blocked(
+            result_placeholder,
+            generating_points,
+            split_positions,
+            subtree_sizes,
+            masks,
+            exponents,
+            block_size,
+        )
+        return
+
+    if backend == "numba":
+        dds_kernel = jit_dds
+    elif result_placeholder.shape[1] >= get_num_threads():
+        dds_kernel = jit_dds_par_columns
+    else:
+        dds_kernel = jit_dds_par
+
+    dds_kernel(
+        result_placeholder,
+        generating_points,
+        split_positions,
+        subtree_sizes,
+        masks,
+        exponents,
+    )
+
+
+def _init_result_placeholder(values: ARRAY, overwrite_input: bool) -> ARRAY:
+    """Returns the 2D placeholder of the DDS initialised with the function values.
+
+    :param values: the function values (= Lagrange coefficients), a 1D or 2D array
+    :param overwrite_input: if ``True``, the values array itself is used as the placeholder
+        if possible (i.e., it is a writeable array of the floating-point type)
+    :return: a 2D array; either a copy or a view of the values
+
+    Notes
+    -----
+    Mirrors the ``overwrite_a`` option of SciPy: whether the input is actually
+    overwritten depends on its data type and it must not be used afterwards.
+    """
+    if overwrite_input and values.dtype == FLOAT_DTYPE and values.flags.writeable:
+        result_placeholder = values
+    else:
+        result_placeholder = values.copy()
+    if values.ndim == 1:
+        # ATTENTION: the DDS operates on the first dimension! -> second dimension must be 1
+        result_placeholder = result_placeholder.reshape(-1, 1)
+
+    return result_placeholder
+
+
+def dds(
+    fct_values: ARRAY,
+    tree: "MultiIndexTree",
+    backend: str = "numba",
+    block_size: Optional[int] = None,
+    overwrite_input: bool = False,
+) -> ARRAY:
     """Computes the newton coefficients for the multi dimensional polynomial using divided differences.
 
     :param fct_values: the function values on the unisolvent nodes
     :param tree: the MultiIndex tree instance
+    :param backend: the computational backend; ``"numba"`` (default) for the serial scheme,
+        ``"numba-par"`` for the parallel scheme (see :py:func:`jit_dds_par`
+        and :py:func:`jit_dds_par_columns`) for large grids or many sets of function values,
+        or ``"numba-blocked"`` for the column-blocked scheme (see :py:func:`jit_dds_blocked`)
+        for many sets of function values
+    :param block_size: the number of columns processed at once by the ``"numba-blocked"`` backend
+    :param overwrite_input: if ``True``, the function values may be overwritten by the results
+        to avoid a copy (halving the peak memory); the input must not be used afterwards
     :return: the newton coefficients of the polynomial
+    :raises NotImplementedError: if the backend is not supported
 
     """
     # TODO type checking?!
@@ -806,22 +1460,21 @@ def dds(fct_values: ARRAY, tree: "MultiIndexTree") -> ARRAY:
     # NOTE: for more memory efficiency computes the results "in place"
     # initialise the placeholder with the function values (= Lagrange coefficients
     # NOTE: the DDS function expects a 2D array as input
-    result_placeholder = fct_values.copy()
-    if fct_values.ndim == 1:
-        # ATTENTION: the DDS operates on the first dimension! -> second dimension must be 1
-        result_placeholder = result_placeholder.reshape(-1, 1)
+    result_placeholder = _init_result_placeholder(fct_values, overwrite_input)
     generating_points = tree.grid.generating_points
     split_positions = tree.split_positions
     subtree_sizes = tree.subtree_sizes
     masks = tree.stored_masks
     exponents = tree.multi_index.exponents
-    jit_dds(
+    _run_dds(
         result_placeholder,
         generating_points,
         split_positions,
         subtree_sizes,
         masks,
         exponents,
+        backend,
+        block_size,
     )
     return result_placeholder  # = Newton coefficients
 
@@ -832,7 +1485,10 @@ def dds_(
     generating_points: ARRAY,
     split_positions: TYPED_LIST,
     subtree_sizes: TYPED_LIST,
-    masks: ARRAY_DICT,
+    masks: ARRAY,
+    backend: str = "numba",
+    block_size: Optional[int] = None,
+    overwrite_input: bool = False,
 ) -> ARRAY:
     """Computes the Newton coefficients from the Lagrange coefficients.
 
@@ -854,9 +1510,24 @@ def dds_(
         The split positions of the multi-index tree.
     subtree_sizes : TYPED_LIST
         The subtree sizes of the multi-index tree.
-    masks : ARRAY_DICT
+    masks : :class:`numpy:numpy.ndarray`
         The masks that define the correspondence between left and right parts
-        of the tree.
+        of the tree (see :py:func:`precompute_masks`). If empty, the masks are
+        computed just in time during the traversal and discarded afterwards
+        (lazy mode).
+    backend : str, optional
+        The computational backend, either ``"numba"`` (default) for the serial
+        scheme, ``"numba-par"`` for the parallel scheme, or ``"numba-blocked"``
+        for the column-blocked scheme tuned for many sets of coefficients.
+    block_size : int, optional
+        The number of columns processed at once by the ``"numba-blocked"``
+        backend. If not specified,
+        ``minterpy.global_settings.DEFAULT_DDS_BLOCK_SIZE`` is used.
+    overwrite_input : bool, optional
+        If ``True``, the Lagrange coefficients may be overwritten by
+        the Newton coefficients to avoid a copy; this halves the peak memory
+        for large arrays. The input array must not be used afterwards.
+        The default is ``False``.
 
     Returns
     -------
@@ -864,6 +1535,11 @@ def dds_(
         The corresponding Newton coefficients based on the Lagrange
         coefficients and the multi-index tree.
 
+    Raises
+    ------
+    NotImplementedError
+        If the selected backend is not supported.
+
     Notes
     -----
     - This is a similar function to `dds()` but with a different interface.
@@ -872,6 +1548,8 @@ def dds_(
     - The DDS algorithm operates on a two-dimensional ``lag_coeffs`` array.
       If `lag_coeffs` is a one-dimensional array, it is reshaped to have
       a second dimension of size 1 before applying the algorithm.
+    - With ``overwrite_input=True``, the input is only overwritten if it is
+      a writeable array of ``FLOAT_DTYPE``; otherwise it is copied as usual.
     """
     # TODO type checking?!
     # check_type_n_values(fct_values)
@@ -880,17 +1558,16 @@ def dds_(
     # NOTE: for more memory efficiency computes the results "in place"
     # initialise the placeholder with the function values (= Lagrange coefficients
     # NOTE: the DDS function expects a 2D array as input
-    result_placeholder = lag_coeffs.copy()
-    if lag_coeffs.ndim == 1:
-        # ATTENTION: the DDS operates on the first dimension! -> second dimension must be 1
-        result_placeholder = result_placeholder.reshape(-1, 1)
+    result_placeholder = _init_result_placeholder(lag_coeffs, overwrite_input)
 
-    jit_dds(
+    _run_dds(
         result_placeholder,
         generating_points,
         split_positions,
         subtree_sizes,
         masks,
         exponents,
+        backend,
+        block_size,
     )
     return result_placeholder
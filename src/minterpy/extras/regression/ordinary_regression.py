@@ -461,12 +461,19 @@ def compute_regression_matrix(
         # Evaluate the Newton polynomials representing the Lagrange monomials
         # on the input points
         regression_matrix = eval_newton_polynomials(
-            xx, newton_coeffs, exponents, generating_points
+            xx,
+            newton_coeffs,
+            exponents,
+            generating_points,
+            max_exponents=basis_poly.multi_index.max_exponents,
         )
 
     elif isinstance(basis_poly, NewtonPolynomial):
         regression_matrix = eval_newton_monomials(
-            xx, exponents, generating_points
+            xx,
+            exponents,
+            generating_points,
+            max_exponents=basis_poly.multi_index.max_exponents,
         )
 
     elif isinstance(basis_poly, CanonicalPolynomial):
@@ -30,6 +30,8 @@ F_3D = FLOAT[:, :, :]
 INT = numba.from_dtype(INT_DTYPE)
 I_1D = INT[:]
 I_2D = INT[:, :]
+# NOTE: also accepts writeable arrays (e.g., memoized arrays are read-only)
+I_1D_RO = numba.types.Array(INT, 1, "A", readonly=True)
 UINT32 = numba.from_dtype(np.uint32)
 UINT64 = numba.from_dtype(np.uint64)
 
@@ -39,6 +41,22 @@ B_1D = B_TYPE[:]
 
 DEFAULT_LP_DEG = 2.0
 
+# Memory budget (in bytes) for the intermediate arrays of batched evaluations
+DEFAULT_MEMORY_BUDGET = 2**28  # 256 MiB
+
+# Number of coefficient columns processed at once by the column-blocked DDS
+DEFAULT_DDS_BLOCK_SIZE = 64
+
+# Number of chunks per CPU when evaluating a function with an executor
+DEFAULT_CHUNKS_PER_CPU = 4
+
+# Format of the Lagrange-to-Newton and Newton-to-Lagrange operators
+# ("auto" selects the format with a cost model)
+DEFAULT_OPERATOR_FORMAT = "auto"
+
+# Memory budget (in bytes) to store an automatically selected operator
+DEFAULT_OPERATOR_MEMORY_BUDGET = 2**28  # 256 MiB
+
 NOT_FOUND = -1  # meaning: exponent vector is not contained
 
 ARRAY = np.ndarray  # type: ignore
@@ -50,3 +68,5 @@ TRAFO_DICT = Dict[Tuple[int, int], ARRAY]  # type: ignore
 INT_SET = Set[int]
 DICT_TRAFO_TYPE = Tuple[TRAFO_DICT, ARRAY]  # type: ignore
 FACTORISED_TRAFO_TYPE = Tuple[ARRAY, ARRAY, ARRAY, ARRAY]  # type: ignore
+FLAT_TRAFO_TYPE = Tuple[ARRAY, ARRAY, ARRAY, ARRAY, ARRAY, ARRAY, ARRAY]  # type: ignore
+NESTED_TRAFO_TYPE = Tuple[ARRAY, ARRAY, ARRAY, ARRAY]  # type: ignore
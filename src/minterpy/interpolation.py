@@ -9,30 +9,45 @@ This represents the given function as a multidimensional (Newton) polynomial.
 Moreover, it is also possible to construct an `Interpolator` instance.
 This object precomputes and caches all the necessary ingredients
 for the interpolation of any functions.
-
-+-------------------+---------------------------------------------------------+
-| Function / Class  | Description                                             |
-+===================+=========================================================+
-| `interpolate`     | Interpolate a given function                            |
-+-------------------+---------------------------------------------------------+
-| `Interpolant`     | Class that represents an interpolated function          |
-+-------------------+---------------------------------------------------------+
-| `Interpolator`    | Class that represents interpolators for given functions |
-+-------------------+---------------------------------------------------------+
+An `AdaptiveInterpolator` instead grows the multi-index set greedily
+and evaluates the function only at the nodes it adds.
+
++------------------------+---------------------------------------------------------+
+| Function / Class       | Description                                             |
++========================+=========================================================+
+| `interpolate`          | Interpolate a given function                            |
++------------------------+---------------------------------------------------------+
+| `Interpolant`          | Class that represents an interpolated function          |
++------------------------+---------------------------------------------------------+
+| `Interpolator`         | Class that represents interpolators for given functions |
++------------------------+---------------------------------------------------------+
+| `AdaptiveInterpolator` | Class that represents adaptive (greedy) interpolators   |
++------------------------+---------------------------------------------------------+
 
 """
 
 import attr
+import numpy as np
 
+from concurrent.futures import Executor
 from typing import Callable, Optional
 
 from .core import Grid, MultiIndexSet
 from .dds import dds
+from .gen_points import gen_chebychev_2nd_order_leja_ordered
 from .polynomials import NewtonPolynomial, LagrangePolynomial
 from .transformations import NewtonToCanonical, NewtonToChebyshev
-from .global_settings import DEFAULT_LP_DEG
+from .global_settings import DEFAULT_LP_DEG, INT_DTYPE
+from .utils.arrays import eval_in_chunks
+from .utils.multi_index import gen_backward_neighbors
+from .utils.polynomials.newton import update_newton_coeffs
 
-__all__ = ["Interpolator", "Interpolant", "interpolate"]
+__all__ = [
+    "Interpolator",
+    "AdaptiveInterpolator",
+    "Interpolant",
+    "interpolate",
+]
 
 
 class InterpolationError(Exception):
@@ -74,13 +89,28 @@ class Interpolator:
     def __grid_default(self) -> Grid:
         return Grid(self.multi_index)
 
-    def __call__(self, fct: Callable) -> Optional[NewtonPolynomial]:
+    def __call__(
+        self,
+        fct: Callable,
+        backend: str = "numba",
+        overwrite_input: bool = False,
+        executor: Optional[Executor] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Optional[NewtonPolynomial]:
         """Interpolate a given function.
 
         Builds a `NewtonPolynomial` which interpolates the given `fct`, where the precomuted setting of the current instance is used.
 
-        :param fct: Function to be interpolated. Needs to be (numpy) universal function which shall be interpolated. If `arr` is an :class:`np.ndarray` with shape ``arr.shape == (N,spatial_dimension)``, the signature needs to be ``fct(arr) -> res``, where ``res`` is an :class:`np.ndarray` with shape ``(N,)``.
-        :type fct: Callable
+        :param fct: Function to be interpolated. Needs to be (numpy) universal function which shall be interpolated. If `arr` is an :class:`np.ndarray` with shape ``arr.shape == (N,spatial_dimension)``, the signature needs to be ``fct(arr) -> res``, where ``res`` is an :class:`np.ndarray` with shape ``(N,)``. A :class:`.FunctionValueCache` may be given instead to only evaluate the nodes that are not cached.
+        :type fct: Union[Callable, FunctionValueCache]
+        :param backend: Computational backend of the divided difference scheme, ``"numba"`` (default) or ``"numba-par"`` for the parallel scheme on large grids (see :py:func:`minterpy.dds.dds`).
+        :type backend: str
+        :param overwrite_input: If ``True``, the array of function values returned by ``fct`` is overwritten by the divided difference scheme to avoid a copy; only use it if ``fct`` returns a new array (and not, e.g., a view of its input).
+        :type overwrite_input: bool
+        :param executor: If given, ``fct`` is evaluated concurrently on chunks of the unisolvent nodes submitted to the executor, e.g., a :class:`concurrent.futures.ProcessPoolExecutor` (``fct`` must then be picklable); see :py:meth:`.Grid.eval_on_nodes`.
+        :type executor: concurrent.futures.Executor, optional
+        :param chunk_size: Number of nodes per call of ``fct`` if ``executor`` is given. If ``None`` (default), the nodes are split evenly into a few chunks per CPU.
+        :type chunk_size: int, optional
 
         :return: Interpolation polynomial in Newton form, which interpolates the function ``fct``, where the used divided difference scheme is build from ``self.multi_index`` and ``self.grid``.
         :rtype: NewtonPolynomial
@@ -88,15 +118,190 @@ class Interpolator:
         :raises InterpolationError: Raised if anything goes wrong with the interpolation.
         """
         try:
-            fct_values = self.grid(fct)
+            fct_values = self.grid.eval_on_nodes(
+                fct,
+                executor=executor,
+                chunk_size=chunk_size,
+            )
             # NOTE: Don't use np.squeeze as DDS results may be of shape (1,1)
-            interpol_coeffs = dds(fct_values, self.grid.tree).reshape(-1)
+            interpol_coeffs = dds(
+                fct_values,
+                self.grid.tree,
+                backend=backend,
+                overwrite_input=overwrite_input,
+            ).reshape(-1)
         except Exception as e:
             raise InterpolationError(e) from e
 
         return NewtonPolynomial(self.multi_index, interpol_coeffs)
 
 
+@attr.s(frozen=True, order=False, eq=False)
+class AdaptiveInterpolator:
+    """The construction class for adaptive (greedy) interpolation.
+
+    Instead of interpolating on a fixed multi-index set, the multi-index set
+    is grown greedily, one admissible exponent at a time, where the exponents
+    with the largest hierarchical surplus (i.e., the magnitude of
+    the Newton coefficient) are refined first. The function is only evaluated
+    at the unisolvent nodes of the added exponents.
+
+    Attributes
+    ----------
+    spatial_dimension : dimension of the domain space.
+    max_degree : maximum exponent of the interpolation polynomials in any dimension.
+    lp_degree : degree of the :math:`l_p` norm assigned to the resulting multi index set.
+    generating_points : Leja-ordered Chebyshev points of degree `max_degree`; the unisolvent nodes of every multi index set are taken from them (nested grids).
+
+    Notes
+    -----
+    - The candidates of the refinement (the active set) are the forward
+      neighbors of the accepted exponents whose backward neighbors are
+      all accepted. The union of the accepted and the active exponents
+      is downward-closed.
+    - Since the Newton interpolant is hierarchical, the coefficient of
+      a candidate only depends on the accepted exponents; it is computed
+      once, when the candidate is evaluated
+      (see :py:func:`~minterpy.utils.polynomials.newton.update_newton_coeffs`).
+    - A surplus may vanish by symmetry (e.g., for an even function, as
+      the generating points are symmetric); with a positive tolerance,
+      the refinement may then stop early.
+    """
+
+    spatial_dimension: int = attr.ib()
+    max_degree: int = attr.ib()
+    lp_degree: float = attr.ib(default=DEFAULT_LP_DEG)
+
+    generating_points = attr.ib(init=False, repr=False)
+
+    @generating_points.default
+    def __generating_points_default(self) -> np.ndarray:
+        gen_points = gen_chebychev_2nd_order_leja_ordered(self.max_degree)
+        return np.tile(gen_points.reshape(-1, 1), (1, self.spatial_dimension))
+
+    def __call__(
+        self,
+        fct: Callable,
+        tol: float = 0.0,
+        max_evals: Optional[int] = None,
+        batch_size: int = 1,
+        executor: Optional[Executor] = None,
+        chunk_size: Optional[int] = None,
+    ) -> NewtonPolynomial:
+        """Adaptively interpolate a given function.
+
+        :param fct: Function to be interpolated. If `arr` is an :class:`np.ndarray` with shape ``arr.shape == (N,spatial_dimension)``, the signature needs to be ``fct(arr) -> res``, where ``res`` is an :class:`np.ndarray` with shape ``(N,)`` (or ``(N, p)`` for multiple functions).
+        :type fct: Callable
+        :param tol: The refinement stops once the largest surplus of the candidates is smaller than ``tol``. Defaults to ``0.0``.
+        :type tol: float
+        :param max_evals: Maximum number of function evaluations. If ``None`` (default), the refinement is only bounded by ``max_degree``.
+        :type max_evals: int, optional
+        :param batch_size: Number of candidates refined in each step; their forward neighbors are evaluated in a single call of ``fct`` (or ``executor``). Defaults to ``1``.
+        :type batch_size: int
+        :param executor: If given, the new unisolvent nodes of each step are submitted to the executor in chunks of ``chunk_size`` nodes, e.g., in a :class:`concurrent.futures.ProcessPoolExecutor` (``fct`` must then be picklable).
+        :type executor: concurrent.futures.Executor, optional
+        :param chunk_size: Number of nodes per call of ``fct`` if ``executor`` is given. If ``None`` (default), the new nodes of each step are split evenly into a few chunks per CPU.
+        :type chunk_size: int, optional
+
+        :return: Interpolation polynomial in Newton form on the downward-closed multi index set of all the evaluated exponents.
+        :rtype: NewtonPolynomial
+
+        :raises ValueError: If ``max_evals``, ``batch_size``, or ``chunk_size`` is smaller than one.
+        :raises InterpolationError: Raised if anything goes wrong with the interpolation.
+        """
+        if max_evals is not None and max_evals < 1:
+            raise ValueError(f"max_evals must be positive (got {max_evals})")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive (got {batch_size})")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive (got {chunk_size})")
+
+        try:
+            exponents, coeffs = self._refine(
+                fct, tol, max_evals, batch_size, executor, chunk_size
+            )
+        except Exception as e:
+            raise InterpolationError(e) from e
+
+        order = np.lexsort(exponents.T)
+        multi_index = MultiIndexSet(exponents[order], self.lp_degree)
+        grid = Grid.from_points(multi_index, self.generating_points)
+
+        return NewtonPolynomial(multi_index, coeffs[order], grid=grid)
+
+    def _refine(self, fct, tol, max_evals, batch_size, executor, chunk_size):
+        """Run the greedy refinement; return the exponents and coefficients."""
+        num_dim = self.spatial_dimension
+        gen_points = self.generating_points
+        exponents = np.empty((0, num_dim), dtype=INT_DTYPE)
+        coeffs = None
+        accepted = set()
+        active = {}  # exponent -> position in `exponents`
+        num_evals = 0
+
+        candidates = np.zeros((1, num_dim), dtype=INT_DTYPE)
+        while True:
+            if len(candidates) > 0:
+                # Evaluate the function only at the nodes of the candidates
+                nodes = gen_points[candidates, np.arange(num_dim)]
+                fct_values = np.asarray(
+                    eval_in_chunks(fct, nodes, executor, chunk_size)
+                )
+                if coeffs is None:
+                    coeffs = np.empty((0,) + fct_values.shape[1:])
+                new_coeffs = update_newton_coeffs(
+                    coeffs, exponents, candidates, fct_values, gen_points
+                )
+                for i, candidate in enumerate(candidates):
+                    active[tuple(candidate)] = len(exponents) + i
+                exponents = np.concatenate((exponents, candidates))
+                coeffs = np.concatenate((coeffs, new_coeffs))
+                num_evals += len(candidates)
+
+            if not active or (max_evals is not None and num_evals >= max_evals):
+                break
+
+            # Accept the candidates with the largest surpluses
+            positions = np.fromiter(active.values(), dtype=INT_DTYPE)
+            surpluses = np.abs(coeffs[positions].reshape(len(positions), -1))
+            surpluses = surpluses.max(axis=1)
+            selected = np.argsort(-surpluses, kind="stable")[:batch_size]
+            selected = positions[selected[surpluses[selected] >= tol]]
+            if len(selected) == 0:
+                break
+            for position in selected:
+                exponent = tuple(exponents[position])
+                del active[exponent]
+                accepted.add(exponent)
+
+            # New candidates: the admissible forward neighbors
+            new_candidates = {}
+            for position in selected:
+                for j in range(num_dim):
+                    forward = exponents[position].copy()
+                    forward[j] += 1
+                    key = tuple(forward)
+                    if (
+                        forward[j] > self.max_degree
+                        or key in active
+                        or key in new_candidates
+                    ):
+                        continue
+                    if all(
+                        tuple(backward) in accepted
+                        for backward in gen_backward_neighbors(forward)
+                    ):
+                        new_candidates[key] = forward
+            candidates = np.array(
+                list(new_candidates.values()),
+                dtype=INT_DTYPE,
+            ).reshape(-1, num_dim)
+            if max_evals is not None:
+                candidates = candidates[: max_evals - num_evals]
+
+        return exponents, coeffs
+
+
 @attr.s(frozen=True, order=False, eq=False)
 class Interpolant:
     """Data type representing the result of an interpolation.
@@ -107,18 +312,34 @@ class Interpolant:
     ----------
     fct : Function to be interpolated. Needs to be (numpy) universal function which shall be interpolated. If `arr` is an :class:`np.ndarray` with shape ``arr.shape == (N,spatial_dimension)``, the signature needs to be ``fct(arr) -> res``, where ``res`` is an :class:`np.ndarray` with shape ``(N,)``.
     interpolator : Instance of :class:`Interpolator`, which represents the interpolation scheme to be used.
+    executor : Optional executor to evaluate `fct` concurrently on chunks of the unisolvent nodes (see :py:meth:`Interpolator.__call__`).
+    chunk_size : Optional number of nodes per call of `fct` if `executor` is given.
     """
 
     fct: Callable = attr.ib(repr=False)
     interpolator: Interpolator = attr.ib(repr=False)
+    executor: Optional[Executor] = attr.ib(default=None, repr=False)
+    chunk_size: Optional[int] = attr.ib(default=None, repr=False)
     __interpolation_poly: NewtonPolynomial = attr.ib(init=False, repr=False)
 
     @__interpolation_poly.default
     def __interpolation_poly_default(self):
-        return self.interpolator(self.fct)
+        return self.interpolator(
+            self.fct,
+            executor=self.executor,
+            chunk_size=self.chunk_size,
+        )
 
     @classmethod
-    def from_degree(cls, fct, spatial_dimension, poly_degree, lp_degree):
+    def from_degree(
+        cls,
+        fct,
+        spatial_dimension,
+        poly_degree,
+        lp_degree,
+        executor=None,
+        chunk_size=None,
+    ):
         """Custom constructor of an interpolant using dimensionality and degree parameter.
 
         :param fct: Function to be interpolated. Needs to be (numpy) universal function which shall be interpolated. If `arr` is an :class:`np.ndarray` with shape ``arr.shape == (N,spatial_dimension)``, the signature needs to be ``fct(arr) -> res``, where ``res`` is an :class:`np.ndarray` with shape ``(N,)``.
@@ -130,11 +351,20 @@ class Interpolant:
         :type poly_degree: int
         :param lp_degree: degree of the :math:`l_p` norm used to determine the `poly_degree`.
         :type lp_degree: int
+        :param executor: executor to evaluate ``fct`` concurrently on chunks of the unisolvent nodes (see :py:meth:`Interpolator.__call__`).
+        :type executor: concurrent.futures.Executor, optional
+        :param chunk_size: number of nodes per call of ``fct`` if ``executor`` is given.
+        :type chunk_size: int, optional
 
         :return: The interpolant of ``fct`` using the default interpolator build from ``(spatial_dimension, poly_degree, lp_degree)``.
         :rtype: Interpolant
         """
-        return cls(fct, Interpolator(spatial_dimension, poly_degree, lp_degree))
+        return cls(
+            fct,
+            Interpolator(spatial_dimension, poly_degree, lp_degree),
+            executor=executor,
+            chunk_size=chunk_size,
+        )
 
     @property
     def spatial_dimension(self):
@@ -169,7 +399,11 @@ class Interpolant:
     @property
     def lagrange_coeffs(self):
         """Return the Lagrange coefficients of the interpolating polynomial."""
-        return self.interpolator.grid(self.fct)
+        return self.interpolator.grid.eval_on_nodes(
+            self.fct,
+            executor=self.executor,
+            chunk_size=self.chunk_size,
+        )
 
     def to_newton(self):
         """Return the interpolant as a polynomial in the Newton basis."""
@@ -203,7 +437,14 @@ class Interpolant:
         return self.__interpolation_poly(pts)
 
 
-def interpolate(fct, spatial_dimension, poly_degree, lp_degree=DEFAULT_LP_DEG):
+def interpolate(
+    fct,
+    spatial_dimension,
+    poly_degree,
+    lp_degree=DEFAULT_LP_DEG,
+    executor=None,
+    chunk_size=None,
+):
     """Interpolate a given function.
 
     Return an interpolant, which represents the given function on the domain :math:`[-1, 1]^d`, where :math:`d` is the dimension of the domain space.
@@ -219,8 +460,19 @@ def interpolate(fct, spatial_dimension, poly_degree, lp_degree=DEFAULT_LP_DEG):
     :type poly_degree: int
     :param lp_degree: degree of the :math:`l_p` norm used to determine the `poly_degree`.
     :type lp_degree: int
+    :param executor: executor (e.g., a :class:`concurrent.futures.ProcessPoolExecutor`) to evaluate ``fct`` concurrently on chunks of the unisolvent nodes; ``fct`` must then be picklable.
+    :type executor: concurrent.futures.Executor, optional
+    :param chunk_size: number of nodes per call of ``fct`` if ``executor`` is given. If ``None`` (default), the nodes are split evenly into a few chunks per CPU.
+    :type chunk_size: int, optional
 
     :return: The interpolant of ``fct`` using the default interpolator build from ``(spatial_dimension, poly_degree, lp_degree)``.
     :rtype: Interpolant
     """
-    return Interpolant.from_degree(fct, spatial_dimension, poly_degree, lp_degree)
+    return Interpolant.from_degree(
+        fct,
+        spatial_dimension,
+        poly_degree,
+        lp_degree,
+        executor=executor,
+        chunk_size=chunk_size,
+    )
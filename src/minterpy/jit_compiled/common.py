@@ -8,7 +8,7 @@ within a JIT-compiled function.
 """
 import numpy as np
 
-from numba import njit
+from numba import njit, void
 
 from minterpy.global_settings import (
     UINT32,
@@ -18,6 +18,7 @@ from minterpy.global_settings import (
     I_2D,
     F_1D,
     F_2D,
+    F_3D,
 )
 
 
@@ -188,3 +189,67 @@ def get_max_columnwise(xx: np.ndarray) -> np.ndarray:
         out[j] = np.max(xx[:, j])
 
     return out
+
+
+@njit(void(F_3D, F_2D, I_1D, I_1D, I_1D, F_2D), cache=True)
+def eval_polynomials_sparse(
+    tables: np.ndarray,
+    coefficients: np.ndarray,
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    values: np.ndarray,
+    output_placeholder: np.ndarray,
+) -> None:
+    """Evaluate polynomials with sparse (CSR) exponents from 1D lookup tables.
+
+    The following notations are used below:
+
+    - ``m``: the spatial dimension of the polynomial
+    - ``n``: the maximum exponent in any dimension
+    - ``N``: the number of elements in the multi-index set (i.e., monomials)
+    - ``nnz``: the number of nonzero exponents
+    - ``p``: the number of polynomials (i.e., number of coefficient sets)
+    - ``k``: the number of query points
+
+    Parameters
+    ----------
+    tables : :class:`numpy:numpy.ndarray`
+        The values of the one-dimensional basis polynomials at the query
+        points, an array of shape ``(k, n + 1, m)``; ``tables[i, e, j]`` is
+        the value of the one-dimensional polynomial of degree ``e``
+        in dimension ``j`` at the ``i``-th query point.
+        The polynomials of degree zero must be constant one.
+    coefficients : :class:`numpy:numpy.ndarray`
+        The coefficients of the polynomials, an ``(N, p)`` array.
+    indptr : :class:`numpy:numpy.ndarray`
+        The row pointers of the exponents in the CSR format, an array
+        of length ``N + 1``.
+    indices : :class:`numpy:numpy.ndarray`
+        The dimensions of the nonzero exponents, an array of length ``nnz``.
+    values : :class:`numpy:numpy.ndarray`
+        The values of the nonzero exponents, an array of length ``nnz``.
+    output_placeholder : :class:`numpy:numpy.ndarray`
+        The placeholder for the values of the polynomials, an ``(k, p)``
+        array; the values are stored in-place.
+
+    Notes
+    -----
+    - Only the nonzero exponents are visited, the cost per query point is
+      :math:`O(nnz + Np)` instead of :math:`O(Nm + Np)`.
+    - The monomial of an all-zero multi-index evaluates to one.
+    """
+    num_points = tables.shape[0]
+    num_monomials = len(indptr) - 1
+    num_polynomials = coefficients.shape[1]
+
+    for i in range(num_points):
+        for q in range(num_polynomials):
+            output_placeholder[i, q] = 0.0
+
+        for j in range(num_monomials):
+            monomial = 1.0
+            for idx in range(indptr[j], indptr[j + 1]):
+                monomial *= tables[i, values[idx], indices[idx]]
+
+            for q in range(num_polynomials):
+                output_placeholder[i, q] += monomial * coefficients[j, q]
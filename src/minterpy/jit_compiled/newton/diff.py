@@ -15,6 +15,7 @@ from minterpy.global_settings import (
     F_2D,
     F_1D,
     I_1D,
+    I_1D_RO,
     FLOAT,
     FLOAT_DTYPE,
     INT_DTYPE,
@@ -24,7 +25,6 @@ from minterpy.global_settings import (
 from minterpy.jit_compiled.common import (
     combinations_iter,
     dot,
-    get_max_columnwise,
     n_choose_r,
 )
 
@@ -154,7 +154,7 @@ def create_lua_differentiated(
     return res_sum
 
 
-@njit(void(F_1D, I_1D, F_2D, I_1D, F_2D))
+@njit(void(F_1D, I_1D_RO, F_2D, I_1D, F_2D))
 def create_lut_differentiated(
     x: np.ndarray,
     max_exponents: np.ndarray,
@@ -346,7 +346,7 @@ def compute_monomials_from_lut(
         monomials_placeholder[i] = newt_mon_val
 
 
-@njit(void(F_1D, I_2D, I_1D, F_2D, I_1D, F_2D, F_1D))
+@njit(void(F_1D, I_2D, I_1D_RO, F_2D, I_1D, F_2D, F_1D))
 def eval_monomials_single_query(
     x: np.ndarray,
     exponents: np.ndarray,
@@ -430,13 +430,14 @@ def eval_monomials_single_query(
     )
 
 
-@njit(F_2D(F_2D, F_2D, I_2D, F_2D, I_1D), cache=True)
+@njit(F_2D(F_2D, F_2D, I_2D, F_2D, I_1D, I_1D_RO), cache=True)
 def eval_multiple_query(
     xx: np.ndarray,
     coefficients: np.ndarray,
     exponents: np.ndarray,
     generating_points: np.ndarray,
     derivative_order_along: np.ndarray,
+    max_exponents: np.ndarray,
 ) -> np.ndarray:
     """Evaluate the derivative of Newton poly(s) on multiple query points.
 
@@ -468,6 +469,10 @@ def eval_multiple_query(
         For example, the array ``np.array([2, 3, 1])`` specifies the 2nd-order,
         3rd-order, and 1st-order derivatives along the 1st, 2nd, and 3rd
         dimension, respectively.
+    max_exponents : :class:`numpy:numpy.ndarray`
+        The maximum exponents in the multi-index set for each dimension given
+        as one-dimensional non-negative integer array of length ``m``
+        (e.g., the memoized :py:attr:`.MultiIndexSet.max_exponents`).
 
     Returns
     -------
@@ -494,8 +499,6 @@ def eval_multiple_query(
     m = xx.shape[1]
     num_monomials = len(exponents)
 
-    # Compute the column-wise maximum of the exponents to avoid re-computation
-    max_exponents = get_max_columnwise(exponents)
     num_prods = np.max(max_exponents) + 1  # Maximum number of product terms
 
     # Create the output array
@@ -526,13 +529,14 @@ def eval_multiple_query(
     return output
 
 
-@njit(F_2D(F_2D, F_2D, I_2D, F_2D, I_1D), parallel=True, nogil=True)
+@njit(F_2D(F_2D, F_2D, I_2D, F_2D, I_1D, I_1D_RO), parallel=True, nogil=True)
 def eval_multiple_query_par(
     xx: np.ndarray,
     coefficients: np.ndarray,
     exponents: np.ndarray,
     generating_points: np.ndarray,
     derivative_order_along: np.ndarray,
+    max_exponents: np.ndarray,
 ) -> np.ndarray:
     """Evaluate the derivative of Newton polynomial(s) on multiple query points
     in parallel.
@@ -565,6 +569,10 @@ def eval_multiple_query_par(
         For example, the array ``np.array([2, 3, 1])`` specifies the 2nd-order,
         3rd-order, and 1st-order derivatives along the 1st, 2nd, and 3rd
         dimension, respectively.
+    max_exponents : :class:`numpy:numpy.ndarray`
+        The maximum exponents in the multi-index set for each dimension given
+        as one-dimensional non-negative integer array of length ``m``
+        (e.g., the memoized :py:attr:`.MultiIndexSet.max_exponents`).
 
     Returns
     -------
@@ -595,8 +603,6 @@ def eval_multiple_query_par(
     m = xx.shape[1]
     num_monomials = len(exponents)
 
-    # Compute the column-wise maximum of the exponents to avoid re-computation
-    max_exponents = get_max_columnwise(exponents)
     num_prods = np.max(max_exponents) + 1  # Maximum number of product terms
 
     # Create the output array
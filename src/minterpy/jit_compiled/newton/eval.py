@@ -1,49 +1,49 @@
 import numpy as np
-from numba import njit, void
+from numba import get_num_threads, njit, prange, void
 
-from minterpy.global_settings import F_1D, I_2D, F_2D, I_1D, B_TYPE
+from minterpy.global_settings import (
+    F_1D,
+    I_2D,
+    F_2D,
+    I_1D,
+    I_1D_RO,
+    B_TYPE,
+    FLOAT_DTYPE,
+    INT_DTYPE,
+)
 
 
-@njit(void(F_1D, I_2D, F_2D, I_1D, F_2D, F_1D), cache=True)  # O(Nm)
-def eval_newton_monomials_single(
+@njit(void(F_1D, F_2D, I_1D_RO, F_2D), cache=True)  # O(nm)
+def eval_newton_products_single(
     x_single,
-    exponents,
     generating_points,
     max_exponents,
     products_placeholder,
-    monomials_placeholder,
 ) -> None:
-    """Precomputes the value of all given Newton basis polynomials at a point.
+    """Precomputes the (chained) products of all one-dimensional Newton monomials at a point.
 
-    Core of the fast polynomial evaluation algorithm.
     - ``m`` spatial dimension
-    - ``N`` number of monomials
     - ``n`` maximum exponent in each dimension
 
     :param x_single: coordinates of the point. The shape has to be ``m``.
-    :param exponents: numpy array with exponents for the polynomial. The shape has to be ``(N x m)``.
     :param generating_points: generating points used to generate the grid. The shape is ``(n x m)``.
     :param max_exponents: array with maximum exponent in each dimension. The shape has to be ``m``.
     :param products_placeholder: a numpy array for storing the (chained) products.
-    :param monomials_placeholder: a numpy array of length N for storing the values of all Newton basis polynomials.
 
     Notes
     -----
     - This is a Numba-accelerated function.
-    - The function precompute all the (chained) products required during Newton evaluation for a single query point
-      with complexity of ``O(mN)``.
-    - The (pre-)computation of Newton monomials is coefficient agnostic.
-    - Results are stored in the placeholder arrays. The function returns None.
+    - The row ``j`` (``j > 0``) of the products placeholder contains
+      the value of the ``j``-th one-dimensional Newton monomial in each
+      dimension. The first row is never accessed.
+    - Results are stored in the placeholder array. The function returns None.
     """
-
     # NOTE: the maximal exponent might be different in every dimension,
     #    in this case the matrix becomes sparse (towards the end)
     # NOTE: avoid index shifting during evaluation (has larger complexity than pre-computation!)
     #    by just adding one empty row in front. ATTENTION: these values must not be accessed!
     #    -> the exponents of each monomial ("alpha") then match the indices of the required products
-
-    # Create the products matrix
-    m = exponents.shape[1]
+    m = len(x_single)
     for i in range(m):
         max_exp_in_dim = max_exponents[i]
         x_i = x_single[i]
@@ -56,7 +56,49 @@ def eval_newton_monomials_single(
             exponent = j + 1  # NOTE: otherwise the result type is float
             products_placeholder[exponent, i] = prod
 
+
+@njit(void(F_1D, I_2D, F_2D, I_1D_RO, F_2D, F_1D), cache=True)  # O(Nm)
+def eval_newton_monomials_single(
+    x_single,
+    exponents,
+    generating_points,
+    max_exponents,
+    products_placeholder,
+    monomials_placeholder,
+) -> None:
+    """Precomputes the value of all given Newton basis polynomials at a point.
+
+    Core of the fast polynomial evaluation algorithm.
+    - ``m`` spatial dimension
+    - ``N`` number of monomials
+    - ``n`` maximum exponent in each dimension
+
+    :param x_single: coordinates of the point. The shape has to be ``m``.
+    :param exponents: numpy array with exponents for the polynomial. The shape has to be ``(N x m)``.
+    :param generating_points: generating points used to generate the grid. The shape is ``(n x m)``.
+    :param max_exponents: array with maximum exponent in each dimension. The shape has to be ``m``.
+    :param products_placeholder: a numpy array for storing the (chained) products.
+    :param monomials_placeholder: a numpy array of length N for storing the values of all Newton basis polynomials.
+
+    Notes
+    -----
+    - This is a Numba-accelerated function.
+    - The function precompute all the (chained) products required during Newton evaluation for a single query point
+      with complexity of ``O(mN)``.
+    - The (pre-)computation of Newton monomials is coefficient agnostic.
+    - Results are stored in the placeholder arrays. The function returns None.
+    """
+
+    # Create the products matrix
+    eval_newton_products_single(
+        x_single,
+        generating_points,
+        max_exponents,
+        products_placeholder,
+    )
+
     # evaluate all Newton polynomials. O(Nm)
+    m = exponents.shape[1]
     N = exponents.shape[0]
     for j in range(N):
         # the exponents of each monomial ("alpha")
@@ -72,7 +114,7 @@ def eval_newton_monomials_single(
     #NOTE: results have been stored in the numpy arrays. no need to return anything.
 
 
-@njit(void(F_2D, I_2D, F_2D, I_1D, F_2D, F_2D, B_TYPE), cache=True)
+@njit(void(F_2D, I_2D, F_2D, I_1D_RO, F_2D, F_2D, B_TYPE), cache=True)
 def eval_newton_monomials_multiple(
     xx: np.ndarray,
     exponents: np.ndarray,
@@ -154,3 +196,697 @@ def eval_newton_monomials_multiple(
             products_placeholder,
             monomials_placeholder_single
         )
+
+
+@njit(void(F_2D, I_2D, F_2D, I_1D_RO, F_2D), parallel=True, nogil=True)
+def eval_newton_monomials_multiple_par(
+    xx: np.ndarray,
+    exponents: np.ndarray,
+    generating_points: np.ndarray,
+    max_exponents: np.ndarray,
+    monomials_placeholder: np.ndarray,
+) -> None:
+    """Evaluate the Newton monomials at multiple query points in parallel.
+
+    The following notations are used below:
+
+    - ``k``: the number of query (evaluation) points
+    - ``m``: the spatial dimension of the polynomial
+    - ``n``: the (maximum) degree of the polynomial in any dimension
+    - ``N``: the number of elements in the multi-index set (i.e., monomials)
+
+    Parameters
+    ----------
+    xx : :class:`numpy:numpy.ndarray`
+        The set of query points at which the monomials are evaluated;
+        the values are given in a two-dimensional array of shape ``(k, m)``.
+    exponents : :class:`numpy:numpy.ndarray`
+        Set of exponents given as a two-dimensional non-negative integer array
+        of shape ``(N, m)``.
+    generating_points : :class:`numpy:numpy.ndarray`
+        Interpolation points for each dimension given as a two-dimensional
+        array of shape ``(n + 1, m)``.
+    max_exponents : :class:`numpy:numpy.ndarray`
+        The maximum exponent values in each dimension as a one-dimensional
+        array of length ``m``; this is to avoid re-computation.
+    monomials_placeholder : :class:`numpy:numpy.ndarray`
+        The placeholder for the values of the Newton monomials evaluated
+        at the query points, a two-dimensional array of shape ``(k, N)``.
+
+    Notes
+    -----
+    - The query points are split into (contiguous) chunks, one per thread.
+      Each thread allocates its own placeholder for the (chained) products
+      once and reuses it for all the query points of its chunk.
+    - Unlike :py:func:`eval_newton_monomials_multiple`, there is no
+      ``triangular`` option; the parallel variant is meant for evaluating
+      the monomials on a large number of arbitrary query points.
+    - This function is compiled (NJIT-ted) and executed in parallel
+      with the help of Numba.
+    - Results are stored in the placeholder arrays. The function returns None.
+
+    See Also
+    --------
+    minterpy.jit_compiled.newton.eval.eval_newton_monomials_multiple
+        Evaluation of the Newton monomials at multiple query points
+        on a single CPU.
+    """
+    n_points = xx.shape[0]
+    m = exponents.shape[1]
+    num_prods = np.max(max_exponents) + 1  # Maximum number of product terms
+
+    # Split the query points into one chunk per thread
+    num_chunks = min(get_num_threads(), n_points)
+    if num_chunks == 0:
+        return
+    chunk_size = (n_points + num_chunks - 1) // num_chunks
+
+    for chunk_idx in prange(num_chunks):
+        # Per-thread placeholder for the (chained) products
+        products_placeholder = np.empty(
+            shape=(num_prods, m),
+            dtype=FLOAT_DTYPE,
+        )
+        start_idx = chunk_idx * chunk_size
+        end_idx = min(start_idx + chunk_size, n_points)
+        for idx in range(start_idx, end_idx):
+            eval_newton_monomials_single(
+                xx[idx, :],
+                exponents,
+                generating_points,
+                max_exponents,
+                products_placeholder,
+                monomials_placeholder[idx],
+            )
+
+
+@njit(void(F_1D, F_2D, I_2D, F_2D, I_1D_RO, F_2D, F_1D), cache=True)  # O(Nm + Np)
+def eval_newton_polynomials_single(
+    x_single: np.ndarray,
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    generating_points: np.ndarray,
+    max_exponents: np.ndarray,
+    products_placeholder: np.ndarray,
+    output_placeholder: np.ndarray,
+) -> None:
+    """Evaluate the Newton polynomial(s) at a single query point.
+
+    The following notations are used below:
+
+    - ``m``: the spatial dimension of the polynomial
+    - ``n``: the (maximum) degree of the polynomial in any dimension
+    - ``N``: the number of elements in the multi-index set (i.e., monomials)
+    - ``p``: the number of polynomials (i.e., number of coefficient sets)
+
+    Parameters
+    ----------
+    x_single : :class:`numpy:numpy.ndarray`
+        The query point, a one-dimensional array of length ``m``.
+    coefficients : :class:`numpy:numpy.ndarray`
+        The coefficients of the Newton polynomial(s);
+        the values are given in a two-dimensional array of shape ``(N, p)``.
+    exponents : :class:`numpy:numpy.ndarray`
+        Set of exponents given as a two-dimensional non-negative integer array
+        of shape ``(N, m)``.
+    generating_points : :class:`numpy:numpy.ndarray`
+        Interpolation points for each dimension given as a two-dimensional
+        array of shape ``(n + 1, m)``.
+    max_exponents : :class:`numpy:numpy.ndarray`
+        The maximum exponent values in each dimension as a one-dimensional
+        array of length ``m``; this is to avoid re-computation.
+    products_placeholder : :class:`numpy:numpy.ndarray`
+        A placeholder for the (chained) products of the one-dimensional
+        Newton monomials, a two-dimensional array of shape ``(n + 1, m)``.
+    output_placeholder : :class:`numpy:numpy.ndarray`
+        The placeholder for the values of the polynomial(s) at the query point,
+        a one-dimensional array of length ``p``.
+
+    Notes
+    -----
+    - The value of each Newton monomial is contracted with its coefficients
+      right away and accumulated in the output; the values of the monomials
+      are never stored.
+    - This function is compiled (NJIT-ted) with the help of Numba.
+    - Results are stored in the placeholder arrays. The function returns None.
+    """
+    eval_newton_products_single(
+        x_single,
+        generating_points,
+        max_exponents,
+        products_placeholder,
+    )
+
+    num_monomials, m = exponents.shape
+    num_polys = coefficients.shape[1]
+    output_placeholder[:] = 0.0  # additive identity
+    for j in range(num_monomials):
+        newt_mon_val = 1.0  # multiplicative identity
+        for i in range(m):
+            exp = exponents[j, i]
+            # NOTE: an exponent of 0 should not cause a multiplication
+            if exp > 0:
+                newt_mon_val *= products_placeholder[exp, i]
+        for k in range(num_polys):
+            output_placeholder[k] += coefficients[j, k] * newt_mon_val
+
+
+@njit(void(F_2D, F_2D, I_2D, F_2D, I_1D_RO, F_2D, F_2D), cache=True)
+def eval_newton_polynomials_multiple(
+    xx: np.ndarray,
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    generating_points: np.ndarray,
+    max_exponents: np.ndarray,
+    products_placeholder: np.ndarray,
+    output_placeholder: np.ndarray,
+) -> None:
+    """Evaluate the Newton polynomial(s) at multiple query points.
+
+    The following notations are used below:
+
+    - ``k``: the number of query (evaluation) points
+    - ``m``: the spatial dimension of the polynomial
+    - ``n``: the (maximum) degree of the polynomial in any dimension
+    - ``N``: the number of elements in the multi-index set (i.e., monomials)
+    - ``p``: the number of polynomials (i.e., number of coefficient sets)
+
+    Parameters
+    ----------
+    xx : :class:`numpy:numpy.ndarray`
+        The set of query points at which the polynomials are evaluated;
+        the values are given in a two-dimensional array of shape ``(k, m)``.
+    coefficients : :class:`numpy:numpy.ndarray`
+        The coefficients of the Newton polynomial(s);
+        the values are given in a two-dimensional array of shape ``(N, p)``.
+    exponents : :class:`numpy:numpy.ndarray`
+        Set of exponents given as a two-dimensional non-negative integer array
+        of shape ``(N, m)``.
+    generating_points : :class:`numpy:numpy.ndarray`
+        Interpolation points for each dimension given as a two-dimensional
+        array of shape ``(n + 1, m)``.
+    max_exponents : :class:`numpy:numpy.ndarray`
+        The maximum exponent values in each dimension as a one-dimensional
+        array of length ``m``; this is to avoid re-computation.
+    products_placeholder : :class:`numpy:numpy.ndarray`
+        A placeholder for the (chained) products of the one-dimensional
+        Newton monomials, a two-dimensional array of shape ``(n + 1, m)``.
+    output_placeholder : :class:`numpy:numpy.ndarray`
+        The placeholder for the values of the polynomial(s) at the query
+        points, a two-dimensional array of shape ``(k, p)``.
+
+    Notes
+    -----
+    - Unlike :py:func:`eval_newton_monomials_multiple`, the ``(k, N)`` matrix
+      of the Newton monomials evaluated at the query points is never
+      materialized. The memory footprint is ``O(kp + nm)`` instead
+      of ``O(kN)``.
+    - This function is compiled (NJIT-ted) with the help of Numba.
+    - Results are stored in the placeholder arrays. The function returns None.
+    """
+    n_points = xx.shape[0]
+    for idx in range(n_points):
+        eval_newton_polynomials_single(
+            xx[idx, :],
+            coefficients,
+            exponents,
+            generating_points,
+            max_exponents,
+            products_placeholder,
+            output_placeholder[idx],
+        )
+
+
+@njit(void(F_2D, F_2D, I_2D, F_2D, I_1D_RO, F_2D), parallel=True, nogil=True)
+def eval_newton_polynomials_multiple_par(
+    xx: np.ndarray,
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    generating_points: np.ndarray,
+    max_exponents: np.ndarray,
+    output_placeholder: np.ndarray,
+) -> None:
+    """Evaluate the Newton polynomial(s) at multiple query points in parallel.
+
+    The following notations are used below:
+
+    - ``k``: the number of query (evaluation) points
+    - ``m``: the spatial dimension of the polynomial
+    - ``n``: the (maximum) degree of the polynomial in any dimension
+    - ``N``: the number of elements in the multi-index set (i.e., monomials)
+    - ``p``: the number of polynomials (i.e., number of coefficient sets)
+
+    Parameters
+    ----------
+    xx : :class:`numpy:numpy.ndarray`
+        The set of query points at which the polynomials are evaluated;
+        the values are given in a two-dimensional array of shape ``(k, m)``.
+    coefficients : :class:`numpy:numpy.ndarray`
+        The coefficients of the Newton polynomial(s);
+        the values are given in a two-dimensional array of shape ``(N, p)``.
+    exponents : :class:`numpy:numpy.ndarray`
+        Set of exponents given as a two-dimensional non-negative integer array
+        of shape ``(N, m)``.
+    generating_points : :class:`numpy:numpy.ndarray`
+        Interpolation points for each dimension given as a two-dimensional
+        array of shape ``(n + 1, m)``.
+    max_exponents : :class:`numpy:numpy.ndarray`
+        The maximum exponent values in each dimension as a one-dimensional
+        array of length ``m``; this is to avoid re-computation.
+    output_placeholder : :class:`numpy:numpy.ndarray`
+        The placeholder for the values of the polynomial(s) at the query
+        points, a two-dimensional array of shape ``(k, p)``.
+
+    Notes
+    -----
+    - The query points are split into (contiguous) chunks, one per thread.
+      Each thread allocates its own placeholder for the (chained) products.
+    - This function is compiled (NJIT-ted) and executed in parallel
+      with the help of Numba.
+    - Results are stored in the placeholder arrays. The function returns None.
+
+    See Also
+    --------
+    minterpy.jit_compiled.newton.eval.eval_newton_polynomials_multiple
+        Evaluation of the Newton polynomial(s) at multiple query points
+        on a single CPU.
+    """
+    n_points = xx.shape[0]
+    m = exponents.shape[1]
+    num_prods = np.max(max_exponents) + 1  # Maximum number of product terms
+
+    # Split the query points into one chunk per thread
+    num_chunks = min(get_num_threads(), n_points)
+    if num_chunks == 0:
+        return
+    chunk_size = (n_points + num_chunks - 1) // num_chunks
+
+    for chunk_idx in prange(num_chunks):
+        # Per-thread placeholder for the (chained) products
+        products_placeholder = np.empty(
+            shape=(num_prods, m),
+            dtype=FLOAT_DTYPE,
+        )
+        start_idx = chunk_idx * chunk_size
+        end_idx = min(start_idx + chunk_size, n_points)
+        for idx in range(start_idx, end_idx):
+            eval_newton_polynomials_single(
+                xx[idx, :],
+                coefficients,
+                exponents,
+                generating_points,
+                max_exponents,
+                products_placeholder,
+                output_placeholder[idx],
+            )
+
+
+@njit(void(F_1D, F_2D, I_2D, I_1D, F_2D, I_1D_RO, F_2D, F_1D, F_1D), cache=True)
+def eval_newton_polynomials_tree_single(
+    x_single: np.ndarray,
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    split_dims: np.ndarray,
+    generating_points: np.ndarray,
+    max_exponents: np.ndarray,
+    products_placeholder: np.ndarray,
+    partials_placeholder: np.ndarray,
+    output_placeholder: np.ndarray,
+) -> None:
+    """Evaluate the Newton polynomial(s) at a single query point via the tree.
+
+    The following notations are used below:
+
+    - ``m``: the spatial dimension of the polynomial
+    - ``n``: the (maximum) degree of the polynomial in any dimension
+    - ``N``: the number of elements in the multi-index set (i.e., monomials)
+    - ``p``: the number of polynomials (i.e., number of coefficient sets)
+
+    Parameters
+    ----------
+    x_single : :class:`numpy:numpy.ndarray`
+        The query point, a one-dimensional array of length ``m``.
+    coefficients : :class:`numpy:numpy.ndarray`
+        The coefficients of the Newton polynomial(s);
+        the values are given in a two-dimensional array of shape ``(N, p)``.
+    exponents : :class:`numpy:numpy.ndarray`
+        Set of exponents given as a two-dimensional non-negative integer array
+        of shape ``(N, m)``; the exponents must be lexicographically sorted.
+    split_dims : :class:`numpy:numpy.ndarray`
+        The highest dimension in which each multi-index element differs
+        from its predecessor, a one-dimensional array of length ``N``
+        (see :py:func:`minterpy.dds.compile_split_dims`).
+    generating_points : :class:`numpy:numpy.ndarray`
+        Interpolation points for each dimension given as a two-dimensional
+        array of shape ``(n + 1, m)``.
+    max_exponents : :class:`numpy:numpy.ndarray`
+        The maximum exponent values in each dimension as a one-dimensional
+        array of length ``m``; this is to avoid re-computation.
+    products_placeholder : :class:`numpy:numpy.ndarray`
+        A placeholder for the (chained) products of the one-dimensional
+        Newton monomials, a two-dimensional array of shape ``(n + 1, m)``.
+    partials_placeholder : :class:`numpy:numpy.ndarray`
+        A placeholder for the partial products along the path from the root
+        of the multi-index tree, a one-dimensional array of length ``m + 1``.
+        The entry of the first dimension is never accessed.
+    output_placeholder : :class:`numpy:numpy.ndarray`
+        The placeholder for the values of the polynomial(s) at the query point,
+        a one-dimensional array of length ``p``.
+
+    Notes
+    -----
+    - The lexicographically sorted multi-indices are visited in order,
+      i.e., the multi-index tree is traversed depth-first.
+      The entry ``i`` of the partial products holds the product of
+      the factors in dimensions ``i, ..., m - 1`` of the current multi-index;
+      the factors above the split dimension are shared with the predecessor
+      (the parent nodes in the tree) and are not recomputed.
+      As most consecutive elements only differ in the first dimension,
+      the cost per query point drops from :math:`O(mN)` toward :math:`O(N)`.
+    - This function is compiled (NJIT-ted) with the help of Numba.
+    - Results are stored in the placeholder arrays. The function returns None.
+    """
+    eval_newton_products_single(
+        x_single,
+        generating_points,
+        max_exponents,
+        products_placeholder,
+    )
+
+    # NOTE: the otherwise unused first row acts as the factor of exponent 0,
+    # this avoids branching in the inner loop below
+    products_placeholder[0, :] = 1.0
+
+    num_monomials = exponents.shape[0]
+    num_polys = coefficients.shape[1]
+    output_placeholder[:] = 0.0  # additive identity
+    partials_placeholder[-1] = 1.0  # multiplicative identity (root)
+    for j in range(num_monomials):
+        # Only update the partial products from the split dimension down
+        for i in range(split_dims[j], 0, -1):
+            partials_placeholder[i] = (
+                partials_placeholder[i + 1]
+                * products_placeholder[exponents[j, i], i]
+            )
+        # NOTE: the first dimension changes for (almost) every element
+        newt_mon_val = (
+            partials_placeholder[1] * products_placeholder[exponents[j, 0], 0]
+        )
+        for k in range(num_polys):
+            output_placeholder[k] += coefficients[j, k] * newt_mon_val
+
+
+@njit(void(F_2D, F_2D, I_2D, I_1D, F_2D, I_1D_RO, F_2D), cache=True)
+def eval_newton_polynomials_tree_multiple(
+    xx: np.ndarray,
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    split_dims: np.ndarray,
+    generating_points: np.ndarray,
+    max_exponents: np.ndarray,
+    output_placeholder: np.ndarray,
+) -> None:
+    """Evaluate the Newton polynomial(s) at multiple query points via the tree.
+
+    The following notations are used below:
+
+    - ``k``: the number of query (evaluation) points
+    - ``m``: the spatial dimension of the polynomial
+    - ``n``: the (maximum) degree of the polynomial in any dimension
+    - ``N``: the number of elements in the multi-index set (i.e., monomials)
+    - ``p``: the number of polynomials (i.e., number of coefficient sets)
+
+    Parameters
+    ----------
+    xx : :class:`numpy:numpy.ndarray`
+        The set of query points at which the polynomials are evaluated;
+        the values are given in a two-dimensional array of shape ``(k, m)``.
+    coefficients : :class:`numpy:numpy.ndarray`
+        The coefficients of the Newton polynomial(s);
+        the values are given in a two-dimensional array of shape ``(N, p)``.
+    exponents : :class:`numpy:numpy.ndarray`
+        Set of exponents given as a two-dimensional non-negative integer array
+        of shape ``(N, m)``; the exponents must be lexicographically sorted.
+    split_dims : :class:`numpy:numpy.ndarray`
+        The highest dimension in which each multi-index element differs
+        from its predecessor, a one-dimensional array of length ``N``.
+    generating_points : :class:`numpy:numpy.ndarray`
+        Interpolation points for each dimension given as a two-dimensional
+        array of shape ``(n + 1, m)``.
+    max_exponents : :class:`numpy:numpy.ndarray`
+        The maximum exponent values in each dimension as a one-dimensional
+        array of length ``m``; this is to avoid re-computation.
+    output_placeholder : :class:`numpy:numpy.ndarray`
+        The placeholder for the values of the polynomial(s) at the query
+        points, a two-dimensional array of shape ``(k, p)``.
+
+    Notes
+    -----
+    - This function is compiled (NJIT-ted) with the help of Numba.
+    - Results are stored in the placeholder arrays. The function returns None.
+
+    See Also
+    --------
+    minterpy.jit_compiled.newton.eval.eval_newton_polynomials_tree_single
+        Evaluation of the Newton polynomial(s) at a single query point
+        by traversing the multi-index tree.
+    """
+    n_points = xx.shape[0]
+    m = exponents.shape[1]
+    num_prods = np.max(max_exponents) + 1  # Maximum number of product terms
+    products_placeholder = np.empty(shape=(num_prods, m), dtype=FLOAT_DTYPE)
+    partials_placeholder = np.empty(shape=(m + 1), dtype=FLOAT_DTYPE)
+
+    for idx in range(n_points):
+        eval_newton_polynomials_tree_single(
+            xx[idx, :],
+            coefficients,
+            exponents,
+            split_dims,
+            generating_points,
+            max_exponents,
+            products_placeholder,
+            partials_placeholder,
+            output_placeholder[idx],
+        )
+
+
+@njit(void(F_1D, F_2D, I_2D, I_1D, F_2D, I_1D_RO, F_2D, F_2D, I_1D, F_1D), cache=True)
+def eval_newton_polynomials_horner_single(
+    x_single: np.ndarray,
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    split_dims: np.ndarray,
+    generating_points: np.ndarray,
+    max_exponents: np.ndarray,
+    products_placeholder: np.ndarray,
+    accumulators_placeholder: np.ndarray,
+    last_exponents_placeholder: np.ndarray,
+    output_placeholder: np.ndarray,
+) -> None:
+    """Evaluate the Newton polynomial(s) at a single query point via Horner.
+
+    The following notations are used below:
+
+    - ``m``: the spatial dimension of the polynomial
+    - ``n``: the (maximum) degree of the polynomial in any dimension
+    - ``N``: the number of elements in the multi-index set (i.e., monomials)
+    - ``p``: the number of polynomials (i.e., number of coefficient sets)
+
+    Parameters
+    ----------
+    x_single : :class:`numpy:numpy.ndarray`
+        The query point, a one-dimensional array of length ``m``.
+    coefficients : :class:`numpy:numpy.ndarray`
+        The coefficients of the Newton polynomial(s);
+        the values are given in a two-dimensional array of shape ``(N, p)``.
+    exponents : :class:`numpy:numpy.ndarray`
+        Set of exponents given as a two-dimensional non-negative integer array
+        of shape ``(N, m)``; the exponents must be lexicographically sorted.
+    split_dims : :class:`numpy:numpy.ndarray`
+        The highest dimension in which each multi-index element differs
+        from its predecessor, a one-dimensional array of length ``N``
+        (see :py:func:`minterpy.dds.compile_split_dims`).
+    generating_points : :class:`numpy:numpy.ndarray`
+        Interpolation points for each dimension given as a two-dimensional
+        array of shape ``(n + 1, m)``.
+    max_exponents : :class:`numpy:numpy.ndarray`
+        The maximum exponent values in each dimension as a one-dimensional
+        array of length ``m``; this is to avoid re-computation.
+    products_placeholder : :class:`numpy:numpy.ndarray`
+        A placeholder for the (chained) products of the one-dimensional
+        Newton monomials, a two-dimensional array of shape ``(n + 1, m)``.
+    accumulators_placeholder : :class:`numpy:numpy.ndarray`
+        A placeholder for the Horner accumulators of the currently open node
+        in each dimension, a two-dimensional array of shape ``(m, p)``.
+    last_exponents_placeholder : :class:`numpy:numpy.ndarray`
+        A placeholder for the exponent of the last term added to
+        the accumulator in each dimension, a one-dimensional integer array
+        of length ``m``.
+    output_placeholder : :class:`numpy:numpy.ndarray`
+        The placeholder for the values of the polynomial(s) at the query point,
+        a one-dimensional array of length ``p``.
+
+    Notes
+    -----
+    - A node of the multi-index tree in dimension ``d`` collects
+      the elements sharing the exponents in dimensions ``d + 1, ..., m - 1``.
+      Its value is a one-dimensional Newton polynomial in ``x_d``
+      whose coefficients are the values of its children (the nodes
+      in dimension ``d - 1`` or the coefficients in the first dimension),
+      evaluated with the Horner scheme.
+    - The multi-indices are visited in reverse lexicographical order,
+      i.e., from the highest exponents down as required by the Horner scheme.
+      A node is closed as soon as the next element splits off in a higher
+      dimension; its value is then multiplied by the remaining factors
+      of its lowest exponent and passed on to the parent node.
+    - The values of the Newton monomials are never computed; the cost per
+      query point is :math:`O(Np)` multiplications plus the closing of nodes.
+      Gaps in the exponents (non-downward-closed sets) are supported.
+    - This function is compiled (NJIT-ted) with the help of Numba.
+    - Results are stored in the placeholder arrays. The function returns None.
+    """
+    eval_newton_products_single(
+        x_single,
+        generating_points,
+        max_exponents,
+        products_placeholder,
+    )
+    # NOTE: the otherwise unused first row acts as the factor of exponent 0
+    products_placeholder[0, :] = 1.0
+
+    num_monomials, m = exponents.shape
+    num_polys = coefficients.shape[1]
+    # NOTE: a negative exponent marks an empty (not yet opened) node
+    last_exponents_placeholder[:] = -1
+
+    for j in range(num_monomials - 1, -1, -1):
+        # Add the coefficients as the next term of the node in the first dim.
+        exp = exponents[j, 0]
+        last_exp = last_exponents_placeholder[0]
+        if last_exp < 0:
+            for k in range(num_polys):
+                accumulators_placeholder[0, k] = coefficients[j, k]
+        else:
+            factor = x_single[0] - generating_points[exp, 0]
+            # NOTE: more than a single factor only if there are gaps
+            for t in range(exp + 1, last_exp):
+                factor *= x_single[0] - generating_points[t, 0]
+            for k in range(num_polys):
+                accumulators_placeholder[0, k] = (
+                    accumulators_placeholder[0, k] * factor
+                    + coefficients[j, k]
+                )
+        last_exponents_placeholder[0] = exp
+
+        # Close the nodes not shared with the preceding element
+        # and add their values as the next term of the parent nodes
+        # NOTE: the first element closes all nodes but the root
+        for d in range(split_dims[j]):
+            closing_factor = products_placeholder[
+                last_exponents_placeholder[d], d
+            ]
+            last_exponents_placeholder[d] = -1
+            exp = exponents[j, d + 1]
+            last_exp = last_exponents_placeholder[d + 1]
+            if last_exp < 0:
+                for k in range(num_polys):
+                    accumulators_placeholder[d + 1, k] = (
+                        accumulators_placeholder[d, k] * closing_factor
+                    )
+            else:
+                factor = x_single[d + 1] - generating_points[exp, d + 1]
+                for t in range(exp + 1, last_exp):
+                    factor *= x_single[d + 1] - generating_points[t, d + 1]
+                for k in range(num_polys):
+                    accumulators_placeholder[d + 1, k] = (
+                        accumulators_placeholder[d + 1, k] * factor
+                        + accumulators_placeholder[d, k] * closing_factor
+                    )
+            last_exponents_placeholder[d + 1] = exp
+
+    # Close the root node
+    closing_factor = products_placeholder[last_exponents_placeholder[m - 1], m - 1]
+    for k in range(num_polys):
+        output_placeholder[k] = accumulators_placeholder[m - 1, k] * closing_factor
+
+
+@njit(void(F_2D, F_2D, I_2D, I_1D, F_2D, I_1D_RO, F_2D), cache=True)
+def eval_newton_polynomials_horner_multiple(
+    xx: np.ndarray,
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    split_dims: np.ndarray,
+    generating_points: np.ndarray,
+    max_exponents: np.ndarray,
+    output_placeholder: np.ndarray,
+) -> None:
+    """Evaluate the Newton polynomial(s) at multiple query points via Horner.
+
+    The following notations are used below:
+
+    - ``k``: the number of query (evaluation) points
+    - ``m``: the spatial dimension of the polynomial
+    - ``n``: the (maximum) degree of the polynomial in any dimension
+    - ``N``: the number of elements in the multi-index set (i.e., monomials)
+    - ``p``: the number of polynomials (i.e., number of coefficient sets)
+
+    Parameters
+    ----------
+    xx : :class:`numpy:numpy.ndarray`
+        The set of query points at which the polynomials are evaluated;
+        the values are given in a two-dimensional array of shape ``(k, m)``.
+    coefficients : :class:`numpy:numpy.ndarray`
+        The coefficients of the Newton polynomial(s);
+        the values are given in a two-dimensional array of shape ``(N, p)``.
+    exponents : :class:`numpy:numpy.ndarray`
+        Set of exponents given as a two-dimensional non-negative integer array
+        of shape ``(N, m)``; the exponents must be lexicographically sorted.
+    split_dims : :class:`numpy:numpy.ndarray`
+        The highest dimension in which each multi-index element differs
+        from its predecessor, a one-dimensional array of length ``N``.
+    generating_points : :class:`numpy:numpy.ndarray`
+        Interpolation points for each dimension given as a two-dimensional
+        array of shape ``(n + 1, m)``.
+    max_exponents : :class:`numpy:numpy.ndarray`
+        The maximum exponent values in each dimension as a one-dimensional
+        array of length ``m``; this is to avoid re-computation.
+    output_placeholder : :class:`numpy:numpy.ndarray`
+        The placeholder for the values of the polynomial(s) at the query
+        points, a two-dimensional array of shape ``(k, p)``.
+
+    Notes
+    -----
+    - This function is compiled (NJIT-ted) with the help of Numba.
+    - Results are stored in the placeholder arrays. The function returns None.
+
+    See Also
+    --------
+    minterpy.jit_compiled.newton.eval.eval_newton_polynomials_horner_single
+        Evaluation of the Newton polynomial(s) at a single query point
+        with the multivariate Horner scheme.
+    """
+    n_points = xx.shape[0]
+    m = exponents.shape[1]
+    num_polys = coefficients.shape[1]
+    num_prods = np.max(max_exponents) + 1  # Maximum number of product terms
+    products_placeholder = np.empty(shape=(num_prods, m), dtype=FLOAT_DTYPE)
+    accumulators_placeholder = np.empty(
+        shape=(m, num_polys),
+        dtype=FLOAT_DTYPE,
+    )
+    last_exponents_placeholder = np.empty(shape=(m), dtype=INT_DTYPE)
+
+    for idx in range(n_points):
+        eval_newton_polynomials_horner_single(
+            xx[idx, :],
+            coefficients,
+            exponents,
+            split_dims,
+            generating_points,
+            max_exponents,
+            products_placeholder,
+            accumulators_placeholder,
+            last_exponents_placeholder,
+            output_placeholder[idx],
+        )
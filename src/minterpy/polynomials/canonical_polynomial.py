@@ -7,6 +7,7 @@ from __future__ import annotations
 import numpy as np
 
 from scipy.special import factorial
+from typing import Optional, Union
 
 from minterpy.global_settings import INT_DTYPE
 from minterpy.core.ABC import MultivariatePolynomialSingleABC
@@ -26,7 +27,7 @@ from minterpy.utils.verification import (
     dummy,
     verify_domain,
 )
-from minterpy.utils.arrays import make_coeffs_2d
+from minterpy.utils.arrays import EvalWorkspace, make_coeffs_2d
 from minterpy.utils.multi_index import find_match_between
 from minterpy.jit_compiled.multi_index import all_indices_are_contained
 
@@ -34,7 +35,16 @@ __all__ = ["CanonicalPolynomial"]
 
 
 # --- Evaluation
-def eval_canonical(poly: "CanonicalPolynomial", xx: np.ndarray) -> np.ndarray:
+def eval_canonical(
+    poly: "CanonicalPolynomial",
+    xx: np.ndarray,
+    *,
+    backend: str = "numpy",
+    batch_size: Optional[Union[int, str]] = None,
+    memory_budget: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
+) -> np.ndarray:
     """Evaluate polynomial(s) in the canonical basis on a set of query points.
 
     Parameters
@@ -45,6 +55,31 @@ def eval_canonical(poly: "CanonicalPolynomial", xx: np.ndarray) -> np.ndarray:
         Array of query points in the at which the polynomial(s) is evaluated.
         The array is of shape ``(N, m)`` where ``N`` is the number of points
         and ``m`` is the spatial dimension of the polynomial.
+    backend : str
+        Computational backend to carry out the evaluation.
+        Supported values are:
+
+        - ``"numpy"`` (default): vectorized implementation with NumPy.
+        - ``"numba-sparse"``: implementation based on compiled code with
+          the help of Numba that only visits the nonzero exponents stored in
+          the compressed sparse row (CSR) format; may accelerate
+          the evaluation of polynomials in higher dimensions with
+          a low :math:`l_p`-degree.
+    batch_size : Union[int, str], optional
+        The number of query points evaluated at once. If ``None`` (default),
+        all query points are evaluated at once. If ``"auto"``, the batch size
+        is determined such that the intermediate arrays fit
+        the ``memory_budget``.
+    memory_budget : int, optional
+        The memory budget in bytes for the intermediate arrays of a batch;
+        only relevant if ``batch_size`` is ``"auto"``. If not specified,
+        ``minterpy.global_settings.DEFAULT_MEMORY_BUDGET`` is used.
+    out : :class:`numpy:numpy.ndarray`, optional
+        The array into which the values of the polynomial(s) are written
+        and which is returned; it must have the shape of the output.
+    workspace : EvalWorkspace, optional
+        The workspace whose buffers are reused for the intermediate arrays
+        across repeated evaluations.
 
     Returns
     -------
@@ -63,8 +98,25 @@ def eval_canonical(poly: "CanonicalPolynomial", xx: np.ndarray) -> np.ndarray:
     """
     coeffs = poly.coeffs
     exponents = poly.multi_index.exponents
-
-    return eval_polynomials(xx, coeffs, exponents)
+    if backend.lower() == "numba-sparse":
+        sparse_exponents = poly.multi_index.sparse_exponents
+        max_exponent = poly.multi_index.max_exponent
+    else:
+        sparse_exponents = None
+        max_exponent = None
+
+    return eval_polynomials(
+        xx,
+        coeffs,
+        exponents,
+        backend=backend,
+        sparse_exponents=sparse_exponents,
+        max_exponent=max_exponent,
+        batch_size=batch_size,
+        memory_budget=memory_budget,
+        out=out,
+        workspace=workspace,
+    )
 
 
 # --- Arithmetics (Addition, Multiplication)
@@ -13,6 +13,8 @@ Chebyshev polynomials are defined on :math:`[-1, 1]^m`.
 """
 import numpy as np
 
+from typing import Optional, Union
+
 from minterpy.core.ABC import MultivariatePolynomialSingleABC
 from minterpy.core import Grid, MultiIndexSet
 from minterpy.utils.polynomials.chebyshev import (
@@ -28,6 +30,7 @@ from minterpy.utils.polynomials.interface import (
     scalar_add_via_monomials,
     select_active_monomials,
 )
+from minterpy.utils.arrays import EvalWorkspace
 from minterpy.utils.verification import dummy, verify_domain
 from minterpy.services import is_scalar
 
@@ -39,6 +42,12 @@ __all__ = ["ChebyshevPolynomial"]
 def eval_chebyshev(
     chebyshev_polynomials: "ChebyshevPolynomial",
     xx: np.ndarray,
+    *,
+    backend: str = "numpy",
+    batch_size: Optional[Union[int, str]] = None,
+    memory_budget: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
 ) -> np.ndarray:
     """Wrapper for the evaluation function in the Chebyshev bases.
 
@@ -49,6 +58,31 @@ def eval_chebyshev(
     xx : np.ndarray
         The array of query points of shape ``(k, m)`` at which the monomials
         are evaluated. The values must be in :math:`[-1, 1]^m`.
+    backend : str
+        Computational backend to carry out the evaluation.
+        Supported values are:
+
+        - ``"numpy"`` (default): vectorized implementation with NumPy.
+        - ``"numba-sparse"``: implementation based on compiled code with
+          the help of Numba that only visits the nonzero exponents stored in
+          the compressed sparse row (CSR) format; may accelerate
+          the evaluation of polynomials in higher dimensions with
+          a low :math:`l_p`-degree.
+    batch_size : Union[int, str], optional
+        The number of query points evaluated at once. If ``None`` (default),
+        all query points are evaluated at once. If ``"auto"``, the batch size
+        is determined such that the intermediate arrays fit
+        the ``memory_budget``.
+    memory_budget : int, optional
+        The memory budget in bytes for the intermediate arrays of a batch;
+        only relevant if ``batch_size`` is ``"auto"``. If not specified,
+        ``minterpy.global_settings.DEFAULT_MEMORY_BUDGET`` is used.
+    out : :class:`numpy:numpy.ndarray`, optional
+        The array into which the values of the polynomial(s) are written
+        and which is returned; it must have the shape of the output.
+    workspace : EvalWorkspace, optional
+        The workspace whose buffers are reused for the intermediate arrays
+        across repeated evaluations.
 
     Notes
     -----
@@ -58,14 +92,30 @@ def eval_chebyshev(
       on the same grid are defined by a multiple set of coefficients.
 
     .. todo::
-        - Allows batch evaluations somewhere upstream.
         - make sure the input is in the domain [-1, 1]^m somewhere upstream.
     """
     # Get required data from the object
     exponents = chebyshev_polynomials.multi_index.exponents
     coefficients = chebyshev_polynomials.coeffs
-
-    results = evaluate_polynomials(xx, exponents, coefficients)
+    if backend.lower() == "numba-sparse":
+        sparse_exponents = chebyshev_polynomials.multi_index.sparse_exponents
+        max_exponent = chebyshev_polynomials.multi_index.max_exponent
+    else:
+        sparse_exponents = None
+        max_exponent = None
+
+    results = evaluate_polynomials(
+        xx,
+        exponents,
+        coefficients,
+        backend=backend,
+        sparse_exponents=sparse_exponents,
+        max_exponent=max_exponent,
+        batch_size=batch_size,
+        memory_budget=memory_budget,
+        out=out,
+        workspace=workspace,
+    )
 
     return results
 
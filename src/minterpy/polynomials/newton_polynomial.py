@@ -38,18 +38,24 @@ from __future__ import annotations
 
 import numpy as np
 
-from minterpy.global_settings import DEBUG
+from typing import Callable, Optional, Union
+
+from minterpy.global_settings import DEBUG, INT_DTYPE
 from minterpy.core.ABC.multivariate_polynomial_abstract import (
     MultivariatePolynomialSingleABC,
 )
 from minterpy.core import Grid, MultiIndexSet
 from minterpy.dds import dds
+from minterpy.utils.arrays import EvalWorkspace
 from minterpy.utils.verification import dummy, verify_domain
 from minterpy.utils.polynomials.newton import (
+    NewtonEvaluator,
     eval_newton_polynomials,
     deriv_newt_eval as eval_diff_numpy,
     integrate_monomials_newton,
+    update_newton_coeffs,
 )
+from minterpy.utils.multi_index import find_match_between
 from minterpy.jit_compiled.newton.diff import (
     eval_multiple_query as eval_diff_numba,
     eval_multiple_query_par as eval_diff_numba_par,
@@ -75,7 +81,16 @@ SUPPORTED_BACKENDS = {
 
 
 # --- Evaluation
-def eval_newton(poly: "NewtonPolynomial", xx: np.ndarray) -> np.ndarray:
+def eval_newton(
+    poly: "NewtonPolynomial",
+    xx: np.ndarray,
+    *,
+    backend: str = "numba",
+    batch_size: Optional[Union[int, str]] = None,
+    memory_budget: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
+) -> np.ndarray:
     """Evaluate polynomial(s) in the Newton basis on a set of query points.
 
     This is a wrapper for the evaluation function in the Newton basis.
@@ -88,6 +103,43 @@ def eval_newton(poly: "NewtonPolynomial", xx: np.ndarray) -> np.ndarray:
         Array of query points in the at which the polynomial(s) is evaluated.
         The array is of shape ``(N, m)`` where ``N`` is the number of points
         and ``m`` is the spatial dimension of the polynomial.
+    backend : str
+        Computational backend to carry out the evaluation.
+        Supported values are:
+
+        - ``"numba"`` (default): implementation based on compiled code with
+          the help of Numba; the query points are evaluated serially.
+        - ``"numba-par"``: parallelized (CPU) implementation based on compiled
+          code with the help of Numba for a large number of query points.
+        - ``"numba-tree"``: implementation based on compiled code with
+          the help of Numba that reuses the partial products of the Newton
+          monomials shared along the multi-index tree; may accelerate
+          the evaluation of polynomials in higher dimensions.
+        - ``"numba-horner"``: implementation based on compiled code with
+          the help of Numba that evaluates the polynomial with
+          the multivariate Horner scheme along the multi-index tree without
+          forming the values of the Newton monomials; numerically more stable
+          for polynomials of high degree.
+        - ``"numba-sparse"``: implementation based on compiled code with
+          the help of Numba that only visits the nonzero exponents stored in
+          the compressed sparse row (CSR) format; may accelerate
+          the evaluation of polynomials in higher dimensions with
+          a low :math:`l_p`-degree.
+    batch_size : Union[int, str], optional
+        The number of query points evaluated at once if the Newton monomials
+        are explicitly evaluated. If ``None`` (default), all query points are
+        evaluated at once. If ``"auto"``, the batch size is determined such
+        that the intermediate arrays fit the ``memory_budget``.
+    memory_budget : int, optional
+        The memory budget in bytes for the intermediate arrays of a batch;
+        only relevant if ``batch_size`` is ``"auto"``. If not specified,
+        ``minterpy.global_settings.DEFAULT_MEMORY_BUDGET`` is used.
+    out : :class:`numpy:numpy.ndarray`, optional
+        The array into which the values of the polynomial(s) are written
+        and which is returned; it must have the shape of the output.
+    workspace : EvalWorkspace, optional
+        The workspace whose buffers are reused for the intermediate arrays
+        across repeated evaluations.
 
     See Also
     --------
@@ -99,6 +151,10 @@ def eval_newton(poly: "NewtonPolynomial", xx: np.ndarray) -> np.ndarray:
     coeffs = poly.coeffs
     exponents = poly.multi_index.exponents
     gen_points = poly.grid.generating_points
+    if backend.lower() == "numba-sparse":
+        sparse_exponents = poly.multi_index.sparse_exponents
+    else:
+        sparse_exponents = None
 
     return eval_newton_polynomials(
         xx,
@@ -106,6 +162,49 @@ def eval_newton(poly: "NewtonPolynomial", xx: np.ndarray) -> np.ndarray:
         exponents,
         gen_points,
         verify_input=DEBUG,
+        batch_size=batch_size,
+        backend=backend,
+        memory_budget=memory_budget,
+        out=out,
+        workspace=workspace,
+        max_exponents=poly.multi_index.max_exponents,
+        sparse_exponents=sparse_exponents,
+    )
+
+
+def compile_evaluator_newton(
+    poly: "NewtonPolynomial",
+    *,
+    parallel: bool = False,
+) -> NewtonEvaluator:
+    """Create a low-overhead evaluator of polynomial(s) in the Newton basis.
+
+    Parameters
+    ----------
+    poly : NewtonPolynomial
+        The instance of polynomial in the Newton basis to evaluate.
+    parallel : bool, optional
+        Flag to evaluate multiple query points in parallel (CPU); may
+        accelerate the evaluation of a large number of query points.
+        The default is ``False``.
+
+    Returns
+    -------
+    NewtonEvaluator
+        The evaluator that directly calls the compiled kernels; a single query
+        point is evaluated without any memory allocation.
+
+    See Also
+    --------
+    minterpy.utils.polynomials.newton.NewtonEvaluator
+        The actual implementation of the evaluator.
+    """
+    return NewtonEvaluator(
+        poly.coeffs,
+        poly.multi_index.exponents,
+        poly.grid.generating_points,
+        parallel=parallel,
+        max_exponents=poly.multi_index.max_exponents,
     )
 
 
@@ -233,7 +332,8 @@ def diff_newton(
       validation regarding that parameter is required here.
     - The transformation of computed Lagrange coefficients of
       the differentiated polynomial to the Newton coefficients is carried out
-      using multivariate divided-difference scheme (DDS).
+      using multivariate divided-difference scheme (DDS). With
+      the ``"numba-par"`` backend, the parallel DDS is used as well.
 
     See Also
     --------
@@ -272,10 +372,15 @@ def diff_newton(
         exponents,
         generating_points,
         order,
+        multi_index.max_exponents,
     )
 
     # DDS returns a 2D array, reshaping it according to input coefficient array
-    nwt_diff_coeffs = dds(lag_diff_coeffs, tree).reshape(poly.coeffs.shape)
+    dds_backend = "numba-par" if backend == "numba-par" else "numba"
+    nwt_diff_coeffs = dds(
+        lag_diff_coeffs, tree, backend=dds_backend, overwrite_input=True
+    )
+    nwt_diff_coeffs = nwt_diff_coeffs.reshape(poly.coeffs.shape)
 
     return NewtonPolynomial(
         coeffs=nwt_diff_coeffs,
@@ -386,6 +491,7 @@ class NewtonPolynomial(MultivariatePolynomialSingleABC):
 
     # Evaluation
     _eval = staticmethod(eval_newton)
+    _compile_evaluator = staticmethod(compile_evaluator_newton)
 
     # Arithmetics (polynomial-polynomial)
     _add = staticmethod(add_newton)
@@ -406,6 +512,112 @@ class NewtonPolynomial(MultivariatePolynomialSingleABC):
     generate_internal_domain = staticmethod(generate_internal_domain_newton)
     generate_user_domain = staticmethod(generate_user_domain_newton)
 
+    # --- Public methods
+    def refine(
+        self,
+        exponents: np.ndarray,
+        fct_values: Union[Callable, np.ndarray],
+    ) -> "NewtonPolynomial":
+        """Refine the interpolating polynomial with additional exponents.
+
+        Parameters
+        ----------
+        exponents : :class:`numpy:numpy.ndarray`
+            The exponents to be added, a ``(K, m)`` array (or an ``(m,)``
+            array for a single exponent). They must be unique, must not be
+            contained in the current multi-index set, and the extended
+            multi-index set must be downward-closed.
+        fct_values : Union[Callable, :class:`numpy:numpy.ndarray`]
+            The function values at the unisolvent nodes of the added
+            exponents, a ``(K,)`` or ``(K, p)`` array. Alternatively,
+            a function that is evaluated only at those ``K`` nodes.
+
+        Returns
+        -------
+        NewtonPolynomial
+            A new instance of `NewtonPolynomial` that interpolates
+            the function on the extended grid.
+
+        Raises
+        ------
+        ValueError
+            If the polynomial is not an interpolating polynomial on its grid
+            (i.e., the multi-index sets differ), if the added exponents are
+            invalid, or if the generating points of the extended grid are
+            not nested with the current ones.
+
+        Notes
+        -----
+        - The Newton coefficients of the current exponents remain unchanged;
+          only the coefficients of the added exponents are computed
+          (see :py:func:`.update_newton_coeffs`). The function is only
+          evaluated at the added unisolvent nodes.
+        - The generating points of the current grid must remain the same
+          in the extended grid. This is not the case for a grid created
+          from a generating function whose points depend on the degree
+          (e.g., the default Leja-ordered Chebyshev-Lobatto points);
+          use a grid created from (sufficiently many) generating points.
+        """
+        if self.indices_are_separate:
+            raise ValueError(
+                "Only an interpolating polynomial, whose multi-index set "
+                "is the one of its grid, can be refined"
+            )
+
+        exponents = np.atleast_2d(np.require(exponents, dtype=INT_DTYPE))
+        grid = self.grid
+        grid_refined = grid.add_exponents(exponents)
+        mi_refined = grid_refined.multi_index
+        if len(mi_refined) != len(self.multi_index) + len(exponents):
+            raise ValueError(
+                "The added exponents must be unique and must not be "
+                "contained in the multi-index set of the polynomial"
+            )
+        if not mi_refined.is_downward_closed:
+            raise ValueError(
+                "The refined multi-index set must be downward-closed"
+            )
+
+        # The current nodes and Newton monomials must remain unchanged
+        num_points = self.multi_index.max_exponent + 1
+        gen_points = grid_refined.generating_points
+        if not np.array_equal(
+            gen_points[:num_points],
+            grid.generating_points[:num_points],
+        ):
+            raise ValueError(
+                "The generating points of the refined grid are not nested "
+                "with the generating points of the current grid"
+            )
+
+        if callable(fct_values):
+            num_dim = exponents.shape[1]
+            fct_values = fct_values(gen_points[exponents, np.arange(num_dim)])
+
+        new_coeffs = update_newton_coeffs(
+            self.coeffs,
+            self.multi_index.exponents,
+            exponents,
+            fct_values,
+            gen_points,
+        )
+
+        # Merge the coefficients in the order of the refined multi-index set
+        exps_refined = mi_refined.exponents
+        coeffs = np.empty(
+            (len(mi_refined),) + new_coeffs.shape[1:],
+            dtype=new_coeffs.dtype,
+        )
+        coeffs[
+            find_match_between(self.multi_index.exponents, exps_refined)
+        ] = self.coeffs
+        order = np.lexsort(exponents.T)
+        coeffs[find_match_between(exponents[order], exps_refined)] = (
+            new_coeffs[order]
+        )
+
+        return self.__class__(mi_refined, coeffs, grid=grid_refined)
+
 
 # --- Internal utility functions
 def _compute_data_poly_sum(
@@ -604,6 +816,7 @@ def _compute_coeffs_poly_sum_via_lagrange(
         grid_sum,
         poly_1.indices_are_separate or poly_2.indices_are_separate,
         multi_index_sum,
+        overwrite_input=True,
     )
 
     return nwt_coeffs_sum
@@ -804,6 +1017,7 @@ def _compute_coeffs_poly_prod_via_lagrange(
         grid_prod,
         poly_1.indices_are_separate or poly_2.indices_are_separate,
         multi_index_prod,
+        overwrite_input=True,
     )
 
     return nwt_coeffs_prod
@@ -814,6 +1028,7 @@ def _transform_lag2nwt(
     grid: Grid,
     indices_are_separate: bool,
     multi_index: MultiIndexSet,
+    overwrite_input: bool = False,
 ) -> np.ndarray:
     """Transform the (active) Lagrange coefficients to the Newton coefficients.
 
@@ -828,6 +1043,10 @@ def _transform_lag2nwt(
         and the given multi-index set are not the same.
     multi_index : MultiIndexSet
         The multi-index set of the polynomial
+    overwrite_input : bool, optional
+        If ``True``, the Lagrange coefficients may be overwritten by the DDS
+        to avoid a copy; the array must not be used afterwards.
+        The default is ``False``.
 
     Returns
     -------
@@ -842,7 +1061,7 @@ def _transform_lag2nwt(
       by better organization and/or using interface functions.
     """
     # Transform the Lagrange coefficients into Newton coefficients
-    nwt_coeffs = dds(lag_coeffs, grid.tree)
+    nwt_coeffs = dds(lag_coeffs, grid.tree, overwrite_input=overwrite_input)
 
     # Deal with separate indices, select only w.r.t the active monomials
     if indices_are_separate:
@@ -876,7 +1095,10 @@ def _compute_quad_weights(
     generating_points = poly.grid.generating_points
 
     quad_weights = integrate_monomials_newton(
-        exponents, generating_points, bounds
+        exponents,
+        generating_points,
+        bounds,
+        max_exponents=poly.multi_index.max_exponents,
     )
 
     return quad_weights
@@ -12,12 +12,15 @@ from numba import njit
 
 from minterpy.global_settings import (
     ARRAY,
+    FLAT_TRAFO_TYPE,
     FLOAT_DTYPE,
     INT_DTYPE,
     TRAFO_DICT,
     TYPED_LIST,
 )
 
+from .transformation_fcts import transform_barycentric_nested
+
 
 @no_type_check
 @njit(cache=True)
@@ -56,6 +59,187 @@ def merge_trafo_dict(trafo_dict: TRAFO_DICT, leaf_positions: ARRAY) -> ARRAY:
     return combined_matrix
 
 
+@njit(cache=True)
+def get_packed_size(size_out: int, size_in: int) -> int:
+    """Number of entries of a lower triangular matrix piece in packed format.
+
+    :param size_out: the number of rows of the piece (size of the output leaf)
+    :param size_in: the number of columns of the piece (size of the input leaf)
+    :return: the number of entries on and below the diagonal
+
+    Notes
+    -----
+    Row ``i`` of the piece holds ``min(i + 1, size_in)`` entries.
+    """
+    if size_out <= size_in:
+        return size_out * (size_out + 1) // 2
+    return size_in * (size_in + 1) // 2 + (size_out - size_in) * size_in
+
+
+@njit(cache=True)
+def get_packed_identity(size: int) -> ARRAY:
+    """Creates the identity matrix in packed lower triangular format.
+
+    :param size: the number of rows (and columns) of the matrix
+    :return: the packed identity matrix (see :py:func:`triangular_2_packed`)
+    """
+    packed_matrix = np.zeros(get_packed_size(size, size), dtype=FLOAT_DTYPE)
+    for i in range(size):
+        # NOTE: the diagonal entry is the last entry of each row
+        packed_matrix[i * (i + 3) // 2] = 1.0
+
+    return packed_matrix
+
+
+@njit(cache=True)
+def triangular_2_packed(matrix: ARRAY) -> ARRAY:
+    """Converts a square lower triangular matrix into the packed format.
+
+    :param matrix: the square lower triangular matrix
+    :return: the entries on and below the diagonal stored row by row,
+        i.e., the entry ``(i, j)`` (``j <= i``) is stored at ``i * (i + 1) // 2 + j``
+
+    Notes
+    -----
+    The entries above the diagonal are ignored.
+    The packed format requires ``n * (n + 1) / 2`` instead of ``n * n`` entries.
+    """
+    size = matrix.shape[0]
+    packed_matrix = np.empty(get_packed_size(size, size), dtype=FLOAT_DTYPE)
+    for i in range(size):
+        offset = i * (i + 1) // 2
+        packed_matrix[offset : offset + i + 1] = matrix[i, : i + 1]
+
+    return packed_matrix
+
+
+@njit(cache=True)
+def packed_2_triangular(packed_matrix: ARRAY, size: int) -> ARRAY:
+    """Converts a lower triangular matrix in packed format into a square matrix.
+
+    :param packed_matrix: the packed lower triangular matrix (see :py:func:`triangular_2_packed`)
+    :param size: the number of rows (and columns) of the matrix
+    :return: the square lower triangular matrix
+    """
+    matrix = np.zeros((size, size), dtype=FLOAT_DTYPE)
+    for i in range(size):
+        offset = i * (i + 1) // 2
+        matrix[i, : i + 1] = packed_matrix[offset : offset + i + 1]
+
+    return matrix
+
+
+@no_type_check
+@njit(cache=True)
+def dict_2_flat(trafo_dict: TRAFO_DICT, leaf_positions: ARRAY) -> FLAT_TRAFO_TYPE:
+    """Converts a transformation in dictionary format into the flat format.
+
+    :param trafo_dict: transformation dictionary
+    :param leaf_positions: leaf positions
+    :return: the flat piece store: the packed values of all the pieces, the offsets of each piece in the values,
+        the start positions in the input and output coefficients, the sizes of the input and output slices,
+        and the range of the pieces of each output leaf
+
+    Notes
+    -----
+    All the matrix pieces are lower triangular.
+    Only the entries on and below the diagonal of each piece are stored (row by row, "packed" format),
+    all the pieces are stored in a single contiguous array.
+    The pieces are sorted by their output leaf, such that the pieces of the output leaf ``k``
+    are given by the range ``out_leaf_ptr[k]:out_leaf_ptr[k + 1]``.
+    """
+    nr_leaves = len(leaf_positions)
+    nr_pieces = len(trafo_dict)
+    leaf_idxs_in = np.empty(nr_pieces, dtype=INT_DTYPE)
+    leaf_idxs_out = np.empty(nr_pieces, dtype=INT_DTYPE)
+    piece_idx = 0
+    for leaf_idx_in, leaf_idx_out in trafo_dict.keys():
+        leaf_idxs_in[piece_idx] = leaf_idx_in
+        leaf_idxs_out[piece_idx] = leaf_idx_out
+        piece_idx += 1
+
+    # sort the pieces by output leaf (then input leaf)
+    order = np.argsort(leaf_idxs_out * nr_leaves + leaf_idxs_in)
+    leaf_idxs_in = leaf_idxs_in[order]
+    leaf_idxs_out = leaf_idxs_out[order]
+
+    positions_in = np.empty(nr_pieces, dtype=INT_DTYPE)
+    positions_out = np.empty(nr_pieces, dtype=INT_DTYPE)
+    sizes_in = np.empty(nr_pieces, dtype=INT_DTYPE)
+    sizes_out = np.empty(nr_pieces, dtype=INT_DTYPE)
+    piece_offsets = np.zeros(nr_pieces + 1, dtype=INT_DTYPE)
+    out_leaf_ptr = np.zeros(nr_leaves + 1, dtype=INT_DTYPE)
+    for piece_idx in range(nr_pieces):
+        leaf_idx_in = leaf_idxs_in[piece_idx]
+        leaf_idx_out = leaf_idxs_out[piece_idx]
+        size_out, size_in = trafo_dict[leaf_idx_in, leaf_idx_out].shape
+        positions_in[piece_idx] = leaf_positions[leaf_idx_in]
+        positions_out[piece_idx] = leaf_positions[leaf_idx_out]
+        sizes_in[piece_idx] = size_in
+        sizes_out[piece_idx] = size_out
+        piece_offsets[piece_idx + 1] = piece_offsets[piece_idx] + get_packed_size(
+            size_out, size_in
+        )
+        out_leaf_ptr[leaf_idx_out + 1] += 1
+    out_leaf_ptr = np.cumsum(out_leaf_ptr)
+
+    # pack the lower triangular part of each piece
+    piece_values = np.empty(piece_offsets[nr_pieces], dtype=FLOAT_DTYPE)
+    for piece_idx in range(nr_pieces):
+        matrix_piece = trafo_dict[leaf_idxs_in[piece_idx], leaf_idxs_out[piece_idx]]
+        value_idx = piece_offsets[piece_idx]
+        for i in range(sizes_out[piece_idx]):
+            for j in range(min(i + 1, sizes_in[piece_idx])):
+                piece_values[value_idx] = matrix_piece[i, j]
+                value_idx += 1
+
+    return (
+        piece_values,
+        piece_offsets,
+        positions_in,
+        positions_out,
+        sizes_in,
+        sizes_out,
+        out_leaf_ptr,
+    )
+
+
+@njit(cache=True)
+def merge_trafo_flat(
+    piece_values: ARRAY,
+    piece_offsets: ARRAY,
+    positions_in: ARRAY,
+    positions_out: ARRAY,
+    sizes_in: ARRAY,
+    sizes_out: ARRAY,
+    out_leaf_ptr: ARRAY,
+) -> ARRAY:
+    """Reconstructing the global transformation matrix from the precomputed transformation in flat format.
+
+    :param piece_values: the packed lower triangular values of all the pieces
+    :param piece_offsets: the offsets of each piece in the values
+    :param positions_in: the start positions of the pieces in the input coefficients
+    :param positions_out: the start positions of the pieces in the output coefficients
+    :param sizes_in: the sizes of the input slices
+    :param sizes_out: the sizes of the output slices
+    :param out_leaf_ptr: the range of the pieces of each output leaf
+    :return: reconstructed transformation matrix
+
+    """
+    expected_size = np.max(positions_out + sizes_out)
+    combined_matrix = np.zeros((expected_size, expected_size), dtype=FLOAT_DTYPE)
+    for piece_idx in range(len(piece_offsets) - 1):
+        pos_in = positions_in[piece_idx]
+        pos_out = positions_out[piece_idx]
+        value_idx = piece_offsets[piece_idx]
+        for i in range(sizes_out[piece_idx]):
+            for j in range(min(i + 1, sizes_in[piece_idx])):
+                combined_matrix[pos_out + i, pos_in + j] = piece_values[value_idx]
+                value_idx += 1
+
+    return combined_matrix
+
+
 @njit(cache=True)
 def factorised_2_piecewise(
     first_leaf_solution, leaf_factors, leaf_positions, leaf_sizes
@@ -63,7 +247,7 @@ def factorised_2_piecewise(
     """Computes the actual matrix pieces of a transformation in factorised format explicitly.
 
     :param first_leaf_solution:
-    :param leaf_factors:
+    :param leaf_factors: the factors of all leaf combinations in packed lower triangular format
     :param leaf_positions:
     :param leaf_sizes:
     :return:
@@ -79,7 +263,7 @@ def factorised_2_piecewise(
     for node_idx_1 in range(nr_of_leaves):
         # "lower triangular form"
         for node_idx_2 in range(node_idx_1, nr_of_leaves):
-            corr_factor = leaf_factors[node_idx_2, node_idx_1]
+            corr_factor = leaf_factors[node_idx_2 * (node_idx_2 + 1) // 2 + node_idx_1]
             if corr_factor == 0.0:
                 continue
 
@@ -153,7 +337,7 @@ def merge_trafo_factorised(
     """Reconstructing the global transformation matrix from the precomputed transformation in factorised format.
 
     :param first_leaf_solution:
-    :param leaf_factors:
+    :param leaf_factors: the factors of all leaf combinations in packed lower triangular format
     :param leaf_positions:
     :param leaf_sizes:
     :return:
@@ -163,3 +347,36 @@ def merge_trafo_factorised(
         first_leaf_solution, leaf_factors, leaf_positions, leaf_sizes
     )
     return merge_trafo_piecewise(*trafo_piecewise)
+
+
+def merge_trafo_nested(
+    solutions_1d: ARRAY,
+    fiber_idxs: ARRAY,
+    fiber_ptrs: ARRAY,
+    fiber_ptr_offsets: ARRAY,
+) -> ARRAY:
+    """Reconstructing the global transformation matrix from the precomputed transformation in nested format.
+
+    :param solutions_1d: the 1D transformation matrices of each dimension
+    :param fiber_idxs: the positions of the coefficients sorted by the fibers of each dimension
+    :param fiber_ptrs: the start (and end) of each fiber in the sorted positions
+    :param fiber_ptr_offsets: the range of the fiber pointers of each dimension
+    :return: reconstructed transformation matrix
+
+    Notes
+    -----
+    The matrix is obtained by transforming the identity matrix (column by column).
+    """
+    expected_size = fiber_idxs.shape[1]
+    identity = np.eye(expected_size, dtype=FLOAT_DTYPE)
+    combined_matrix = np.zeros((expected_size, expected_size), dtype=FLOAT_DTYPE)
+    transform_barycentric_nested(
+        identity,
+        combined_matrix,
+        solutions_1d,
+        fiber_idxs,
+        fiber_ptrs,
+        fiber_ptr_offsets,
+    )
+
+    return combined_matrix
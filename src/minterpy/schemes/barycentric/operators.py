@@ -13,6 +13,7 @@ matrix is performed and how the transformation is applied:
 - `BarycentricDictOperator`
 - `BarycentricFactorisedOperator`
 - `BarycentricPiecewiseOperator`
+- `BarycentricNestedOperator`
 
 ----
 
@@ -28,10 +29,16 @@ from minterpy.core.ABC import OperatorABC
 from minterpy.global_settings import ARRAY, FLOAT_DTYPE
 
 from ..matrix_operator import MatrixOperator
-from .conversion import merge_trafo_dict, merge_trafo_factorised, merge_trafo_piecewise
+from .conversion import (
+    merge_trafo_factorised,
+    merge_trafo_flat,
+    merge_trafo_nested,
+    merge_trafo_piecewise,
+)
 from .transformation_fcts import (
     transform_barycentric_dict,
     transform_barycentric_factorised,
+    transform_barycentric_nested,
     transform_barycentric_piecewise,
 )
 
@@ -83,16 +90,22 @@ class BarycentricOperator(OperatorABC):
         # TODO support "separate multi index" transformations
 
         # assuming the input are coefficients which should be transformed
-        coeffs_in = other  # alias
+        # NOTE: the transformation fcts operate on 2D arrays
+        #  (one column per set of coefficients) -> all sets are transformed at once
+        coeffs_in = np.ascontiguousarray(other, dtype=FLOAT_DTYPE)
+        is_one_dimensional = coeffs_in.ndim == 1
+        if is_one_dimensional:
+            coeffs_in = coeffs_in.reshape(-1, 1)
         # use an output placeholder (for an increases compatibility with Numba JIT compilation)
         # initialise the placeholder with 0
         coeffs_out_placeholder = np.zeros(coeffs_in.shape, dtype=FLOAT_DTYPE)
-        # trafo_dict, leaf_positions = self.data_container
 
         # NOTE: 'self' arg must not be passed to the the transformation fcts (@staticmethod)
         self.__class__.transformation_fct(
             coeffs_in, coeffs_out_placeholder, *self.transformation_data
         )  # type: ignore
+        if is_one_dimensional:
+            return coeffs_out_placeholder.reshape(-1)
         return coeffs_out_placeholder
 
     def _get_array_repr(self):
@@ -103,15 +116,21 @@ class BarycentricOperator(OperatorABC):
 class BarycentricDictOperator(BarycentricOperator):
     """Concrete implementation of the BarycentricOperator given by the edge case given by decomposition to the 1D
     atomic sub-problems.
+
+    The transformation data is the flat piece store of the decomposition
+    (see :py:func:`.conversion.dict_2_flat`).
     """
 
     transformation_fct = transform_barycentric_dict
-    merging_fct = merge_trafo_dict
+    merging_fct = merge_trafo_flat
 
 
 class BarycentricFactorisedOperator(BarycentricOperator):
     """Concrete implementation of the BarycentricOperator given by the edge case given by realizing the factorised
     copied of the basic 1D atomic sub-problem.
+
+    The factors of the leaf combinations are stored in packed lower triangular format
+    (see :py:func:`.conversion.triangular_2_packed`).
     """
 
     transformation_fct = transform_barycentric_factorised
@@ -125,3 +144,16 @@ class BarycentricPiecewiseOperator(BarycentricOperator):
 
     transformation_fct = transform_barycentric_piecewise
     merging_fct = merge_trafo_piecewise
+
+
+class BarycentricNestedOperator(BarycentricOperator):
+    """Concrete implementation of the BarycentricOperator given by the fully nested (hierarchical) factorisation
+    into the 1D atomic sub-problems of each dimension.
+
+    The storage (the 1D solutions and the fibers of each dimension) grows linearly with the number of coefficients
+    and the transformation is applied one dimension after the other
+    (see :py:func:`.transformation_fcts.transform_barycentric_nested`).
+    """
+
+    transformation_fct = transform_barycentric_nested
+    merging_fct = merge_trafo_nested
@@ -9,7 +9,7 @@ there are different formats for storing (and computing) these trees
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, no_type_check
+from typing import TYPE_CHECKING, Optional, Tuple, no_type_check
 
 import numpy as np
 from numba import njit
@@ -28,12 +28,20 @@ from minterpy.global_settings import (
     FACTORISED_TRAFO_TYPE,
     FLOAT_DTYPE,
     INT_DTYPE,
+    NESTED_TRAFO_TYPE,
     TRAFO_DICT,
     TYPED_LIST,
 )
+from minterpy.jit_compiled.newton.eval import eval_newton_monomials_single
 from minterpy.utils.polynomials.newton import eval_newton_monomials
 
-from .operators import BarycentricFactorisedOperator, BarycentricOperator
+from .conversion import dict_2_flat, get_packed_identity, get_packed_size
+from .operators import (
+    BarycentricDictOperator,
+    BarycentricFactorisedOperator,
+    BarycentricNestedOperator,
+    BarycentricOperator,
+)
 
 if TYPE_CHECKING:
     # https://stackoverflow.com/questions/39740632/python-type-hinting-without-cyclic-imports
@@ -216,27 +224,13 @@ def compute_l2n_dict(
     return curr_solutions, leaf_positions
 
 
-@njit(cache=True)
-def get_leaf_array_slice(
-    dim_idx: int,
-    node_idx: int,
-    array: ARRAY,
-    split_positions: TYPED_LIST,
-    subtree_sizes: TYPED_LIST,
-) -> ARRAY:
-    """Get leaf slices"""
-    pos_from, pos_to = get_leaf_idxs(dim_idx, node_idx, split_positions, subtree_sizes)
-    return array[pos_from:pos_to]
-
-
 @njit(cache=True)
 def update_leaves(
     dim_idx: int,
     node_idx_left: int,
     node_idx_right: int,
     gen_val_idx_left: int,
-    v_left: ARRAY,
-    result_placeholder: ARRAY,
+    leaf_factors: ARRAY,
     generating_values: ARRAY,
     split_positions: TYPED_LIST,
     subtree_sizes: TYPED_LIST,
@@ -245,9 +239,9 @@ def update_leaves(
     """Project the left split exponents onto right split exponents.
 
     Each split in the multi-index set corresponds to a group of leaf nodes,
-    each of which corresponds to a slice of result array.
-    This function projects a slice of a result array that belongs to a left
-    subtree onto its correspondence in a right subtree and update the result
+    each of which corresponds to a row of the (lower triangular) leaf factors.
+    This function projects the rows that belong to a left subtree onto
+    their correspondences in a right subtree and update the result
     according to the divided difference scheme.
 
     The correspondence between the left and right subtrees (of splits) are
@@ -263,10 +257,10 @@ def update_leaves(
         The index of the right subtree.
     gen_val_idx_left: int
         The index of the generating values that corresponds to the left subtree.
-    v_left: ARRAY
-        The values that correspond to the left subtree.
-    result_placeholder: ARRAY
-        The result placeholder for in-place modification.
+    leaf_factors: ARRAY
+        The leaf factors in packed lower triangular format
+        (see :py:func:`.conversion.triangular_2_packed`)
+        for in-place modification.
     generating_values: ARRAY
         Generating points of the current parent dimension (`dim_idx` + 1).
     split_positions: TYPED_LIST
@@ -280,8 +274,15 @@ def update_leaves(
     Returns
     -------
     None
-        The input `result_placeholder` is modified in place to store the
+        The input `leaf_factors` is modified in place to store the
         results of the projection.
+
+    Notes
+    -----
+    The leaves of the left subtree precede the leaves of the right subtree,
+    i.e., a left row is shorter than the right row it is projected onto.
+    The entries of the right row beyond the left row are only divided
+    (the missing entries of the left row are zero).
     """
 
     # Get the number of "jumps" in grid values of the same dimension
@@ -292,18 +293,28 @@ def update_leaves(
     # Get the difference between two grid values
     grid_val_diff = gen_val_right - gen_val_left
 
-    # Values corresponding to the right subtree
-    v_right = get_leaf_array_slice(
-        dim_idx, node_idx_right, result_placeholder, split_positions, subtree_sizes
+    # Rows (leaves) corresponding to the left and right subtrees
+    leaf_idx_left, _ = get_leaf_idxs(
+        dim_idx, node_idx_left, split_positions, subtree_sizes
+    )
+    leaf_idx_right, leaf_idx_right_end = get_leaf_idxs(
+        dim_idx, node_idx_right, split_positions, subtree_sizes
     )
-
-    # Consider only entries in the left subtree
-    # that have matching correspondences with the right subtree
-    v_left = v_left[leaf_mask]
 
     # Compute the divided difference L_2 = (L - Q_1) / Q_H
-    # NOTE: Replace all values of the view
-    v_right[:] = (v_right - v_left) / grid_val_diff
+    # NOTE: consider only the entries in the left subtree
+    # that have matching correspondences with the right subtree
+    for mask_idx in range(leaf_idx_right_end - leaf_idx_right):
+        row_right = leaf_idx_right + mask_idx
+        row_left = leaf_idx_left + leaf_mask[mask_idx]
+        offset_right = row_right * (row_right + 1) // 2
+        offset_left = row_left * (row_left + 1) // 2
+        for col in range(row_left + 1):
+            leaf_factors[offset_right + col] = (
+                leaf_factors[offset_right + col] - leaf_factors[offset_left + col]
+            ) / grid_val_diff
+        for col in range(row_left + 1, row_right + 1):
+            leaf_factors[offset_right + col] /= grid_val_diff
 
 
 @njit(cache=True)
@@ -411,7 +422,7 @@ def compute_leaf_projection_mask(
 
 @njit(cache=True)  # TODO
 def leaf_node_dds(
-    result_placeholder: ARRAY,
+    leaf_factors: ARRAY,
     generating_points: ARRAY,
     split_positions: TYPED_LIST,
     subtree_sizes: TYPED_LIST,
@@ -428,13 +439,12 @@ def leaf_node_dds(
     These factors are used in the factorized form of the barycentric
     Lagrange-to-Newton transformation operator.
 
-    NOTE: only use case is calling this with the identity matrix?!
-    TODO: optimise for this use case
-
     Parameters
     ----------
-    result_placeholder: ARRAY
-        The result placeholder for in-place modification.
+    leaf_factors: ARRAY
+        The identity matrix in packed lower triangular format
+        (see :py:func:`.conversion.triangular_2_packed`)
+        for in-place modification.
     generating_points: ARRAY
         The generating points of the grid.
     split_positions: TYPED_LIST
@@ -447,7 +457,7 @@ def leaf_node_dds(
     Returns
     -------
     None
-        The input `result_placeholder` is modified in place to store the
+        The input `leaf_factors` is modified in place to store the
         results of the divided difference scheme.
 
     Notes
@@ -458,6 +468,8 @@ def leaf_node_dds(
     two leaf nodes (left and right) are "related").
     The correspondence between the left and right subtrees (nodes) are
     established via masking that is computed on-the-fly.
+    The results are lower triangular, only the entries on and below
+    the diagonal are stored and updated.
     """
 
     # Get the dimensionality of the problem
@@ -490,15 +502,6 @@ def leaf_node_dds(
                 range(first_child_idx, last_child_idx)
             ):
 
-                # Get the values that correspond to the left subtree (splits)
-                v_left = get_leaf_array_slice(
-                    dim_idx_child,
-                    node_idx_left,
-                    result_placeholder,
-                    split_positions,
-                    subtree_sizes,
-                )
-
                 for node_idx_right in range(node_idx_left + 1, last_child_idx + 1):
                     # Loop over all right subtrees (splits)
                     # ATTENTION: Also include the last subtree
@@ -519,8 +522,7 @@ def leaf_node_dds(
                         node_idx_left,
                         node_idx_right,
                         gen_val_idx_left,
-                        v_left,
-                        result_placeholder,
+                        leaf_factors,
                         generating_values,
                         split_positions,
                         subtree_sizes,
@@ -548,6 +550,7 @@ def compute_l2n_factorised(
     this allows a very efficient computation and compact storage of the trees:
     - solve the 1D DDS for the leaf problem of maximal size once
     - compute all factors for the leaf node combinations ("leaf level DDS")
+      (a lower triangular matrix stored in packed format)
 
     -> exploit this property for storing the tree in an even more compressed format!
     (and with just numpy arrays!)
@@ -586,10 +589,10 @@ def compute_l2n_factorised(
     # compute the correction factors for all leaf node combinations (recursively defined by the DDS)
     # = the first value of each triangular tree matrix piece
     # initialise a placeholder with the expected DDS result
-    # NOTE: this matrix will be triangular (1/2 of the values are 0)
+    # NOTE: this matrix is triangular, only the entries on and below
+    # the diagonal are stored (packed format)
     # TODO again this matrix is of nested triangular form. optimise!?
-    # TODO find more memory efficient format?!
-    leaf_factors = np.eye(nr_of_leaves, dtype=FLOAT_DTYPE)
+    leaf_factors = get_packed_identity(nr_of_leaves)
     leaf_node_dds(
         leaf_factors, generating_points, split_positions, subtree_sizes, exponents
     )
@@ -600,6 +603,46 @@ def compute_l2n_factorised(
 # functions for the N2L tree:
 
 
+@njit(cache=True)
+def eval_packed_leaf_factors(
+    leaf_points: ARRAY, leaf_exponents: ARRAY, generating_points: ARRAY
+) -> ARRAY:
+    """Evaluates the Newton monomials of the leaves on the leaf points in packed lower triangular format.
+
+    :param leaf_points: the unisolvent nodes of the first node of each leaf
+    :param leaf_exponents: the exponents of the first node of each leaf
+    :param generating_points: the generating points of the grid
+    :return: the value of the Newton monomial of leaf ``j`` at the point of leaf ``i``
+        for all ``j <= i``, stored row by row (see :py:func:`.conversion.triangular_2_packed`)
+
+    Notes
+    -----
+    The Newton monomial of a leaf vanishes on the points of all the preceding leaves,
+    so only the entries on and below the diagonal are evaluated.
+    """
+    nr_of_leaves, spatial_dimension = leaf_exponents.shape
+    max_exponents = np.empty(spatial_dimension, dtype=INT_DTYPE)
+    for dim_idx in range(spatial_dimension):
+        max_exponents[dim_idx] = np.max(leaf_exponents[:, dim_idx])
+    products_placeholder = np.empty(
+        (np.max(max_exponents) + 1, spatial_dimension), dtype=FLOAT_DTYPE
+    )
+    packed_size = get_packed_size(nr_of_leaves, nr_of_leaves)
+    leaf_factors = np.empty(packed_size, dtype=FLOAT_DTYPE)
+    for leaf_idx in range(nr_of_leaves):
+        offset = leaf_idx * (leaf_idx + 1) // 2
+        eval_newton_monomials_single(
+            leaf_points[leaf_idx],
+            leaf_exponents[: leaf_idx + 1],
+            generating_points,
+            max_exponents,
+            products_placeholder,
+            leaf_factors[offset : offset + leaf_idx + 1],
+        )
+
+    return leaf_factors
+
+
 def compute_n2l_factorised(
     exponents: ARRAY,
     generating_points: ARRAY,
@@ -643,19 +686,131 @@ def compute_n2l_factorised(
     # = the first value of each triangular tree matrix piece
     leaf_exponents = exponents[leaf_positions, :]
     leaf_points = unisolvent_nodes[leaf_positions, :]
-    # NOTE: this matrix will be triangular (1/2 of the values are 0)
-    # TODO  find more memory efficient format?!
-    leaf_factors = eval_newton_monomials(
-        leaf_points,
-        leaf_exponents,
-        generating_points,
-        verify_input=DEBUG,
-        triangular=True,
+    # NOTE: this matrix is triangular, only the entries on and below
+    # the diagonal are evaluated and stored (packed format)
+    leaf_factors = eval_packed_leaf_factors(
+        leaf_points, leaf_exponents, generating_points
     )
 
     return first_n2l_piece, leaf_factors, leaf_positions, leaf_sizes
 
 
+# functions for the nested format (both L2N and N2L):
+
+
+def compute_nested_fibers(exponents: ARRAY) -> Tuple[ARRAY, ARRAY, ARRAY]:
+    """Computes the fibers of a downward-closed multi-index set along each dimension.
+
+    :param exponents: the exponents of the (downward-closed) multi-index set
+    :return: the positions of the exponents sorted by the fibers of each dimension (a 2D array),
+        the start (and end) of each fiber in the sorted positions (all dimensions concatenated),
+        and the range of the fiber pointers of each dimension
+
+    Notes
+    -----
+    A fiber along a dimension consists of all the exponents that differ only in that dimension.
+    Within a fiber the positions are sorted by the exponent in that dimension;
+    due to the downward-closedness the exponents of a fiber with ``k`` entries are exactly ``0, ..., k-1``.
+    The fibers along the first dimension are the leaves of the multi-index tree.
+    """
+    nr_exponents, dimensionality = exponents.shape
+    fiber_idxs = np.empty((dimensionality, nr_exponents), dtype=INT_DTYPE)
+    fiber_ptrs = []
+    fiber_ptr_offsets = np.zeros(dimensionality + 1, dtype=INT_DTYPE)
+    for dim_idx in range(dimensionality):
+        exponents_other = np.delete(exponents, dim_idx, axis=1)
+        # NOTE: the last key is the primary sorting key
+        sort_keys = [exponents[:, dim_idx]]
+        sort_keys.extend(exponents_other.T)
+        order = np.lexsort(sort_keys)
+        fiber_idxs[dim_idx] = order
+
+        exponents_other = exponents_other[order]
+        is_new_fiber = np.any(exponents_other[1:] != exponents_other[:-1], axis=1)
+        ptrs = np.concatenate(
+            ([0], np.flatnonzero(is_new_fiber) + 1, [nr_exponents])
+        ).astype(INT_DTYPE)
+        fiber_ptrs.append(ptrs)
+        fiber_ptr_offsets[dim_idx + 1] = fiber_ptr_offsets[dim_idx] + len(ptrs)
+
+    return fiber_idxs, np.concatenate(fiber_ptrs), fiber_ptr_offsets
+
+
+def compute_l2n_nested(
+    generating_points: ARRAY,
+    exponents: ARRAY,
+    max_exponents: Optional[ARRAY] = None,
+) -> NESTED_TRAFO_TYPE:
+    """Computes the L2N tree in nested (hierarchical) factorised format.
+
+    :param generating_points: generating points of the grid
+    :param exponents: the exponents of the (downward-closed) multi-index set
+    :param max_exponents: the (precomputed) maximum exponent per dimension,
+        e.g., :py:attr:`MultiIndexSet.max_exponents`. If not given, it is
+        computed from the exponents.
+    :return: all the required data structures for the transformation
+
+    Notes
+    -----
+    The L2N transformation of a downward-closed set is the restriction of the Kronecker product
+    of the 1D DDS solutions of each dimension (the tensorial divided differences).
+    Only the 1D DDS solutions of maximal size and the fibers are stored,
+    i.e., ``O(m n^2 + m N)`` values instead of the ``O(N^2)`` values of the full matrix.
+    """
+    dimensionality = exponents.shape[1]
+    if max_exponents is None:
+        max_exponents = np.max(exponents, axis=0)
+    max_problem_size = np.max(max_exponents) + 1
+    solutions_1d = np.empty(
+        (dimensionality, max_problem_size, max_problem_size), dtype=FLOAT_DTYPE
+    )
+    for dim_idx in range(dimensionality):
+        dds_solution_max = np.eye(max_problem_size, dtype=FLOAT_DTYPE)
+        # ATTENTION: different in each dimension!
+        gen_vals = np.ascontiguousarray(generating_points[:, dim_idx])
+        dds_1_dimensional(gen_vals, dds_solution_max)
+        solutions_1d[dim_idx] = dds_solution_max
+
+    return (solutions_1d,) + compute_nested_fibers(exponents)
+
+
+def compute_n2l_nested(
+    generating_points: ARRAY,
+    exponents: ARRAY,
+    max_exponents: Optional[ARRAY] = None,
+) -> NESTED_TRAFO_TYPE:
+    """Computes the N2L tree in nested (hierarchical) factorised format.
+
+    :param generating_points: generating points of the grid
+    :param exponents: the exponents of the (downward-closed) multi-index set
+    :param max_exponents: the (precomputed) maximum exponent per dimension,
+        e.g., :py:attr:`MultiIndexSet.max_exponents`. If not given, it is
+        computed from the exponents.
+    :return: all the required data structures for the transformation
+
+    Notes
+    -----
+    The Newton monomials are products of 1D Newton monomials,
+    hence the N2L transformation is the restriction of the Kronecker product of the 1D evaluations
+    of the Newton monomials at the generating points of each dimension.
+    This realises evaluating just in one dimension and passing the results to all the nodes "below".
+    """
+    if max_exponents is None:
+        max_exponents = np.max(exponents, axis=0)
+    max_problem_size = np.max(max_exponents) + 1
+    gen_vals = generating_points[:max_problem_size].T
+    # 1D Newton monomial j at the point i: prod_{k < j} (p_i - p_k), lower triangular
+    solutions_1d = np.ones(
+        (gen_vals.shape[0], max_problem_size, max_problem_size), dtype=FLOAT_DTYPE
+    )
+    for j in range(1, max_problem_size):
+        solutions_1d[:, :, j] = solutions_1d[:, :, j - 1] * (
+            gen_vals - gen_vals[:, j - 1 : j]
+        )
+
+    return (solutions_1d,) + compute_nested_fibers(exponents)
+
+
 def _build_lagrange_to_newton_bary(
     transformation: TransformationABC,
 ) -> BarycentricOperator:
@@ -691,6 +846,39 @@ def _build_lagrange_to_newton_bary(
     return transformation_operator
 
 
+def _build_lagrange_to_newton_bary_dict(
+    transformation: TransformationABC,
+) -> BarycentricDictOperator:
+    """Construct the barycentric transformation operator for Lagrange-to-Newton in dictionary format.
+
+    Parameters
+    ----------
+    transformation: TransformationABC
+        An instance of one of the concrete implementation of TransformationABC
+
+    Returns
+    -------
+    BarycentricDictOperator
+        a BarycentricOperator for Lagrange to Newton transformation
+        storing a triangular matrix piece for every leaf node combination.
+    """
+    grid = transformation.grid
+    tree = grid.tree
+    trafo_dict, leaf_positions = compute_l2n_dict(
+        grid.generating_points,
+        tree.split_positions,
+        tree.subtree_sizes,
+        tree.problem_sizes,
+    )
+    transformation_data = dict_2_flat(trafo_dict, leaf_positions)
+
+    transformation_operator = BarycentricDictOperator(
+        transformation, transformation_data
+    )
+
+    return transformation_operator
+
+
 def _build_newton_to_lagrange_bary(
     transformation: TransformationABC,
 ) -> BarycentricFactorisedOperator:
@@ -717,3 +905,63 @@ def _build_newton_to_lagrange_bary(
     )
 
     return transformation_operator
+
+
+def _build_lagrange_to_newton_bary_nested(
+    transformation: TransformationABC,
+) -> BarycentricNestedOperator:
+    """Construct the barycentric transformation operator for Lagrange-to-Newton in nested format.
+
+    Parameters
+    ----------
+    transformation: TransformationABC
+        An instance of one of the concrete implementation of TransformationABC
+
+    Returns
+    -------
+    BarycentricNestedOperator
+        a BarycentricOperator for Lagrange to Newton transformation
+        storing only the 1D DDS solutions and the fibers of each dimension.
+    """
+    grid = transformation.grid
+    multi_index = grid.multi_index
+    transformation_data = compute_l2n_nested(
+        grid.generating_points,
+        multi_index.exponents,
+        max_exponents=multi_index.max_exponents,
+    )
+    transformation_operator = BarycentricNestedOperator(
+        transformation, transformation_data
+    )
+
+    return transformation_operator
+
+
+def _build_newton_to_lagrange_bary_nested(
+    transformation: TransformationABC,
+) -> BarycentricNestedOperator:
+    """Construct the barycentric transformation operator for Newton-to-Lagrange in nested format.
+
+    Parameters
+    ----------
+    transformation: TransformationABC
+        An instance of one of the concrete implementation of TransformationABC
+
+    Returns
+    -------
+    BarycentricNestedOperator
+        a BarycentricOperator for Newton to Lagrange transformation
+        storing only the 1D Newton monomials and the fibers of each dimension.
+    """
+    grid = transformation.grid
+    multi_index = grid.multi_index
+    transformation_data = compute_n2l_nested(
+        grid.generating_points,
+        multi_index.exponents,
+        max_exponents=multi_index.max_exponents,
+    )
+    transformation_operator = BarycentricNestedOperator(
+        transformation, transformation_data
+    )
+
+    return transformation_operator
@@ -13,24 +13,71 @@ then just use multiples of these results instead of performing actual matrix mul
 
 TODO test all different transformation formats!
 """
-from typing import no_type_check
+from numba import njit, prange
 
-from numba import njit
+from minterpy.global_settings import ARRAY, TYPED_LIST
 
-from minterpy.global_settings import ARRAY, TRAFO_DICT, TYPED_LIST
 
-
-@no_type_check
 @njit(cache=True)
+def add_packed_piece_product(
+    coeffs_in: ARRAY,
+    coeffs_out: ARRAY,
+    piece_values: ARRAY,
+    value_idx: int,
+    pos_in: int,
+    pos_out: int,
+    size_in: int,
+    size_out: int,
+) -> None:
+    """Adds the product of a lower triangular matrix piece in packed format with a slice of the coefficients.
+
+    :param coeffs_in: the coefficients to be transformed, a 2D array (one column per set of coefficients)
+    :param coeffs_out: the output coefficients, updated in place
+    :param piece_values: the packed values of the pieces (see :py:func:`.conversion.dict_2_flat`)
+    :param value_idx: the offset of the piece in the packed values
+    :param pos_in: the start position of the input slice
+    :param pos_out: the start position of the output slice
+    :param size_in: the size of the input slice
+    :param size_out: the size of the output slice
+
+    Notes
+    -----
+    Only the entries on and below the diagonal are visited (the zero triangle is skipped).
+    """
+    nr_columns = coeffs_in.shape[1]
+    for i in range(size_out):
+        row_out = pos_out + i
+        for j in range(min(i + 1, size_in)):
+            factor = piece_values[value_idx]
+            value_idx += 1
+            row_in = pos_in + j
+            for k in range(nr_columns):
+                coeffs_out[row_out, k] += factor * coeffs_in[row_in, k]
+
+
+@njit(parallel=True, nogil=True)
 def transform_barycentric_dict(
-    coeffs_in: ARRAY, coeffs_out: ARRAY, trafo_dict: TRAFO_DICT, leaf_positions: ARRAY
+    coeffs_in: ARRAY,
+    coeffs_out: ARRAY,
+    piece_values: ARRAY,
+    piece_offsets: ARRAY,
+    positions_in: ARRAY,
+    positions_out: ARRAY,
+    sizes_in: ARRAY,
+    sizes_out: ARRAY,
+    out_leaf_ptr: ARRAY,
 ) -> None:
     """Transformation using a dictionary encoding (= a triangular array piece for every leaf node combination).
 
-    :param coeffs_in: the coefficients to be transformed
-    :param coeffs_out: a placeholder for the output coefficients
-    :param trafo_dict: dictionary with matrix pieces
-    :param leaf_positions: starting positions in the input and output coeffs arrays
+    :param coeffs_in: the coefficients to be transformed, a 2D array (one column per set of coefficients)
+    :param coeffs_out: a placeholder for the output coefficients (initialised to 0)
+    :param piece_values: the packed lower triangular values of all the pieces
+    :param piece_offsets: the offsets of each piece in the values
+    :param positions_in: the start positions of the pieces in the input coefficients
+    :param positions_out: the start positions of the pieces in the output coefficients
+    :param sizes_in: the sizes of the input slices
+    :param sizes_out: the sizes of the output slices
+    :param out_leaf_ptr: the range of the pieces of each output leaf
 
     Notes
     -----
@@ -38,32 +85,66 @@ def transform_barycentric_dict(
     to use a different implementation of this transformation!
     (e.g. regular DDS or leaf level DDS (factorised format)
 
-    Transforms and sums up the respective parts (slices) of the coefficients.
+    The dictionary is converted into a flat piece store beforehand,
+    the pieces are grouped by their output leaf (see :py:func:`.conversion.dict_2_flat`).
+    Each thread processes all the pieces of an output leaf, hence the output slices
+    written by different threads are disjoint and no atomic updates are required.
     """
+    nr_leaves = len(out_leaf_ptr) - 1
+    for leaf_idx_out in prange(nr_leaves):
+        for piece_idx in range(out_leaf_ptr[leaf_idx_out], out_leaf_ptr[leaf_idx_out + 1]):
+            add_packed_piece_product(
+                coeffs_in,
+                coeffs_out,
+                piece_values,
+                piece_offsets[piece_idx],
+                positions_in[piece_idx],
+                positions_out[piece_idx],
+                sizes_in[piece_idx],
+                sizes_out[piece_idx],
+            )
 
-    # NOTE: this format includes a lot of redundancies,
-    #     because the matrix pieces are actually just multiples of each other!
-    for (leaf_idx_l, leaf_idx_r), matrix_piece in trafo_dict.items():
-        start_pos_in = leaf_positions[leaf_idx_l]
-        start_pos_out = leaf_positions[leaf_idx_r]
 
-        # NOTE: the size of the required slices of the coefficient vectors
-        # are implicitly encoded in the size of each transformation matrix piece!
-        size_out, size_in = matrix_piece.shape
+@njit(cache=True)
+def add_piece_product(
+    coeffs_in: ARRAY,
+    coeffs_out: ARRAY,
+    matrix_piece: ARRAY,
+    factor: float,
+    pos_in: int,
+    pos_out: int,
+    size_in: int,
+    size_out: int,
+) -> None:
+    """Adds the (scaled) product of a lower triangular matrix piece with a slice of the coefficients.
 
-        end_pos_in = start_pos_in + size_in
-        slice_in = coeffs_in[start_pos_in:end_pos_in]
-        # TODO exploit property that all matrix pieces are also triangular! -> avoid unnecessary computations!
-        # TODO build own function using numpy.triu_indices_from?
-        coeff_slice_transformed = matrix_piece @ slice_in
+    :param coeffs_in: the coefficients to be transformed, a 2D array (one column per set of coefficients)
+    :param coeffs_out: the output coefficients, updated in place
+    :param matrix_piece: the matrix piece; only the upper left ``size_out x size_in`` block is used
+    :param factor: the factor of the piece
+    :param pos_in: the start position of the input slice
+    :param pos_out: the start position of the output slice
+    :param size_in: the size of the input slice
+    :param size_out: the size of the output slice
 
-        end_pos_out = start_pos_out + size_out
-        slice_out = coeffs_out[start_pos_out:end_pos_out]
-        slice_out[:] += coeff_slice_transformed  # sum up
+    Notes
+    -----
+    Only the entries on and below the diagonal are visited (the zero triangle is skipped).
+    No temporary arrays are created, all the sets of coefficients are updated at once.
+    """
+    nr_columns = coeffs_in.shape[1]
+    for i in range(size_out):
+        row_out = pos_out + i
+        for j in range(min(i + 1, size_in)):
+            entry = factor * matrix_piece[i, j]
+            if entry == 0.0:
+                continue
+            row_in = pos_in + j
+            for k in range(nr_columns):
+                coeffs_out[row_out, k] += entry * coeffs_in[row_in, k]
 
 
-#  TODO void(F_1D, F_1D, F_2D, F_2D, F_1D, F_1D),
-@njit(cache=True)
+@njit(parallel=True, nogil=True)
 def transform_barycentric_factorised(
     coeffs_in: ARRAY,
     coeffs_out_placeholder: ARRAY,
@@ -77,41 +158,38 @@ def transform_barycentric_factorised(
     The factorised copies of the basic 1D atomic sub-problem are assigned to each combination of leaf problems.
     By keeping the decomposition, the transformation acts on the respective parts (slices) of the coefficients.
 
-    :param leaf_factors: square array of lower triangular form containing a factor for each combination of leaf nodes.
+    :param leaf_factors: lower triangular array containing a factor for each combination of leaf nodes
+        in packed format, i.e., the factor of the leaves ``(i, j)`` (``j <= i``) is at ``i * (i + 1) // 2 + j``
+        (see :py:func:`.conversion.triangular_2_packed`).
     :param first_leaf_solution: the solution of the 1D sub-problem (leaf) of maximal size
-    :param coeffs_in: the Lagrange coefficients to be transformed
+    :param coeffs_in: the Lagrange coefficients to be transformed, a 2D array (one column per set of coefficients)
     :param coeffs_out_placeholder: a placeholder for the output coefficients
         NOTE: must be initialised to all 0 and have the equal size as the input coefficients
 
+    Notes
+    -----
+    The output leaves are distributed over the threads;
+    each thread sums up the contributions of all the input leaves to its output leaf
+    (no atomic updates are required).
     """
     nr_of_leaves = len(leaf_positions)
-    for node_idx_1 in range(nr_of_leaves):
-        # "lower triangular form"
-        for node_idx_2 in range(node_idx_1, nr_of_leaves):
-            corr_factor = leaf_factors[node_idx_2, node_idx_1]
+    for node_idx_2 in prange(nr_of_leaves):
+        # "lower triangular form": the factors of an output leaf are contiguous
+        offset = node_idx_2 * (node_idx_2 + 1) // 2
+        for node_idx_1 in range(node_idx_2 + 1):
+            corr_factor = leaf_factors[offset + node_idx_1]
             if corr_factor == 0.0:
                 continue
-            start_pos_in = leaf_positions[node_idx_1]
-            start_pos_out = leaf_positions[node_idx_2]
-
-            size_in = leaf_sizes[node_idx_1]
-            size_out = leaf_sizes[node_idx_2]
-
-            end_pos_in = start_pos_in + size_in
-            slice_in = coeffs_in[start_pos_in:end_pos_in]
-            # TODO exploit property that all matrix pieces are also triangular! -> avoid unnecessary computations!
-            # TODO build own function using numpy.triu_indices_from ?
-            # TODO np.dot() is faster on contiguous arrays. by slicing contiguity is lost.
-            #  is it faster to actually store all matrix pieces?!
-            #  on the other hand in this implementation all input arguments are numpy arrays
-            #  -> efficient JIT compilation possible!
-            matrix_piece = first_leaf_solution[:size_out, :size_in]
-            coeff_slice_transformed = matrix_piece @ slice_in
-            coeff_slice_transformed *= corr_factor
-
-            end_pos_out = start_pos_out + size_out
-            slice_out = coeffs_out_placeholder[start_pos_out:end_pos_out]
-            slice_out[:] += coeff_slice_transformed  # sum up
+            add_piece_product(
+                coeffs_in,
+                coeffs_out_placeholder,
+                first_leaf_solution,
+                corr_factor,
+                leaf_positions[node_idx_1],
+                leaf_positions[node_idx_2],
+                leaf_sizes[node_idx_1],
+                leaf_sizes[node_idx_2],
+            )
 
 
 @njit(cache=True)
@@ -124,9 +202,9 @@ def transform_barycentric_piecewise(
 ) -> None:
     """Transformation based on piecewise format.
 
-    :param coeffs_in: the coefficients to be transformed.
-    :param coeffs_out_placeholder: a placeholder for the output coefficients.
-    :param matrix_pieces: sub transformation matrices.
+    :param coeffs_in: the coefficients to be transformed, a 2D array (one column per set of coefficients).
+    :param coeffs_out: a placeholder for the output coefficients.
+    :param matrix_pieces: sub transformation matrices (of lower triangular form).
     :param start_positions_in: start position for the slice in coefficients to be transformed.
     :param start_positions_out: start position for the slice in output coefficients.
 
@@ -137,13 +215,63 @@ def transform_barycentric_piecewise(
         # NOTE: the size of the required slices of the coefficient vectors
         # are implicitly encoded in the size of each transformation matrix piece!
         size_out, size_in = matrix_piece.shape
+        add_piece_product(
+            coeffs_in,
+            coeffs_out,
+            matrix_piece,
+            1.0,
+            start_pos_in,
+            start_pos_out,
+            size_in,
+            size_out,
+        )
+
 
-        end_pos_in = start_pos_in + size_in
-        slice_in = coeffs_in[start_pos_in:end_pos_in]
-        # TODO exploit property that all matrix pieces are also triangular! -> avoid unnecessary computations!
-        # TODO build own function using numpy.triu_indices_from ?
-        coeff_slice_transformed = matrix_piece @ slice_in
+@njit(parallel=True, nogil=True)
+def transform_barycentric_nested(
+    coeffs_in: ARRAY,
+    coeffs_out: ARRAY,
+    solutions_1d: ARRAY,
+    fiber_idxs: ARRAY,
+    fiber_ptrs: ARRAY,
+    fiber_ptr_offsets: ARRAY,
+) -> None:
+    """Transformation based on the nested (hierarchical) factorised format.
 
-        end_pos_out = start_pos_out + size_out
-        slice_out = coeffs_out[start_pos_out:end_pos_out]
-        slice_out[:] += coeff_slice_transformed  # sum up
+    :param coeffs_in: the coefficients to be transformed, a 2D array (one column per set of coefficients)
+    :param coeffs_out: a placeholder for the output coefficients of the same shape
+    :param solutions_1d: the 1D transformation matrices (lower triangular) of each dimension, a 3D array
+    :param fiber_idxs: the positions of the coefficients sorted by the fibers of each dimension, a 2D array
+    :param fiber_ptrs: the start (and end) of each fiber in the sorted positions, all dimensions concatenated
+    :param fiber_ptr_offsets: the range of the fiber pointers of each dimension
+
+    Notes
+    -----
+    The transformation matrix is a (downward-closed) restriction of the Kronecker product
+    of the 1D transformation matrices.
+    It is applied one dimension after the other ("sum factorisation"):
+    the 1D matrix of a dimension is applied to each fiber along that dimension
+    (the coefficients whose exponents differ only in that dimension).
+    The fibers of a dimension are disjoint and are distributed over the threads.
+    The cost is ``O(N n m)`` instead of ``O(N^2)``,
+    with ``n`` the maximal fiber length and ``m`` the dimensionality.
+    """
+    coeffs_out[:] = coeffs_in
+    nr_columns = coeffs_out.shape[1]
+    dimensionality = len(solutions_1d)
+    for dim_idx in range(dimensionality):
+        solution = solutions_1d[dim_idx]
+        idxs = fiber_idxs[dim_idx]
+        ptr_start = fiber_ptr_offsets[dim_idx]
+        nr_fibers = fiber_ptr_offsets[dim_idx + 1] - ptr_start - 1
+        for fiber_idx in prange(nr_fibers):
+            start = fiber_ptrs[ptr_start + fiber_idx]
+            end = fiber_ptrs[ptr_start + fiber_idx + 1]
+            # NOTE: lower triangular -> update in place starting from the last entry
+            for i in range(end - start - 1, -1, -1):
+                row = idxs[start + i]
+                for k in range(nr_columns):
+                    value = solution[i, i] * coeffs_out[row, k]
+                    for j in range(i):
+                        value += solution[i, j] * coeffs_out[idxs[start + j], k]
+                    coeffs_out[row, k] = value
@@ -25,6 +25,8 @@ All the concrete classes implement the abstract base class
 +------------------------+---------------------------------------------------------------------+
 | :py:mod:`.utils`       | Low-level utility functions related to basis transformations        |
 +------------------------+---------------------------------------------------------------------+
+| ``operator_selection`` | Cost model to select the format of the transformation operators     |
++------------------------+---------------------------------------------------------------------+
 """
 
 
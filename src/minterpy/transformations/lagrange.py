@@ -12,7 +12,9 @@ Implementations of the transformation classes of **from**
   :ref:`Chebyshev basis <fundamentals/polynomial-bases:Chebyshev basis>`
   of the first kind)
 """
-from minterpy.core.ABC import TransformationABC
+from typing import Optional
+
+from minterpy.core.ABC import OperatorABC, TransformationABC
 from minterpy.polynomials import (
     LagrangePolynomial,
     NewtonPolynomial,
@@ -23,17 +25,63 @@ from minterpy.transformations.utils import (
     build_lagrange_to_canonical_operator,
     build_lagrange_to_newton_operator,
     build_lagrange_to_chebyshev_operator,
+    get_operator_format,
+    verify_operator_format,
 )
 
 __all__ = ["LagrangeToNewton", "LagrangeToCanonical", "LagrangeToChebyshev"]
 
 
 class LagrangeToNewton(TransformationABC):
-    """Transformation from the Lagrange basis to the Newton basis."""
+    """Transformation from the Lagrange basis to the Newton basis.
+
+    Parameters
+    ----------
+    origin_poly : LagrangePolynomial
+        The polynomial to be transformed.
+    operator_format : str, optional
+        The format of the transformation operator: ``"auto"`` (select
+        the format with a cost model), ``"matrix"``, ``"factorised"``,
+        ``"dict"``, or ``"nested"``.
+        If not specified, the default format is used
+        (``minterpy.global_settings.DEFAULT_OPERATOR_FORMAT``).
+
+    Raises
+    ------
+    ValueError
+        If the operator format is not supported.
+    """
 
     origin_type = LagrangePolynomial
     target_type = NewtonPolynomial
-    _get_transformation_operator = build_lagrange_to_newton_operator
+
+    def __init__(
+        self,
+        origin_poly: LagrangePolynomial,
+        operator_format: Optional[str] = None,
+    ):
+        super().__init__(origin_poly)
+        self.operator_format = verify_operator_format(operator_format, "l2n")
+        self._selected_format: Optional[str] = None
+
+    @property
+    def selected_format(self) -> str:
+        """The format of the transformation operator.
+
+        Returns
+        -------
+        str
+            The format of the (constructed or to be constructed) operator;
+            the format ``"auto"`` is resolved with the cost model.
+        """
+        if self._selected_format is None:
+            return get_operator_format(self, self.operator_format, "l2n")
+        return self._selected_format
+
+    def _get_transformation_operator(self) -> OperatorABC:
+        """Construct the transformation operator in the selected format."""
+        self._selected_format = self.selected_format
+        return build_lagrange_to_newton_operator(self, self._selected_format)
 
 
 class LagrangeToCanonical(TransformationABC):
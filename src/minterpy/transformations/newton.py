@@ -12,7 +12,9 @@ Implementations of the transformation classes **from**
   :ref:`Chebyshev basis <fundamentals/polynomial-bases:Chebyshev basis>`
   of the first kind)
 """
-from minterpy.core.ABC import TransformationABC
+from typing import Optional
+
+from minterpy.core.ABC import OperatorABC, TransformationABC
 from minterpy.polynomials import (
     NewtonPolynomial,
     LagrangePolynomial,
@@ -23,17 +25,62 @@ from minterpy.transformations.utils import (
     build_newton_to_lagrange_operator,
     build_newton_to_canonical_operator,
     build_newton_to_chebyshev_operator,
+    get_operator_format,
+    verify_operator_format,
 )
 
 __all__ = ["NewtonToLagrange", "NewtonToCanonical", "NewtonToChebyshev"]
 
 
 class NewtonToLagrange(TransformationABC):
-    """Transformation from the Newton basis to the Lagrange basis."""
+    """Transformation from the Newton basis to the Lagrange basis.
+
+    Parameters
+    ----------
+    origin_poly : NewtonPolynomial
+        The polynomial to be transformed.
+    operator_format : str, optional
+        The format of the transformation operator: ``"auto"`` (select
+        the format with a cost model), ``"matrix"``, ``"factorised"``, or ``"nested"``.
+        If not specified, the default format is used
+        (``minterpy.global_settings.DEFAULT_OPERATOR_FORMAT``).
+
+    Raises
+    ------
+    ValueError
+        If the operator format is not supported.
+    """
 
     origin_type = NewtonPolynomial
     target_type = LagrangePolynomial
-    _get_transformation_operator = build_newton_to_lagrange_operator
+
+    def __init__(
+        self,
+        origin_poly: NewtonPolynomial,
+        operator_format: Optional[str] = None,
+    ):
+        super().__init__(origin_poly)
+        self.operator_format = verify_operator_format(operator_format, "n2l")
+        self._selected_format: Optional[str] = None
+
+    @property
+    def selected_format(self) -> str:
+        """The format of the transformation operator.
+
+        Returns
+        -------
+        str
+            The format of the (constructed or to be constructed) operator;
+            the format ``"auto"`` is resolved with the cost model.
+        """
+        if self._selected_format is None:
+            return get_operator_format(self, self.operator_format, "n2l")
+        return self._selected_format
+
+    def _get_transformation_operator(self) -> OperatorABC:
+        """Construct the transformation operator in the selected format."""
+        self._selected_format = self.selected_format
+        return build_newton_to_lagrange_operator(self, self._selected_format)
 
 
 class NewtonToCanonical(TransformationABC):
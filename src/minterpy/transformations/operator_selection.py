@@ -0,0 +1,389 @@
+"""
+Automatic selection of the format of the transformation operators.
+
+The Lagrange-to-Newton and Newton-to-Lagrange transformations of polynomials
+with downward-closed multi-index sets are available in several formats:
+
+- ``"matrix"``: the full (dense) transformation matrix
+  (:py:class:`.MatrixOperator`)
+- ``"factorised"``: the leaf-level factorised barycentric format
+  (:py:class:`.BarycentricFactorisedOperator`)
+- ``"dict"``: a triangular matrix piece for every combination of leaves
+  (:py:class:`.BarycentricDictOperator`; Lagrange-to-Newton only)
+- ``"nested"``: the fully nested factorised barycentric format
+  (:py:class:`.BarycentricNestedOperator`)
+
+Which format is the most performant depends on the problem size.
+The cost model of this module estimates, for each format, the time to
+construct the operator, the time to apply it once, and the memory required
+to store it. The estimated times are linear models (a constant overhead plus
+a cost per unit of work) of the number of floating-point operations as
+derived from the structure of the multi-index set. The coefficients of the
+models are obtained by a micro-benchmark (:py:func:`calibrate_operator_costs`);
+the coefficients shipped with minterpy have been obtained on a reference
+machine and can be replaced by the ones of the current machine
+(:py:func:`set_operator_costs`).
+
+The format ``"auto"`` selects the format with the smallest estimated time
+(construction and one application) among the formats that fit into
+the memory budget (:py:func:`select_operator_format`).
+
+----
+
+"""
+
+import time
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from minterpy import global_settings
+from minterpy.core.multi_index import MultiIndexSet
+
+__all__ = [
+    "OperatorCost",
+    "L2N_FORMATS",
+    "N2L_FORMATS",
+    "estimate_operator_costs",
+    "select_operator_format",
+    "calibrate_operator_costs",
+    "get_operator_costs",
+    "set_operator_costs",
+]
+
+L2N_FORMATS = ("matrix", "factorised", "dict", "nested")
+N2L_FORMATS = ("matrix", "factorised", "nested")
+_FORMATS = {"l2n": L2N_FORMATS, "n2l": N2L_FORMATS}
+
+# (Overhead, cost per unit) in seconds of the construction and the application
+# NOTE: obtained with `calibrate_operator_costs()` on a reference machine
+DEFAULT_OPERATOR_COSTS = {
+    "l2n": {
+        "matrix": ((5.3e-05, 1.1e-10), (2.7e-06, 2.3e-10)),
+        "factorised": ((3.1e-05, 1.9e-07), (9.3e-06, 4.2e-09)),
+        "dict": ((4.4e-05, 3.0e-08), (1.1e-05, 9.3e-09)),
+        "nested": ((6.0e-05, 1.2e-08), (8.3e-06, 3.3e-09)),
+    },
+    "n2l": {
+        "matrix": ((1.6e-05, 2.1e-09), (3.2e-06, 4.4e-10)),
+        "factorised": ((5.0e-05, 1.7e-09), (9.4e-06, 5.3e-09)),
+        "nested": ((1.1e-04, 1.3e-08), (1.5e-05, 3.1e-09)),
+    },
+}
+
+_OPERATOR_COSTS = DEFAULT_OPERATOR_COSTS
+
+# Reference problems of the micro-benchmark (spatial dimension, degree)
+_CALIBRATION_PROBLEMS = ((2, 4), (2, 12), (3, 16))
+
+
+class OperatorCost(NamedTuple):
+    """The estimated costs of a transformation operator format."""
+
+    build_time: float
+    """The estimated time (in seconds) to construct the operator."""
+    apply_time: float
+    """The estimated time (in seconds) to apply the operator once."""
+    memory: int
+    """The estimated memory (in bytes) to store the operator."""
+
+    @property
+    def total_time(self) -> float:
+        """The estimated time to construct and apply the operator once."""
+        return self.build_time + self.apply_time
+
+
+def get_operator_costs() -> Dict[str, Dict[str, Tuple[Tuple[float, float], ...]]]:
+    """Get the coefficients of the cost model.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Tuple[Tuple[float, float], ...]]]
+        For each direction (``"l2n"`` and ``"n2l"``) and format, the overhead
+        and the cost per unit (in seconds) of the construction and of
+        the application of the operator.
+    """
+    return _OPERATOR_COSTS
+
+
+def set_operator_costs(
+    costs: Optional[Dict[str, Dict[str, Tuple[Tuple[float, float], ...]]]],
+) -> None:
+    """Set the coefficients of the cost model.
+
+    Parameters
+    ----------
+    costs : Dict[str, Dict[str, Tuple[Tuple[float, float], ...]]], optional
+        The coefficients of the cost model, e.g., as obtained by
+        :py:func:`calibrate_operator_costs`. If ``None``, the shipped default
+        coefficients are restored.
+
+    Raises
+    ------
+    ValueError
+        If the coefficients of a direction or a format are missing.
+    """
+    global _OPERATOR_COSTS
+    if costs is None:
+        _OPERATOR_COSTS = DEFAULT_OPERATOR_COSTS
+        return
+
+    for direction, formats in _FORMATS.items():
+        missing = set(formats) - set(costs.get(direction, {}))
+        if missing:
+            raise ValueError(
+                f"Missing coefficients of the formats {sorted(missing)} "
+                f"of the direction <{direction}>"
+            )
+    _OPERATOR_COSTS = costs
+
+
+def estimate_operator_costs(
+    multi_index: MultiIndexSet,
+    direction: str,
+    num_polynomials: int = 1,
+) -> Dict[str, OperatorCost]:
+    """Estimate the costs of each format of a transformation operator.
+
+    Parameters
+    ----------
+    multi_index : MultiIndexSet
+        The (downward-closed) multi-index set of the grid.
+    direction : str
+        The direction of the transformation, ``"l2n"`` (Lagrange-to-Newton)
+        or ``"n2l"`` (Newton-to-Lagrange).
+    num_polynomials : int, optional
+        The number of sets of coefficients transformed at once.
+
+    Returns
+    -------
+    Dict[str, OperatorCost]
+        The estimated costs of each supported format.
+
+    Raises
+    ------
+    ValueError
+        If the direction is not supported.
+    """
+    if direction not in _FORMATS:
+        raise ValueError(
+            f"Direction <{direction}> is not supported; "
+            f"supported directions are {tuple(_FORMATS)}"
+        )
+    units = _count_units(multi_index, direction)
+    itemsize = np.dtype(global_settings.FLOAT_DTYPE).itemsize
+    coeffs = _OPERATOR_COSTS[direction]
+
+    estimates = {}
+    for operator_format in _FORMATS[direction]:
+        build_units, apply_units, memory_items = units[operator_format]
+        (build_overhead, build_cost), (apply_overhead, apply_cost) = coeffs[
+            operator_format
+        ]
+        estimates[operator_format] = OperatorCost(
+            build_time=build_overhead + build_cost * build_units,
+            apply_time=apply_overhead + apply_cost * apply_units * num_polynomials,
+            memory=int(memory_items * itemsize),
+        )
+
+    return estimates
+
+
+def select_operator_format(
+    multi_index: MultiIndexSet,
+    direction: str,
+    num_polynomials: int = 1,
+    memory_budget: Optional[int] = None,
+) -> str:
+    """Select the format of a transformation operator with the cost model.
+
+    Parameters
+    ----------
+    multi_index : MultiIndexSet
+        The (downward-closed) multi-index set of the grid.
+    direction : str
+        The direction of the transformation, ``"l2n"`` (Lagrange-to-Newton)
+        or ``"n2l"`` (Newton-to-Lagrange).
+    num_polynomials : int, optional
+        The number of sets of coefficients transformed at once.
+    memory_budget : int, optional
+        The maximum memory in bytes to store the operator. If not specified,
+        ``minterpy.global_settings.DEFAULT_OPERATOR_MEMORY_BUDGET`` is used.
+
+    Returns
+    -------
+    str
+        The format with the smallest estimated time to construct and apply
+        the operator once among the formats that fit into the memory budget;
+        ``"nested"`` (the storage of which grows only linearly with
+        the number of coefficients) if none fits.
+    """
+    if memory_budget is None:
+        memory_budget = global_settings.DEFAULT_OPERATOR_MEMORY_BUDGET
+
+    estimates = estimate_operator_costs(multi_index, direction, num_polynomials)
+    candidates = {
+        operator_format: cost
+        for operator_format, cost in estimates.items()
+        if cost.memory <= memory_budget
+    }
+    if not candidates:
+        return "nested"
+
+    return min(candidates, key=lambda key: candidates[key].total_time)
+
+
+def calibrate_operator_costs(
+    repeats: int = 5,
+) -> Dict[str, Dict[str, Tuple[Tuple[float, float], ...]]]:
+    """Calibrate the cost model with a micro-benchmark on the current machine.
+
+    Parameters
+    ----------
+    repeats : int, optional
+        The number of timed repetitions; the fastest one is used.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Tuple[Tuple[float, float], ...]]]
+        The coefficients of the cost model to be passed to
+        :py:func:`set_operator_costs`.
+
+    Notes
+    -----
+    - Each format is constructed and applied on three small reference
+      problems after a warm-up run (to exclude the just-in-time compilation);
+      the overhead and the cost per unit are fitted to the timings.
+    - The benchmark takes several seconds.
+    """
+    # NOTE: import here to avoid circular imports
+    from minterpy.polynomials import LagrangePolynomial, NewtonPolynomial
+    from minterpy.transformations.lagrange import LagrangeToNewton
+    from minterpy.transformations.newton import NewtonToLagrange
+    from minterpy.transformations.utils import (
+        build_lagrange_to_newton_operator,
+        build_newton_to_lagrange_operator,
+    )
+
+    if repeats < 1:
+        raise ValueError(f"Invalid number of repetitions <{repeats}>")
+
+    directions = {
+        "l2n": (
+            LagrangePolynomial,
+            LagrangeToNewton,
+            build_lagrange_to_newton_operator,
+        ),
+        "n2l": (NewtonPolynomial, NewtonToLagrange, build_newton_to_lagrange_operator),
+    }
+    costs: Dict[str, Dict[str, Tuple[Tuple[float, float], ...]]] = {}
+    for direction, (poly_class, trafo_class, build_operator) in directions.items():
+        samples: Dict[str, list] = {key: [] for key in _FORMATS[direction]}
+        for spatial_dimension, poly_degree in _CALIBRATION_PROBLEMS:
+            mi = MultiIndexSet.from_degree(spatial_dimension, poly_degree, 2.0)
+            coeffs = np.ones(len(mi))
+            transformation = trafo_class(poly_class(mi, coeffs))
+            units = _count_units(mi, direction)
+            for operator_format in _FORMATS[direction]:
+                operator = build_operator(transformation, operator_format)
+                operator @ coeffs  # warm-up
+                build_time = _time_fastest(
+                    repeats, build_operator, transformation, operator_format
+                )
+                apply_time = _time_fastest(repeats, operator.__matmul__, coeffs)
+                samples[operator_format].append(
+                    (units[operator_format], build_time, apply_time)
+                )
+
+        costs[direction] = {
+            operator_format: (
+                _fit_line([(s[0][0], s[1]) for s in samples[operator_format]]),
+                _fit_line([(s[0][1], s[2]) for s in samples[operator_format]]),
+            )
+            for operator_format in samples
+        }
+
+    return costs
+
+
+def _count_units(
+    multi_index: MultiIndexSet, direction: str
+) -> Dict[str, Tuple[float, float, float]]:
+    """Count the units of work and storage of each format.
+
+    The units are proxies of the number of floating-point operations to
+    construct and to apply (to a single set of coefficients) an operator, and
+    of the number of floating-point values to store it.
+    """
+    nr_exponents, spatial_dimension = multi_index.exponents.shape
+    exponents = multi_index.exponents.astype(np.float64)
+    # NOTE: the maximum exponent is memoized by the multi-index set
+    max_size = multi_index.max_exponent + 1 if nr_exponents > 0 else 1
+
+    # The leaves are the runs of exponents with a common tail (starting at 0)
+    leaf_starts = np.flatnonzero(exponents[:, 0] == 0)
+    leaf_sizes = np.diff(np.append(leaf_starts, nr_exponents))
+    nr_leaves = len(leaf_starts)
+    # Number of nonzero leaf combinations (the boxes below each leaf)
+    leaf_boxes = np.prod(exponents[leaf_starts, 1:] + 1, axis=1)
+    piece_ops = np.sum(leaf_boxes * leaf_sizes * (leaf_sizes + 1) / 2)
+    # Each entry of a fiber of length k costs its position within the fiber
+    nested_ops = np.sum(exponents) + spatial_dimension * nr_exponents
+
+    matrix_items = float(nr_exponents) ** 2
+    if direction == "l2n":
+        # NOTE: the naive operator is obtained by an inversion
+        matrix_build = matrix_items * (nr_exponents + spatial_dimension)
+        factorised_build = np.sum(leaf_boxes) * spatial_dimension + max_size**2
+    else:
+        matrix_build = matrix_items * spatial_dimension
+        factorised_build = float(nr_leaves) ** 2 * spatial_dimension
+    nested_build = spatial_dimension * nr_exponents * np.log2(nr_exponents + 1)
+
+    units = {
+        "matrix": (matrix_build, matrix_items, matrix_items),
+        "factorised": (
+            factorised_build,
+            piece_ops,
+            nr_leaves * (nr_leaves + 1) / 2 + max_size**2,
+        ),
+        "nested": (
+            nested_build,
+            nested_ops,
+            spatial_dimension * (max_size**2 + 2 * nr_exponents),
+        ),
+    }
+    if direction == "l2n":
+        units["dict"] = (piece_ops, piece_ops, 2 * piece_ops)
+
+    return units
+
+
+def _time_fastest(repeats: int, fun, *args) -> float:
+    """Return the fastest wall-clock time of repeated calls."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fun(*args)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def _fit_line(samples) -> Tuple[float, float]:
+    """Fit the (non-negative) overhead and cost per unit to the timings.
+
+    The relative errors of the timings are minimized (least-squares).
+    """
+    units, timings = np.array(samples, dtype=np.float64).T
+    timings = np.maximum(timings, np.finfo(np.float64).tiny)
+    lhs = np.column_stack((np.ones_like(units), units)) / timings[:, np.newaxis]
+    overhead, slope = np.linalg.lstsq(lhs, np.ones_like(units), rcond=None)[0]
+    if slope < 0.0:
+        overhead, slope = np.sum(1 / timings) / np.sum(1 / timings**2), 0.0
+    elif overhead < 0.0:
+        ratios = units / timings
+        overhead, slope = 0.0, np.sum(ratios) / np.sum(ratios**2)
+
+    return float(f"{overhead:.2g}"), float(f"{slope:.2g}")
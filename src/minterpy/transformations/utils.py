@@ -11,17 +11,26 @@ Utility functions for computing matrices for transformation between canonical, l
 """
 import numpy as np
 
-from typing import no_type_check
+from typing import Optional, no_type_check
 
 from minterpy.core.ABC import OperatorABC, TransformationABC
 from minterpy.dds import dds
+from minterpy import global_settings
 from minterpy.global_settings import ARRAY, DEBUG, FLOAT_DTYPE
 from minterpy.jit_compiled.transformations import compute_vandermonde_n2c
 from minterpy.schemes.barycentric.precomp import (
     _build_lagrange_to_newton_bary,
+    _build_lagrange_to_newton_bary_dict,
+    _build_lagrange_to_newton_bary_nested,
     _build_newton_to_lagrange_bary,
+    _build_newton_to_lagrange_bary_nested,
 )
 from minterpy.schemes.matrix_operator import MatrixOperator
+from minterpy.transformations.operator_selection import (
+    L2N_FORMATS,
+    N2L_FORMATS,
+    select_operator_format,
+)
 from minterpy.utils.polynomials.newton import eval_newton_monomials
 
 from minterpy.utils.polynomials.chebyshev import (
@@ -32,6 +41,89 @@ from minterpy.utils.polynomials.chebyshev import (
 # NOTE: avoid looping over a numpy array! e.g. for j in np.arange(num_monomials):
 # see: # https://stackoverflow.com/questions/10698858/built-in-range-or-numpy-arange-which-is-more-efficient
 
+def verify_operator_format(
+    operator_format: Optional[str],
+    direction: str = "l2n",
+) -> str:
+    """Verify the format of a Lagrange-to-Newton or Newton-to-Lagrange operator.
+
+    Parameters
+    ----------
+    operator_format : str, optional
+        The format of the operator, ``"auto"`` or one of the formats listed in
+        :py:mod:`.operator_selection`; ``None`` selects the (configurable)
+        module-level default ``minterpy.global_settings.DEFAULT_OPERATOR_FORMAT``.
+    direction : str, optional
+        The direction of the transformation, ``"l2n"`` (Lagrange-to-Newton)
+        or ``"n2l"`` (Newton-to-Lagrange).
+
+    Returns
+    -------
+    str
+        The verified format of the operator.
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported.
+    """
+    if operator_format is None:
+        operator_format = global_settings.DEFAULT_OPERATOR_FORMAT
+    operator_format = operator_format.lower()
+    supported_formats = ("auto",) + (L2N_FORMATS if direction == "l2n" else N2L_FORMATS)
+    if operator_format not in supported_formats:
+        raise ValueError(
+            f"Operator format <{operator_format}> is not supported; "
+            f"supported formats are {supported_formats}"
+        )
+
+    return operator_format
+
+
+def get_operator_format(
+    transformation: TransformationABC,
+    operator_format: Optional[str] = None,
+    direction: str = "l2n",
+) -> str:
+    """Get the format of the operator constructed for a transformation.
+
+    Parameters
+    ----------
+    transformation : TransformationABC
+        The transformer instance (Lagrange-to-Newton or Newton-to-Lagrange).
+    operator_format : str, optional
+        The requested format of the operator (see :py:func:`verify_operator_format`).
+    direction : str, optional
+        The direction of the transformation, ``"l2n"`` (Lagrange-to-Newton)
+        or ``"n2l"`` (Newton-to-Lagrange).
+
+    Returns
+    -------
+    str
+        The format of the operator; the format ``"auto"`` is resolved with
+        the cost model (see :py:func:`.select_operator_format`).
+
+    Notes
+    -----
+    - The ``"matrix"`` format is always used if the multi-indices
+      are not downward-closed or are separate from the grid indices.
+    """
+    operator_format = verify_operator_format(operator_format, direction)
+    grid = transformation.grid
+    is_downward_closed = grid.multi_index.is_downward_closed
+    identical_indices = not transformation.origin_poly.indices_are_separate
+    if not (is_downward_closed and identical_indices):
+        return "matrix"
+
+    if operator_format == "auto":
+        coeffs = transformation.origin_poly._coeffs
+        num_polynomials = 1 if coeffs is None or coeffs.ndim == 1 else coeffs.shape[1]
+        operator_format = select_operator_format(
+            grid.multi_index, direction, num_polynomials
+        )
+
+    return operator_format
+
 
 def invert_triangular(triangular_matrix: np.ndarray) -> np.ndarray:
     # FIXME: triangular inversion is not working! required when using barycentric transforms?
@@ -60,6 +152,7 @@ def _build_n2l_array(grid, multi_index=None, require_invertible: bool = False) -
         generating_points,
         verify_input=DEBUG,
         triangular=True,
+        max_exponents=multi_index.max_exponents,
     )
     return transformation_matrix
 
@@ -94,7 +187,8 @@ def build_l2n_matrix_dds(grid):
     num_monomials = len(grid.multi_index)
     lagr_coeff_matrix = np.eye(num_monomials, dtype=FLOAT_DTYPE)
     tree = grid.tree
-    lagrange_to_newton = dds(lagr_coeff_matrix, tree)
+    # NOTE: the identity matrix is a temporary; transform it in place
+    lagrange_to_newton = dds(lagr_coeff_matrix, tree, overwrite_input=True)
     return lagrange_to_newton
 
 
@@ -124,7 +218,7 @@ def _build_c2n_array(transformation) -> ARRAY:
         V_n2c, transformation.grid.unisolvent_nodes, multi_index.exponents
     )  # computes the result "in place"
     tree = transformation.grid.tree
-    c2n = dds(V_n2c, tree)
+    c2n = dds(V_n2c, tree, overwrite_input=True)
     return c2n
 
 
@@ -133,10 +227,25 @@ def _build_n2c_array(transformation: TransformationABC) -> ARRAY:
     return invert_triangular(_build_c2n_array(transformation))
 
 
+# Builders of the operators for each supported format
+_L2N_BUILDERS = {
+    "matrix": _build_lagrange_to_newton_naive,
+    "factorised": _build_lagrange_to_newton_bary,
+    "dict": _build_lagrange_to_newton_bary_dict,
+    "nested": _build_lagrange_to_newton_bary_nested,
+}
+_N2L_BUILDERS = {
+    "matrix": _build_newton_to_lagrange_naive,
+    "factorised": _build_newton_to_lagrange_bary,
+    "nested": _build_newton_to_lagrange_bary_nested,
+}
+
+
 # --- From LagrangePolynomial
 @no_type_check
 def build_lagrange_to_newton_operator(
     transformation: TransformationABC,
+    operator_format: Optional[str] = None,
 ) -> OperatorABC:
     """Construct the Lagrange-to-Newton transformation operator.
 
@@ -146,6 +255,10 @@ def build_lagrange_to_newton_operator(
         The transformer instance with information about the origin polynomial
         (an instance of LagrangePolynomial) and
         the target type (NewtonPolynomial).
+    operator_format : str, optional
+        The format of the transformation operator, ``"auto"`` or one of
+        the formats listed in :py:mod:`.operator_selection`. If not specified,
+        the default format is used (see :py:func:`verify_operator_format`).
 
     Returns
     -------
@@ -154,19 +267,16 @@ def build_lagrange_to_newton_operator(
 
     Notes
     -----
-    - The barycentric transformation operator is employed if the multi-indices
-      are downward-closed.
+    - A barycentric transformation operator may only be employed if
+      the multi-indices are downward-closed; the format is selected with
+      a cost model by default (see :py:func:`get_operator_format`).
     - The naive transformation operator is inefficient due to the following
       inversion: ``inv(nwt2lag_matrix)``.
     """
-    grid = transformation.grid
-    is_downward_closed = grid.multi_index.is_downward_closed
-    identical_indices = not transformation.origin_poly.indices_are_separate
-    if is_downward_closed and identical_indices:
-        # use barycentric transformation
-        transformation_operator = _build_lagrange_to_newton_bary(transformation)
-    else:  # use "naive" matrix transformation format
-        transformation_operator = _build_lagrange_to_newton_naive(transformation)
+    operator_format = get_operator_format(
+        transformation, operator_format, "l2n"
+    )
+    transformation_operator = _L2N_BUILDERS[operator_format](transformation)
     return transformation_operator
 
 
@@ -254,6 +364,7 @@ def build_lagrange_to_chebyshev_operator(
 @no_type_check
 def build_newton_to_lagrange_operator(
     transformation: TransformationABC,
+    operator_format: Optional[str] = None,
 ) -> OperatorABC:
     """Construct the Newton-to-Lagrange transformation operator.
 
@@ -263,6 +374,10 @@ def build_newton_to_lagrange_operator(
         The transformer instance with information about the origin polynomial
         (an instance of NewtonPolynomial) and
         the target type (LagrangePolynomial).
+    operator_format : str, optional
+        The format of the transformation operator, ``"auto"`` or one of
+        the formats listed in :py:mod:`.operator_selection`. If not specified,
+        the default format is used (see :py:func:`verify_operator_format`).
 
     Returns
     -------
@@ -271,17 +386,14 @@ def build_newton_to_lagrange_operator(
 
     Notes
     -----
-    - The barycentric transformation operator is employed if the multi-indices
-      are downward-closed.
+    - A barycentric transformation operator may only be employed if
+      the multi-indices are downward-closed; the format is selected with
+      a cost model by default (see :py:func:`get_operator_format`).
     """
-    grid = transformation.grid
-    is_downward_closed = grid.multi_index.is_downward_closed
-    identical_indices = not transformation.origin_poly.indices_are_separate
-    if is_downward_closed and identical_indices:
-        # use barycentric transformation
-        transformation_operator = _build_newton_to_lagrange_bary(transformation)
-    else:  # use "naive" matrix transformation format
-        transformation_operator = _build_newton_to_lagrange_naive(transformation)
+    operator_format = get_operator_format(
+        transformation, operator_format, "n2l"
+    )
+    transformation_operator = _N2L_BUILDERS[operator_format](transformation)
 
     return transformation_operator
 
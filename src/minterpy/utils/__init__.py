@@ -36,6 +36,8 @@ such as instances of :py:mod:`concrete polynomials <.polynomials>`,
 +-----------------------------------+---------------------------------------------------------------+
 | :py:mod:`.quad`                   | Numerical routines relevant to quadrature                     |
 +-----------------------------------+---------------------------------------------------------------+
+| :py:mod:`.tree_cache`             | Persistent on-disk cache of the multi-index tree              |
++-----------------------------------+---------------------------------------------------------------+
 | :py:mod:`.verification`           | Utility functions to verify a given value                     |
 +-----------------------------------+---------------------------------------------------------------+
 """
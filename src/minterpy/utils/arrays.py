@@ -4,10 +4,15 @@ This module contains common numerical routines that operate on NumPy arrays.
 
 from __future__ import annotations
 
-from typing import Union
+import os
+
+from concurrent.futures import Executor
+from typing import Callable, Iterator, Optional, Union
 
 import numpy as np
 
+from minterpy import global_settings
+
 
 def lp_norm(arr, p, axis=None, keepdims: bool = False):
     """Robust lp-norm function.
@@ -261,6 +266,215 @@ def is_unique(xx: np.ndarray) -> bool:
     return len(np.unique(xx)) == len(xx)
 
 
+def get_batch_size(
+    num_points: int,
+    row_size: int,
+    memory_budget: Optional[int] = None,
+) -> int:
+    """Compute the number of query points per batch within a memory budget.
+
+    Parameters
+    ----------
+    num_points : int
+        The total number of query points.
+    row_size : int
+        The number of (floating-point) elements of the intermediate arrays
+        required per query point, e.g., ``N`` for the values of ``N``
+        monomials at a query point.
+    memory_budget : int, optional
+        The memory budget in bytes for the intermediate arrays of a batch.
+        If not specified, the (configurable) module-level default
+        ``minterpy.global_settings.DEFAULT_MEMORY_BUDGET`` is used.
+
+    Returns
+    -------
+    int
+        The number of query points per batch; at least one and at most
+        ``num_points`` (unless there is no query point at all).
+
+    Examples
+    --------
+    >>> get_batch_size(1000, 128, memory_budget=8 * 128 * 100)
+    100
+    >>> get_batch_size(10, 128, memory_budget=8 * 128 * 100)
+    10
+    >>> get_batch_size(1000, 10**9, memory_budget=1024)
+    1
+    """
+    if memory_budget is None:
+        memory_budget = global_settings.DEFAULT_MEMORY_BUDGET
+
+    itemsize = np.dtype(global_settings.FLOAT_DTYPE).itemsize
+    row_bytes = max(row_size, 1) * itemsize
+    batch_size = max(int(memory_budget) // row_bytes, 1)
+
+    return min(batch_size, max(num_points, 1))
+
+
+def get_batch_slices(num_points: int, batch_size: int) -> Iterator[slice]:
+    """Iterate over the slices of consecutive batches of query points.
+
+    Parameters
+    ----------
+    num_points : int
+        The total number of query points.
+    batch_size : int
+        The (maximum) number of query points per batch; the last batch
+        may be smaller.
+
+    Returns
+    -------
+    Iterator[slice]
+        The slices selecting the query points of each batch.
+
+    Examples
+    --------
+    >>> list(get_batch_slices(5, 2))
+    [slice(0, 2, None), slice(2, 4, None), slice(4, 5, None)]
+    """
+    for start_idx in range(0, num_points, batch_size):
+        yield slice(start_idx, min(start_idx + batch_size, num_points))
+
+
+class EvalWorkspace:
+    """Reusable buffers for the intermediate arrays of repeated evaluations.
+
+    A workspace hands out named buffers for the intermediate arrays of
+    an evaluation (e.g., the values of the monomials at the query points).
+    A buffer is only (re-)allocated if it is requested for the first time
+    or if a larger size or a different dtype is required; otherwise,
+    a view of the existing buffer is returned. Repeated evaluations of
+    the same polynomial on same-sized batches of query points therefore
+    do not allocate any new intermediate arrays.
+
+    Notes
+    -----
+    - The content of a buffer is overwritten by the next evaluation that
+      uses the same workspace. Arrays obtained from a workspace must not be
+      kept beyond the evaluation that requested them.
+    - A workspace must not be shared by concurrent evaluations.
+
+    Examples
+    --------
+    >>> ws = EvalWorkspace()
+    >>> buf_1 = ws.get("monomials", (10, 3))
+    >>> buf_2 = ws.get("monomials", (5, 3))  # smaller, reuses the buffer
+    >>> np.shares_memory(buf_1, buf_2)
+    True
+    >>> ws.nbytes
+    240
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+    @property
+    def nbytes(self) -> int:
+        """The total number of bytes held by the buffers of the workspace."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def get(
+        self,
+        name: str,
+        shape: tuple,
+        dtype: np.dtype = global_settings.FLOAT_DTYPE,
+    ) -> np.ndarray:
+        """Get a (C-contiguous, uninitialized) buffer of a given shape.
+
+        Parameters
+        ----------
+        name : str
+            The name of the buffer.
+        shape : tuple
+            The shape of the requested array.
+        dtype : np.dtype, optional
+            The dtype of the requested array; by default, ``FLOAT_DTYPE``.
+
+        Returns
+        -------
+        :class:`numpy:numpy.ndarray`
+            An array of the requested shape and dtype backed by the buffer.
+        """
+        size = int(np.prod(shape))
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.size < size or buffer.dtype != dtype:
+            buffer = np.empty(size, dtype=dtype)
+            self._buffers[name] = buffer
+
+        return buffer[:size].reshape(shape)
+
+
+def eval_in_chunks(
+    fun: Callable,
+    xx: np.ndarray,
+    executor: Optional[Executor] = None,
+    chunk_size: Optional[int] = None,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+) -> np.ndarray:
+    """Evaluate a function at points, optionally in chunks with an executor.
+
+    Parameters
+    ----------
+    fun : Callable
+        The function to evaluate. It must accept as its first argument
+        a two-dimensional array of points and return an array of the same
+        length as the input array.
+    xx : :class:`numpy:numpy.ndarray`
+        The points, a ``(k, m)`` array.
+    executor : :class:`concurrent.futures.Executor`, optional
+        The executor (e.g., a thread or a process pool) to which the chunks
+        of points are submitted. If ``None`` (default), the function is
+        called once with all the points.
+    chunk_size : int, optional
+        The (maximum) number of points per call of the function. If ``None``
+        (default), the points are split into
+        ``minterpy.global_settings.DEFAULT_CHUNKS_PER_CPU`` chunks per CPU.
+        Only relevant if an executor is given.
+    args : tuple, optional
+        Additional positional arguments passed to the function.
+    kwargs : dict, optional
+        Additional keyword arguments passed to the function.
+
+    Returns
+    -------
+    :class:`numpy:numpy.ndarray`
+        The values of the function at the points, in the order of
+        the points.
+
+    Raises
+    ------
+    ValueError
+        If the chunk size is smaller than one.
+
+    Notes
+    -----
+    - With a process pool, the function and its arguments must be picklable
+      (e.g., a function defined at the top level of a module).
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"Invalid chunk size <{chunk_size}>")
+    if kwargs is None:
+        kwargs = {}
+    if executor is None:
+        return fun(xx, *args, **kwargs)
+
+    num_points = len(xx)
+    if chunk_size is None:
+        num_cpus = os.cpu_count() or 1
+        num_chunks = global_settings.DEFAULT_CHUNKS_PER_CPU * num_cpus
+        chunk_size = max(-(-num_points // num_chunks), 1)
+
+    futures = [
+        executor.submit(fun, xx[chunk], *args, **kwargs)
+        for chunk in get_batch_slices(num_points, chunk_size)
+    ]
+    if len(futures) == 0:
+        return fun(xx, *args, **kwargs)
+
+    return np.concatenate([np.asarray(future.result()) for future in futures])
+
+
 if __name__ == "__main__":
     import doctest
-    doctest.testmod()
\ No newline at end of file
+    doctest.testmod()
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from decimal import Decimal, ROUND_HALF_UP
 from math import ceil
-from typing import Iterable, no_type_check
+from typing import Iterable, NamedTuple, Optional, no_type_check
 
 import numpy as np
 
@@ -765,6 +765,67 @@ def lex_sort(indices: np.ndarray) -> np.ndarray:
     return indices_lex_sorted
 
 
+class SparseExponents(NamedTuple):
+    """Container of exponents in a compressed sparse row (CSR) format.
+
+    Only the nonzero exponents are stored. The nonzero exponents of
+    the ``i``-th multi-index are ``values[indptr[i]:indptr[i + 1]]`` in
+    the dimensions ``indices[indptr[i]:indptr[i + 1]]``.
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    values: np.ndarray
+
+
+def compress_exponents(
+    exponents: np.ndarray,
+    nonzero_mask: Optional[np.ndarray] = None,
+) -> SparseExponents:
+    """Compress an array of exponents into the CSR format.
+
+    Parameters
+    ----------
+    exponents : :class:`numpy:numpy.ndarray`
+        Array of exponents of shape ``(N, m)``.
+    nonzero_mask : :class:`numpy:numpy.ndarray`, optional
+        The (precomputed) masks of the nonzero exponents, a boolean array of
+        shape ``(N, m)``. If not given, it is computed from the exponents.
+
+    Returns
+    -------
+    SparseExponents
+        The exponents in the CSR format, i.e., the row pointers of length
+        ``N + 1``, the column (dimension) indices, and the values of
+        the nonzero exponents.
+
+    Notes
+    -----
+    - For multi-index sets in high dimensions and with a low
+      :math:`l_p`-degree most exponents are zero; the number of nonzero
+      exponents ``nnz`` is then much smaller than ``N * m``.
+
+    Examples
+    --------
+    >>> exponents = np.array([[0, 0], [1, 0], [0, 2], [1, 1]])
+    >>> sparse_exponents = compress_exponents(exponents)
+    >>> sparse_exponents.indptr
+    array([0, 0, 1, 2, 4])
+    >>> sparse_exponents.indices
+    array([0, 1, 0, 1])
+    >>> sparse_exponents.values
+    array([1, 2, 1, 1])
+    """
+    if nonzero_mask is None:
+        nonzero_mask = exponents != 0
+
+    indptr = np.zeros(len(exponents) + 1, dtype=INT_DTYPE)
+    np.cumsum(np.sum(nonzero_mask, axis=1), out=indptr[1:])
+    indices = np.nonzero(nonzero_mask)[1].astype(INT_DTYPE)
+    values = np.require(exponents[nonzero_mask], dtype=INT_DTYPE)
+
+    return SparseExponents(indptr, indices, values)
+
+
 def multiply_indices(
     indices_1: np.ndarray,
     indices_2: np.ndarray
@@ -6,7 +6,24 @@ from __future__ import annotations
 
 import numpy as np
 
-from minterpy.utils.multi_index import find_match_between
+from typing import Optional, Union
+
+from minterpy.global_settings import FLOAT_DTYPE
+from minterpy.utils.arrays import (
+    EvalWorkspace,
+    get_batch_size,
+    get_batch_slices,
+    make_coeffs_2d,
+)
+from minterpy.utils.multi_index import (
+    SparseExponents,
+    compress_exponents,
+    find_match_between,
+)
+from minterpy.utils.polynomials.sparse import eval_sparse
+from minterpy.utils.verification import verify_batch_size
+
+SUPPORTED_EVAL_BACKENDS = ("numpy", "numba-sparse")
 
 
 def integrate_monomials(
@@ -67,6 +84,13 @@ def eval_polynomials(
     xx: np.ndarray,
     coeffs: np.ndarray,
     exponents: np.ndarray,
+    batch_size: Optional[Union[int, str]] = None,
+    memory_budget: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
+    backend: str = "numpy",
+    sparse_exponents: Optional[SparseExponents] = None,
+    max_exponent: Optional[int] = None,
 ) -> np.ndarray:
     """Evaluate polynomial in the canonical basis.
 
@@ -83,6 +107,38 @@ def eval_polynomials(
     exponents : :class:`numpy:numpy.ndarray`
         The exponents of the polynomial as multi-indices, a two-dimensional
         positive integer array.
+    batch_size : Union[int, str], optional
+        The number of query points evaluated at once. If ``None`` (default),
+        all query points are evaluated at once. If ``"auto"``, the batch size
+        is determined such that the intermediate arrays fit
+        the ``memory_budget``.
+    memory_budget : int, optional
+        The memory budget in bytes for the intermediate arrays of a batch;
+        only relevant if ``batch_size`` is ``"auto"``. If not specified,
+        ``minterpy.global_settings.DEFAULT_MEMORY_BUDGET`` is used.
+    out : :class:`numpy:numpy.ndarray`, optional
+        The array of shape ``(N,)`` or ``(N, n_poly)`` into which the output
+        is written. If given, it is returned instead of a new array.
+    workspace : EvalWorkspace, optional
+        The workspace whose buffers are reused for the intermediate arrays
+        (the powers and the monomials) across calls.
+    backend : str, optional
+        Computational backend to carry out the evaluation.
+        Supported values are ``"numpy"`` (default), the vectorized
+        evaluation with NumPy, and ``"numba-sparse"``, the compiled
+        evaluation that only visits the nonzero exponents; the latter is
+        faster and uses less memory for multi-index sets in high dimensions
+        with a low :math:`l_p`-degree.
+    sparse_exponents : SparseExponents, optional
+        The (precomputed) exponents in the CSR format, e.g.,
+        :py:attr:`MultiIndexSet.sparse_exponents`; only relevant for
+        the ``"numba-sparse"`` backend. If not given, the exponents are
+        compressed on every call.
+    max_exponent : int, optional
+        The (precomputed) maximum exponent over all dimensions, e.g.,
+        :py:attr:`MultiIndexSet.max_exponent`; only relevant for
+        the ``"numba-sparse"`` backend. If not given, it is computed from
+        the exponents on every call.
 
     Returns
     -------
@@ -93,16 +149,119 @@ def eval_polynomials(
         sets, the output array is two-dimensional with a shape of
         ``(N, n_poly)`` where ``n_poly`` is the number of coefficient sets.
 
+    Raises
+    ------
+    NotImplementedError
+        If the selected ``backend`` is not supported.
+
     Notes
     -----
     - This implementation is considered unsafe and may fail spectacularly
       for polynomials of moderate degrees. Consider a more advanced
       implementation in the future.
+    - The intermediate arrays hold ``N_mon * (m + 1)`` elements per query
+      point where ``N_mon`` is the number of monomials. With
+      the ``"numba-sparse"`` backend, the intermediate lookup table of
+      the powers holds ``(n + 1) * m`` elements per query point where ``n``
+      is the maximum exponent.
     """
-    monomials = np.prod(
-        np.power(xx[:, None, :], exponents[None, :, :]),
-        axis=-1,
-    )
-    yy = np.dot(monomials, coeffs)
+    # Process the selected backend
+    backend = backend.lower()
+    if backend not in SUPPORTED_EVAL_BACKENDS:
+        raise NotImplementedError(f"Backend <{backend}> is not supported")
+
+    batch_size = verify_batch_size(batch_size)
+    num_points = xx.shape[0]
+    if backend == "numba-sparse":
+        if sparse_exponents is None:
+            sparse_exponents = compress_exponents(exponents)
+        if max_exponent is None:
+            max_exponent = np.max(exponents, initial=0)
+        return eval_sparse(
+            xx,
+            coeffs,
+            sparse_exponents,
+            int(max_exponent),
+            fill_powers_table,
+            batch_size=batch_size,
+            memory_budget=memory_budget,
+            out=out,
+            workspace=workspace,
+        )
+
+    if batch_size == "auto":
+        num_monomials, m = exponents.shape
+        batch_size = get_batch_size(
+            num_points,
+            num_monomials * (m + 1),
+            memory_budget,
+        )
+
+    if batch_size is None or batch_size >= num_points:
+        return _eval_polynomials(xx, coeffs, exponents, out, workspace)
+
+    # Evaluate the polynomials in batches
+    if out is None:
+        yy = np.empty((num_points,) + coeffs.shape[1:], dtype=FLOAT_DTYPE)
+    else:
+        yy = out
+    for batch in get_batch_slices(num_points, batch_size):
+        _eval_polynomials(xx[batch], coeffs, exponents, yy[batch], workspace)
 
     return yy
+
+
+def _eval_polynomials(
+    xx: np.ndarray,
+    coeffs: np.ndarray,
+    exponents: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
+) -> np.ndarray:
+    """Evaluate polynomial in the canonical basis at once (no batching)."""
+    if workspace is None:
+        monomials = np.prod(
+            np.power(xx[:, None, :], exponents[None, :, :]),
+            axis=-1,
+        )
+    else:
+        num_points = xx.shape[0]
+        num_monomials, m = exponents.shape
+        powers = workspace.get("powers", (num_points, num_monomials, m))
+        np.power(xx[:, None, :], exponents[None, :, :], out=powers)
+        monomials = workspace.get("monomials", (num_points, num_monomials))
+        np.prod(powers, axis=-1, out=monomials)
+
+    if out is None:
+        return np.dot(monomials, coeffs)
+
+    _matmul_into(monomials, coeffs, out)
+
+    return out
+
+
+def fill_powers_table(xx: np.ndarray, tables: np.ndarray) -> None:
+    """Tabulate the powers of the query points in each dimension.
+
+    Parameters
+    ----------
+    xx : :class:`numpy:numpy.ndarray`
+        The query points, an ``(k, m)`` array.
+    tables : :class:`numpy:numpy.ndarray`
+        The placeholder of shape ``(k, n + 1, m)``; on return,
+        ``tables[i, e, j]`` is ``xx[i, j] ** e``.
+    """
+    tables[:, 0, :] = 1.0
+    for e in range(1, tables.shape[1]):
+        np.multiply(tables[:, e - 1, :], xx, out=tables[:, e, :])
+
+
+def _matmul_into(
+    monomials: np.ndarray,
+    coeffs: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Multiply the monomials with the coefficients into an output array."""
+    if out.ndim == 1:
+        out = out[:, np.newaxis]
+    np.matmul(monomials, make_coeffs_2d(coeffs), out=out)
@@ -5,9 +5,27 @@ in the Chebyshev basis.
 import numpy as np
 
 from scipy.special import eval_chebyt
+from typing import Optional, Union
 
+from minterpy.global_settings import FLOAT_DTYPE
+from minterpy.utils.arrays import (
+    EvalWorkspace,
+    get_batch_size,
+    get_batch_slices,
+    make_coeffs_2d,
+)
+from minterpy.utils.multi_index import SparseExponents, compress_exponents
+from minterpy.utils.polynomials.sparse import eval_sparse
+from minterpy.utils.verification import verify_batch_size
 
-def evaluate_monomials(xx: np.ndarray, exponents: np.ndarray) -> np.ndarray:
+SUPPORTED_EVAL_BACKENDS = ("numpy", "numba-sparse")
+
+
+def evaluate_monomials(
+    xx: np.ndarray,
+    exponents: np.ndarray,
+    workspace: Optional[EvalWorkspace] = None,
+) -> np.ndarray:
     """Evaluate the Chebyshev monomials at all query points.
 
     Parameters
@@ -18,6 +36,10 @@ def evaluate_monomials(xx: np.ndarray, exponents: np.ndarray) -> np.ndarray:
     exponents : :class:`numpy:numpy.ndarray`
         The non-negative integer array of polynomial exponents (i.e., as
         multi-indices) of shape ``(N, m)``.
+    workspace : EvalWorkspace, optional
+        The workspace whose buffers are reused for the one-dimensional
+        and the multi-dimensional monomials across calls. If given,
+        the returned array is a view of a workspace buffer.
 
     Returns
     -------
@@ -25,11 +47,21 @@ def evaluate_monomials(xx: np.ndarray, exponents: np.ndarray) -> np.ndarray:
         The value of each Chebyshev basis evaluated at each given point.
         The array is of shape ``(k, N)``.
     """
-    # One-dimensional monomials in each dimension
-    monomials = eval_chebyt(exponents[None, :, :], xx[:, None, :])
+    if workspace is None:
+        # One-dimensional monomials in each dimension
+        monomials = eval_chebyt(exponents[None, :, :], xx[:, None, :])
+
+        # Multi-dimensional monomials by tensor product
+        monomials = np.prod(monomials, axis=-1)
 
-    # Multi-dimensional monomials by tensor product
-    monomials = np.prod(monomials, axis=-1)
+        return monomials
+
+    num_points = xx.shape[0]
+    num_monomials, m = exponents.shape
+    monomials_1d = workspace.get("monomials_1d", (num_points, num_monomials, m))
+    eval_chebyt(exponents[None, :, :], xx[:, None, :], out=monomials_1d)
+    monomials = workspace.get("monomials", (num_points, num_monomials))
+    np.prod(monomials_1d, axis=-1, out=monomials)
 
     return monomials
 
@@ -38,6 +70,13 @@ def evaluate_polynomials(
     xx: np.ndarray,
     exponents: np.ndarray,
     coefficients: np.ndarray,
+    batch_size: Optional[Union[int, str]] = None,
+    memory_budget: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
+    backend: str = "numpy",
+    sparse_exponents: Optional[SparseExponents] = None,
+    max_exponent: Optional[int] = None,
 ) -> np.ndarray:
     """Evaluate polynomial(s) in the Chebyshev basis at all query points.
 
@@ -53,15 +92,130 @@ def evaluate_polynomials(
         The array of coefficients of the polynomials of shape ``(N, Np)``.
         Multiple sets of coefficients (``Np > 1``) indicate multiple Chebyshev
         polynomials evaluated at the same time at the same query points.
+    batch_size : Union[int, str], optional
+        The number of query points evaluated at once. If ``None`` (default),
+        all query points are evaluated at once. If ``"auto"``, the batch size
+        is determined such that the intermediate arrays fit
+        the ``memory_budget``.
+    memory_budget : int, optional
+        The memory budget in bytes for the intermediate arrays of a batch;
+        only relevant if ``batch_size`` is ``"auto"``. If not specified,
+        ``minterpy.global_settings.DEFAULT_MEMORY_BUDGET`` is used.
+    out : :class:`numpy:numpy.ndarray`, optional
+        The array of shape ``(k,)`` or ``(k, Np)`` into which the output
+        is written. If given, it is returned instead of a new array.
+    workspace : EvalWorkspace, optional
+        The workspace whose buffers are reused for the intermediate arrays
+        across calls.
+    backend : str, optional
+        Computational backend to carry out the evaluation.
+        Supported values are ``"numpy"`` (default), the vectorized
+        evaluation with NumPy (and SciPy), and ``"numba-sparse"``, the compiled
+        evaluation that only visits the nonzero exponents; the latter is
+        faster and uses less memory for multi-index sets in high dimensions
+        with a low :math:`l_p`-degree.
+    sparse_exponents : SparseExponents, optional
+        The (precomputed) exponents in the CSR format, e.g.,
+        :py:attr:`MultiIndexSet.sparse_exponents`; only relevant for
+        the ``"numba-sparse"`` backend. If not given, the exponents are
+        compressed on every call.
+    max_exponent : int, optional
+        The (precomputed) maximum exponent over all dimensions, e.g.,
+        :py:attr:`MultiIndexSet.max_exponent`; only relevant for
+        the ``"numba-sparse"`` backend. If not given, it is computed from
+        the exponents on every call.
+
+    Raises
+    ------
+    NotImplementedError
+        If the selected ``backend`` is not supported.
 
     Notes
     -----
     - The Chebyshev Polynomial has domain :math:`[-1, 1]^m`.
+    - The intermediate arrays hold ``N * (m + 1)`` elements per query point.
+      With the ``"numba-sparse"`` backend, the intermediate lookup table of
+      the one-dimensional Chebyshev polynomials holds ``(n + 1) * m``
+      elements per query point where ``n`` is the maximum exponent.
     """
-    # Evaluate the monomials
-    monomials = evaluate_monomials(xx, exponents)
+    # Process the selected backend
+    backend = backend.lower()
+    if backend not in SUPPORTED_EVAL_BACKENDS:
+        raise NotImplementedError(f"Backend <{backend}> is not supported")
+
+    batch_size = verify_batch_size(batch_size)
+    num_points = xx.shape[0]
+    if backend == "numba-sparse":
+        if sparse_exponents is None:
+            sparse_exponents = compress_exponents(exponents)
+        if max_exponent is None:
+            max_exponent = np.max(exponents, initial=0)
+        return eval_sparse(
+            xx,
+            coefficients,
+            sparse_exponents,
+            int(max_exponent),
+            fill_chebyshev_table,
+            batch_size=batch_size,
+            memory_budget=memory_budget,
+            out=out,
+            workspace=workspace,
+        )
+
+    if batch_size == "auto":
+        num_monomials, m = exponents.shape
+        batch_size = get_batch_size(
+            num_points,
+            num_monomials * (m + 1),
+            memory_budget,
+        )
+
+    if (batch_size is None or batch_size >= num_points) and out is None:
+        # Evaluate the monomials
+        monomials = evaluate_monomials(xx, exponents, workspace)
+
+        # Multiply with the coefficients
+        return monomials @ coefficients
 
-    # Multiply with the coefficients
-    results = monomials @ coefficients
+    if batch_size is None:
+        batch_size = max(num_points, 1)
+
+    # Evaluate the polynomials in batches
+    if out is None:
+        results = np.empty(
+            (num_points,) + coefficients.shape[1:],
+            dtype=FLOAT_DTYPE,
+        )
+    else:
+        results = out
+    results_2d = results[:, np.newaxis] if results.ndim == 1 else results
+    coefficients = make_coeffs_2d(coefficients)
+    for batch in get_batch_slices(num_points, batch_size):
+        monomials = evaluate_monomials(xx[batch], exponents, workspace)
+        np.matmul(monomials, coefficients, out=results_2d[batch])
 
     return results
+
+
+def fill_chebyshev_table(xx: np.ndarray, tables: np.ndarray) -> None:
+    """Tabulate the one-dimensional Chebyshev polynomials at the query points.
+
+    Parameters
+    ----------
+    xx : :class:`numpy:numpy.ndarray`
+        The query points, an ``(k, m)`` array.
+    tables : :class:`numpy:numpy.ndarray`
+        The placeholder of shape ``(k, n + 1, m)``; on return,
+        ``tables[i, e, j]`` is :math:`T_e(x_{i, j})`.
+
+    Notes
+    -----
+    - The polynomials are computed with the three-term recurrence
+      :math:`T_{e}(x) = 2 x T_{e - 1}(x) - T_{e - 2}(x)`.
+    """
+    tables[:, 0, :] = 1.0
+    if tables.shape[1] > 1:
+        tables[:, 1, :] = xx
+    for e in range(2, tables.shape[1]):
+        np.multiply(tables[:, e - 1, :], 2 * xx, out=tables[:, e, :])
+        tables[:, e, :] -= tables[:, e - 2, :]
@@ -4,7 +4,7 @@ in the Lagrange basis.
 """
 import numpy as np
 
-from minterpy.global_settings import ARRAY_DICT, TYPED_LIST
+from minterpy.global_settings import TYPED_LIST
 from minterpy.dds import dds_
 from minterpy.utils.polynomials.newton import integrate_monomials_newton
 
@@ -14,7 +14,7 @@ def integrate_monomials_lagrange(
     generating_points: np.ndarray,
     split_positions: TYPED_LIST,
     subtree_sizes: TYPED_LIST,
-    masks: ARRAY_DICT,
+    masks: np.ndarray,
     bounds: np.ndarray,
 ) -> np.ndarray:
     """Integrate the monomials in the Lagrange basis given a set of exponents.
@@ -35,9 +35,9 @@ def integrate_monomials_lagrange(
         The split positions of the multi-index tree.
     subtree_sizes : TYPED_LIST
         The subtree sizes of the multi-index tree.
-    masks : ARRAY_DICT
+    masks : :class:`numpy:numpy.ndarray`
         The masks that define the correspondence between left and right parts
-        of the tree.
+        of the tree (see :py:func:`minterpy.dds.precompute_masks`).
     bounds : :class:`numpy:numpy.ndarray`
         The bounds (lower and upper) of the definite integration, an ``(M, 2)``
         array, where ``M`` is the number of spatial dimensions.
@@ -67,6 +67,7 @@ def integrate_monomials_lagrange(
         split_positions,
         subtree_sizes,
         masks,
+        overwrite_input=True,
     )
 
     # --- Carry out the transformation from Newton to Lagrange
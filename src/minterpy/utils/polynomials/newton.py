@@ -6,10 +6,40 @@ import itertools
 import math
 import numpy as np
 
+from numba import njit
+from scipy.linalg import solve_triangular
+from typing import Callable, Optional, Union
+
+from minterpy.dds import compile_split_dims, compile_splits
+from minterpy.utils.arrays import (
+    EvalWorkspace,
+    get_batch_size,
+    get_batch_slices,
+    make_coeffs_2d,
+)
+from minterpy.utils.multi_index import SparseExponents, compress_exponents
+from minterpy.utils.polynomials.sparse import eval_sparse
 from minterpy.utils.quad import gauss_leg
-from minterpy.utils.verification import check_dtype
+from minterpy.utils.verification import check_dtype, verify_batch_size
 from minterpy.global_settings import FLOAT_DTYPE, INT_DTYPE, DEBUG
-from minterpy.jit_compiled.newton.eval import eval_newton_monomials_multiple
+from minterpy.jit_compiled.multi_index import is_lex_sorted
+from minterpy.jit_compiled.newton.eval import (
+    eval_newton_monomials_multiple,
+    eval_newton_monomials_multiple_par,
+    eval_newton_polynomials_single,
+    eval_newton_polynomials_multiple,
+    eval_newton_polynomials_multiple_par,
+    eval_newton_polynomials_tree_multiple,
+    eval_newton_polynomials_horner_multiple,
+)
+
+SUPPORTED_EVAL_BACKENDS = (
+    "numba",
+    "numba-par",
+    "numba-tree",
+    "numba-horner",
+    "numba-sparse",
+)
 
 
 def eval_newton_monomials(
@@ -18,6 +48,9 @@ def eval_newton_monomials(
     generating_points: np.ndarray,
     verify_input: bool = False,
     triangular: bool = False,
+    parallel: bool = False,
+    workspace: Optional[EvalWorkspace] = None,
+    max_exponents: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Newton evaluation function.
 
@@ -33,6 +66,15 @@ def eval_newton_monomials(
     :type verify_input: bool
     :param triangular: weather or not the output will be of lower triangular form. This will skip the evaluation of some values. Defaults to :class:`False`.
     :type triangular: bool
+    :param parallel: weather the query points should be evaluated in parallel (CPU). Can't be combined with ``triangular``. Defaults to :class:`False`.
+    :type parallel: bool
+    :param workspace: workspace providing reusable buffers for
+        the intermediate arrays.
+    :type workspace: EvalWorkspace, optional
+    :param max_exponents: the (precomputed) maximum exponent per dimension,
+        e.g., :py:attr:`MultiIndexSet.max_exponents`. If not given, it is
+        computed from the exponents.
+    :type max_exponents: np.ndarray, optional
 
     :return: the value of each Newton polynomial on each point. The output shape is ``(k, N)``, where ``k`` is the number of points and ``N`` is the number of coeffitions of the Newton polyomial.
     :rtype: np.ndarray
@@ -56,20 +98,41 @@ def eval_newton_monomials(
     if verify_input:
         check_dtype(x, FLOAT_DTYPE)
         check_dtype(exponents, INT_DTYPE)
+    if parallel and triangular:
+        raise ValueError(
+            "Parallel evaluation of triangular Newton monomials "
+            "is not supported"
+        )
 
     # NOTE: the downstream numba-accelerated function does not support kwargs,
     # so the maximum exponent per dimension must be computed here
-    max_exponents = np.max(exponents, axis=0)
+    max_exponents = _get_max_exponents(exponents, workspace, max_exponents)
 
     # Create placeholders for the final and intermediate results
-    result_placeholder = np.empty(
-        shape=(num_points, num_monomials),
-        dtype=FLOAT_DTYPE,
-    )
-    prod_placeholder = np.empty(
-        shape=(np.max(max_exponents) + 1, m),
-        dtype=FLOAT_DTYPE,
-    )
+    if workspace is None:
+        result_placeholder = np.empty(
+            shape=(num_points, num_monomials),
+            dtype=FLOAT_DTYPE,
+        )
+    else:
+        result_placeholder = workspace.get(
+            "monomials",
+            (num_points, num_monomials),
+        )
+
+    if parallel:
+        # NOTE: the products placeholders are created per thread
+        eval_newton_monomials_multiple_par(
+            x,
+            exponents,
+            generating_points,
+            max_exponents,
+            result_placeholder,
+        )
+
+        return result_placeholder
+
+    prod_placeholder = _get_products_placeholder(max_exponents, workspace)
 
     # Compute the Newton monomials on all the query points
     eval_newton_monomials_multiple(
@@ -91,7 +154,13 @@ def eval_newton_polynomials(
     exponents: np.ndarray,
     generating_points: np.ndarray,
     verify_input: bool = False,
-    batch_size: int = None,
+    batch_size: Optional[Union[int, str]] = None,
+    backend: str = "numba",
+    memory_budget: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
+    max_exponents: Optional[np.ndarray] = None,
+    sparse_exponents: Optional[SparseExponents] = None,
 ):
     """Evaluate the polynomial(s) in Newton form at multiple query points.
 
@@ -129,10 +198,50 @@ def eval_newton_polynomials(
     :type generating_points: np.ndarray, shape = (m, n+1)
     :param verify_input: weather the data types of the input should be checked. turned off by default for speed.
     :type verify_input: bool, optional
-    :param batch_size: batch size of query points
-    :type batch_size: int, optional
+    :param batch_size: batch size of query points. If ``"auto"``, the batch
+        size is determined such that the Newton monomials of a batch fit
+        the ``memory_budget``. Only relevant if the Newton monomials are
+        explicitly evaluated, i.e., if there are at least as many polynomials
+        as monomials (``p >= N``).
+    :type batch_size: Union[int, str], optional
+    :param backend: Computational backend to carry out the evaluation.
+        Supported values are ``"numba"`` (default), the compiled evaluation
+        on a single CPU, ``"numba-par"``, the compiled evaluation where
+        the query points are distributed over several CPUs (threads),
+        ``"numba-tree"``, the compiled evaluation on a single CPU that reuses
+        the partial products shared along the multi-index tree, and
+        ``"numba-horner"``, the compiled evaluation on a single CPU with
+        the multivariate Horner scheme along the multi-index tree, and
+        ``"numba-sparse"``, the compiled evaluation on a single CPU that
+        only visits the nonzero exponents. The tree-based backends
+        (``"numba-tree"`` and ``"numba-horner"``) require lexicographically
+        sorted exponents (as stored in :class:`MultiIndexSet`).
+    :type backend: str, optional
+    :param memory_budget: memory budget in bytes for the Newton monomials of
+        a batch; only relevant if ``batch_size`` is ``"auto"``. If not
+        specified, ``minterpy.global_settings.DEFAULT_MEMORY_BUDGET`` is used.
+    :type memory_budget: int, optional
+    :param out: output array of shape ``(k,)`` or ``(k, p)`` into which
+        the values are written; it is returned instead of a new array.
+    :type out: np.ndarray, optional
+    :param workspace: workspace providing reusable buffers for
+        the intermediate arrays (the maximum exponents, the products, and
+        the Newton monomials). Not used by the tree-based backends.
+    :type workspace: EvalWorkspace, optional
+    :param max_exponents: the (precomputed) maximum exponent per dimension,
+        e.g., :py:attr:`MultiIndexSet.max_exponents`. If not given, it is
+        computed from the exponents on every call.
+    :type max_exponents: np.ndarray, optional
+    :param sparse_exponents: the (precomputed) exponents in the CSR format,
+        e.g., :py:attr:`MultiIndexSet.sparse_exponents`; only relevant for
+        the ``"numba-sparse"`` backend. If not given, the exponents are
+        compressed on every call.
+    :type sparse_exponents: SparseExponents, optional
 
     :raise TypeError: If the input ``generating_points`` do not have ``dtype = float``.
+    :raise ValueError: If the ``batch_size`` is invalid or if the exponents
+        are not lexicographically sorted for a tree-based ``backend``.
+    :raise NotImplementedError: If the selected ``backend`` is not supported.
 
     :return: (k, p) the value of each input polynomial at each point. TODO squeezed into the expected shape (1D if possible). Notice, format fixed such that the regression can use the result as transformation matrix without transponation
 
@@ -147,27 +256,99 @@ def eval_newton_polynomials(
     - advantage:
         - just operating on numpy arrays, can be just-in-time (jit) compiled
         - can evaluate multiple polynomials without recomputing all intermediary results
+    - If there are fewer polynomials than monomials (``p < N``),
+      the values of the Newton monomials are contracted with the coefficients
+      right away inside a compiled kernel and the ``(k, N)`` matrix
+      of the monomials is never materialized (memory :math:`O(kp + mn)`).
+      Otherwise, the monomials are evaluated (possibly in batches)
+      and multiplied with the coefficients.
 
     See Also
     --------
     evaluate_multiple : ``numba`` accelerated implementation which is called internally by this function.
     convert_eval_output: ``numba`` accelerated implementation of the output converter.
     """
+    # Process the selected backend
+    backend = backend.lower()
+    if backend not in SUPPORTED_EVAL_BACKENDS:
+        raise NotImplementedError(f"Backend <{backend}> is not supported")
+    parallel = backend == "numba-par"
+    batch_size = verify_batch_size(batch_size)
+
     # Get the relevant data
     verify_input = verify_input or DEBUG
     num_points = len(xx)
+    num_monomials = exponents.shape[0]
+    num_polynomials = 1 if coefficients.ndim == 1 else coefficients.shape[1]
+
+    if backend in ("numba-tree", "numba-horner"):
+        results = _eval_newton_polynomials_tree(
+            xx,
+            coefficients,
+            exponents,
+            generating_points,
+            verify_input,
+            horner=backend == "numba-horner",
+            out=out,
+            max_exponents=max_exponents,
+        )
+        return results
+
+    if backend == "numba-sparse":
+        results = _eval_newton_polynomials_sparse(
+            xx,
+            coefficients,
+            exponents,
+            generating_points,
+            verify_input,
+            batch_size=batch_size,
+            memory_budget=memory_budget,
+            out=out,
+            workspace=workspace,
+            max_exponents=max_exponents,
+            sparse_exponents=sparse_exponents,
+        )
+        return results
+
+    if num_polynomials < num_monomials:
+        # Fused evaluation: the (k, N) Newton monomials are never stored
+        results = _eval_newton_polynomials_fused(
+            xx,
+            coefficients,
+            exponents,
+            generating_points,
+            verify_input,
+            parallel,
+            out=out,
+            workspace=workspace,
+            max_exponents=max_exponents,
+        )
+        return results
 
     # Get batch size
-    # TODO: Verify the batch size
+    if batch_size == "auto":
+        batch_size = get_batch_size(num_points, num_monomials, memory_budget)
     if batch_size is None or batch_size >= num_points:
         newton_monomials = eval_newton_monomials(
             xx,
             exponents,
             generating_points,
             verify_input,
-            False
+            False,
+            parallel,
+            workspace=workspace,
+            max_exponents=max_exponents,
         )
-        results = newton_monomials @ coefficients
+        if out is None:
+            results = newton_monomials @ coefficients
+        else:
+            results = _get_output_placeholder(out, num_points, num_polynomials)
+            np.matmul(
+                newton_monomials,
+                make_coeffs_2d(coefficients),
+                out=results,
+            )
+            results = out
     else:
         # Evaluate the Newton polynomials in batches
         results = eval_newton_polynomials_batch(
@@ -175,18 +356,316 @@ def eval_newton_polynomials(
             coefficients,
             exponents,
             generating_points,
-            batch_size
+            batch_size,
+            parallel,
+            out=out,
+            workspace=workspace,
+            max_exponents=max_exponents,
         )
 
     return results
 
 
+def _eval_newton_polynomials_fused(
+    xx: np.ndarray,
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    generating_points: np.ndarray,
+    verify_input: bool = False,
+    parallel: bool = False,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
+    max_exponents: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Evaluate the polynomial(s) in Newton form without the monomial matrix.
+
+    Notes
+    -----
+    - The Newton monomials are contracted with the coefficients inside
+      the compiled kernel as they are evaluated; the memory footprint is
+      :math:`O(kp + mn)` instead of :math:`O(kN)`.
+    - The output has the shape ``(k,)`` if the coefficients are given
+      as a one-dimensional array and ``(k, p)`` otherwise, same as the result
+      of ``newton_monomials @ coefficients``.
+    """
+    if verify_input:
+        check_dtype(xx, FLOAT_DTYPE)
+        check_dtype(exponents, INT_DTYPE)
+
+    # Coefficients are processed as a two-dimensional array
+    coefficients_2d = np.asarray(coefficients, dtype=FLOAT_DTYPE)
+    if coefficients.ndim == 1:
+        coefficients_2d = coefficients_2d[:, np.newaxis]
+
+    num_points = xx.shape[0]
+    num_polynomials = coefficients_2d.shape[1]
+    max_exponents = _get_max_exponents(exponents, workspace, max_exponents)
+
+    # Create an output placeholder
+    results = _get_output_placeholder(out, num_points, num_polynomials)
+    if parallel:
+        # NOTE: the products placeholders are created per thread
+        eval_newton_polynomials_multiple_par(
+            xx,
+            coefficients_2d,
+            exponents,
+            generating_points,
+            max_exponents,
+            results,
+        )
+    else:
+        prod_placeholder = _get_products_placeholder(max_exponents, workspace)
+        eval_newton_polynomials_multiple(
+            xx,
+            coefficients_2d,
+            exponents,
+            generating_points,
+            max_exponents,
+            prod_placeholder,
+            results,
+        )
+
+    return _shape_output(results, coefficients, out)
+
+
+def _eval_newton_polynomials_tree(
+    xx: np.ndarray,
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    generating_points: np.ndarray,
+    verify_input: bool = False,
+    horner: bool = False,
+    out: Optional[np.ndarray] = None,
+    max_exponents: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Evaluate the polynomial(s) in Newton form by traversing the tree.
+
+    Notes
+    -----
+    - The exponents must be lexicographically sorted (otherwise
+      a ``ValueError`` is raised). Consecutive elements share the factors of the Newton monomials
+      in the dimensions above their split dimension (the common path
+      in the multi-index tree); these partial products are reused instead of
+      recomputed. The cost per query point is between :math:`O(N)`
+      and :math:`O(mN)`.
+    - If ``horner`` is ``True``, the polynomials are evaluated with
+      the multivariate Horner scheme along the tree instead; the values of
+      the Newton monomials are not formed at all. The scheme is numerically
+      more stable for polynomials of high degree.
+    - As with the fused evaluation, the ``(k, N)`` matrix of the monomials
+      is never materialized.
+    """
+    if verify_input:
+        check_dtype(xx, FLOAT_DTYPE)
+        check_dtype(exponents, INT_DTYPE)
+
+    # The splits of the multi-index tree are only valid for sorted exponents
+    if not is_lex_sorted(exponents):
+        raise ValueError(
+            "The exponents must be lexicographically sorted "
+            "for the tree-based evaluation"
+        )
+
+    # Coefficients are processed as a two-dimensional array
+    coefficients_2d = np.asarray(coefficients, dtype=FLOAT_DTYPE)
+    if coefficients.ndim == 1:
+        coefficients_2d = coefficients_2d[:, np.newaxis]
+
+    num_points = xx.shape[0]
+    num_monomials = exponents.shape[0]
+    num_polynomials = coefficients_2d.shape[1]
+    max_exponents = _get_max_exponents(exponents, None, max_exponents)
+
+    # Locate where each element branches off in the multi-index tree
+    split_dims = compile_split_dims(num_monomials, compile_splits(exponents))
+
+    # Create an output placeholder
+    results = _get_output_placeholder(out, num_points, num_polynomials)
+    if horner:
+        evaluator = eval_newton_polynomials_horner_multiple
+    else:
+        evaluator = eval_newton_polynomials_tree_multiple
+    evaluator(
+        xx,
+        coefficients_2d,
+        exponents,
+        split_dims,
+        generating_points,
+        max_exponents,
+        results,
+    )
+
+    return _shape_output(results, coefficients, out)
+
+
+def _eval_newton_polynomials_sparse(
+    xx: np.ndarray,
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    generating_points: np.ndarray,
+    verify_input: bool = False,
+    batch_size: Optional[Union[int, str]] = None,
+    memory_budget: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
+    max_exponents: Optional[np.ndarray] = None,
+    sparse_exponents: Optional[SparseExponents] = None,
+) -> np.ndarray:
+    """Evaluate the polynomial(s) in Newton form with sparse exponents.
+
+    Notes
+    -----
+    - The one-dimensional Newton monomials (the chained products) are
+      tabulated per query point; only the nonzero exponents are then
+      visited. The cost per query point is :math:`O(mn + nnz + Np)` instead
+      of :math:`O(mn + mN + Np)` where ``nnz`` is the number of nonzero
+      exponents.
+    """
+    if verify_input:
+        check_dtype(xx, FLOAT_DTYPE)
+        check_dtype(exponents, INT_DTYPE)
+
+    if sparse_exponents is None:
+        sparse_exponents = compress_exponents(exponents)
+    max_exponents = _get_max_exponents(exponents, None, max_exponents)
+
+    def fill_tables(xx_batch: np.ndarray, tables: np.ndarray) -> None:
+        fill_newton_products_table(xx_batch, generating_points, tables)
+
+    return eval_sparse(
+        xx,
+        coefficients,
+        sparse_exponents,
+        int(np.max(max_exponents)),
+        fill_tables,
+        batch_size=batch_size,
+        memory_budget=memory_budget,
+        out=out,
+        workspace=workspace,
+    )
+
+
+def fill_newton_products_table(
+    xx: np.ndarray,
+    generating_points: np.ndarray,
+    tables: np.ndarray,
+) -> None:
+    """Tabulate the one-dimensional Newton monomials at the query points.
+
+    :param xx: The query points, an ``(k, m)`` array.
+    :type xx: np.ndarray
+    :param generating_points: The generating points, an array with ``m``
+        columns and at least ``n`` rows.
+    :type generating_points: np.ndarray
+    :param tables: The placeholder of shape ``(k, n + 1, m)``; on return,
+        ``tables[i, e, j]`` is the product of ``(xx[i, j] - gp[l, j])`` for
+        ``l < e``.
+    :type tables: np.ndarray
+    """
+    tables[:, 0, :] = 1.0
+    for e in range(1, tables.shape[1]):
+        np.multiply(
+            tables[:, e - 1, :],
+            xx - generating_points[e - 1],
+            out=tables[:, e, :],
+        )
+
+
+def _get_max_exponents(
+    exponents: np.ndarray,
+    workspace: Optional[EvalWorkspace] = None,
+    max_exponents: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Compute the maximum exponent per dimension, possibly in a workspace.
+
+    Notes
+    -----
+    - If the maximum exponents are given (i.e., precomputed), they are
+      returned as they are.
+    """
+    if max_exponents is not None:
+        return max_exponents
+
+    if workspace is None:
+        return np.max(exponents, axis=0)
+
+    max_exponents = workspace.get(
+        "max_exponents",
+        (exponents.shape[1],),
+        INT_DTYPE,
+    )
+    np.max(exponents, axis=0, out=max_exponents)
+
+    return max_exponents
+
+
+def _get_products_placeholder(
+    max_exponents: np.ndarray,
+    workspace: Optional[EvalWorkspace] = None,
+) -> np.ndarray:
+    """Get a placeholder for the (chained) products, possibly from a workspace.
+    """
+    shape = (np.max(max_exponents) + 1, len(max_exponents))
+    if workspace is None:
+        return np.empty(shape=shape, dtype=FLOAT_DTYPE)
+
+    return workspace.get("products", shape)
+
+
+def _get_output_placeholder(
+    out: Optional[np.ndarray],
+    num_points: int,
+    num_polynomials: int,
+) -> np.ndarray:
+    """Get a two-dimensional placeholder for the values of the polynomials.
+
+    Notes
+    -----
+    - If an output array is given, the placeholder is (a two-dimensional view
+      of) the output array.
+    """
+    if out is None:
+        return np.empty(
+            shape=(num_points, num_polynomials),
+            dtype=FLOAT_DTYPE,
+        )
+
+    if out.ndim == 1:
+        return out[:, np.newaxis]
+
+    return out
+
+
+def _shape_output(
+    results: np.ndarray,
+    coefficients: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Shape the values of the polynomials like ``monomials @ coefficients``.
+
+    Notes
+    -----
+    - If an output array is given, it is returned as it is.
+    """
+    if out is not None:
+        return out
+
+    if coefficients.ndim == 1:
+        return results[:, 0]
+
+    return results
+
+
 def eval_newton_polynomials_batch(
     xx: np.ndarray,
     coefficients: np.ndarray,
     exponents: np.ndarray,
     generating_points: np.ndarray,
-    batch_size: int
+    batch_size: int,
+    parallel: bool = False,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
+    max_exponents: Optional[np.ndarray] = None,
 ):
     """Evaluate the polynomial in Newton form in batches of query points.
 
@@ -206,42 +685,281 @@ def eval_newton_polynomials_batch(
     else:
         num_polynomials = coefficients.shape[1]
     # Create an output placeholder
-    results_placeholder = np.empty(
-        shape=(num_points, num_polynomials),
-        dtype=FLOAT_DTYPE,
+    results_placeholder = _get_output_placeholder(
+        out,
+        num_points,
+        num_polynomials,
     )
+    coefficients = make_coeffs_2d(coefficients)
 
     # Batch processing: evaluate the polynomials at a batch of query points
-    n_batches, remainder = divmod(num_points, batch_size)
-    if remainder != 0:
-        n_batches += 1
-    for idx in range(n_batches):
-        start_idx = idx * batch_size
-        if idx == n_batches - 1 and remainder != 0:
-            end_idx = idx * batch_size + remainder
-        else:
-            end_idx = (idx + 1) * batch_size
-
+    for batch in get_batch_slices(num_points, batch_size):
         # Get the current batch of query points
-        xx_batch = xx[start_idx:end_idx, :]
+        xx_batch = xx[batch, :]
         # Compute the Newton monomials for the batch
         newton_monomials = eval_newton_monomials(
             xx_batch,
             exponents,
             generating_points,
             False,
-            False
+            False,
+            parallel,
+            workspace=workspace,
+            max_exponents=max_exponents,
         )
 
         # Compute the polynomial values for the batch
-        results_placeholder[start_idx:end_idx] = \
-            newton_monomials @ coefficients
+        np.matmul(
+            newton_monomials,
+            coefficients,
+            out=results_placeholder[batch],
+        )
+
+    if out is not None:
+        return out
 
     return results_placeholder
 
 
+class NewtonEvaluator:
+    """Low-overhead evaluator of polynomial(s) in the Newton basis.
+
+    The evaluator stores the coefficients, the exponents, the generating
+    points, and the maximum exponent per dimension as contiguous arrays
+    together with the placeholders of the compiled kernels once such that
+    each call goes directly to the compiled kernel. Neither the inputs are
+    verified nor the intermediate arrays are allocated.
+
+    :param coefficients: The coefficients of the polynomial(s), a one- or
+        a two-dimensional array of shape ``(N,)`` or ``(N, p)``.
+    :type coefficients: np.ndarray
+    :param exponents: The exponents of the polynomial(s), an ``(N, m)`` array.
+    :type exponents: np.ndarray
+    :param generating_points: The generating points of the interpolation
+        grid, an array with ``m`` columns.
+    :type generating_points: np.ndarray
+    :param parallel: Flag to evaluate multiple query points in parallel.
+    :type parallel: bool
+    :param max_exponents: The (precomputed) maximum exponent per dimension.
+    :type max_exponents: np.ndarray, optional
+
+    Notes
+    -----
+    - The arrays are copied; later changes of the original arrays (e.g.,
+      the coefficients of a polynomial) are not reflected in the evaluator.
+    - The query points must be given as a float array;
+      a single query point as a one-dimensional array of length ``m``
+      and multiple query points as an ``(k, m)`` array.
+    - An evaluator must not be shared by concurrent evaluations.
+    - The evaluator itself is a Python object; each call passes through
+      the Python interpreter and the Numba dispatcher and it cannot be
+      called from Numba-compiled code. Use :py:attr:`kernel` for that.
+
+    Examples
+    --------
+    >>> exponents = np.array([[0], [1], [2]])
+    >>> generating_points = np.array([[0.0], [1.0], [-1.0]])
+    >>> evaluator = NewtonEvaluator(
+    ...     np.array([1.0, 2.0, 3.0]), exponents, generating_points
+    ... )
+    >>> evaluator(np.array([0.5]))  # 1 + 2 * 0.5 + 3 * 0.5 * (0.5 - 1)
+    1.25
+    >>> evaluator(np.array([[0.5], [1.0]]))
+    array([1.25, 3.  ])
+    """
+
+    def __init__(
+        self,
+        coefficients: np.ndarray,
+        exponents: np.ndarray,
+        generating_points: np.ndarray,
+        parallel: bool = False,
+        max_exponents: Optional[np.ndarray] = None,
+    ):
+        # NOTE: Single polynomial, following the output shape convention
+        self._single = coefficients.ndim == 1 or coefficients.shape[1] == 1
+        self._coefficients = np.array(
+            make_coeffs_2d(coefficients),
+            dtype=FLOAT_DTYPE,
+            order="C",
+        )
+        self._exponents = np.array(exponents, dtype=INT_DTYPE, order="C")
+        self._generating_points = np.array(
+            generating_points,
+            dtype=FLOAT_DTYPE,
+            order="C",
+        )
+        self._max_exponents = np.array(
+            _get_max_exponents(self._exponents, None, max_exponents),
+            dtype=INT_DTYPE,
+        )
+        self._products = _get_products_placeholder(self._max_exponents)
+        self._point_output = np.empty(
+            self._coefficients.shape[1],
+            dtype=FLOAT_DTYPE,
+        )
+        self._parallel = parallel
+        self._kernel = None
+
+    @property
+    def kernel(self) -> Callable:
+        """The compiled evaluation function with the data of the polynomial(s).
+
+        :return: A Numba-compiled function ``kernel(x, out)`` that evaluates
+            the polynomial(s) at a single query point ``x`` (a one-dimensional
+            float array of length ``m``), writes the values into ``out``
+            (a float array of shape ``(p,)``), and returns ``out``.
+            The function can be called from other Numba-compiled functions
+            (e.g., the right-hand side of an ODE compiled with ``njit``).
+        :rtype: Callable
+
+        .. note::
+            The function is compiled when the property is first accessed.
+            The data of the polynomial(s) are bound to the function as
+            compile-time constants, hence the compilation time grows with
+            the number of coefficients.
+
+        Examples
+        --------
+        >>> exponents = np.array([[0], [1], [2]])
+        >>> generating_points = np.array([[0.0], [1.0], [-1.0]])
+        >>> evaluator = NewtonEvaluator(
+        ...     np.array([1.0, 2.0, 3.0]), exponents, generating_points
+        ... )
+        >>> evaluator.kernel(np.array([0.5]), np.empty(1))
+        array([1.25])
+        """
+        if self._kernel is None:
+            self._kernel = _compile_point_kernel(
+                self._coefficients,
+                self._exponents,
+                self._generating_points,
+                self._max_exponents,
+            )
+
+        return self._kernel
+
+    def __call__(
+        self,
+        xx: np.ndarray,
+        out: Optional[np.ndarray] = None,
+    ) -> Union[float, np.ndarray]:
+        """Evaluate the polynomial(s) at a single or multiple query points.
+
+        :param xx: A single query point as a one-dimensional array of length
+            ``m`` or multiple query points as an ``(k, m)`` array.
+        :type xx: np.ndarray
+        :param out: Output array into which the values are written (and
+            which is returned) instead of a new array; of shape ``(p,)``
+            for a single query point, or ``(k,)`` and ``(k, p)`` for multiple
+            query points. It must be a contiguous float array.
+        :type out: np.ndarray, optional
+        :return: The value(s) of the polynomial(s). For a single query point,
+            a float for a single polynomial (if ``out`` is not given) or
+            an array of shape ``(p,)``; for multiple query points, an array of
+            shape ``(k,)`` for a single polynomial or ``(k, p)``.
+        """
+        if xx.ndim == 1:
+            results = self._point_output if out is None else out
+            eval_newton_polynomials_single(
+                xx,
+                self._coefficients,
+                self._exponents,
+                self._generating_points,
+                self._max_exponents,
+                self._products,
+                results,
+            )
+            if out is not None:
+                return out
+            if self._single:
+                return float(results[0])
+            return results.copy()
+
+        num_points = xx.shape[0]
+        num_polynomials = self._coefficients.shape[1]
+        results = _get_output_placeholder(out, num_points, num_polynomials)
+        if self._parallel:
+            eval_newton_polynomials_multiple_par(
+                xx,
+                self._coefficients,
+                self._exponents,
+                self._generating_points,
+                self._max_exponents,
+                results,
+            )
+        else:
+            eval_newton_polynomials_multiple(
+                xx,
+                self._coefficients,
+                self._exponents,
+                self._generating_points,
+                self._max_exponents,
+                self._products,
+                results,
+            )
+        if out is not None:
+            return out
+        if self._single:
+            return results[:, 0]
+
+        return results
+
+
+def _compile_point_kernel(
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    generating_points: np.ndarray,
+    max_exponents: np.ndarray,
+) -> Callable:
+    """Compile the evaluation at a single point with the given data bound.
+
+    :param coefficients: The coefficients of the polynomial(s), an ``(N, p)``
+        array.
+    :param exponents: The exponents of the polynomial(s), an ``(N, m)`` array.
+    :param generating_points: The generating points of the interpolation grid.
+    :param max_exponents: The maximum exponent per dimension.
+    :return: The compiled function ``kernel(x, out)``; see
+        :py:attr:`NewtonEvaluator.kernel`.
+
+    Notes
+    -----
+    - The arrays captured by the closure are frozen by Numba as (read-only)
+      constants; the function therefore does not call the kernels with
+      explicit signatures (which require writeable arrays).
+    """
+    num_monomials, spatial_dimension = exponents.shape
+    num_polynomials = coefficients.shape[1]
+    max_exponent = int(np.max(max_exponents)) if spatial_dimension > 0 else 0
+
+    @njit(nogil=True)
+    def kernel(x, out):  # pragma: no cover
+        # Chained products of the one-dimensional Newton monomials
+        products = np.empty((max_exponent + 1, spatial_dimension))
+        for i in range(spatial_dimension):
+            prod = 1.0
+            for j in range(max_exponents[i]):
+                prod *= x[i] - generating_points[j, i]
+                products[j + 1, i] = prod
+
+        out[:] = 0.0
+        for k in range(num_monomials):
+            monomial = 1.0
+            for i in range(spatial_dimension):
+                exponent = exponents[k, i]
+                if exponent > 0:
+                    monomial *= products[exponent, i]
+            for p in range(num_polynomials):
+                out[p] += coefficients[k, p] * monomial
+
+        return out
+
+    return kernel
+
+
 def deriv_newt_eval(x: np.ndarray, coefficients: np.ndarray, exponents: np.ndarray,
-                    generating_points: np.ndarray, derivative_order_along: np.ndarray) -> np.ndarray:
+                    generating_points: np.ndarray, derivative_order_along: np.ndarray,
+                    max_exponents: Optional[np.ndarray] = None) -> np.ndarray:
     """Evaluate the derivative of a polynomial in the Newton form.
 
      m = spatial dimension
@@ -260,6 +978,9 @@ def deriv_newt_eval(x: np.ndarray, coefficients: np.ndarray, exponents: np.ndarr
     derivative_order_along: (m) specifying the order along each dimension to compute the derivative
     eg. [2,3,1] will compute respectively 2nd order, 3rd order, and 1st order along spatial dimensions
     0, 1, and 2.
+    max_exponents: (m) the (precomputed) maximum exponent per dimension,
+        e.g., :py:attr:`MultiIndexSet.max_exponents`. If not given, it is
+        computed from the exponents.
 
     Returns
     -------
@@ -288,7 +1009,8 @@ def deriv_newt_eval(x: np.ndarray, coefficients: np.ndarray, exponents: np.ndarr
         num_polynomials = 1
     else:
         num_polynomials = coefficients.shape[1]
-    max_exponents = np.max(exponents, axis=0)
+    if max_exponents is None:
+        max_exponents = np.max(exponents, axis=0)
 
     # Result of the derivative evaluation
     results = np.empty((num_points, num_polynomials), dtype=FLOAT_DTYPE)
@@ -363,7 +1085,10 @@ def deriv_newt_eval(x: np.ndarray, coefficients: np.ndarray, exponents: np.ndarr
 
 
 def integrate_monomials_newton(
-    exponents: np.ndarray, generating_points: np.ndarray, bounds: np.ndarray
+    exponents: np.ndarray,
+    generating_points: np.ndarray,
+    bounds: np.ndarray,
+    max_exponents: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Integrate the monomials in the Newton basis given a set of exponents.
 
@@ -382,6 +1107,10 @@ def integrate_monomials_newton(
     bounds : :class:`numpy:numpy.ndarray`
         The bounds (lower and upper) of the definite integration, an ``(M, 2)``
         array, where ``M`` is the number of spatial dimensions.
+    max_exponents : :class:`numpy:numpy.ndarray`, optional
+        The (precomputed) maximum exponents per dimension, an ``(M,)`` array,
+        e.g., :py:attr:`MultiIndexSet.max_exponents`. If not given, it is
+        computed from the exponents.
 
     Returns
     -------
@@ -391,8 +1120,10 @@ def integrate_monomials_newton(
     """
     # --- Get some basic data
     num_monomials, num_dim = exponents.shape
-    max_exp = np.max(exponents)
-    max_exps_in_dim = np.max(exponents, axis=0)
+    if max_exponents is None:
+        max_exponents = np.max(exponents, axis=0)
+    max_exps_in_dim = max_exponents
+    max_exp = np.max(max_exps_in_dim)
 
     # --- Compute the integrals of one-dimensional bases
     one_dim_integrals = np.empty((max_exp + 1, num_dim))  # A lookup table
@@ -430,3 +1161,84 @@ def integrate_monomials_newton(
     #       and the implementation.
 
     return monomials_integrals
+
+
+def update_newton_coeffs(
+    coefficients: np.ndarray,
+    exponents: np.ndarray,
+    new_exponents: np.ndarray,
+    new_fct_values: np.ndarray,
+    generating_points: np.ndarray,
+) -> np.ndarray:
+    """Compute the Newton coefficients of exponents added to an interpolant.
+
+    Parameters
+    ----------
+    coefficients : :class:`numpy:numpy.ndarray`
+        The Newton coefficients of the current interpolating polynomial(s),
+        an ``(N,)`` or ``(N, p)`` array.
+    exponents : :class:`numpy:numpy.ndarray`
+        The exponents of the current interpolating polynomial(s),
+        an ``(N, m)`` array.
+    new_exponents : :class:`numpy:numpy.ndarray`
+        The added exponents, a ``(K, m)`` array. They must not be contained
+        in ``exponents``.
+    new_fct_values : :class:`numpy:numpy.ndarray`
+        The function values at the unisolvent nodes of the added exponents,
+        a ``(K,)`` or ``(K, p)`` array.
+    generating_points : :class:`numpy:numpy.ndarray`
+        The generating points of the interpolating polynomial(s),
+        a ``(P + 1, m)`` array, where ``P`` is the maximum exponent
+        of the current and the added exponents in any dimension.
+
+    Returns
+    -------
+    :class:`numpy:numpy.ndarray`
+        The Newton coefficients of the added exponents, a ``(K,)`` or
+        ``(K, p)`` array, in the order of ``new_exponents``.
+
+    Notes
+    -----
+    - The Newton interpolant is hierarchical: if the union of the current
+      and the added exponents is downward-closed, the coefficients of
+      the current exponents remain unchanged. Only the polynomial(s) at
+      the ``K`` new nodes and the ``(K, K)`` Newton monomials among the new
+      nodes are evaluated, i.e., :math:`\\mathcal{O}(K N)` instead of
+      :math:`\\mathcal{O}((N + K)^2)` operations for a new interpolation.
+    - The Newton monomials of the added exponents at their unisolvent nodes
+      form a lower triangular matrix once the exponents are sorted
+      lexicographically.
+    - Neither the downward-closedness of the union nor the disjointness of
+      the exponents is verified here.
+    """
+    num_dim = exponents.shape[1]
+    new_nodes = generating_points[new_exponents, np.arange(num_dim)]
+
+    # Lexicographically sort the added exponents (last dimension first)
+    order = np.lexsort(new_exponents.T)
+    sorted_exponents = np.ascontiguousarray(new_exponents[order])
+    sorted_nodes = np.ascontiguousarray(new_nodes[order])
+
+    # Residuals of the current interpolant at the new nodes
+    residuals = np.asarray(new_fct_values, dtype=FLOAT_DTYPE)[order]
+    if len(exponents) > 0:
+        residuals = residuals - eval_newton_polynomials(
+            sorted_nodes,
+            coefficients,
+            exponents,
+            generating_points,
+        )
+
+    # Solve the lower triangular system of the added Newton monomials
+    monomials = eval_newton_monomials(
+        sorted_nodes,
+        sorted_exponents,
+        generating_points,
+        triangular=True,
+    )
+    sorted_coeffs = solve_triangular(monomials, residuals, lower=True)
+
+    new_coeffs = np.empty_like(sorted_coeffs)
+    new_coeffs[order] = sorted_coeffs
+
+    return new_coeffs
@@ -0,0 +1,131 @@
+"""
+This module provides computational routines shared by the evaluation of
+polynomials with sparse exponents.
+
+The exponents are given in the compressed sparse row (CSR) format
+(see :py:func:`~minterpy.utils.multi_index.compress_exponents`); only
+the nonzero exponents are visited during the evaluation. This is beneficial
+for multi-index sets in high dimensions with a low :math:`l_p`-degree
+where most exponents are zero.
+
+The basis-specific part of the evaluation is the lookup table of
+the one-dimensional basis polynomials at the query points;
+see the respective basis module for the function that fills the table.
+"""
+
+import numpy as np
+
+from typing import Callable, Optional, Union
+
+from minterpy.global_settings import FLOAT_DTYPE
+from minterpy.jit_compiled.common import eval_polynomials_sparse
+from minterpy.utils.arrays import (
+    EvalWorkspace,
+    get_batch_size,
+    get_batch_slices,
+    make_coeffs_2d,
+)
+from minterpy.utils.multi_index import SparseExponents
+
+
+def eval_sparse(
+    xx: np.ndarray,
+    coefficients: np.ndarray,
+    sparse_exponents: SparseExponents,
+    max_exponent: int,
+    fill_tables: Callable[[np.ndarray, np.ndarray], None],
+    batch_size: Optional[Union[int, str]] = None,
+    memory_budget: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    workspace: Optional[EvalWorkspace] = None,
+) -> np.ndarray:
+    """Evaluate polynomial(s) with sparse exponents at multiple query points.
+
+    Parameters
+    ----------
+    xx : :class:`numpy:numpy.ndarray`
+        The query points, an ``(k, m)`` array.
+    coefficients : :class:`numpy:numpy.ndarray`
+        The coefficients of the polynomial(s), an ``(N,)`` or ``(N, p)``
+        array.
+    sparse_exponents : SparseExponents
+        The exponents of the polynomial(s) in the CSR format.
+    max_exponent : int
+        The maximum exponent in any dimension.
+    fill_tables : Callable[[np.ndarray, np.ndarray], None]
+        The function that fills the lookup table of shape
+        ``(k_b, max_exponent + 1, m)`` (the second argument) with the values
+        of the one-dimensional basis polynomials at the query points of
+        a batch (the first argument) in-place.
+    batch_size : Union[int, str], optional
+        The number of query points evaluated at once. If ``None`` (default)
+        or ``"auto"``, the batch size is determined such that the lookup
+        table fits the ``memory_budget``.
+    memory_budget : int, optional
+        The memory budget in bytes for the lookup table of a batch.
+        If not specified, ``minterpy.global_settings.DEFAULT_MEMORY_BUDGET``
+        is used.
+    out : :class:`numpy:numpy.ndarray`, optional
+        The array of shape ``(k,)`` or ``(k, p)`` into which the values
+        are written. If given, it is returned instead of a new array.
+    workspace : EvalWorkspace, optional
+        The workspace whose buffer is reused for the lookup table.
+
+    Returns
+    -------
+    :class:`numpy:numpy.ndarray`
+        The values of the polynomial(s), an array of shape ``(k,)`` if
+        the coefficients are one-dimensional and ``(k, p)`` otherwise.
+
+    Notes
+    -----
+    - The lookup table holds ``(max_exponent + 1) * m`` elements per query
+      point.
+    """
+    num_points, m = xx.shape
+    table_shape = (max_exponent + 1, m)
+    coefficients_2d = np.asarray(
+        make_coeffs_2d(coefficients),
+        dtype=FLOAT_DTYPE,
+    )
+    num_polynomials = coefficients_2d.shape[1]
+
+    # Get the batch size
+    if batch_size is None or batch_size == "auto":
+        batch_size = get_batch_size(
+            num_points,
+            table_shape[0] * table_shape[1],
+            memory_budget,
+        )
+
+    # Create an output placeholder
+    if out is None:
+        results = np.empty((num_points, num_polynomials), dtype=FLOAT_DTYPE)
+    elif out.ndim == 1:
+        results = out[:, np.newaxis]
+    else:
+        results = out
+
+    for batch in get_batch_slices(num_points, batch_size):
+        xx_batch = xx[batch]
+        shape = (len(xx_batch),) + table_shape
+        if workspace is None:
+            tables = np.empty(shape, dtype=FLOAT_DTYPE)
+        else:
+            tables = workspace.get("tables", shape)
+        fill_tables(xx_batch, tables)
+        eval_polynomials_sparse(
+            tables,
+            coefficients_2d,
+            sparse_exponents.indptr,
+            sparse_exponents.indices,
+            sparse_exponents.values,
+            results[batch],
+        )
+
+    if out is not None:
+        return out
+    if coefficients.ndim == 1:
+        return results[:, 0]
+
+    return results
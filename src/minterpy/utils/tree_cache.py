@@ -0,0 +1,360 @@
+"""
+This module contains the persistent on-disk cache of the precomputations
+of a multi-index tree.
+
+The components of a :py:class:`.MultiIndexTree` (the split positions,
+the subtree sizes, the problem sizes, and the projection masks) depend only
+on the exponents of the underlying multi-index set. They are stored
+in a content-addressed directory, keyed by a hash of the exponents
+(and of the version of the storage format), such that the same tree is
+only computed once across processes.
+
+The arrays are stored as NumPy ``.npy`` files; the (potentially large)
+masks, a single flat array (see :py:func:`minterpy.dds.precompute_masks`),
+are loaded memory-mapped. Cached arrays that do not match the multi-index
+set or the tree (e.g., stale or truncated files) are ignored and
+recomputed.
+
+The cache is disabled by default. It is enabled by setting the environment
+variable ``MINTERPY_TREE_CACHE_DIR`` or by calling
+:py:func:`set_tree_cache_dir`.
+"""
+
+import hashlib
+import os
+import tempfile
+
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from numba.typed import List
+
+from minterpy.global_settings import ARRAY, INT_DTYPE, TYPED_LIST
+
+__all__ = [
+    "get_tree_cache_dir",
+    "set_tree_cache_dir",
+    "get_cache_key",
+    "load_tree_structure",
+    "save_tree_structure",
+    "load_masks",
+    "save_masks",
+]
+
+TREE_CACHE_DIR_ENV = "MINTERPY_TREE_CACHE_DIR"
+
+_CACHE_DIR: Optional[Path] = (
+    Path(os.environ[TREE_CACHE_DIR_ENV]) if os.environ.get(TREE_CACHE_DIR_ENV) else None
+)
+
+# NOTE: Increment when the layout of the stored arrays changes
+CACHE_FORMAT_VERSION = 1
+
+_STRUCTURE = ("split_positions", "subtree_sizes", "problem_sizes")
+
+
+def get_tree_cache_dir() -> Optional[Path]:
+    """Get the directory of the tree cache.
+
+    Returns
+    -------
+    Path, optional
+        The directory of the cache; ``None`` if the cache is disabled.
+    """
+    return _CACHE_DIR
+
+
+def set_tree_cache_dir(cache_dir: Optional[Union[str, os.PathLike]]) -> None:
+    """Set the directory of the tree cache.
+
+    Parameters
+    ----------
+    cache_dir : Union[str, os.PathLike], optional
+        The directory of the cache; it is created on the first write.
+        If ``None``, the cache is disabled.
+    """
+    global _CACHE_DIR
+    _CACHE_DIR = None if cache_dir is None else Path(cache_dir)
+
+
+def get_cache_key(exponents: ARRAY) -> str:
+    """Get the content-addressed key of a set of exponents.
+
+    Parameters
+    ----------
+    exponents : :class:`numpy:numpy.ndarray`
+        The exponents of a multi-index set, an ``(N, m)`` array.
+
+    Returns
+    -------
+    str
+        The SHA-256 hash of the version of the storage format
+        (:py:data:`CACHE_FORMAT_VERSION`) and of the shape and the values
+        of the exponents.
+    """
+    exponents = np.ascontiguousarray(exponents, dtype=INT_DTYPE)
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_FORMAT_VERSION}".encode())
+    digest.update(str(exponents.shape).encode())
+    digest.update(exponents.tobytes())
+
+    return digest.hexdigest()
+
+
+def load_tree_structure(
+    cache_dir: Union[str, os.PathLike],
+    key: str,
+    nr_exponents: int,
+    spatial_dimension: int,
+) -> Optional[Tuple[TYPED_LIST, TYPED_LIST, TYPED_LIST]]:
+    """Load the structure of a multi-index tree from the cache.
+
+    Parameters
+    ----------
+    cache_dir : Union[str, os.PathLike]
+        The directory of the cache.
+    key : str
+        The key of the multi-index set (see :py:func:`get_cache_key`).
+    nr_exponents : int
+        The number of elements of the multi-index set.
+    spatial_dimension : int
+        The spatial dimension of the multi-index set.
+
+    Returns
+    -------
+    Tuple[TYPED_LIST, TYPED_LIST, TYPED_LIST], optional
+        The split positions, the subtree sizes, and the problem sizes of
+        the tree; ``None`` if they are not (or not completely) cached or
+        if the cached arrays are not consistent with the multi-index set.
+    """
+    entry_dir = Path(cache_dir) / key
+    flat_lists = []
+    try:
+        for name in _STRUCTURE:
+            values = np.load(entry_dir / f"{name}.npy")
+            offsets = np.load(entry_dir / f"{name}_offsets.npy")
+            if not _is_valid_flat_list(values, offsets, spatial_dimension):
+                return None
+            flat_lists.append((values, offsets))
+    except (OSError, ValueError):
+        return None
+
+    if not _is_valid_structure(flat_lists, nr_exponents):
+        return None
+
+    return tuple(_unflatten_list(values, offsets) for values, offsets in flat_lists)
+
+
+def save_tree_structure(
+    cache_dir: Union[str, os.PathLike],
+    key: str,
+    split_positions: TYPED_LIST,
+    subtree_sizes: TYPED_LIST,
+    problem_sizes: TYPED_LIST,
+) -> None:
+    """Save the structure of a multi-index tree in the cache.
+
+    Parameters
+    ----------
+    cache_dir : Union[str, os.PathLike]
+        The directory of the cache.
+    key : str
+        The key of the multi-index set (see :py:func:`get_cache_key`).
+    split_positions : TYPED_LIST
+        The split positions of the tree.
+    subtree_sizes : TYPED_LIST
+        The subtree sizes of the tree.
+    problem_sizes : TYPED_LIST
+        The problem sizes of the tree.
+
+    Notes
+    -----
+    - Each file is written atomically; failing to write (e.g., due to missing
+      permissions) is silently ignored as the cache is only an optimization.
+    """
+    entry_dir = Path(cache_dir) / key
+    lists = (split_positions, subtree_sizes, problem_sizes)
+    for name, arrays in zip(_STRUCTURE, lists):
+        values, offsets = _flatten_list(arrays)
+        _save_array(entry_dir, f"{name}.npy", values)
+        _save_array(entry_dir, f"{name}_offsets.npy", offsets)
+
+
+def load_masks(
+    cache_dir: Union[str, os.PathLike],
+    key: str,
+    header: ARRAY,
+) -> Optional[ARRAY]:
+    """Load the projection masks of a multi-index tree from the cache.
+
+    Parameters
+    ----------
+    cache_dir : Union[str, os.PathLike]
+        The directory of the cache.
+    key : str
+        The key of the multi-index set (see :py:func:`get_cache_key`).
+    header : :class:`numpy:numpy.ndarray`
+        The expected header ``[nr_dims, nr_nodes, nr_pairs]`` of the masks
+        (see :py:func:`minterpy.dds.get_masks_header`).
+
+    Returns
+    -------
+    :class:`numpy:numpy.ndarray`, optional
+        The masks of the tree; ``None`` if they are not cached or if
+        the cached array does not match the header.
+
+    Notes
+    -----
+    - The masks are a memory-mapped array; the data are only read from
+      the disk when they are accessed. The array is mapped copy-on-write
+      (the file is never modified) such that it has the same (writeable) type
+      in the compiled code as the computed masks.
+    """
+    try:
+        masks = np.load(Path(cache_dir) / key / "masks.npy", mmap_mode="c")
+    except (OSError, ValueError):
+        return None
+
+    if not _is_valid_masks(masks, header):
+        return None
+
+    return masks
+
+
+def save_masks(
+    cache_dir: Union[str, os.PathLike],
+    key: str,
+    masks: ARRAY,
+) -> None:
+    """Save the projection masks of a multi-index tree in the cache.
+
+    Parameters
+    ----------
+    cache_dir : Union[str, os.PathLike]
+        The directory of the cache.
+    key : str
+        The key of the multi-index set (see :py:func:`get_cache_key`).
+    masks : :class:`numpy:numpy.ndarray`
+        The masks of the tree.
+    """
+    _save_array(Path(cache_dir) / key, "masks.npy", masks)
+
+
+def _save_array(entry_dir: Path, name: str, array: ARRAY) -> None:
+    """Save an array atomically in the directory of a cache entry."""
+    try:
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, entry_dir / name)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def _is_valid_masks(masks: ARRAY, header: ARRAY) -> bool:
+    """Check the layout of a flat array of masks against the expected header.
+
+    Notes
+    -----
+    - Only the header and the offsets are read; the data of the masks
+      are not accessed.
+    """
+    if masks.ndim != 1 or masks.dtype != INT_DTYPE or len(masks) < 3:
+        return False
+    if not np.array_equal(masks[:3], header):
+        return False
+
+    nr_dims, nr_nodes, nr_pairs = (int(value) for value in header)
+    pos_offsets = 3 + nr_dims + nr_nodes
+    pos_data = pos_offsets + nr_pairs + 1
+    if len(masks) < pos_data:
+        return False
+
+    # The offsets must be sorted and cover exactly the data
+    offsets = masks[pos_offsets:pos_data]
+    if offsets[0] != 0 or offsets[-1] != len(masks) - pos_data:
+        return False
+
+    return bool(np.all(offsets[1:] >= offsets[:-1]))
+
+
+def _is_valid_flat_list(values: ARRAY, offsets: ARRAY, nr_lists: int) -> bool:
+    """Check the types and the offsets of a flattened list of arrays."""
+    for array in (values, offsets):
+        if array.ndim != 1 or array.dtype != INT_DTYPE:
+            return False
+    if len(offsets) != nr_lists + 1:
+        return False
+
+    # The offsets must be sorted and cover exactly the values
+    if offsets[0] != 0 or offsets[-1] != len(values):
+        return False
+
+    return bool(np.all(offsets[1:] >= offsets[:-1]))
+
+
+def _is_valid_structure(flat_lists, nr_exponents: int) -> bool:
+    """Check the consistency of the (flattened) structure of a tree.
+
+    Notes
+    -----
+    - In each dimension, the subtree sizes sum up to the number of elements
+      and the split positions are their cumulative sums (starting at 0).
+      The problem sizes in the first dimension are the subtree sizes;
+      in a higher dimension, they sum up to the number of subtrees one
+      dimension lower.
+    """
+    (splits, split_offsets), (sizes, size_offsets), (problems, problem_offsets) = (
+        flat_lists
+    )
+    if not (
+        np.array_equal(split_offsets, size_offsets)
+        and np.array_equal(size_offsets, problem_offsets)
+    ):
+        return False
+
+    nr_nodes_lower = 0
+    for dim_idx, (start, end) in enumerate(zip(size_offsets[:-1], size_offsets[1:])):
+        sizes_in_dim = sizes[start:end]
+        if np.sum(sizes_in_dim) != nr_exponents or np.any(sizes_in_dim < 1):
+            return False
+        expected_splits = np.cumsum(sizes_in_dim) - sizes_in_dim
+        if not np.array_equal(splits[start:end], expected_splits):
+            return False
+        problems_in_dim = problems[start:end]
+        if dim_idx == 0:
+            if not np.array_equal(problems_in_dim, sizes_in_dim):
+                return False
+        elif np.sum(problems_in_dim) != nr_nodes_lower:
+            return False
+        nr_nodes_lower = end - start
+
+    return True
+
+
+def _flatten_list(arrays: TYPED_LIST) -> Tuple[ARRAY, ARRAY]:
+    """Flatten a list of arrays into the values and the offsets."""
+    offsets = np.zeros(len(arrays) + 1, dtype=INT_DTYPE)
+    offsets[1:] = np.cumsum([len(array) for array in arrays])
+    if len(arrays) > 0:
+        values = np.concatenate(list(arrays)).astype(INT_DTYPE)
+    else:
+        values = np.zeros(0, dtype=INT_DTYPE)
+
+    return values, offsets
+
+
+def _unflatten_list(values: ARRAY, offsets: ARRAY) -> TYPED_LIST:
+    """Create a typed list of arrays from the values and the offsets."""
+    arrays = List()
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        arrays.append(values[start:end].copy())
+
+    return arrays
@@ -860,6 +860,130 @@ def verify_poly_power(power: int) -> int:
     return power
 
 
+def verify_batch_size(
+    batch_size: Optional[Union[int, str]],
+) -> Optional[Union[int, str]]:
+    """Verify if the value of a given batch size is valid.
+
+    Parameters
+    ----------
+    batch_size : Union[int, str], optional
+        Batch size (number of query points) to verify; the value must be
+        ``None`` (no batching), ``"auto"`` (the batch size is determined
+        from a memory budget), or a strictly positive whole number.
+
+    Returns
+    -------
+    Union[int, str], optional
+        Verified batch size. If the input is a number but not an `int`,
+        the function does a type conversion to an `int` if possible.
+
+    Raises
+    ------
+    TypeError
+        If ``batch_size`` is not of a correct type.
+    ValueError
+        If ``batch_size`` is, for example, not a positive or a whole number,
+        or a string other than ``"auto"``.
+
+    Examples
+    --------
+    >>> verify_batch_size(None) is None
+    True
+    >>> verify_batch_size("AUTO")
+    'auto'
+    >>> verify_batch_size(100.0)  # float but whole
+    100
+    """
+    if batch_size is None:
+        return batch_size
+
+    if isinstance(batch_size, str):
+        if batch_size.lower() != "auto":
+            raise ValueError(
+                f"{batch_size!r} is invalid for batch size! "
+                "The only supported string is 'auto'."
+            )
+        return batch_size.lower()
+
+    try:
+        # Must be a real scalar
+        if not is_real_scalar(batch_size):
+            raise TypeError("Batch size must be a scalar.")
+
+        # Must be strictly positive
+        check_values(batch_size, negative=False, zero=False)
+
+        # Other type than int may be acceptable if it's a whole number
+        if batch_size % 1 != 0:
+            raise ValueError("Batch size must be a whole number.")
+
+        # Make sure that it's an int (whole number checked must come first!)
+        batch_size = int(batch_size)
+
+    except TypeError as err:
+        custom_message = f"Invalid type for batch size (got {batch_size})!"
+        err.args = _add_custom_exception_message(err.args, custom_message)
+        raise err
+
+    except ValueError as err:
+        custom_message = f"{batch_size} is invalid for batch size!"
+        err.args = _add_custom_exception_message(err.args, custom_message)
+        raise err
+
+    return batch_size
+
+
+def verify_eval_output(
+    out: np.ndarray,
+    num_points: int,
+    num_polynomials: int,
+) -> np.ndarray:
+    """Verify if a given output array can hold the values of an evaluation.
+
+    Parameters
+    ----------
+    out : :class:`numpy:numpy.ndarray`
+        The output array to verify.
+    num_points : int
+        The number of query points.
+    num_polynomials : int
+        The number of polynomials (i.e., sets of coefficients) evaluated.
+
+    Returns
+    -------
+    :class:`numpy:numpy.ndarray`
+        The verified output array. The array is of shape ``(k,)`` for
+        a single polynomial or ``(k, np)`` for multiple polynomials, following
+        the convention of :py:func:`shape_eval_output`.
+
+    Raises
+    ------
+    TypeError
+        If ``out`` is not an array of the floating point type.
+    ValueError
+        If ``out`` is not of the expected shape.
+
+    Examples
+    --------
+    >>> out = verify_eval_output(np.empty(3), 3, 1)
+    >>> out = verify_eval_output(np.empty((3, 2)), 3, 2)
+    >>> out = verify_eval_output(np.empty(3), 3, 2)  # Wrong shape
+    Traceback (most recent call last):
+    ...
+    ValueError: 2-D array is expected; got instead 1-D.
+    """
+    check_type(out, np.ndarray)
+    check_dtype(out, FLOAT_DTYPE)
+
+    if num_polynomials == 1:
+        check_shape(out, (num_points,))
+    else:
+        check_shape(out, (num_points, num_polynomials))
+
+    return out
+
+
 def _add_custom_exception_message(
     exception_args: Tuple[str, ...],
     custom_message: str
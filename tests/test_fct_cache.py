@@ -0,0 +1,169 @@
+"""
+Test suite for the cache of function values at the unisolvent nodes.
+"""
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from conftest import LpDegree, PolyDegree, SpatialDimension
+
+import minterpy as mp
+from minterpy import FunctionValueCache
+
+
+class _CountingFunction:
+    """Test function that records the number of evaluated nodes."""
+
+    def __init__(self):
+        self.num_nodes = []
+
+    def __call__(self, xx: np.ndarray) -> np.ndarray:
+        self.num_nodes.append(len(xx))
+        return np.sin(np.sum(xx, axis=1))
+
+
+def _create_grid(spatial_dimension, poly_degree, lp_degree):
+    """Create a grid with generating points independent of the degree."""
+    gen_points = np.linspace(-1, 1, 10)[:, np.newaxis]
+    gen_points = np.tile(gen_points, (1, spatial_dimension))
+    mi = mp.MultiIndexSet.from_degree(spatial_dimension, poly_degree, lp_degree)
+
+    return mp.Grid.from_points(mi, gen_points)
+
+
+class TestCache:
+    """All tests related to the cache of function values."""
+
+    def test_refinement(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test that only the new nodes of a refined grid are evaluated."""
+        fun = _CountingFunction()
+        cache = FunctionValueCache(fun)
+        grd = _create_grid(SpatialDimension, PolyDegree, LpDegree)
+        grd_refined = _create_grid(SpatialDimension, PolyDegree + 1, LpDegree)
+
+        values = grd(cache)
+        values_refined = grd_refined(cache)
+
+        # Assertions
+        num_nodes = len(grd.multi_index)
+        num_nodes_refined = len(grd_refined.multi_index)
+        assert fun.num_nodes == [num_nodes, num_nodes_refined - num_nodes]
+        assert cache.num_hits == num_nodes
+        assert len(cache) == num_nodes_refined
+        assert np.array_equal(values, fun(grd.unisolvent_nodes))
+        assert np.array_equal(
+            values_refined,
+            fun(grd_refined.unisolvent_nodes),
+        )
+
+        # All the nodes are cached
+        grd(cache)
+        assert cache.num_evals == num_nodes_refined
+
+    def test_interpolator(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test interpolating a cached function."""
+        fun = _CountingFunction()
+        cache = FunctionValueCache(fun)
+        interpolator = mp.Interpolator(SpatialDimension, PolyDegree, LpDegree)
+
+        poly_1 = interpolator(cache)
+        poly_2 = interpolator(cache)
+
+        # Assertions
+        assert poly_1 == poly_2 == interpolator(fun)
+        assert cache.num_evals == len(interpolator.multi_index)
+
+    def test_different_nodes(self, SpatialDimension, LpDegree):
+        """Test that values at different nodes of the same exponent are not
+        reused."""
+        fun = _CountingFunction()
+        cache = FunctionValueCache(fun)
+        grd_1 = _create_grid(SpatialDimension, 2, LpDegree)
+        grd_2 = mp.Grid.from_points(
+            grd_1.multi_index,
+            grd_1.generating_points * 0.99,
+        )
+
+        grd_1(cache)
+        values = grd_2(cache)
+
+        # Assertions
+        assert cache.num_hits == 0
+        assert np.array_equal(values, fun(grd_2.unisolvent_nodes))
+
+    def test_lru(self, SpatialDimension):
+        """Test evicting the least recently used nodes."""
+        fun = _CountingFunction()
+        grd = _create_grid(SpatialDimension, 3, 1.0)
+        grd_small = _create_grid(SpatialDimension, 1, 1.0)
+        max_size = len(grd.multi_index) - 1
+        cache = FunctionValueCache(fun, max_size=max_size)
+
+        grd(cache)
+        assert len(cache) == max_size
+
+        # The most recently used nodes are kept
+        grd_small(cache)
+        assert cache.num_hits == len(grd_small.multi_index) - 1
+
+    def test_persistence(self, tmp_path, SpatialDimension, LpDegree):
+        """Test storing and loading the cache."""
+        path = tmp_path / "values.npz"
+        grd = _create_grid(SpatialDimension, 3, LpDegree)
+        cache = FunctionValueCache(_CountingFunction(), path=path)
+        values = grd(cache)
+        cache.save()
+
+        # Load in a new cache
+        fun = _CountingFunction()
+        cache_loaded = FunctionValueCache(fun, path=path)
+
+        # Assertions
+        assert len(cache_loaded) == len(cache)
+        assert np.array_equal(grd(cache_loaded), values)
+        assert fun.num_nodes == []
+
+    def test_executor(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test evaluating the missing nodes with an executor."""
+        fun = _CountingFunction()
+        cache = FunctionValueCache(fun)
+        grd = _create_grid(SpatialDimension, PolyDegree, LpDegree)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            values = grd.eval_on_nodes(cache, executor=executor, chunk_size=2)
+
+        assert np.array_equal(values, fun(grd.unisolvent_nodes))
+
+    def test_complex_values(self, SpatialDimension, LpDegree):
+        """Test that the type of the cached values is preserved."""
+        def fun(xx):
+            return np.exp(1j * np.sum(xx, axis=1))
+
+        cache = FunctionValueCache(fun)
+        grd = _create_grid(SpatialDimension, 2, LpDegree)
+        grd_refined = _create_grid(SpatialDimension, 3, LpDegree)
+
+        grd(cache)
+        values_cached = grd(cache)  # All values are cached
+        values_refined = grd_refined(cache)  # Some values are cached
+
+        # Assertions
+        assert np.iscomplexobj(values_cached)
+        assert np.array_equal(values_cached, fun(grd.unisolvent_nodes))
+        assert np.iscomplexobj(values_refined)
+        assert np.array_equal(
+            values_refined,
+            fun(grd_refined.unisolvent_nodes),
+        )
+
+    def test_invalid(self):
+        """Test invalid usages of the cache."""
+        with pytest.raises(ValueError):
+            FunctionValueCache(_CountingFunction(), max_size=0)
+
+        cache = FunctionValueCache(_CountingFunction())
+        with pytest.raises(ValueError):
+            cache.save()  # No file specified
+
+        grd = _create_grid(2, 2, 1.0)
+        with pytest.raises(TypeError):
+            grd(cache, True)
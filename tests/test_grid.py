@@ -1,6 +1,10 @@
+import multiprocessing
+
 import numpy as np
 import pytest
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 from minterpy import Grid, MultiIndexSet
 from minterpy.gen_points import (
     GENERATING_FUNCTIONS,
@@ -504,6 +508,77 @@ class TestCall:
         with pytest.raises(TypeError):
             grd(invalid_function)
 
+    def test_call_kwargs(self, multi_index_mnp):
+        """Test that all keyword arguments are passed to the function."""
+        # Create a Grid
+        grd = Grid(multi_index_mnp)
+
+        def fun(xx, executor, chunk_size):
+            return np.full(len(xx), executor + chunk_size)
+
+        # Call the Grid instance
+        lag_coeffs = grd(fun, executor=1, chunk_size=2)
+
+        # Assertion: the names are not taken as execution options
+        assert np.array_equal(lag_coeffs, np.full(len(grd.multi_index), 3))
+
+    @pytest.mark.parametrize("chunk_size", [None, 1, 7])
+    def test_eval_on_nodes_executor(self, multi_index_mnp, chunk_size):
+        """Test evaluating with an executor on chunks of the nodes."""
+        # Create a Grid
+        grd = Grid(multi_index_mnp)
+
+        # Evaluate on the nodes of the Grid instance
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            lag_coeffs_1 = grd.eval_on_nodes(
+                _fun_one_out,
+                executor=executor,
+                chunk_size=chunk_size,
+                kwargs={"sum": True},
+            )
+            lag_coeffs_2 = grd.eval_on_nodes(
+                _fun_multi_out,
+                executor=executor,
+                chunk_size=chunk_size,
+            )
+
+        # Assertions: the values are in the order of the nodes
+        assert np.array_equal(lag_coeffs_1, grd(_fun_one_out, sum=True))
+        assert np.array_equal(lag_coeffs_2, grd.unisolvent_nodes)
+
+    def test_eval_on_nodes_process_pool(self):
+        """Test evaluating with a process pool."""
+        grd = Grid.from_degree(2, 4, 2.0)
+
+        # NOTE: Forking a process with running (Numba) threads may deadlock
+        mp_context = multiprocessing.get_context("spawn")
+        executor = ProcessPoolExecutor(max_workers=2, mp_context=mp_context)
+        with executor:
+            lag_coeffs = grd.eval_on_nodes(
+                _fun_one_out,
+                executor=executor,
+                chunk_size=4,
+            )
+
+        assert np.array_equal(lag_coeffs, grd(_fun_one_out))
+
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_eval_on_nodes_invalid_chunk_size(
+        self,
+        multi_index_mnp,
+        chunk_size,
+    ):
+        """Test evaluating with an invalid chunk size."""
+        grd = Grid(multi_index_mnp)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(ValueError):
+                grd.eval_on_nodes(
+                    _fun_one_out,
+                    executor=executor,
+                    chunk_size=chunk_size,
+                )
+
 
 class TestExpandDim:
     """All tests related to the dimension expansion of a Grid instance."""
@@ -6,7 +6,9 @@ Here the functionality of the respective attribute is not tested.
 
 import numpy as np
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from conftest import (
+    SEED,
     LpDegree,
     NrPoints,
     PolyDegree,
@@ -22,7 +24,8 @@ from conftest import (
 from numpy.testing import assert_, assert_almost_equal
 
 import minterpy as mp
-from minterpy import Interpolant, Interpolator, interpolate
+from minterpy import AdaptiveInterpolator, Interpolant, Interpolator, interpolate
+from minterpy.core.tree import MultiIndexTree
 
 # test construction
 
@@ -104,6 +107,26 @@ def test_interpolate(NrPoints, SpatialDimension, PolyDegree, LpDegree):
     assert_almost_equal(res, groundtruth)
 
 
+def test_interpolate_executor(SpatialDimension, PolyDegree, LpDegree):
+    """Test interpolating with the function evaluated by an executor."""
+    interpolant_1 = interpolate(_fun, SpatialDimension, PolyDegree, LpDegree)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        interpolant_2 = interpolate(
+            _fun,
+            SpatialDimension,
+            PolyDegree,
+            LpDegree,
+            executor=executor,
+            chunk_size=3,
+        )
+        poly = interpolant_2.interpolator(_fun, executor=executor)
+        lag_coeffs = interpolant_2.lagrange_coeffs
+
+    assert interpolant_1.to_newton() == interpolant_2.to_newton()
+    assert interpolant_1.to_newton() == poly
+    assert np.array_equal(interpolant_1.lagrange_coeffs, lag_coeffs)
+
+
 def _fun(xx: np.ndarray) -> np.ndarray:
     """Dummy function for testing interpolant."""
     return np.sum(xx, axis=1)
@@ -176,3 +199,285 @@ class TestPoly:
         poly_2 = mp.NewtonToChebyshev(nwt_poly)()
 
         assert poly_1 == poly_2
+
+
+class TestDDS:
+    """All tests related to the divided difference scheme (DDS)."""
+
+    def test_interpolator_par(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test interpolating with the parallel DDS."""
+        interpolator = Interpolator(SpatialDimension, PolyDegree, LpDegree)
+
+        poly_1 = interpolator(_fun)
+        poly_2 = interpolator(_fun, backend="numba-par")
+
+        assert poly_1 == poly_2
+
+    @pytest.mark.parametrize("num_columns", [1, 7])
+    def test_par(self, SpatialDimension, PolyDegree, LpDegree, num_columns):
+        """Test the parallel DDS kernels against the serial one."""
+        grd = mp.Grid.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        tree = grd.tree
+        rng = np.random.default_rng(SEED)
+        lag_coeffs = rng.random((len(grd.multi_index), num_columns))
+
+        # Reference (serial)
+        nwt_coeffs_ref = mp.dds.dds(lag_coeffs, tree)
+
+        # Parallel over the nodes and over the columns, resp.
+        args = (
+            grd.generating_points,
+            tree.split_positions,
+            tree.subtree_sizes,
+            tree.stored_masks,
+            grd.multi_index.exponents,
+        )
+        nwt_coeffs_nodes = lag_coeffs.copy()
+        mp.dds.jit_dds_par(nwt_coeffs_nodes, *args)
+        nwt_coeffs_columns = lag_coeffs.copy()
+        mp.dds.jit_dds_par_columns(nwt_coeffs_columns, *args)
+
+        # Assertions: the same operations in the same order per entry
+        assert np.array_equal(nwt_coeffs_nodes, nwt_coeffs_ref)
+        assert np.array_equal(nwt_coeffs_columns, nwt_coeffs_ref)
+        assert np.array_equal(
+            mp.dds.dds(lag_coeffs, tree, backend="numba-par"),
+            nwt_coeffs_ref,
+        )
+
+    def test_invalid_backend(self):
+        """Test using an unsupported backend for the DDS."""
+        grd = mp.Grid.from_degree(2, 2, 1.0)
+        lag_coeffs = grd(_fun)
+
+        with pytest.raises(NotImplementedError):
+            mp.dds.dds(lag_coeffs, grd.tree, backend="numba-invalid")
+
+    @pytest.mark.parametrize("num_columns", [1, 7, 70])
+    @pytest.mark.parametrize("block_size", [None, 1, 4])
+    def test_blocked(
+        self, SpatialDimension, PolyDegree, LpDegree, num_columns, block_size
+    ):
+        """Test the column-blocked DDS against the serial one."""
+        grd = mp.Grid.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        rng = np.random.default_rng(SEED)
+        lag_coeffs = rng.random((len(grd.multi_index), num_columns))
+
+        nwt_coeffs_ref = mp.dds.dds(lag_coeffs, grd.tree)
+        nwt_coeffs = mp.dds.dds(
+            lag_coeffs, grd.tree, backend="numba-blocked", block_size=block_size
+        )
+
+        # Assertion: the same operations in the same order per entry
+        assert np.array_equal(nwt_coeffs, nwt_coeffs_ref)
+
+    def test_blocked_invalid_block_size(self):
+        """Test using an invalid block size for the column-blocked DDS."""
+        grd = mp.Grid.from_degree(2, 2, 1.0)
+        lag_coeffs = grd(_fun)
+
+        with pytest.raises(ValueError):
+            mp.dds.dds(lag_coeffs, grd.tree, backend="numba-blocked", block_size=0)
+
+    @pytest.mark.parametrize("num_columns", [None, 3])
+    def test_overwrite_input(
+        self, SpatialDimension, PolyDegree, LpDegree, num_columns
+    ):
+        """Test the DDS that overwrites the input array."""
+        grd = mp.Grid.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        rng = np.random.default_rng(SEED)
+        if num_columns is None:
+            lag_coeffs = rng.random(len(grd.multi_index))
+        else:
+            lag_coeffs = rng.random((len(grd.multi_index), num_columns))
+        lag_coeffs_orig = lag_coeffs.copy()
+
+        # Reference (the input is not overwritten)
+        nwt_coeffs_ref = mp.dds.dds(lag_coeffs, grd.tree)
+        assert np.array_equal(lag_coeffs, lag_coeffs_orig)
+
+        # Overwrite the input
+        nwt_coeffs = mp.dds.dds(lag_coeffs, grd.tree, overwrite_input=True)
+
+        # Assertions
+        assert np.shares_memory(nwt_coeffs, lag_coeffs)
+        assert np.array_equal(nwt_coeffs, nwt_coeffs_ref)
+
+    def test_overwrite_input_int(self):
+        """Test that an integer input array is not overwritten by the DDS."""
+        grd = mp.Grid.from_degree(2, 3, 1.0)
+        lag_coeffs = np.arange(len(grd.multi_index))
+        lag_coeffs_orig = lag_coeffs.copy()
+
+        nwt_coeffs = mp.dds.dds(lag_coeffs, grd.tree, overwrite_input=True)
+
+        # Assertions
+        assert not np.shares_memory(nwt_coeffs, lag_coeffs)
+        assert np.array_equal(lag_coeffs, lag_coeffs_orig)
+
+    def test_interpolator_overwrite_input(
+        self, SpatialDimension, PolyDegree, LpDegree
+    ):
+        """Test interpolating with the DDS that overwrites the input."""
+        interpolator = Interpolator(SpatialDimension, PolyDegree, LpDegree)
+
+        poly_1 = interpolator(_fun)
+        poly_2 = interpolator(_fun, overwrite_input=True)
+
+        assert poly_1 == poly_2
+
+    def test_masks(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test the lookup of the projection masks in the flat array."""
+        grd = mp.Grid.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        tree = grd.tree
+        split_positions = tree.split_positions
+        subtree_sizes = tree.subtree_sizes
+        exponents = grd.multi_index.exponents
+        masks = tree.stored_masks
+
+        # Assertions
+        assert masks.ndim == 1
+        assert masks[0] == max(SpatialDimension - 1, 0)
+        nr_pairs = 0
+        for dim_idx_par in range(SpatialDimension - 1, 0, -1):
+            for node_idx_par in range(len(split_positions[dim_idx_par])):
+                first_idx, last_idx = mp.dds.get_direct_child_idxs(
+                    dim_idx_par, node_idx_par, split_positions, subtree_sizes
+                )
+                for node_idx_l in range(first_idx, last_idx):
+                    for node_idx_r in range(node_idx_l + 1, last_idx + 1):
+                        mask_ref = mp.dds.compute_projection_mask(
+                            dim_idx_par - 1,
+                            node_idx_l,
+                            node_idx_r,
+                            split_positions,
+                            subtree_sizes,
+                            exponents,
+                        )
+                        mask = mp.dds.get_mask(
+                            masks, dim_idx_par - 1, node_idx_l, node_idx_r
+                        )
+                        assert np.array_equal(mask, mask_ref)
+                        nr_pairs += 1
+        assert masks[2] == nr_pairs
+
+    @pytest.mark.parametrize("backend", ["numba", "numba-par", "numba-blocked"])
+    def test_lazy_masks(self, SpatialDimension, PolyDegree, LpDegree, backend):
+        """Test the DDS with the masks computed just in time."""
+        grd = mp.Grid.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        rng = np.random.default_rng(SEED)
+        lag_coeffs = rng.random((len(grd.multi_index), 3))
+        tree = MultiIndexTree(grd, lazy_masks=True)
+
+        nwt_coeffs_ref = mp.dds.dds(lag_coeffs, grd.tree)
+        nwt_coeffs = mp.dds.dds(lag_coeffs, tree, backend=backend)
+
+        # Assertions
+        assert tree.lazy_masks
+        assert len(tree.stored_masks) == 0
+        assert np.array_equal(nwt_coeffs, nwt_coeffs_ref)
+
+    def test_lazy_masks_switch(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test switching the tree of an interpolator to the lazy mode."""
+        interpolator = Interpolator(SpatialDimension, PolyDegree, LpDegree)
+        poly_1 = interpolator(_fun)
+        tree = interpolator.grid.tree
+        assert not tree.lazy_masks
+        assert len(tree.stored_masks) > 0
+
+        # Switch to the lazy mode
+        tree.lazy_masks = True
+        poly_2 = interpolator(_fun)
+
+        # Assertions
+        assert tree._stored_masks is None
+        assert poly_1 == poly_2
+
+
+def _fun_adaptive(xx: np.ndarray) -> np.ndarray:
+    """Dummy function without symmetries for testing adaptive interpolation.
+    """
+    return np.exp(np.sum(xx * np.arange(1, xx.shape[1] + 1) / 4, axis=1))
+
+
+class TestAdaptive:
+    """All tests related to the adaptive interpolation."""
+
+    def test_complete(self, SpatialDimension, PolyDegree):
+        """Test refining up to the maximum degree against the interpolation.
+        """
+        interpolator = AdaptiveInterpolator(
+            SpatialDimension,
+            PolyDegree,
+            lp_degree=np.inf,
+        )
+        poly = interpolator(_fun_adaptive)
+
+        # Reference: Interpolation on the whole tensorial grid
+        mi = mp.MultiIndexSet.from_degree(SpatialDimension, PolyDegree, np.inf)
+        grd = mp.Grid.from_points(mi, interpolator.generating_points)
+        coeffs = mp.dds.dds(_fun_adaptive(grd.unisolvent_nodes), grd.tree)
+
+        # Assertions
+        assert poly.multi_index == mi
+        assert_almost_equal(poly.coeffs, coeffs.reshape(-1))
+
+    def test_max_evals(self, SpatialDimension):
+        """Test that the function is only evaluated at the new nodes."""
+        nodes = []
+
+        def fun(xx):
+            nodes.append(xx)
+            return _fun_adaptive(xx)
+
+        interpolator = AdaptiveInterpolator(SpatialDimension, 24)
+        poly = interpolator(fun, max_evals=20, batch_size=2)
+
+        # Assertions
+        nodes = np.concatenate(nodes)
+        assert len(nodes) == len(poly.multi_index) == 20
+        assert len(np.unique(nodes, axis=0)) == len(nodes)
+        assert poly.multi_index.is_downward_closed
+        assert_almost_equal(poly(nodes), _fun_adaptive(nodes))
+
+    def test_tol(self, SpatialDimension):
+        """Test refining a polynomial function up to a tolerance."""
+        interpolator = AdaptiveInterpolator(SpatialDimension, 8)
+        poly = interpolator(_fun, tol=1e-10)
+
+        # Assertions
+        rnd_points = build_rnd_points(10, SpatialDimension, seed=SEED)
+        assert len(poly.multi_index) < 9**SpatialDimension
+        assert_almost_equal(poly(rnd_points), _fun(rnd_points))
+
+    def test_executor(self, SpatialDimension):
+        """Test evaluating the new nodes with an executor."""
+        interpolator = AdaptiveInterpolator(SpatialDimension, 6)
+        poly_1 = interpolator(_fun_adaptive, max_evals=30, batch_size=3)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            poly_2 = interpolator(
+                _fun_adaptive,
+                max_evals=30,
+                batch_size=3,
+                executor=executor,
+                chunk_size=2,
+            )
+            poly_3 = interpolator(
+                _fun_adaptive,
+                max_evals=30,
+                batch_size=3,
+                executor=executor,
+            )
+
+        assert poly_1 == poly_2
+        assert poly_1 == poly_3
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"max_evals": 0}, {"batch_size": 0}, {"chunk_size": 0}],
+    )
+    def test_invalid(self, kwargs):
+        """Test adaptively interpolating with invalid parameters."""
+        interpolator = AdaptiveInterpolator(2, 4)
+        with pytest.raises(ValueError):
+            interpolator(_fun_adaptive, **kwargs)
@@ -360,6 +360,71 @@ class TestAttributes:
         assert not multi_index.is_complete
         assert multi_index.max_exponent < multi_index.poly_degree
 
+    def test_memoized_arrays(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test the memoized derived arrays of the multi-index set."""
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        exponents = mi.exponents
+
+        # Assertions
+        assert np.array_equal(mi.max_exponents, np.max(exponents, axis=0))
+        assert mi.max_exponents is mi.max_exponents
+        assert np.array_equal(mi.nonzero_mask, exponents != 0)
+        assert mi.nonzero_mask is mi.nonzero_mask
+        # The memoized arrays are read-only
+        assert not mi.max_exponents.flags.writeable
+        assert not mi.nonzero_mask.flags.writeable
+        with pytest.raises(ValueError):
+            mi.max_exponents[0] = 0
+
+    def test_memoized_arrays_inplace(self, SpatialDimension, LpDegree):
+        """Test the re-computation of the memoized arrays after a change."""
+        mi = MultiIndexSet.from_degree(SpatialDimension, 1, LpDegree)
+        max_exponents = mi.max_exponents
+        nonzero_mask = mi.nonzero_mask
+
+        # Add a new exponent in-place
+        new_exponent = np.full(SpatialDimension, 3)
+        mi.add_exponents(new_exponent, inplace=True)
+
+        # Assertions
+        assert np.all(max_exponents == 1)
+        assert np.all(mi.max_exponents == 3)
+        assert mi.max_exponent == 3
+        assert len(nonzero_mask) == len(mi) - 1
+        assert np.array_equal(mi.nonzero_mask, mi.exponents != 0)
+
+    def test_sparse_exponents(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test the exponents in the compressed sparse row (CSR) format."""
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        sparse_exponents = mi.sparse_exponents
+
+        # Decompress the exponents
+        exponents = np.zeros_like(mi.exponents)
+        for i in range(len(mi)):
+            start, end = sparse_exponents.indptr[i:i + 2]
+            dims = sparse_exponents.indices[start:end]
+            exponents[i, dims] = sparse_exponents.values[start:end]
+
+        # Assertions
+        assert np.array_equal(exponents, mi.exponents)
+        assert np.all(sparse_exponents.values != 0)
+        assert len(sparse_exponents.values) == np.count_nonzero(mi.exponents)
+        assert mi.sparse_exponents is sparse_exponents
+
+    def test_sparse_exponents_inplace(self, SpatialDimension, LpDegree):
+        """Test the re-computation of the sparse exponents after a change."""
+        mi = MultiIndexSet.from_degree(SpatialDimension, 1, LpDegree)
+        sparse_exponents = mi.sparse_exponents
+
+        # Add a new exponent in-place
+        new_exponent = np.full(SpatialDimension, 3)
+        mi.add_exponents(new_exponent, inplace=True)
+
+        # Assertions
+        assert mi.sparse_exponents is not sparse_exponents
+        assert len(mi.sparse_exponents.indptr) == len(mi) + 1
+        assert mi.sparse_exponents.indptr[-1] == np.count_nonzero(mi.exponents)
+
 
 class TestCopy:
     """All tests related to copy and deepcopy of MultiIndexSet instances.
@@ -394,6 +459,24 @@ class TestCopy:
         assert mi_deepcopy is not mi
         assert not np.shares_memory(mi.exponents, mi_deepcopy.exponents)
 
+    def test_deepcopy_memoized(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test creating a deep copy with memoized arrays."""
+        # Create a multi-index set with memoized arrays
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        max_exponents = mi.max_exponents
+        nonzero_mask = mi.nonzero_mask
+
+        # Create a deep copy
+        mi_deepcopy = copy.deepcopy(mi)
+
+        # Assertions
+        assert np.array_equal(mi_deepcopy.max_exponents, max_exponents)
+        assert not np.shares_memory(mi_deepcopy.max_exponents, max_exponents)
+        assert np.array_equal(mi_deepcopy.nonzero_mask, nonzero_mask)
+        assert not np.shares_memory(mi_deepcopy.nonzero_mask, nonzero_mask)
+        assert not mi_deepcopy.max_exponents.flags.writeable
+        assert not mi_deepcopy.nonzero_mask.flags.writeable
+
 
 # --- Instance Methods
 
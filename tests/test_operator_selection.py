@@ -0,0 +1,235 @@
+"""
+Test suite for the automatic selection of the transformation operator format.
+"""
+import numpy as np
+import pytest
+
+from conftest import build_rnd_coeffs
+
+from minterpy import (
+    LagrangePolynomial,
+    LagrangeToNewton,
+    MultiIndexSet,
+    NewtonPolynomial,
+    NewtonToLagrange,
+    global_settings,
+)
+from minterpy.schemes.barycentric.operators import (
+    BarycentricDictOperator,
+    BarycentricFactorisedOperator,
+    BarycentricNestedOperator,
+)
+from minterpy.schemes.matrix_operator import MatrixOperator
+from minterpy.transformations.operator_selection import (
+    L2N_FORMATS,
+    N2L_FORMATS,
+    OperatorCost,
+    _fit_line,
+    estimate_operator_costs,
+    get_operator_costs,
+    select_operator_format,
+    set_operator_costs,
+)
+
+OPERATOR_CLASSES = {
+    "matrix": MatrixOperator,
+    "factorised": BarycentricFactorisedOperator,
+    "dict": BarycentricDictOperator,
+    "nested": BarycentricNestedOperator,
+}
+
+
+class TestCostModel:
+    """All tests related to the cost model."""
+
+    def test_estimates(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test the estimated costs of each format."""
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        for direction, formats in [("l2n", L2N_FORMATS), ("n2l", N2L_FORMATS)]:
+            estimates = estimate_operator_costs(mi, direction)
+            assert tuple(estimates) == formats
+            for cost in estimates.values():
+                assert isinstance(cost, OperatorCost)
+                assert cost.build_time >= 0.0
+                assert cost.apply_time >= 0.0
+                assert cost.memory > 0
+
+            # More sets of coefficients are more expensive to transform
+            estimates_multi = estimate_operator_costs(mi, direction, 10)
+            for key, cost in estimates_multi.items():
+                assert cost.apply_time >= estimates[key].apply_time
+                assert cost.build_time == estimates[key].build_time
+
+    def test_select_large(self):
+        """Test that a barycentric format is selected for large problems."""
+        mi = MultiIndexSet.from_degree(3, 20, 2.0)
+
+        assert select_operator_format(mi, "l2n") != "matrix"
+        assert select_operator_format(mi, "n2l") != "matrix"
+
+    def test_memory_budget(self):
+        """Test that the formats exceeding the memory budget are excluded."""
+        mi = MultiIndexSet.from_degree(3, 6, 2.0)
+
+        for direction in ["l2n", "n2l"]:
+            estimates = estimate_operator_costs(mi, direction)
+            memory_budget = min(cost.memory for cost in estimates.values())
+            selected_format = select_operator_format(
+                mi,
+                direction,
+                memory_budget=memory_budget,
+            )
+            assert estimates[selected_format].memory == memory_budget
+            # Nothing fits
+            assert select_operator_format(mi, direction, memory_budget=0) == "nested"
+
+    def test_default_memory_budget(self, monkeypatch):
+        """Test that the dedicated default memory budget is used."""
+        mi = MultiIndexSet.from_degree(3, 6, 2.0)
+        estimates = estimate_operator_costs(mi, "l2n")
+        memory_budget = min(cost.memory for cost in estimates.values())
+        selected_format = select_operator_format(
+            mi, "l2n", memory_budget=memory_budget
+        )
+
+        # The budget of the batched evaluations is not used
+        monkeypatch.setattr(global_settings, "DEFAULT_MEMORY_BUDGET", 0)
+        monkeypatch.setattr(
+            global_settings, "DEFAULT_OPERATOR_MEMORY_BUDGET", memory_budget
+        )
+        assert select_operator_format(mi, "l2n") == selected_format
+
+    def test_set_costs(self):
+        """Test setting the coefficients of the cost model."""
+        mi = MultiIndexSet.from_degree(2, 4, 1.0)
+        costs = get_operator_costs()
+        try:
+            # Make the matrix format the cheapest one
+            new_costs = {
+                direction: {
+                    key: ((0.0, 0.0), (0.0, 0.0)) if key == "matrix"
+                    else ((1.0, 1.0), (1.0, 1.0))
+                    for key in formats
+                }
+                for direction, formats in costs.items()
+            }
+            set_operator_costs(new_costs)
+            assert get_operator_costs() is new_costs
+            assert select_operator_format(mi, "l2n") == "matrix"
+            assert select_operator_format(mi, "n2l") == "matrix"
+        finally:
+            set_operator_costs(None)
+        assert get_operator_costs() == costs
+
+    def test_fit_line(self):
+        """Test fitting the coefficients to the timings."""
+        samples = [(units, 1e-5 + 2e-9 * units) for units in [1e2, 1e4, 1e6]]
+        overhead, slope = _fit_line(samples)
+
+        assert np.isclose(overhead, 1e-5)
+        assert np.isclose(slope, 2e-9)
+
+        # Decreasing timings (noise) yield a constant model
+        overhead, slope = _fit_line([(1e2, 2e-5), (1e4, 1e-5)])
+        assert overhead > 0.0
+        assert slope == 0.0
+
+    def test_invalid(self):
+        """Test invalid usages of the cost model."""
+        mi = MultiIndexSet.from_degree(2, 2, 1.0)
+        with pytest.raises(ValueError):
+            estimate_operator_costs(mi, "l2c")
+        with pytest.raises(ValueError):
+            set_operator_costs({"l2n": {}})
+
+
+class TestTransformation:
+    """All tests related to the selection of the format in transformations."""
+
+    @pytest.mark.parametrize("operator_format", L2N_FORMATS)
+    def test_lagrange_to_newton(
+        self,
+        SpatialDimension,
+        PolyDegree,
+        LpDegree,
+        operator_format,
+    ):
+        """Test the user-selected formats of the Lagrange-to-Newton operator."""
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        lag_poly = LagrangePolynomial(mi, build_rnd_coeffs(mi))
+        nwt_coeffs_ref = LagrangeToNewton(lag_poly, "matrix")().coeffs
+
+        transformer = LagrangeToNewton(lag_poly, operator_format=operator_format)
+
+        # Assertions
+        assert transformer.selected_format == operator_format
+        assert isinstance(
+            transformer.transformation_operator,
+            OPERATOR_CLASSES[operator_format],
+        )
+        assert np.allclose(transformer().coeffs, nwt_coeffs_ref)
+
+    @pytest.mark.parametrize("operator_format", N2L_FORMATS)
+    def test_newton_to_lagrange(
+        self,
+        SpatialDimension,
+        PolyDegree,
+        LpDegree,
+        operator_format,
+    ):
+        """Test the user-selected formats of the Newton-to-Lagrange operator."""
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        nwt_poly = NewtonPolynomial(mi, build_rnd_coeffs(mi))
+        lag_coeffs_ref = nwt_poly(nwt_poly.grid.unisolvent_nodes)
+
+        transformer = NewtonToLagrange(nwt_poly, operator_format=operator_format)
+
+        # Assertions
+        assert transformer.selected_format == operator_format
+        assert isinstance(
+            transformer.transformation_operator,
+            OPERATOR_CLASSES[operator_format],
+        )
+        assert np.allclose(transformer().coeffs, lag_coeffs_ref)
+
+    def test_auto(self, SpatialDimension, PolyDegree, LpDegree, num_polynomials):
+        """Test the automatically selected format."""
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        coeffs = build_rnd_coeffs(mi, num_polynomials)
+        transformers = [
+            (LagrangeToNewton(LagrangePolynomial(mi, coeffs)), "l2n"),
+            (NewtonToLagrange(NewtonPolynomial(mi, coeffs)), "n2l"),
+        ]
+
+        for transformer, direction in transformers:
+            selected_format = select_operator_format(
+                mi,
+                direction,
+                num_polynomials,
+            )
+            assert transformer.operator_format == "auto"
+            assert transformer.selected_format == selected_format
+            assert isinstance(
+                transformer.transformation_operator,
+                OPERATOR_CLASSES[selected_format],
+            )
+
+    def test_non_downward_closed(self, multi_index_non_downward_closed):
+        """Test that the matrix format is used for non-downward-closed sets."""
+        mi = multi_index_non_downward_closed
+        lag_poly = LagrangePolynomial(mi, build_rnd_coeffs(mi))
+
+        transformer = LagrangeToNewton(lag_poly, operator_format="nested")
+
+        assert transformer.selected_format == "matrix"
+
+    def test_invalid(self):
+        """Test selecting unsupported formats."""
+        mi = MultiIndexSet.from_degree(2, 2, 1.0)
+        coeffs = build_rnd_coeffs(mi)
+
+        with pytest.raises(ValueError):
+            LagrangeToNewton(LagrangePolynomial(mi, coeffs), "unknown")
+        with pytest.raises(ValueError):
+            # The dictionary format is only available for Lagrange-to-Newton
+            NewtonToLagrange(NewtonPolynomial(mi, coeffs), "dict")
@@ -23,7 +23,9 @@ from minterpy import (
     Grid,
     LagrangePolynomial,
     MultiIndexSet,
+    NewtonPolynomial,
 )
+from minterpy.utils.arrays import EvalWorkspace
 
 
 class TestInitialization:
@@ -558,6 +560,170 @@ class TestEvaluation:
                 assert np.allclose(yy_test[:, i], yy_test[:, 0])
 
 
+class TestEvaluateOut:
+    """All tests related to the evaluation into a preallocated output array."""
+
+    @pytest.mark.parametrize("batch_size", [None, 7])
+    def test_out(self, rand_poly_mnp_no_lag, batch_size):
+        """Test the evaluation into an output array."""
+        poly = rand_poly_mnp_no_lag
+        xx_test = -1 + 2 * np.random.rand(23, poly.spatial_dimension)
+        yy_ref = poly(xx_test)
+
+        # Evaluate
+        out = np.empty_like(yy_ref)
+        yy = poly(xx_test, batch_size=batch_size, out=out)
+
+        # Assertions
+        assert yy is out
+        assert np.allclose(out, yy_ref)
+
+    def test_workspace(self, rand_poly_mnp_no_lag):
+        """Test the reuse of a workspace across evaluations."""
+        poly = rand_poly_mnp_no_lag
+        workspace = EvalWorkspace()
+        out = None
+        for _ in range(3):
+            xx_test = -1 + 2 * np.random.rand(23, poly.spatial_dimension)
+            yy_ref = poly(xx_test)
+            if out is None:
+                out = np.empty_like(yy_ref)
+
+            # Evaluate
+            yy = poly(xx_test, out=out, workspace=workspace)
+
+            # Assertion
+            assert np.allclose(yy, yy_ref)
+
+        # Evaluate on fewer query points without new buffers
+        nbytes = workspace.nbytes
+        yy = poly(xx_test[:10], workspace=workspace)
+
+        # Assertions
+        assert np.allclose(yy, yy_ref[:10])
+        assert workspace.nbytes == nbytes
+
+    def test_out_invalid_shape(self, rand_poly_mnp_no_lag):
+        """Test evaluating into an output array of an invalid shape."""
+        poly = rand_poly_mnp_no_lag
+        xx_test = -1 + 2 * np.random.rand(23, poly.spatial_dimension)
+        out = np.empty((22, len(poly)))
+
+        with pytest.raises(ValueError):
+            poly(xx_test, out=out)
+
+    def test_out_invalid_dtype(self, rand_poly_mnp_no_lag):
+        """Test evaluating into an output array of an invalid dtype."""
+        poly = rand_poly_mnp_no_lag
+        xx_test = -1 + 2 * np.random.rand(23, poly.spatial_dimension)
+        out = np.empty_like(poly(xx_test), dtype=np.float32)
+
+        with pytest.raises(TypeError):
+            poly(xx_test, out=out)
+
+
+def test_compile_evaluator_unsupported(rand_poly_mnp_all):
+    """Test creating an evaluator of polynomials in unsupported bases."""
+    if isinstance(rand_poly_mnp_all, NewtonPolynomial):
+        pytest.skip("Evaluators of Newton polynomials are supported.")
+
+    with pytest.raises(NotImplementedError):
+        rand_poly_mnp_all.compile_evaluator()
+
+
+class TestEvaluateStream:
+    """All tests related to the streaming evaluation of polynomials."""
+
+    def test_iterable(self, rand_poly_mnp_no_lag):
+        """Test the streaming evaluation on an iterable of chunks."""
+        m = rand_poly_mnp_no_lag.spatial_dimension
+        xx_test = -1 + 2 * np.random.rand(23, m)
+        chunks = (xx_test[i:i + 5] for i in range(0, len(xx_test), 5))
+
+        # Evaluate
+        yy_stream = list(rand_poly_mnp_no_lag.evaluate_stream(chunks))
+
+        # Assertions
+        assert len(yy_stream) == 5
+        yy_ref = rand_poly_mnp_no_lag(xx_test)
+        assert np.allclose(np.concatenate(yy_stream), yy_ref)
+
+    def test_iterable_chunk_size(self, rand_poly_mnp_no_lag):
+        """Test splitting the chunks of an iterable further."""
+        m = rand_poly_mnp_no_lag.spatial_dimension
+        xx_test = -1 + 2 * np.random.rand(23, m)
+        chunks = [xx_test[:10], xx_test[10:12], xx_test[12:]]
+
+        # Evaluate
+        yy_stream = list(
+            rand_poly_mnp_no_lag.evaluate_stream(chunks, chunk_size=4)
+        )
+
+        # Assertions
+        assert [len(yy) for yy in yy_stream] == [4, 4, 2, 2, 4, 4, 3]
+        yy_ref = rand_poly_mnp_no_lag(xx_test)
+        assert np.allclose(np.concatenate(yy_stream), yy_ref)
+
+    @pytest.mark.parametrize("chunk_size", [None, "auto", 1, 7, 100])
+    def test_array(self, rand_poly_mnp_no_lag, chunk_size):
+        """Test the streaming evaluation on a single array."""
+        m = rand_poly_mnp_no_lag.spatial_dimension
+        xx_test = -1 + 2 * np.random.rand(23, m)
+
+        # Evaluate
+        yy_stream = rand_poly_mnp_no_lag.evaluate_stream(
+            xx_test, chunk_size=chunk_size
+        )
+
+        # Assertion
+        yy_ref = rand_poly_mnp_no_lag(xx_test)
+        assert np.allclose(np.concatenate(list(yy_stream)), yy_ref)
+
+    def test_memmap_out(self, rand_poly_mnp_no_lag, tmp_path):
+        """Test the streaming evaluation from and into memory-mapped arrays."""
+        poly = rand_poly_mnp_no_lag
+        m = poly.spatial_dimension
+        num_points = 23
+
+        # Create memory-mapped query points and output array
+        xx_test = np.memmap(
+            tmp_path / "xx.dat", dtype=float, mode="w+", shape=(num_points, m)
+        )
+        xx_test[:] = -1 + 2 * np.random.rand(num_points, m)
+        out_shape = (num_points,) + poly.coeffs.shape[1:]
+        if out_shape[1:] == (1,):
+            out_shape = (num_points,)
+        out = np.memmap(
+            tmp_path / "yy.dat", dtype=float, mode="w+", shape=out_shape
+        )
+
+        # Evaluate
+        for _ in poly.evaluate_stream(xx_test, chunk_size=4, out=out):
+            pass
+
+        # Assertion
+        assert np.allclose(out, poly(np.asarray(xx_test)))
+
+    def test_out_too_small(self, rand_poly_mnp_no_lag):
+        """Test raising an error if the output array is too small."""
+        poly = rand_poly_mnp_no_lag
+        xx_test = -1 + 2 * np.random.rand(10, poly.spatial_dimension)
+        out = np.empty((5,) + poly(xx_test[:1]).shape[1:])
+
+        with pytest.raises(ValueError):
+            for _ in poly.evaluate_stream(xx_test, chunk_size=3, out=out):
+                pass
+
+    def test_lagrange(self, multi_index_mnp):
+        """Test the streaming evaluation of a Lagrange polynomial."""
+        coeffs = np.ones(len(multi_index_mnp))
+        poly = LagrangePolynomial(multi_index_mnp, coeffs)
+        xx_test = np.random.rand(10, multi_index_mnp.spatial_dimension)
+
+        with pytest.raises(NotImplementedError):
+            list(poly.evaluate_stream(xx_test))
+
+
 class TestNegation:
     """All tests related to the negation of a polynomial instance."""
     def test_neg_multi_poly(self, rand_poly_mnp_all):
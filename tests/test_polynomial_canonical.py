@@ -61,6 +61,48 @@ def test_eval(multi_index_mnp, NrPoints):
     assert_almost_equal(res, groundtruth)
 
 
+def test_eval_batch(multi_index_mnp, num_polynomials, BatchSizes):
+    """Test the evaluation of canonical polynomials in batches."""
+    coeffs = build_rnd_coeffs(multi_index_mnp, num_polynomials)
+    poly = CanonicalPolynomial(multi_index_mnp, coeffs)
+    xx = build_rnd_points(421, multi_index_mnp.spatial_dimension)
+
+    # Evaluate
+    yy_batch = poly(xx, batch_size=BatchSizes)
+    yy_auto = poly(xx, batch_size="auto", memory_budget=1024)
+    yy_ref = poly(xx)
+
+    # Assertions
+    assert_almost_equal(yy_batch, yy_ref)
+    assert_almost_equal(yy_auto, yy_ref)
+
+
+def test_eval_sparse(multi_index_mnp, num_polynomials, BatchSizes):
+    """Test the evaluation of canonical polys. with the sparse backend."""
+    coeffs = build_rnd_coeffs(multi_index_mnp, num_polynomials)
+    poly = CanonicalPolynomial(multi_index_mnp, coeffs)
+    xx = build_rnd_points(421, multi_index_mnp.spatial_dimension)
+
+    # Evaluate
+    yy_sparse = poly(xx, backend="numba-sparse")
+    yy_batch = poly(xx, backend="numba-sparse", batch_size=BatchSizes)
+    yy_ref = poly(xx)
+
+    # Assertions
+    assert_almost_equal(yy_sparse, yy_ref)
+    assert_almost_equal(yy_batch, yy_ref)
+
+
+def test_eval_invalid_backend(multi_index_mnp):
+    """Test evaluating canonical polys. with an unsupported backend."""
+    coeffs = build_rnd_coeffs(multi_index_mnp)
+    poly = CanonicalPolynomial(multi_index_mnp, coeffs)
+    xx = build_rnd_points(10, multi_index_mnp.spatial_dimension)
+
+    with pytest.raises(NotImplementedError):
+        poly(xx, backend="numba-invalid")
+
+
 # tests with two polynomials
 # todo:: find out if there are some more sophisticated tests for that
 exps1 = np.array([[0, 0], [1, 0], [0, 1], [1, 1]])
@@ -3,9 +3,11 @@ Testing module for the Chebyshev polynomial implementation.
 """
 
 import numpy as np
+import pytest
 
 from scipy.special import eval_chebyt
 from conftest import SEED, build_rnd_coeffs
+from numpy.testing import assert_almost_equal
 
 from minterpy import ChebyshevPolynomial, MultiIndexSet
 from minterpy.utils.multi_index import get_exponent_matrix
@@ -34,6 +36,55 @@ class TestEvaluation:
         # Assertion
         assert np.array_equal(yy_ref, yy_poly)
 
+    def test_batch(self, multi_index_mnp, num_polynomials, BatchSizes):
+        """Test evaluating Chebyshev polys. in batches of query points."""
+        # Create a random polynomial in the Chebyshev bases
+        mi = multi_index_mnp
+        cheb_coeffs = build_rnd_coeffs(mi, num_polynomials)
+        cheb_poly = ChebyshevPolynomial(mi, cheb_coeffs)
+
+        # Create random test points
+        xx_test = -1 + 2 * np.random.rand(421, mi.spatial_dimension)
+
+        # Evaluate
+        yy_batch = cheb_poly(xx_test, batch_size=BatchSizes)
+        yy_auto = cheb_poly(xx_test, batch_size="auto", memory_budget=1024)
+        yy_ref = cheb_poly(xx_test)
+
+        # Assertions
+        assert_almost_equal(yy_batch, yy_ref)
+        assert_almost_equal(yy_auto, yy_ref)
+
+    def test_sparse(self, multi_index_mnp, num_polynomials, BatchSizes):
+        """Test evaluating Chebyshev polys. with the sparse backend."""
+        # Create a random polynomial in the Chebyshev bases
+        mi = multi_index_mnp
+        cheb_coeffs = build_rnd_coeffs(mi, num_polynomials)
+        cheb_poly = ChebyshevPolynomial(mi, cheb_coeffs)
+
+        # Create random test points
+        xx_test = -1 + 2 * np.random.rand(421, mi.spatial_dimension)
+
+        # Evaluate
+        yy_sparse = cheb_poly(xx_test, backend="numba-sparse")
+        yy_batch = cheb_poly(
+            xx_test, backend="numba-sparse", batch_size=BatchSizes
+        )
+        yy_ref = cheb_poly(xx_test)
+
+        # Assertions
+        assert_almost_equal(yy_sparse, yy_ref)
+        assert_almost_equal(yy_batch, yy_ref)
+
+    def test_invalid_backend(self, multi_index_mnp):
+        """Test evaluating Chebyshev polys. with an unsupported backend."""
+        mi = multi_index_mnp
+        cheb_poly = ChebyshevPolynomial(mi, build_rnd_coeffs(mi))
+        xx_test = -1 + 2 * np.random.rand(10, mi.spatial_dimension)
+
+        with pytest.raises(NotImplementedError):
+            cheb_poly(xx_test, backend="numba-invalid")
+
     def test_nondownward_closed(self):
         """Test evaluating a Chebyshev poly. having an arbitrary multi-index.
         """
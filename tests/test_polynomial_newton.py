@@ -5,6 +5,7 @@ The subclassing is not tested here, see tesing module `test_polynomial.py`
 """
 import numpy as np
 import pytest
+from numba import njit
 from conftest import (
     assert_polynomial_almost_equal,
     build_rnd_coeffs,
@@ -13,8 +14,16 @@ from conftest import (
 )
 from numpy.testing import assert_almost_equal
 
+from minterpy.core.tree import MultiIndexTree
+from minterpy.dds import dds
+from minterpy.gen_points import gen_chebychev_2nd_order_leja_ordered
 from minterpy.global_settings import INT_DTYPE
-from minterpy.utils.polynomials.newton import eval_newton_polynomials
+from minterpy.utils.multi_index import find_match_between
+from minterpy.utils.arrays import EvalWorkspace
+from minterpy.utils.polynomials.newton import (
+    eval_newton_monomials,
+    eval_newton_polynomials,
+)
 from minterpy import Grid, MultiIndexSet
 
 from minterpy import (
@@ -30,6 +39,13 @@ def diff_backend(request):
     return request.param
 
 
+@pytest.fixture(
+    params=["numba", "numba-par", "numba-tree", "numba-horner", "numba-sparse"]
+)
+def eval_backend(request):
+    return request.param
+
+
 def test_eval(multi_index_mnp, NrPoints, num_polynomials):
     """Test the evaluation of Newton polynomials."""
 
@@ -77,6 +93,291 @@ def test_eval_batch(multi_index_mnp, num_polynomials, BatchSizes):
     assert_almost_equal(yy_newton, yy_canonical)
 
 
+def test_eval_batch_auto(multi_index_mnp):
+    """Test the evaluation on Newton polynomials with automatic batch size."""
+    # NOTE: As many polynomials as monomials, the monomials are evaluated
+    num_polynomials = len(multi_index_mnp)
+    newton_coeffs = build_rnd_coeffs(multi_index_mnp, num_polynomials)
+    grid = Grid(multi_index_mnp)
+    generating_points = grid.generating_points
+    exponents = multi_index_mnp.exponents
+
+    # Create test query points
+    xx = build_rnd_points(421, multi_index_mnp.spatial_dimension)
+
+    # Evaluate the polynomial in batches within a tiny memory budget
+    yy_auto = eval_newton_polynomials(
+        xx,
+        newton_coeffs,
+        exponents,
+        generating_points,
+        batch_size="auto",
+        memory_budget=1024,
+    )
+    yy_ref = eval_newton_polynomials(
+        xx, newton_coeffs, exponents, generating_points
+    )
+
+    # Assert
+    assert_almost_equal(yy_auto, yy_ref)
+
+
+@pytest.mark.parametrize("batch_size", [0, -1, 1.5, "max"])
+def test_eval_batch_invalid(multi_index_mnp, batch_size):
+    """Test invalid batch sizes for the evaluation of Newton polynomials."""
+    coeffs = build_rnd_coeffs(multi_index_mnp)
+    poly = NewtonPolynomial(multi_index_mnp, coeffs)
+    xx = build_rnd_points(10, multi_index_mnp.spatial_dimension)
+
+    with pytest.raises(ValueError):
+        poly(xx, batch_size=batch_size)
+
+
+class TestEvalBackend:
+    """All tests related to the selection of the evaluation backend."""
+
+    def test_vs_canonical(self, multi_index_mnp, num_polynomials, eval_backend):
+        """Test the evaluation with each backend against the canonical."""
+        coeffs = build_rnd_coeffs(multi_index_mnp, num_polynomials)
+        poly = NewtonPolynomial(multi_index_mnp, coeffs)
+        xx = build_rnd_points(421, multi_index_mnp.spatial_dimension)
+
+        # Evaluate
+        yy = poly(xx, backend=eval_backend)
+
+        # Reference
+        yy_ref = NewtonToCanonical(poly)()(xx)
+
+        # Assertion
+        assert_almost_equal(yy, yy_ref)
+
+    def test_batch(self, multi_index_mnp, num_polynomials, BatchSizes):
+        """Test the parallel evaluation in batches of query points."""
+        coeffs = build_rnd_coeffs(multi_index_mnp, num_polynomials)
+        grid = Grid(multi_index_mnp)
+        exponents = multi_index_mnp.exponents
+        generating_points = grid.generating_points
+        xx = build_rnd_points(421, multi_index_mnp.spatial_dimension)
+
+        # Evaluate
+        yy_par = eval_newton_polynomials(
+            xx,
+            coeffs,
+            exponents,
+            generating_points,
+            batch_size=BatchSizes,
+            backend="numba-par",
+        )
+        yy_ref = eval_newton_polynomials(
+            xx,
+            coeffs,
+            exponents,
+            generating_points,
+        )
+
+        # Assertion
+        assert_almost_equal(yy_par, yy_ref)
+
+    def test_fused_vs_monomials(
+        self, multi_index_mnp, num_polynomials, eval_backend
+    ):
+        """Test the fused evaluation against the Newton monomials matrix."""
+        coeffs = build_rnd_coeffs(multi_index_mnp, num_polynomials)
+        grid = Grid(multi_index_mnp)
+        exponents = multi_index_mnp.exponents
+        generating_points = grid.generating_points
+        xx = build_rnd_points(421, multi_index_mnp.spatial_dimension)
+
+        # Evaluate
+        yy = eval_newton_polynomials(
+            xx,
+            coeffs,
+            exponents,
+            generating_points,
+            backend=eval_backend,
+        )
+        yy_ref = eval_newton_monomials(xx, exponents, generating_points)
+        yy_ref = yy_ref @ coeffs
+
+        # Assertions
+        assert yy.shape == yy_ref.shape
+        assert_almost_equal(yy, yy_ref)
+
+    @pytest.mark.parametrize("batch_size", [None, 50])
+    def test_out_workspace(
+        self, multi_index_mnp, num_polynomials, eval_backend, batch_size
+    ):
+        """Test the evaluation into an output array with a workspace."""
+        coeffs = build_rnd_coeffs(multi_index_mnp, num_polynomials)
+        poly = NewtonPolynomial(multi_index_mnp, coeffs)
+        xx = build_rnd_points(421, multi_index_mnp.spatial_dimension)
+        yy_ref = poly(xx)
+
+        # Evaluate twice with the same output array and workspace
+        out = np.empty_like(yy_ref)
+        workspace = EvalWorkspace()
+        for _ in range(2):
+            yy = poly(
+                xx,
+                backend=eval_backend,
+                batch_size=batch_size,
+                out=out,
+                workspace=workspace,
+            )
+            nbytes = workspace.nbytes
+
+            # Assertions
+            assert yy is out
+            assert_almost_equal(out, yy_ref)
+
+        # No new buffer for the repeated evaluation
+        assert workspace.nbytes == nbytes
+
+    @pytest.mark.parametrize("backend", ["numba-tree", "numba-horner"])
+    def test_tree_incomplete(self, multi_index_mnp, num_polynomials, backend):
+        """Test the tree evaluation with a non-downward-closed set."""
+        # Create a non-downward-closed multi-index set
+        exponents = multi_index_mnp.exponents
+        if len(exponents) > 2:
+            idx = np.random.choice(
+                len(exponents), len(exponents) // 2, replace=False
+            )
+            exponents = exponents[np.sort(idx)]
+        grid = Grid(multi_index_mnp)
+        coeffs = build_rnd_coeffs(
+            MultiIndexSet(exponents, multi_index_mnp.lp_degree),
+            num_polynomials,
+        )
+        xx = build_rnd_points(421, multi_index_mnp.spatial_dimension)
+
+        # Evaluate
+        yy_tree = eval_newton_polynomials(
+            xx,
+            coeffs,
+            exponents,
+            grid.generating_points,
+            backend=backend,
+        )
+        yy_ref = eval_newton_polynomials(
+            xx,
+            coeffs,
+            exponents,
+            grid.generating_points,
+        )
+
+        # Assertion
+        assert_almost_equal(yy_tree, yy_ref)
+
+    @pytest.mark.parametrize("backend", ["numba-tree", "numba-horner"])
+    def test_tree_unsorted(self, backend):
+        """Test the tree evaluation with unsorted exponents."""
+        mi = MultiIndexSet.from_degree(2, 3, 2.0)
+        grid = Grid(mi)
+        coeffs = build_rnd_coeffs(mi)
+        xx = build_rnd_points(10, mi.spatial_dimension)
+        # Permute the exponents
+        idx = np.roll(np.arange(len(mi)), 1)
+
+        with pytest.raises(ValueError):
+            eval_newton_polynomials(
+                xx,
+                coeffs[idx],
+                mi.exponents[idx],
+                grid.generating_points,
+                backend=backend,
+            )
+
+    def test_unsupported_backend(self, multi_index_mnp):
+        """Test unsupported backend to evaluate Newton polynomials."""
+        coeffs = build_rnd_coeffs(multi_index_mnp)
+        poly = NewtonPolynomial(multi_index_mnp, coeffs)
+        xx = build_rnd_points(10, multi_index_mnp.spatial_dimension)
+
+        with pytest.raises(NotImplementedError):
+            poly(xx, backend="numdumb")
+
+
+class TestCompileEvaluator:
+    """All tests related to the low-overhead evaluator."""
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_vs_call(self, multi_index_mnp, num_polynomials, parallel):
+        """Test the evaluator against the evaluation via the call."""
+        coeffs = build_rnd_coeffs(multi_index_mnp, num_polynomials)
+        poly = NewtonPolynomial(multi_index_mnp, coeffs)
+        xx = build_rnd_points(23, multi_index_mnp.spatial_dimension)
+        evaluator = poly.compile_evaluator(parallel=parallel)
+
+        # Evaluate
+        yy = evaluator(xx)
+        yy_point = [evaluator(x) for x in xx]
+
+        # Assertions
+        yy_ref = poly(xx)
+        assert yy.shape == yy_ref.shape
+        assert_almost_equal(yy, yy_ref)
+        assert_almost_equal(np.array(yy_point), yy_ref)
+        if num_polynomials == 1:
+            assert isinstance(yy_point[0], float)
+
+    def test_out(self, multi_index_mnp, num_polynomials):
+        """Test the evaluator with output arrays."""
+        coeffs = build_rnd_coeffs(multi_index_mnp, num_polynomials)
+        poly = NewtonPolynomial(multi_index_mnp, coeffs)
+        xx = build_rnd_points(23, multi_index_mnp.spatial_dimension)
+        evaluator = poly.compile_evaluator()
+        yy_ref = poly(xx)
+
+        # Evaluate on multiple points
+        out = np.empty_like(yy_ref)
+        yy = evaluator(xx, out=out)
+
+        # Assertions
+        assert yy is out
+        assert_almost_equal(out, yy_ref)
+
+        # Evaluate on a single point
+        out = np.empty(num_polynomials)
+        yy = evaluator(xx[0], out=out)
+
+        # Assertions
+        assert yy is out
+        assert_almost_equal(out, np.atleast_1d(yy_ref[0]))
+
+    def test_snapshot(self, multi_index_mnp):
+        """Test that the evaluator is not affected by later changes."""
+        coeffs = build_rnd_coeffs(multi_index_mnp)
+        poly = NewtonPolynomial(multi_index_mnp, coeffs)
+        xx = build_rnd_points(10, multi_index_mnp.spatial_dimension)
+        yy_ref = poly(xx)
+        evaluator = poly.compile_evaluator()
+
+        # Change the coefficients of the polynomial
+        poly.coeffs = 2 * coeffs
+
+        # Assertion
+        assert_almost_equal(evaluator(xx), yy_ref)
+
+    def test_kernel(self, multi_index_mnp, num_polynomials):
+        """Test the compiled kernel inside a Numba-compiled function."""
+        coeffs = build_rnd_coeffs(multi_index_mnp, num_polynomials)
+        poly = NewtonPolynomial(multi_index_mnp, coeffs)
+        xx = build_rnd_points(7, multi_index_mnp.spatial_dimension)
+        kernel = poly.compile_evaluator().kernel
+
+        @njit
+        def eval_all(xx, out):
+            for i in range(xx.shape[0]):
+                kernel(xx[i], out[i])
+
+        # Evaluate
+        out = np.empty((len(xx), num_polynomials))
+        eval_all(xx, out)
+
+        # Assertion
+        assert_almost_equal(out, poly(xx).reshape(out.shape))
+
+
 class TestDiff:
     """All tests related to the differentiation of polys. in the Newton basis.
     """
@@ -321,3 +622,113 @@ def test_integrate_over(
     # Assertions
     assert np.isclose(value_nwt, value_lag)
     assert np.isclose(value_nwt, value_can)
+
+
+class TestRefine:
+    """All tests related to the refinement of Newton interpolating polys."""
+
+    @staticmethod
+    def _create_grid(multi_index, max_degree):
+        """Create a grid whose generating points do not depend on the degree.
+        """
+        gen_points_1d = gen_chebychev_2nd_order_leja_ordered(max_degree)
+        gen_points = np.tile(
+            gen_points_1d.reshape(-1, 1),
+            (1, multi_index.spatial_dimension),
+        )
+
+        return Grid.from_points(multi_index, gen_points)
+
+    @staticmethod
+    def _fct(xx, num_polynomials):
+        """Compute the values of the test function(s)."""
+        values = np.stack(
+            [np.sin(xx.sum(axis=1) + i) for i in range(num_polynomials)],
+            axis=1,
+        )
+        if num_polynomials == 1:
+            return values[:, 0]
+
+        return values
+
+    def _interpolate(self, grid, num_polynomials):
+        """Interpolate the test function(s) on the whole grid."""
+        fct_values = self._fct(grid.unisolvent_nodes, num_polynomials)
+        coeffs = dds(fct_values, MultiIndexTree(grid))
+        if num_polynomials == 1:
+            coeffs = coeffs[:, 0]
+
+        return NewtonPolynomial(grid.multi_index, coeffs, grid=grid)
+
+    def test_vs_interpolation(
+        self,
+        SpatialDimension,
+        PolyDegree,
+        LpDegree,
+        num_polynomials,
+    ):
+        """Test refining against the interpolation on the refined grid."""
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        mi_refined = MultiIndexSet.from_degree(
+            SpatialDimension,
+            PolyDegree + 2,
+            LpDegree,
+        )
+        grid = self._create_grid(mi, PolyDegree + 2)
+        grid_refined = self._create_grid(mi_refined, PolyDegree + 2)
+        poly = self._interpolate(grid, num_polynomials)
+
+        # The added exponents in an arbitrary order
+        is_new = np.ones(len(mi_refined), dtype=bool)
+        is_new[find_match_between(mi.exponents, mi_refined.exponents)] = False
+        exponents = mi_refined.exponents[is_new]
+        exponents = exponents[np.random.permutation(len(exponents))]
+
+        # Refine the polynomial
+        poly_refined = poly.refine(
+            exponents,
+            lambda xx: self._fct(xx, num_polynomials),
+        )
+
+        # Assertions
+        poly_ref = self._interpolate(grid_refined, num_polynomials)
+        assert poly_refined.multi_index == mi_refined
+        assert_almost_equal(poly_refined.coeffs, poly_ref.coeffs)
+
+        # Function values instead of a function
+        nodes = grid_refined.generating_points[
+            exponents, np.arange(SpatialDimension)
+        ]
+        poly_values = poly.refine(
+            exponents,
+            self._fct(nodes, num_polynomials),
+        )
+        assert np.array_equal(poly_values.coeffs, poly_refined.coeffs)
+
+    def test_invalid_exponents(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test refining with exponents that are not allowed."""
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        grid = self._create_grid(mi, PolyDegree + 3)
+        poly = self._interpolate(grid, 1)
+        fct = lambda xx: self._fct(xx, 1)
+
+        # Not downward-closed
+        exponent = np.zeros(SpatialDimension, dtype=INT_DTYPE)
+        exponent[0] = PolyDegree + 2
+        with pytest.raises(ValueError):
+            poly.refine(exponent, fct)
+
+        # Already contained
+        with pytest.raises(ValueError):
+            poly.refine(mi.exponents[-1], fct)
+
+    def test_not_nested(self, SpatialDimension, LpDegree):
+        """Test refining on a grid with degree-dependent generating points."""
+        # NOTE: The default generating points of degree 2 and 3 differ
+        mi = MultiIndexSet.from_degree(SpatialDimension, 2, LpDegree)
+        poly = self._interpolate(Grid(mi), 1)
+        exponent = np.zeros(SpatialDimension, dtype=INT_DTYPE)
+        exponent[0] = 3
+
+        with pytest.raises(ValueError):
+            poly.refine(exponent, lambda xx: self._fct(xx, 1))
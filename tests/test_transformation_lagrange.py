@@ -27,8 +27,18 @@ from minterpy import (
 from minterpy.transformations.utils import (
     build_l2n_matrix_dds,
     _build_lagrange_to_newton_bary,
+    _build_lagrange_to_newton_bary_dict,
     _build_lagrange_to_newton_naive,
 )
+from minterpy.schemes.barycentric.conversion import (
+    factorised_2_piecewise,
+    packed_2_triangular,
+    triangular_2_packed,
+)
+from minterpy.schemes.barycentric.operators import (
+    BarycentricNestedOperator,
+    BarycentricPiecewiseOperator,
+)
 
 
 class TestDownwardClosed:
@@ -254,3 +264,150 @@ class TestLagrange2NewtonOperator:
             operator_l2n_dds,
             operator_l2n_bary.array_repr_full,
         )
+
+    def test_to_newton_dict(
+        self,
+        SpatialDimension,
+        PolyDegree,
+        LpDegree,
+        num_polynomials,
+    ):
+        """Test the barycentric transformation in dictionary format."""
+        # Create a Lagrange polynomial
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        lag_coeffs_ref = build_rnd_coeffs(mi, num_polynomials)
+        lag_poly = LagrangePolynomial(mi, lag_coeffs_ref)
+
+        # Construct the transformer object
+        transformer_l2n = LagrangeToNewton(lag_poly)
+
+        # Naive and barycentric (dictionary format) transformations
+        operator_l2n_naive = _build_lagrange_to_newton_naive(transformer_l2n)
+        operator_l2n_dict = _build_lagrange_to_newton_bary_dict(transformer_l2n)
+
+        # Assertions
+        assert np.allclose(
+            operator_l2n_dict.array_repr_full,
+            operator_l2n_naive.array_repr_full,
+        )
+        assert np.allclose(
+            operator_l2n_dict @ lag_coeffs_ref,
+            operator_l2n_naive @ lag_coeffs_ref,
+        )
+        # Single set of coefficients
+        assert np.allclose(
+            operator_l2n_dict @ lag_coeffs_ref[:, 0],
+            operator_l2n_naive @ lag_coeffs_ref[:, 0],
+        )
+
+    def test_to_newton_bary_multiple(
+        self,
+        SpatialDimension,
+        PolyDegree,
+        LpDegree,
+        num_polynomials,
+    ):
+        """Test the barycentric transformations of multiple sets of
+        coefficients."""
+        # Create a Lagrange polynomial with multiple sets of coefficients
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        lag_coeffs_ref = build_rnd_coeffs(mi, num_polynomials)
+        lag_poly = LagrangePolynomial(mi, lag_coeffs_ref)
+
+        # Construct the transformer object
+        transformer_l2n = LagrangeToNewton(lag_poly)
+
+        # Naive and barycentric (factorised and piecewise) transformations
+        operator_l2n_naive = _build_lagrange_to_newton_naive(transformer_l2n)
+        operator_l2n_fact = _build_lagrange_to_newton_bary(transformer_l2n)
+        operator_l2n_piece = BarycentricPiecewiseOperator(
+            transformer_l2n,
+            factorised_2_piecewise(*operator_l2n_fact.transformation_data),
+        )
+        nwt_coeffs_ref = operator_l2n_naive @ lag_coeffs_ref
+
+        # Assertions
+        for operator in [operator_l2n_fact, operator_l2n_piece]:
+            nwt_coeffs = operator @ lag_coeffs_ref
+            assert nwt_coeffs.shape == lag_coeffs_ref.shape
+            assert np.allclose(nwt_coeffs_ref, nwt_coeffs)
+            # Each set of coefficients separately
+            for i in range(num_polynomials):
+                assert np.allclose(
+                    operator @ lag_coeffs_ref[:, i],
+                    nwt_coeffs[:, i],
+                )
+
+    def test_to_newton_bary_packed(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test the packed leaf factors of the factorised transformation."""
+        # Create a Lagrange polynomial
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        lag_poly = LagrangePolynomial(mi, build_rnd_coeffs(mi))
+
+        # Construct the transformer object
+        transformer_l2n = LagrangeToNewton(lag_poly)
+
+        # Naive and barycentric (factorised) transformations
+        operator_l2n_naive = _build_lagrange_to_newton_naive(transformer_l2n)
+        operator_l2n_fact = _build_lagrange_to_newton_bary(transformer_l2n)
+        _, leaf_factors, leaf_positions, _ = operator_l2n_fact.transformation_data
+
+        # Assertions
+        nr_of_leaves = len(leaf_positions)
+        assert leaf_factors.shape == (nr_of_leaves * (nr_of_leaves + 1) // 2,)
+        # The factors are the first entries of each piece of the operator
+        leaf_factors_full = packed_2_triangular(leaf_factors, nr_of_leaves)
+        assert np.allclose(
+            leaf_factors_full,
+            operator_l2n_naive.array_repr_full[
+                np.ix_(leaf_positions, leaf_positions)
+            ],
+        )
+        assert np.array_equal(triangular_2_packed(leaf_factors_full), leaf_factors)
+
+    def test_to_newton_nested(
+        self,
+        SpatialDimension,
+        PolyDegree,
+        LpDegree,
+        num_polynomials,
+    ):
+        """Test the barycentric transformation in nested format."""
+        # Create a Lagrange polynomial
+        mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        lag_coeffs_ref = build_rnd_coeffs(mi, num_polynomials)
+        lag_poly = LagrangePolynomial(mi, lag_coeffs_ref)
+
+        # Construct the transformer objects
+        transformer_l2n = LagrangeToNewton(lag_poly)
+        transformer_l2n_nested = LagrangeToNewton(
+            lag_poly,
+            operator_format="nested",
+        )
+
+        # Naive and barycentric (nested format) transformations
+        operator_l2n_naive = _build_lagrange_to_newton_naive(transformer_l2n)
+        operator_l2n_nested = transformer_l2n_nested.transformation_operator
+
+        # Assertions
+        assert isinstance(operator_l2n_nested, BarycentricNestedOperator)
+        assert np.allclose(
+            operator_l2n_nested.array_repr_full,
+            operator_l2n_naive.array_repr_full,
+        )
+        assert np.allclose(
+            operator_l2n_nested @ lag_coeffs_ref,
+            operator_l2n_naive @ lag_coeffs_ref,
+        )
+        assert np.allclose(
+            transformer_l2n_nested().coeffs,
+            transformer_l2n().coeffs,
+        )
+
+    def test_invalid_operator_format(self):
+        """Test selecting an unsupported operator format."""
+        mi = MultiIndexSet.from_degree(2, 2, 1.0)
+        lag_poly = LagrangePolynomial(mi, build_rnd_coeffs(mi))
+
+        with pytest.raises(ValueError):
+            LagrangeToNewton(lag_poly, operator_format="unknown")
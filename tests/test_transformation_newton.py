@@ -27,6 +27,14 @@ from minterpy.transformations.utils import (
     _build_newton_to_lagrange_bary,
     _build_newton_to_lagrange_naive,
 )
+from minterpy.schemes.barycentric.conversion import (
+    factorised_2_piecewise,
+    packed_2_triangular,
+)
+from minterpy.schemes.barycentric.operators import (
+    BarycentricNestedOperator,
+    BarycentricPiecewiseOperator,
+)
 
 
 class TestDownwardClosed:
@@ -211,3 +219,97 @@ def test_newton2lagrange_naive_vs_bary(SpatialDimension, PolyDegree, LpDegree):
     assert np.allclose(lag_coeffs_ref, lag_coeffs_naive)
     assert np.allclose(lag_coeffs_ref, lag_coeffs_baryc)
     assert np.allclose(lag_coeffs_naive, lag_coeffs_baryc)
+
+
+def test_newton2lagrange_bary_multiple(
+    SpatialDimension,
+    PolyDegree,
+    LpDegree,
+    num_polynomials,
+):
+    """Test the barycentric Newton-to-Lagrange transformations of multiple
+    sets of coefficients."""
+    # Create a Newton polynomial with multiple sets of coefficients
+    mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+    coeffs = build_rnd_coeffs(mi, num_polynomials)
+    nwt_poly = NewtonPolynomial(mi, coeffs)
+    lag_coeffs_ref = nwt_poly(nwt_poly.grid.unisolvent_nodes)
+
+    # Barycentric transformations (factorised and piecewise formats)
+    transformer_n2l = NewtonToLagrange(nwt_poly)
+    operator_n2l_fact = _build_newton_to_lagrange_bary(transformer_n2l)
+    operator_n2l_piece = BarycentricPiecewiseOperator(
+        transformer_n2l,
+        factorised_2_piecewise(*operator_n2l_fact.transformation_data),
+    )
+
+    # Assertions
+    for operator in [operator_n2l_fact, operator_n2l_piece]:
+        lag_coeffs = operator @ coeffs
+        assert lag_coeffs.shape == coeffs.shape
+        assert np.allclose(lag_coeffs_ref.reshape(coeffs.shape), lag_coeffs)
+        # Each set of coefficients separately
+        for i in range(num_polynomials):
+            assert np.allclose(operator @ coeffs[:, i], lag_coeffs[:, i])
+
+
+def test_newton2lagrange_bary_packed(SpatialDimension, PolyDegree, LpDegree):
+    """Test the packed leaf factors of the factorised Newton-to-Lagrange
+    transformation."""
+    # Create a Newton polynomial
+    mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+    nwt_poly = NewtonPolynomial(mi, build_rnd_coeffs(mi))
+
+    # Naive and barycentric (factorised) transformations
+    transformer_n2l = NewtonToLagrange(nwt_poly)
+    operator_n2l_naive = _build_newton_to_lagrange_naive(transformer_n2l)
+    operator_n2l_fact = _build_newton_to_lagrange_bary(transformer_n2l)
+    _, leaf_factors, leaf_positions, _ = operator_n2l_fact.transformation_data
+
+    # Assertions
+    nr_of_leaves = len(leaf_positions)
+    assert leaf_factors.shape == (nr_of_leaves * (nr_of_leaves + 1) // 2,)
+    # The factors are the first entries of each piece of the operator
+    assert np.allclose(
+        packed_2_triangular(leaf_factors, nr_of_leaves),
+        operator_n2l_naive.array_repr_full[np.ix_(leaf_positions, leaf_positions)],
+    )
+
+
+def test_newton2lagrange_nested(
+    SpatialDimension,
+    PolyDegree,
+    LpDegree,
+    num_polynomials,
+):
+    """Test the barycentric Newton-to-Lagrange transformation in nested
+    format."""
+    # Create a Newton polynomial
+    mi = MultiIndexSet.from_degree(SpatialDimension, PolyDegree, LpDegree)
+    coeffs = build_rnd_coeffs(mi, num_polynomials)
+    nwt_poly = NewtonPolynomial(mi, coeffs)
+    lag_coeffs_ref = nwt_poly(nwt_poly.grid.unisolvent_nodes)
+
+    # Barycentric transformation (nested format)
+    transformer_n2l = NewtonToLagrange(nwt_poly, operator_format="nested")
+    operator_n2l_nested = transformer_n2l.transformation_operator
+    operator_n2l_naive = _build_newton_to_lagrange_naive(transformer_n2l)
+
+    # Assertions
+    assert isinstance(operator_n2l_nested, BarycentricNestedOperator)
+    assert np.allclose(
+        operator_n2l_nested.array_repr_full,
+        operator_n2l_naive.array_repr_full,
+    )
+    assert np.allclose(
+        lag_coeffs_ref.reshape(coeffs.shape),
+        operator_n2l_nested @ coeffs,
+    )
+    assert np.allclose(
+        transformer_n2l().coeffs,
+        NewtonToLagrange(nwt_poly)().coeffs,
+    )
+
+    # Invalid format
+    with pytest.raises(ValueError):
+        NewtonToLagrange(nwt_poly, operator_format="unknown")
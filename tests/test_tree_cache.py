@@ -0,0 +1,188 @@
+"""
+Test suite for the persistent on-disk cache of the multi-index tree.
+"""
+import numpy as np
+import pytest
+from conftest import LpDegree, PolyDegree, SpatialDimension
+
+import minterpy as mp
+from minterpy.core.tree import MultiIndexTree
+from minterpy.dds import dds, get_masks_header
+from minterpy.utils.tree_cache import (
+    CACHE_FORMAT_VERSION,
+    get_cache_key,
+    get_tree_cache_dir,
+    load_tree_structure,
+    set_tree_cache_dir,
+)
+
+
+def _assert_trees_equal(tree_1, tree_2):
+    """Assert that two multi-index trees have the same precomputations."""
+    for name in ["split_positions", "subtree_sizes", "problem_sizes"]:
+        list_1 = getattr(tree_1, name)
+        list_2 = getattr(tree_2, name)
+        assert len(list_1) == len(list_2)
+        for array_1, array_2 in zip(list_1, list_2):
+            assert np.array_equal(array_1, array_2)
+
+    assert np.array_equal(tree_1.stored_masks, tree_2.stored_masks)
+
+
+class TestCache:
+    """All tests related to the tree cache."""
+
+    def test_warm_start(self, tmp_path, SpatialDimension, PolyDegree, LpDegree):
+        """Test loading the precomputations from the cache."""
+        grd = mp.Grid.from_degree(SpatialDimension, PolyDegree, LpDegree)
+
+        # Cold start; compute and store
+        tree_cold = MultiIndexTree(grd, cache_dir=tmp_path)
+        tree_cold.stored_masks
+        key = get_cache_key(grd.multi_index.exponents)
+        assert (tmp_path / key / "masks.npy").exists()
+
+        # Warm start; load
+        nr_exponents, spatial_dimension = grd.multi_index.exponents.shape
+        structure = load_tree_structure(
+            tmp_path, key, nr_exponents, spatial_dimension
+        )
+        assert structure is not None
+        tree_warm = MultiIndexTree(grd, cache_dir=tmp_path)
+        _assert_trees_equal(tree_cold, tree_warm)
+
+        # The DDS yields the same results
+        lag_coeffs = grd(lambda xx: np.sum(xx**2, axis=1))
+        assert np.array_equal(
+            dds(lag_coeffs, tree_cold), dds(lag_coeffs, tree_warm)
+        )
+
+    def test_no_cache(
+        self, monkeypatch, SpatialDimension, PolyDegree, LpDegree
+    ):
+        """Test that nothing is cached by default."""
+        monkeypatch.delenv("MINTERPY_TREE_CACHE_DIR", raising=False)
+        assert get_tree_cache_dir() is None
+
+        grd = mp.Grid.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        tree = MultiIndexTree(grd)
+
+        assert tree._cache_dir is None
+        assert tree._cache_key is None
+
+    def test_set_cache_dir(self, tmp_path):
+        """Test setting the cache directory globally."""
+        grd = mp.Grid.from_degree(3, 4, 2.0)
+        set_tree_cache_dir(tmp_path)
+        try:
+            grd.tree.stored_masks
+        finally:
+            set_tree_cache_dir(None)
+
+        key = get_cache_key(grd.multi_index.exponents)
+        assert (tmp_path / key / "split_positions.npy").exists()
+        assert (tmp_path / key / "masks.npy").exists()
+
+    def test_key(self):
+        """Test the content-addressed key of the exponents."""
+        mi_1 = mp.MultiIndexSet.from_degree(2, 3, 1.0)
+        mi_2 = mp.MultiIndexSet.from_degree(2, 3, 1.0)
+        mi_3 = mp.MultiIndexSet.from_degree(2, 3, 2.0)
+
+        assert get_cache_key(mi_1.exponents) == get_cache_key(mi_2.exponents)
+        assert get_cache_key(mi_1.exponents) != get_cache_key(mi_3.exponents)
+
+    def test_key_format_version(self, monkeypatch):
+        """Test that the key depends on the version of the storage format."""
+        exponents = mp.MultiIndexSet.from_degree(2, 3, 1.0).exponents
+        key = get_cache_key(exponents)
+        monkeypatch.setattr(
+            "minterpy.utils.tree_cache.CACHE_FORMAT_VERSION",
+            CACHE_FORMAT_VERSION + 1,
+        )
+
+        assert get_cache_key(exponents) != key
+
+    def test_masks_header(self, SpatialDimension, PolyDegree, LpDegree):
+        """Test the header of the masks computed from the tree structure."""
+        grd = mp.Grid.from_degree(SpatialDimension, PolyDegree, LpDegree)
+        tree = MultiIndexTree(grd)
+        header = get_masks_header(tree.split_positions, tree.subtree_sizes)
+
+        assert np.array_equal(tree.stored_masks[:3], header)
+
+    @pytest.mark.parametrize("name", ["masks.npy", "subtree_sizes.npy"])
+    def test_corrupt_entry(self, tmp_path, name):
+        """Test that a corrupt cache entry is recomputed."""
+        grd = mp.Grid.from_degree(3, 4, 2.0)
+        tree_ref = MultiIndexTree(grd, cache_dir=tmp_path)
+        tree_ref.stored_masks
+
+        # Corrupt an entry
+        key = get_cache_key(grd.multi_index.exponents)
+        (tmp_path / key / name).write_bytes(b"corrupt")
+
+        # Assertion
+        tree = MultiIndexTree(grd, cache_dir=tmp_path)
+        _assert_trees_equal(tree_ref, tree)
+
+    @pytest.mark.parametrize("entry", ["header", "truncated"])
+    def test_stale_masks(self, tmp_path, entry):
+        """Test that cached masks that don't match the tree are recomputed."""
+        grd = mp.Grid.from_degree(3, 4, 2.0)
+        tree_ref = MultiIndexTree(grd, cache_dir=tmp_path)
+        tree_ref.stored_masks
+
+        # Store masks with a valid format but a wrong layout
+        key = get_cache_key(grd.multi_index.exponents)
+        masks = np.array(tree_ref.stored_masks)
+        if entry == "header":
+            masks[2] += 1
+        else:
+            masks = masks[:-1]
+        np.save(tmp_path / key / "masks.npy", masks)
+
+        # Assertion
+        tree = MultiIndexTree(grd, cache_dir=tmp_path)
+        _assert_trees_equal(tree_ref, tree)
+
+    @pytest.mark.parametrize(
+        "entry",
+        ["dtype", "offsets", "truncated", "num_lists", "sizes", "splits"],
+    )
+    def test_stale_structure(self, tmp_path, entry):
+        """Test that a cached structure that doesn't match is recomputed."""
+        grd = mp.Grid.from_degree(3, 4, 2.0)
+        tree_ref = MultiIndexTree(grd, cache_dir=tmp_path)
+        tree_ref.stored_masks
+
+        # Store arrays with a valid format but a wrong content
+        key = get_cache_key(grd.multi_index.exponents)
+        entry_dir = tmp_path / key
+        values = np.load(entry_dir / "subtree_sizes.npy")
+        offsets = np.load(entry_dir / "subtree_sizes_offsets.npy")
+        if entry == "dtype":
+            values = values.astype(np.int32)
+        elif entry == "offsets":
+            offsets[1] = offsets[2] + 1
+        elif entry == "truncated":
+            values = values[:-1]
+        elif entry == "num_lists":
+            offsets = offsets[:-1]
+            values = values[: offsets[-1]]
+        elif entry == "sizes":
+            values[0] += 1
+        else:
+            # Swap two sizes; the split positions no longer match
+            values[[0, 1]] = values[[1, 0]]
+        np.save(entry_dir / "subtree_sizes.npy", values)
+        np.save(entry_dir / "subtree_sizes_offsets.npy", offsets)
+
+        # Assertions
+        nr_exponents, spatial_dimension = grd.multi_index.exponents.shape
+        assert (
+            load_tree_structure(tmp_path, key, nr_exponents, spatial_dimension)
+            is None
+        )
+        tree = MultiIndexTree(grd, cache_dir=tmp_path)
+        _assert_trees_equal(tree_ref, tree)
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from minterpy.utils.verification import (
+    verify_batch_size,
     verify_spatial_dimension,
     verify_poly_degree,
     verify_lp_degree,
@@ -210,6 +211,45 @@ class TestVerifyPolyDegree:
             verify_poly_degree(poly_degree)
 
 
+class TestVerifyBatchSize:
+    """All tests related to the verification of batch size parameter."""
+
+    @pytest.mark.parametrize(
+        "batch_size",
+        [1, 100, 100.0, np.array([10])[0]],
+    )
+    def test_valid_batch_size(self, batch_size):
+        """Test for valid numeric batch size values."""
+        # Verify batch size
+        verified_batch_size = verify_batch_size(batch_size)
+
+        # Assertions
+        assert isinstance(verified_batch_size, int)
+        assert verified_batch_size == int(batch_size)
+
+    @pytest.mark.parametrize("batch_size", [None, "auto", "Auto"])
+    def test_valid_non_numeric_batch_size(self, batch_size):
+        """Test for valid non-numeric batch size values."""
+        verified_batch_size = verify_batch_size(batch_size)
+
+        if batch_size is None:
+            assert verified_batch_size is None
+        else:
+            assert verified_batch_size == "auto"
+
+    @pytest.mark.parametrize("batch_size", [{1}, (1,), [1]])
+    def test_invalid_type_batch_size(self, batch_size):
+        """Test raising TypeError in the batch size verification."""
+        with pytest.raises(TypeError):
+            verify_batch_size(batch_size)
+
+    @pytest.mark.parametrize("batch_size", ["1", "max", 0, -10, 1.5])
+    def test_invalid_value_batch_size(self, batch_size):
+        """Test raising ValueError in the batch size verification."""
+        with pytest.raises(ValueError):
+            verify_batch_size(batch_size)
+
+
 def test_check_dimensionality():
     """Test raising ValueError due to wrong dimensionality.
 